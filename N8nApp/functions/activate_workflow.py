@@ -4,45 +4,13 @@ Workflow aktivasyon işlevleri
 """
 
 import requests
-from .utils import N8N_URL, headers, headers_with_content_type
+from .api_client import get_client
+from .workflow_cache import show_workflow_list, invalidate_workflow_list
 
 def get_workflows_list():
     """Tüm workflow'ları ID ve isimleriyle listeler ve döndürür (kaydetme isteği olmadan)"""
-    print("\nWorkflow'lar getiriliyor...\n")
-    
-    try:
-        # API isteğini güncellenen endpoint ile yap (tüm workflow'ları getir)
-        response = requests.get(f"{N8N_URL}/api/v1/workflows?excludePinnedData=true&limit=100", headers=headers)
-        response.raise_for_status()
-        
-        response_data = response.json()
-        
-        # API yanıt formatını kontrol et
-        if isinstance(response_data, dict) and "data" in response_data:
-            # Yeni API formatı - 'data' içinde workflow array'i var
-            workflows = response_data["data"]
-        else:
-            # Eski API formatı - doğrudan workflow array'i
-            workflows = response_data
-        
-        if not workflows or len(workflows) == 0:
-            print("Hiç workflow bulunamadı.")
-            return None
-        
-        print(f"Toplam {len(workflows)} workflow bulundu:\n")
-        for idx, workflow in enumerate(workflows, 1):
-            # Tip kontrolü ekle
-            if isinstance(workflow, dict):
-                active_status = "[Aktif]" if workflow.get("active", False) else "[Pasif]"
-                print(f"{idx}. {active_status} ID: {workflow['id']} - İsim: {workflow['name']}")
-            else:
-                print(f"{idx}. Geçersiz workflow verisi: {workflow}")
-        
-        return workflows
-    
-    except requests.exceptions.RequestException as e:
-        print(f"Workflow'ları getirirken hata oluştu: {str(e)}")
-        return None
+    # Liste oturum önbelleğinden gelir; menü seçenekleri arasında tekrar istenmez
+    return show_workflow_list()
 
 def activate_workflow():
     """ID ile workflow'u aktif et"""
@@ -79,12 +47,12 @@ def activate_workflow():
             
             print(f"\nWorkflow ID: {workflow_id} '{workflow_name}' aktif ediliyor...")
             # Use POST method with an empty string as the data parameter, matching the curl example
-            response = requests.post(
-                f"{N8N_URL}/api/v1/workflows/{workflow_id}/activate",
-                headers=headers,
+            response = get_client().post(
+                f"/workflows/{workflow_id}/activate",
                 data=""  # Empty string as data
             )
             response.raise_for_status()
+            invalidate_workflow_list()
             
             print(f"\nWorkflow '{workflow_name}' başarıyla aktif edildi!")
             break
@@ -140,12 +108,12 @@ def deactivate_workflow():
             
             print(f"\nWorkflow ID: {workflow_id} '{workflow_name}' pasif ediliyor...")
             # Use POST method with an empty string as the data parameter, matching the curl example
-            response = requests.post(
-                f"{N8N_URL}/api/v1/workflows/{workflow_id}/deactivate",
-                headers=headers,
+            response = get_client().post(
+                f"/workflows/{workflow_id}/deactivate",
                 data=""  # Empty string as data
             )
             response.raise_for_status()
+            invalidate_workflow_list()
             
             print(f"\nWorkflow '{workflow_name}' başarıyla pasif edildi!")
             break
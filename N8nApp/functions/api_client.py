@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Paylaşılan, bağlantı havuzlu N8N API istemcisi
+"""
+
+import time
+import random
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from .utils import get_config, getenv, encode_json_body
+
+# Tekrar denenecek HTTP durum kodları (rate limit ve sunucu hataları)
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# Yan etkisi tekrarlansa da sorun olmayan metodlar; POST sadece 429'da tekrar denenir
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+
+# Varsayılan ayarlar .env / çevre değişkenlerinden değiştirilebilir
+DEFAULT_POOL_SIZE = int(getenv("N8N_POOL_SIZE", "10"))
+DEFAULT_TIMEOUT = float(getenv("N8N_TIMEOUT", "30"))
+DEFAULT_MAX_RETRIES = int(getenv("N8N_MAX_RETRIES", "3"))
+DEFAULT_BACKOFF = float(getenv("N8N_BACKOFF", "0.5"))
+MAX_BACKOFF = 30.0
+
+# /workflows sayfa boyutu (n8n en fazla 250 kabul eder)
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 250
+
+# Hafif listeleme için workflow'dan tutulan alanlar
+SUMMARY_FIELDS = ("id", "name", "active", "updatedAt", "versionId")
+
+
+def error_message(e):
+    """İstek hatasından API'nin 'message' alanını, yoksa hatanın metnini döndürür"""
+    try:
+        if getattr(e, 'response', None) is not None:
+            return e.response.json().get('message', str(e))
+    except (ValueError, AttributeError):
+        pass
+    return str(e)
+
+
+def _page_items(data):
+    """/workflows yanıtından (workflow'lar, nextCursor) döndürür"""
+    # Yeni API formatı 'data' + 'nextCursor', eski format doğrudan workflow array'i
+    if isinstance(data, dict) and "data" in data:
+        return data["data"], data.get("nextCursor")
+    return data or [], None
+
+
+def workflow_summary(workflow):
+    """Workflow'un sadece özet alanlarını içeren hafif bir kopyasını döndürür"""
+    if not isinstance(workflow, dict):
+        return workflow
+    return {field: workflow.get(field) for field in SUMMARY_FIELDS}
+
+
+class N8nClient:
+    """Keep-alive bağlantı havuzu, zaman aşımı ve jitter'lı tekrar deneme ile N8N API istemcisi"""
+
+    def __init__(self, base_url=None, api_headers=None, pool_size=DEFAULT_POOL_SIZE,
+                 timeout=DEFAULT_TIMEOUT, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff_factor=DEFAULT_BACKOFF):
+        # Açıkça verilen değerler (boş başlık sözlüğü dahil) kullanılır; config sadece eksik olanlar için çözülür
+        self.base_url = (get_config().n8n_url if base_url is None else base_url).rstrip("/")
+        self.api_url = f"{self.base_url}/api/v1"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+
+        # Tek bir Session tüm istekler için TCP/TLS bağlantılarını yeniden kullanır
+        self.session = requests.Session()
+        self.session.headers.update(get_config().headers if api_headers is None else api_headers)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def url(self, path):
+        """API yolunu tam URL'ye çevirir ('/workflows' -> '<N8N_URL>/api/v1/workflows')"""
+        if path.startswith("http://") or path.startswith("https://"):
+            return path
+        return f"{self.api_url}/{path.lstrip('/')}"
+
+    def backoff_delay(self, attempt, retry_after=None):
+        """Üstel bekleme süresini 'full jitter' ile hesaplar, Retry-After başlığına uyar"""
+        if retry_after is not None:
+            return min(retry_after, MAX_BACKOFF)
+        ceiling = min(MAX_BACKOFF, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    @staticmethod
+    def retry_after(response):
+        """Retry-After başlığını saniye olarak okur (yoksa None)"""
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            return None
+
+    def _should_retry(self, method, status_code):
+        if status_code not in RETRY_STATUS_CODES:
+            return False
+        return status_code == 429 or method in IDEMPOTENT_METHODS
+
+    def request(self, method, path, timeout=None, max_retries=None, **kwargs):
+        """İsteği gönderir; 429/5xx ve bağlantı hatalarında jitter'lı bekleme ile tekrar dener"""
+        method = method.upper()
+        retries = self.max_retries if max_retries is None else max_retries
+        url = self.url(path)
+        attempt = 0
+        if kwargs.get("json") is not None:
+            kwargs["data"] = encode_json_body(kwargs.pop("json"))
+            kwargs["headers"] = {"Content-Type": "application/json", **(kwargs.get("headers") or {})}
+
+        while True:
+            try:
+                response = self.session.request(method, url, timeout=timeout or self.timeout, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout):
+                if attempt >= retries or method not in IDEMPOTENT_METHODS:
+                    raise
+                delay = self.backoff_delay(attempt)
+            else:
+                if attempt >= retries or not self._should_retry(method, response.status_code):
+                    return response
+                delay = self.backoff_delay(attempt, self.retry_after(response))
+                response.close()
+
+            time.sleep(delay)
+            attempt += 1
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def _get_workflow_page(self, params):
+        """Tek bir /workflows sayfasını getirir, (workflow'lar, nextCursor) döndürür"""
+        response = self.get("/workflows", params=params)
+        response.raise_for_status()
+        return _page_items(response.json())
+
+    def iter_workflows(self, summary=False, prefetch=False, page_size=DEFAULT_PAGE_SIZE, **filters):
+        """
+        Tüm workflow'ları nextCursor ile sayfa sayfa gezerek yield eder.
+
+        summary=True ise sadece SUMMARY_FIELDS alanları döner. prefetch=True ise
+        mevcut sayfa işlenirken bir sonraki sayfa arka planda getirilir. Ek
+        filtreler (active, tags, name, projectId) sorgu parametresi olarak iletilir.
+        """
+        params = {"limit": page_size, "excludePinnedData": "true"}
+        for key, value in filters.items():
+            if value is not None:
+                params[key] = str(value).lower() if isinstance(value, bool) else value
+
+        executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+        try:
+            page, cursor = self._get_workflow_page(params)
+            while True:
+                next_page = None
+                if cursor and executor:
+                    next_page = executor.submit(self._get_workflow_page, {**params, "cursor": cursor})
+
+                for workflow in page:
+                    yield workflow_summary(workflow) if summary else workflow
+
+                if not cursor:
+                    break
+                if next_page:
+                    page, cursor = next_page.result()
+                else:
+                    page, cursor = self._get_workflow_page({**params, "cursor": cursor})
+        finally:
+            if executor:
+                executor.shutdown(wait=False, cancel_futures=True)
+
+    def workflow_summaries(self, etag=None, page_size=MAX_PAGE_SIZE):
+        """
+        Tüm workflow özetlerini koşullu istekle getirir: (özetler, etag).
+
+        Liste tek sayfaya sığıyorsa yanıtın ETag'i saklanabilir; sonraki çağrıda
+        If-None-Match ile gönderilir ve sunucu 304 dönerse özetler None olur
+        (boşta bir yoklama tek küçük istek tutar). Çok sayfalı listelerde ETag
+        sadece ilk sayfayı temsil ettiği için None döner.
+        """
+        params = {"limit": page_size, "excludePinnedData": "true"}
+        response = self.get("/workflows", params=params, headers={"If-None-Match": etag} if etag else None)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        page, cursor = _page_items(response.json())
+        new_etag = None if cursor else response.headers.get("ETag")
+
+        summaries = [workflow_summary(workflow) for workflow in page]
+        while cursor:
+            page, cursor = self._get_workflow_page({**params, "cursor": cursor})
+            summaries.extend(workflow_summary(workflow) for workflow in page)
+        return summaries, new_etag
+
+    def get_workflow(self, workflow_id, exclude_pinned_data=True):
+        """Tek bir workflow'un tam içeriğini getirir"""
+        params = {"excludePinnedData": "true"} if exclude_pinned_data else None
+        response = self.get(f"/workflows/{workflow_id}", params=params)
+        response.raise_for_status()
+        return response.json()
+
+    def fetch_workflows(self, workflow_ids, workers=DEFAULT_POOL_SIZE, exclude_pinned_data=True):
+        """
+        Verilen id'lerin tam içeriklerini eşzamanlı olarak getirir.
+
+        (id -> workflow, id -> hata mesajı) ikilisi döndürür; tek bir hatalı
+        istek diğerlerini durdurmaz.
+        """
+        workflows = {}
+        errors = {}
+        workflow_ids = list(dict.fromkeys(workflow_ids))
+        if not workflow_ids:
+            return workflows, errors
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(workflow_ids)))) as executor:
+            futures = {
+                executor.submit(self.get_workflow, workflow_id, exclude_pinned_data): workflow_id
+                for workflow_id in workflow_ids
+            }
+            for future, workflow_id in futures.items():
+                try:
+                    workflows[workflow_id] = future.result()
+                except (requests.exceptions.RequestException, ValueError) as e:
+                    errors[workflow_id] = str(e)
+        return workflows, errors
+
+    def close(self):
+        """Havuzdaki tüm bağlantıları kapatır"""
+        self.session.close()
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Süreç genelinde paylaşılan N8nClient örneğini döndürür (ilk kullanımda oluşturulur)"""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = N8nClient()
+    return _client
+
+
+def iter_workflows(**kwargs):
+    """Paylaşılan istemci üzerinden N8nClient.iter_workflows kısayolu"""
+    return get_client().iter_workflows(**kwargs)
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+İçerik adresli, sıkıştırılmış workflow yedek deposu
+"""
+
+import os
+import re
+import sys
+import gzip
+import json
+import hashlib
+import argparse
+import datetime
+import threading
+from .utils import getenv, get_backups_dir, get_workflows_dir, workflow_file_name, atomic_write_json, write_canonical_json
+from .workflow_projection import split_volatile, merge_volatile
+
+# Sıkıştırılmış içeriklerin tutulduğu klasör ve (workflow id, zaman) -> hash indeksi
+OBJECTS_DIR = "objects"
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+# Her kayıtta değişen, içerikle ilgisi olmayan alanlar: hash'e girmez, indeks kaydında tutulur.
+# pinData, meta ve shared içeriğin parçasıdır; sıkıştırılmış nesnede kalır (indeks küçük kalmalı)
+PER_SAVE_FIELDS = ("updatedAt", "versionId", "createdAt", "triggerCount")
+
+# Zaman damgası formatı (eski yedek dosya adlarıyla aynı)
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Saklama politikası varsayılanları .env / çevre değişkenlerinden değiştirilebilir
+DEFAULT_KEEP_LAST = int(getenv("N8N_BACKUP_KEEP_LAST", "10"))
+DEFAULT_KEEP_DAILY = int(getenv("N8N_BACKUP_KEEP_DAILY", "7"))
+DEFAULT_KEEP_WEEKLY = int(getenv("N8N_BACKUP_KEEP_WEEKLY", "4"))
+
+# Eski format yedek dosyası: <isim>_<id>_<YYYYmmdd>_<HHMMSS>.json
+LEGACY_BACKUP_PATTERN = re.compile(r"^.+_(\d{8}_\d{6})\.json$")
+
+
+def serialize_workflow(workflow):
+    """Workflow'u hash ve sıkıştırma için kanonik (sıralı, boşluksuz) JSON byte'larına çevirir"""
+    return json.dumps(workflow, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
+
+
+class BackupStore:
+    """
+    Workflow yedeklerini içerik hash'ine göre bir kez saklayan depo.
+
+    Her farklı sürüm objects/<ilk iki karakter>/<sha256>.json.gz olarak yazılır;
+    index.json her yedek için workflow id, isim, zaman damgası ve hash tutar.
+    Hash sadece içeriği kapsar: her kayıtta değişen alanlar (PER_SAVE_FIELDS)
+    çıkarılıp indeks kaydında tutulur, böylece aynı içerik tekrar yedeklendiğinde
+    yeni dosya oluşmaz. pinData gibi büyük alanlar sıkıştırılmış içerikte kalır.
+    """
+
+    def __init__(self, backup_dir=None):
+        self.backup_dir = backup_dir or get_backups_dir()
+        self.index_path = os.path.join(self.backup_dir, INDEX_FILE)
+        self.lock = threading.Lock()
+        self._entries = None
+
+    @property
+    def entries(self):
+        """İndeks kayıtları (ilk erişimde diskten yüklenir)"""
+        if self._entries is None:
+            try:
+                with open(self.index_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self._entries = data.get("entries", []) if data.get("version") == INDEX_VERSION else []
+            except (OSError, ValueError, AttributeError):
+                self._entries = []
+        return self._entries
+
+    def _save_index(self):
+        os.makedirs(self.backup_dir, exist_ok=True)
+        atomic_write_json(self.index_path, {"version": INDEX_VERSION, "entries": self.entries})
+
+    def object_path(self, content_hash):
+        """Hash'e ait sıkıştırılmış içerik dosyasının yolunu döndürür"""
+        return os.path.join(self.backup_dir, OBJECTS_DIR, content_hash[:2], f"{content_hash}.json.gz")
+
+    def _write_object(self, content):
+        """İçeriği yoksa gzip ile yazar, hash'ini döndürür"""
+        content_hash = hashlib.sha256(content).hexdigest()
+        path = self.object_path(content_hash)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            temp_path = f"{path}.tmp{threading.get_ident()}"
+            # mtime=0 ile aynı içerik her zaman aynı byte'ları üretir
+            with gzip.GzipFile(temp_path, 'wb', compresslevel=6, mtime=0) as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        return content_hash
+
+    def add(self, workflow, timestamp=None, prune=True):
+        """
+        Workflow'u yedekler ve indeks kaydını döndürür.
+
+        Workflow'un son yedeği aynı içerikteyse yeni kayıt eklenmez, mevcut kayıt
+        döner ('new' False olur). prune=True ise workflow için saklama politikası uygulanır.
+        """
+        # Ortamdan bağımsız, sabit alan listesi: hash'ler N8N_EXPORT_STRIP ayarıyla değişmemeli
+        lean, volatile = split_volatile(workflow, PER_SAVE_FIELDS)
+        content = serialize_workflow(lean)
+        timestamp = timestamp or datetime.datetime.now().strftime(TIMESTAMP_FORMAT)
+
+        with self.lock:
+            content_hash = self._write_object(content)
+            history = self.history(workflow.get("id"))
+            if history and history[0]["hash"] == content_hash:
+                return {**history[0], "new": False}
+
+            entry = {
+                "workflow_id": workflow.get("id"),
+                "name": workflow.get("name"),
+                "timestamp": timestamp,
+                "hash": content_hash,
+                "size": len(content),
+                "volatile": volatile
+            }
+            self.entries.append(entry)
+            if prune:
+                self._prune_locked(workflow_id=workflow.get("id"))
+            self._save_index()
+        return {**entry, "new": True}
+
+    def history(self, workflow_id=None):
+        """Yedek kayıtlarını en yeniden eskiye sıralı döndürür (isteğe bağlı olarak tek workflow için)"""
+        entries = [entry for entry in self.entries if workflow_id is None or entry["workflow_id"] == workflow_id]
+        return sorted(entries, key=lambda entry: entry["timestamp"], reverse=True)
+
+    def load(self, content_hash):
+        """Hash'e ait workflow içeriğini açıp döndürür"""
+        with gzip.open(self.object_path(content_hash), 'rb') as f:
+            return json.loads(f.read().decode('utf-8'))
+
+    def find(self, workflow_id, timestamp=None):
+        """Workflow'un verilen zamandaki (veya öncesindeki en yeni) yedek kaydını döndürür"""
+        for entry in self.history(workflow_id):
+            if timestamp is None or entry["timestamp"] <= timestamp:
+                return entry
+        return None
+
+    def restore(self, workflow_id, timestamp=None):
+        """Workflow'un yedeğini (varsayılan olarak en yenisini) değişken alanlarıyla birlikte döndürür; yoksa None"""
+        entry = self.find(workflow_id, timestamp)
+        return merge_volatile(self.load(entry["hash"]), entry.get("volatile")) if entry else None
+
+    def _prune_locked(self, workflow_id=None, keep_last=None, keep_daily=None, keep_weekly=None):
+        keep_last = DEFAULT_KEEP_LAST if keep_last is None else keep_last
+        keep_daily = DEFAULT_KEEP_DAILY if keep_daily is None else keep_daily
+        keep_weekly = DEFAULT_KEEP_WEEKLY if keep_weekly is None else keep_weekly
+
+        workflow_ids = {entry["workflow_id"] for entry in self.entries}
+        if workflow_id is not None:
+            workflow_ids &= {workflow_id}
+
+        removed = []
+        for current_id in workflow_ids:
+            history = self.history(current_id)
+            keep = set()
+            days = []
+            weeks = []
+            for position, entry in enumerate(history):
+                moment = datetime.datetime.strptime(entry["timestamp"], TIMESTAMP_FORMAT)
+                day = moment.date()
+                week = moment.isocalendar()[:2]
+                # En yeni N kayıt, son günlerin ve haftaların her birinin en yeni kaydı tutulur
+                if position < keep_last:
+                    keep.add(id(entry))
+                if day not in days and len(days) < keep_daily:
+                    days.append(day)
+                    keep.add(id(entry))
+                if week not in weeks and len(weeks) < keep_weekly:
+                    weeks.append(week)
+                    keep.add(id(entry))
+            removed.extend(entry for entry in history if id(entry) not in keep)
+
+        if removed:
+            removed_ids = {id(entry) for entry in removed}
+            self._entries = [entry for entry in self.entries if id(entry) not in removed_ids]
+            self._collect_garbage({entry["hash"] for entry in removed})
+        return removed
+
+    def _collect_garbage(self, candidate_hashes):
+        """Artık hiçbir kayıt tarafından kullanılmayan içerik dosyalarını siler"""
+        used = {entry["hash"] for entry in self.entries}
+        for content_hash in candidate_hashes - used:
+            try:
+                os.remove(self.object_path(content_hash))
+            except OSError:
+                pass
+
+    def prune(self, workflow_id=None, keep_last=None, keep_daily=None, keep_weekly=None):
+        """Saklama politikasını uygular (son N / günlük / haftalık), silinen kayıtları döndürür"""
+        with self.lock:
+            removed = self._prune_locked(workflow_id, keep_last, keep_daily, keep_weekly)
+            if removed:
+                self._save_index()
+        return removed
+
+    def import_legacy(self, remove=False):
+        """backups/ altındaki eski zaman damgalı tam kopyaları depoya aktarır"""
+        imported = 0
+        for file_name in sorted(os.listdir(self.backup_dir)) if os.path.isdir(self.backup_dir) else []:
+            match = LEGACY_BACKUP_PATTERN.match(file_name)
+            if not match:
+                continue
+            file_path = os.path.join(self.backup_dir, file_name)
+            try:
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    workflow = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if not isinstance(workflow, dict):
+                continue
+            self.add(workflow, timestamp=match.group(1), prune=False)
+            imported += 1
+            if remove:
+                os.remove(file_path)
+        return imported
+
+    def disk_usage(self):
+        """Depodaki içerik dosyalarının toplam boyutunu byte olarak döndürür"""
+        total = 0
+        for root, _, files in os.walk(os.path.join(self.backup_dir, OBJECTS_DIR)):
+            total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+        return total
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_backup_store():
+    """Süreç genelinde paylaşılan BackupStore örneğini döndürür"""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = BackupStore()
+    return _store
+
+
+def main(argv=None):
+    """Komut satırından yedek listeleme, geri yükleme ve temizleme"""
+    parser = argparse.ArgumentParser(description="Workflow yedek deposu")
+    parser.add_argument("--dir", dest="backup_dir", default=None, help="Yedek klasörü")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = subparsers.add_parser("list", help="Yedekleri listele")
+    list_parser.add_argument("workflow_id", nargs="?", help="Sadece bu workflow'un yedekleri")
+
+    restore_parser = subparsers.add_parser("restore", help="Yedeği geri yükle")
+    restore_parser.add_argument("workflow_id")
+    restore_parser.add_argument("--at", dest="timestamp", help="Bu zamandaki veya öncesindeki en yeni yedek (YYYYmmdd_HHMMSS)")
+    restore_parser.add_argument("--to-api", action="store_true", help="Dosya yerine doğrudan N8N'e yükle")
+
+    prune_parser = subparsers.add_parser("prune", help="Saklama politikasını uygula")
+    prune_parser.add_argument("--keep-last", type=int, default=DEFAULT_KEEP_LAST)
+    prune_parser.add_argument("--keep-daily", type=int, default=DEFAULT_KEEP_DAILY)
+    prune_parser.add_argument("--keep-weekly", type=int, default=DEFAULT_KEEP_WEEKLY)
+
+    migrate_parser = subparsers.add_parser("migrate", help="Eski zaman damgalı yedek dosyalarını depoya aktar")
+    migrate_parser.add_argument("--remove", action="store_true", help="Aktarılan eski dosyaları sil")
+
+    args = parser.parse_args(argv)
+    store = BackupStore(args.backup_dir)
+
+    if args.command == "list":
+        for entry in store.history(args.workflow_id):
+            print(f"{entry['timestamp']}  {entry['workflow_id']:<20} {entry['hash'][:12]}  {entry['name']}")
+        print(f"Disk kullanımı: {store.disk_usage() / 1024:.1f} KB")
+    elif args.command == "restore":
+        workflow = store.restore(args.workflow_id, args.timestamp)
+        if workflow is None:
+            print(f"{args.workflow_id} için yedek bulunamadı.")
+            return 1
+        if args.to_api:
+            from .upload_workflow import update_workflow
+            return 0 if update_workflow(args.workflow_id, workflow) else 1
+        file_path = os.path.join(get_workflows_dir(), workflow_file_name(workflow))
+        write_canonical_json(file_path, workflow)
+        print(f"Yedek geri yüklendi: {file_path}")
+    elif args.command == "prune":
+        removed = store.prune(keep_last=args.keep_last, keep_daily=args.keep_daily, keep_weekly=args.keep_weekly)
+        print(f"{len(removed)} yedek kaydı silindi.")
+    elif args.command == "migrate":
+        print(f"{store.import_legacy(remove=args.remove)} eski yedek aktarıldı.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
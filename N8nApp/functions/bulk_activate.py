@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Filtreyle seçilen workflow'ları eşzamanlı olarak aktif/pasif yapma ve sonucu doğrulama işlevleri
+"""
+
+import sys
+import time
+import argparse
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from .api_client import get_client, error_message, DEFAULT_POOL_SIZE
+from .workflow_cache import invalidate_workflow_list
+from .workflow_filters import select_workflows, add_filter_arguments, filter_from_args
+
+
+def _post_state(workflow_id, active):
+    """Tek bir workflow için /activate veya /deactivate çağrısı yapar"""
+    action = "activate" if active else "deactivate"
+    response = get_client().post(f"/workflows/{workflow_id}/{action}", data="")
+    response.raise_for_status()
+    return response
+
+
+def verify_states(workflow_ids, active):
+    """Listelemeden son durumu okur; istenen durumda olmayan id'leri döndürür"""
+    wanted = set(workflow_ids)
+    if not wanted:
+        return []
+    states = {summary["id"]: bool(summary.get("active"))
+              for summary in get_client().iter_workflows(summary=True)
+              if isinstance(summary, dict) and summary.get("id") in wanted}
+    return sorted(workflow_id for workflow_id in wanted if states.get(workflow_id) != active)
+
+
+def set_active_state(workflows, active, workers=DEFAULT_POOL_SIZE, dry_run=False, verify=True):
+    """
+    Workflow'ları sınırlı bir thread havuzuyla aktif/pasif yapar.
+
+    Zaten istenen durumda olanlara istek atılmaz. n8n'in reddettikleri API'nin
+    'message' alanıyla 'refused' listesinde döner; verify=True ise işlem sonrası
+    durum listelemeden okunur ve tutmayanlar 'unverified' listesine eklenir.
+    """
+    started = time.perf_counter()
+    targets = [workflow for workflow in workflows if bool(workflow.get("active")) != active]
+    report = {"changed": [], "already": len(workflows) - len(targets), "refused": [], "unverified": [],
+              "seconds": 0.0}
+
+    if dry_run:
+        report["changed"] = [(workflow["id"], workflow.get("name")) for workflow in targets]
+        report["seconds"] = time.perf_counter() - started
+        return report
+
+    def apply(workflow):
+        try:
+            _post_state(workflow["id"], active)
+            return workflow, None
+        except requests.exceptions.RequestException as e:
+            return workflow, error_message(e)
+
+    if targets:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets)))) as executor:
+            for workflow, error in executor.map(apply, targets):
+                if error:
+                    report["refused"].append((workflow["id"], workflow.get("name"), error))
+                else:
+                    report["changed"].append((workflow["id"], workflow.get("name")))
+
+    if report["changed"]:
+        invalidate_workflow_list()
+    if verify and report["changed"]:
+        names = dict(report["changed"])
+        report["unverified"] = [(workflow_id, names[workflow_id])
+                                for workflow_id in verify_states(names, active)]
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def format_activation_report(report, active, dry_run=False):
+    """Toplu aktivasyon raporunu metne çevirir"""
+    state = "aktif" if active else "pasif"
+    lines = []
+    for workflow_id, name in report["changed"]:
+        lines.append(f"  ✓ {name} ({workflow_id})")
+    for workflow_id, name, error in report["refused"]:
+        lines.append(f"  ❌ {name} ({workflow_id}): {error}")
+    for workflow_id, name in report["unverified"]:
+        lines.append(f"  ⚠️ {name} ({workflow_id}): istek başarılı ama listede hâlâ {state} değil")
+    verb = f"{state} yapılacak" if dry_run else f"{state} yapıldı"
+    lines.append(f"{len(report['changed'])} workflow {verb}, {report['already']} zaten {state}, "
+                 f"{len(report['refused'])} reddedildi, {len(report['unverified'])} doğrulanamadı "
+                 f"({report['seconds']:.2f} sn).")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Komut satırından filtreyle toplu aktif/pasif yapma"""
+    parser = argparse.ArgumentParser(description="Filtreyle seçilen workflow'ları toplu olarak aktif/pasif yap")
+    parser.add_argument("action", choices=("activate", "deactivate"))
+    parser.add_argument("--all", action="store_true", help="Filtre olmadan tüm workflow'lar")
+    parser.add_argument("--workers", type=int, default=DEFAULT_POOL_SIZE, help="Eşzamanlı işçi sayısı")
+    parser.add_argument("--dry-run", action="store_true", help="Sadece seçilenleri göster")
+    parser.add_argument("--no-verify", action="store_true", help="İşlem sonrası durumu listelemeden doğrulama")
+    parser.add_argument("--yes", "-y", action="store_true", help="Onay sormadan uygula")
+    add_filter_arguments(parser)
+    args = parser.parse_args(argv)
+
+    workflow_filter = filter_from_args(args)
+    if workflow_filter.is_empty() and not args.all:
+        parser.error("en az bir filtre (ör. --trigger webhook, --tag prod) veya --all gerekli")
+    active = args.action == "activate"
+
+    try:
+        workflows = select_workflows(workflow_filter)
+        print(f"{len(workflows)} workflow seçildi ({workflow_filter.describe()}).")
+        if not workflows:
+            return 0
+        if not args.dry_run and not args.yes:
+            for workflow in workflows:
+                print(f"  - {workflow.get('name')} ({workflow['id']})")
+            if input(f"\nBu workflow'lar {'aktif' if active else 'pasif'} yapılsın mı? (e/h): ").lower() != 'e':
+                print("İşlem iptal edildi.")
+                return 0
+        report = set_active_state(workflows, active, workers=args.workers, dry_run=args.dry_run,
+                                  verify=not args.no_verify)
+    except requests.exceptions.RequestException as e:
+        print(f"Workflow'lar getirilirken hata oluştu: {error_message(e)}")
+        return 1
+    print(format_activation_report(report, active, args.dry_run))
+    return 0 if not report["refused"] and not report["unverified"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
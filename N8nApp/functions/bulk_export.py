@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Tüm workflow'ları eşzamanlı olarak indirip dosyalara kaydetme işlevleri
+"""
+
+import os
+import time
+import argparse
+import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from .api_client import get_client, DEFAULT_POOL_SIZE
+from .utils import get_workflows_dir, workflow_file_name
+from .workflow_projection import write_workflow_file
+
+# Eşzamanlı indirme/yazma işçi sayısı (bağlantı havuzunu aşmamalı)
+DEFAULT_EXPORT_WORKERS = DEFAULT_POOL_SIZE
+
+
+def export_workflow(workflow_id, workflows_dir):
+    """Tek bir workflow'un tam detayını getirir ve dışa aktarım moduna göre atomik olarak dosyaya yazar"""
+    response = get_client().get(f"/workflows/{workflow_id}?excludePinnedData=true")
+    response.raise_for_status()
+    workflow = response.json()
+
+    file_path = os.path.join(workflows_dir, workflow_file_name(workflow))
+    written, _ = write_workflow_file(file_path, workflow)
+    return file_path, written
+
+
+def export_all_workflows(workflows_dir=None, workers=DEFAULT_EXPORT_WORKERS):
+    """
+    Tüm workflow'ları sormadan, sınırlı bir thread havuzuyla indirip kaydeder.
+
+    Listeleme sayfaları geldikçe detay istekleri kuyruğa alınır; dosyalar kanonik
+    biçimde yazılır ve içeriği değişmeyenlere dokunulmaz. Sonunda workflow/s ve
+    MB/s cinsinden verim raporlanır.
+    """
+    workflows_dir = workflows_dir or get_workflows_dir()
+    if not os.path.exists(workflows_dir):
+        os.makedirs(workflows_dir)
+    print(f"Dosyalar {workflows_dir} klasörüne kaydedilecek ({workers} işçi)...")
+
+    started = time.perf_counter()
+    total_bytes = 0
+    saved = []
+    unchanged = []
+    failed = []
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for summary in get_client().iter_workflows(summary=True, prefetch=True):
+                if isinstance(summary, dict) and summary.get("id"):
+                    future = executor.submit(export_workflow, summary["id"], workflows_dir)
+                    futures[future] = summary
+
+            for future in as_completed(futures):
+                summary = futures[future]
+                try:
+                    file_path, written = future.result()
+                    total_bytes += written
+                    saved.append(file_path)
+                    if not written:
+                        unchanged.append(file_path)
+                except (requests.exceptions.RequestException, OSError, KeyError, ValueError) as e:
+                    failed.append((summary, str(e)))
+                    print(f"  ❌ Workflow {summary['id']} kaydedilemedi: {str(e)}")
+
+    except requests.exceptions.RequestException as e:
+        print(f"Workflow'ları getirirken hata oluştu: {str(e)}")
+        return None
+
+    elapsed = max(time.perf_counter() - started, 1e-9)
+    print(f"\n{len(saved)} workflow kaydedildi ({len(unchanged)} dosya değişmediği için yazılmadı), "
+          f"{len(failed)} hata.")
+    print(f"Süre: {elapsed:.2f} sn - {len(saved) / elapsed:.1f} workflow/s - "
+          f"{total_bytes / (1024 * 1024) / elapsed:.2f} MB/s")
+
+    return {
+        "saved": saved,
+        "unchanged": unchanged,
+        "failed": failed,
+        "bytes": total_bytes,
+        "seconds": elapsed
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tüm workflow'ları eşzamanlı olarak dışa aktar")
+    parser.add_argument("--workers", type=int, default=DEFAULT_EXPORT_WORKERS, help="Eşzamanlı işçi sayısı")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="Hedef klasör")
+    args = parser.parse_args()
+    export_all_workflows(args.workflows_dir, workers=args.workers)
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Sadece değişen workflow dosyalarını eşzamanlı olarak N8N'e yükleme işlevleri
+"""
+
+import os
+import json
+import time
+import hashlib
+import argparse
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from .api_client import get_client, error_message, DEFAULT_POOL_SIZE, DEFAULT_MAX_RETRIES
+from .utils import get_workflows_dir, atomic_write_json
+from .upload_workflow import get_workflow_files, read_workflow_json, upload_payload
+from .workflow_validator import validate_files
+from .workflow_cache import invalidate_workflow_list
+
+# Uzak yükleme hash'lerinin saklandığı gizli dosya (workflows klasöründe)
+UPLOAD_CACHE_FILE = ".upload-cache.json"
+
+# Eşzamanlı yükleme işçi sayısı (bağlantı havuzunu aşmamalı)
+DEFAULT_UPLOAD_WORKERS = DEFAULT_POOL_SIZE
+
+
+def payload_hash(payload):
+    """Yükleme gövdesinin (upload_payload) kanonik SHA-256 hash'ini döndürür"""
+    text = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class UploadCache:
+    """
+    Workflow id'sine göre uzaktaki yükleme gövdesinin hash'ini ve sürümünü tutar.
+
+    Uzak sürüm (versionId, yoksa updatedAt) değişmediği sürece kayıtlı hash
+    geçerlidir; böylece uzak içerik yeniden indirilmeden karşılaştırılabilir.
+    """
+
+    def __init__(self, workflows_dir):
+        self.path = os.path.join(workflows_dir, UPLOAD_CACHE_FILE)
+        self.entries = {}
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    @classmethod
+    def load(cls, workflows_dir):
+        """Önbelleği diskten yükler; yoksa veya bozuksa boş döndürür"""
+        cache = cls(workflows_dir)
+        try:
+            with open(cache.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                cache.entries = data
+        except (OSError, ValueError):
+            pass
+        return cache
+
+    def save(self):
+        """Değişiklik varsa önbelleği atomik olarak yazar"""
+        if self.dirty:
+            atomic_write_json(self.path, self.entries)
+            self.dirty = False
+
+    def remote_hash(self, summary):
+        """Uzak sürüm kayıtlıyla aynıysa bilinen hash'i, değilse None döndürür"""
+        entry = self.entries.get(summary.get("id"))
+        if not entry:
+            return None
+        if summary.get("versionId"):
+            return entry["hash"] if entry.get("versionId") == summary["versionId"] else None
+        if summary.get("updatedAt"):
+            return entry["hash"] if entry.get("updatedAt") == summary["updatedAt"] else None
+        return None
+
+    def record(self, workflow, hash_value):
+        """Uzak workflow'un sürümünü ve yükleme gövdesi hash'ini kaydeder"""
+        with self.lock:
+            if not workflow.get("versionId") and not workflow.get("updatedAt"):
+                # Sürüm bilgisi yoksa kayıt doğrulanamaz, eski kaydı da bırakma
+                if self.entries.pop(workflow["id"], None) is not None:
+                    self.dirty = True
+                return
+            self.entries[workflow["id"]] = {
+                "hash": hash_value,
+                "versionId": workflow.get("versionId"),
+                "updatedAt": workflow.get("updatedAt")
+            }
+            self.dirty = True
+
+
+class AdaptiveLimiter:
+    """
+    429 yanıtlarına göre eşzamanlılığı ayarlayan sınırlayıcı (AIMD).
+
+    Rate limit alındığında izin verilen eşzamanlı istek sayısı yarıya iner ve
+    tüm işçiler bekleme süresi dolana kadar durur; başarılı isteklerle sınır
+    tekrar birer birer başlangıç değerine çıkar.
+    """
+
+    def __init__(self, limit):
+        self.max_limit = max(1, limit)
+        self.limit = self.max_limit
+        self.active = 0
+        self.resume_at = 0.0
+        self.condition = threading.Condition()
+
+    def acquire(self):
+        with self.condition:
+            while True:
+                wait = self.resume_at - time.monotonic()
+                if wait <= 0 and self.active < self.limit:
+                    self.active += 1
+                    return
+                self.condition.wait(timeout=wait if wait > 0 else None)
+
+    def release(self, throttled=False, delay=0.0):
+        with self.condition:
+            self.active -= 1
+            if throttled:
+                self.limit = max(1, self.limit // 2)
+                self.resume_at = max(self.resume_at, time.monotonic() + delay)
+            elif self.limit < self.max_limit:
+                self.limit += 1
+            self.condition.notify_all()
+
+
+def put_workflow(workflow_id, payload, limiter, max_attempts=DEFAULT_MAX_RETRIES + 1):
+    """
+    Workflow'u PUT ile yükler; 429'da sınırlayıcıyı daraltıp tekrar dener.
+
+    İstemcinin kendi tekrar denemesi kapatılır ki rate limit tüm işçilere yansısın.
+    Güncellenmiş workflow'u (yanıt gövdesi) döndürür.
+    """
+    client = get_client()
+    for attempt in range(max_attempts):
+        limiter.acquire()
+        throttled = False
+        delay = 0.0
+        try:
+            response = client.put(f"/workflows/{workflow_id}", json=payload, max_retries=0)
+            if response.status_code == 429 and attempt < max_attempts - 1:
+                throttled = True
+                delay = client.backoff_delay(attempt, client.retry_after(response))
+                continue
+            response.raise_for_status()
+            return response.json()
+        finally:
+            limiter.release(throttled, delay)
+
+
+def bulk_upload_workflows(workflows_dir=None, workers=DEFAULT_UPLOAD_WORKERS, force=False):
+    """
+    ID'si olan workflow dosyalarından sadece uzaktakinden farklı olanları eşzamanlı yükler.
+
+    Her dosyanın yükleme gövdesi hash'lenir; uzak sürüm önbellekteki sürümle
+    aynıysa uzak hash önbellekten, değilse workflow indirilerek hesaplanır.
+    force=True ise karşılaştırma yapılmadan hepsi yüklenir. ID'si olmayan
+    dosyalar 'without_id' listesinde döner. Yerel doğrulamadan geçemeyen
+    dosyalar hiçbir API isteği yapılmadan 'failed' listesine eklenir.
+    """
+    if workflows_dir is None:
+        listing = get_workflow_files()
+        if not listing:
+            return None
+        workflow_files, workflows_dir = listing
+    else:
+        workflow_files = [f for f in os.listdir(workflows_dir) if f.endswith('.json') and not f.startswith('.')]
+
+    started = time.perf_counter()
+    client = get_client()
+    cache = UploadCache.load(workflows_dir)
+
+    local = []
+    without_id = []
+    failed = []
+    validation = validate_files(os.path.join(workflows_dir, file) for file in sorted(workflow_files))
+    for file in sorted(workflow_files):
+        file_path = os.path.join(workflows_dir, file)
+        errors = [issue for issue in validation[file_path] if issue["level"] == "error"]
+        if errors:
+            failed.append((file, "doğrulama: " + "; ".join(f"{issue['path'] or '/'}: {issue['message']}"
+                                                           for issue in errors)))
+            continue
+        workflow_data = read_workflow_json(file_path)
+        if not workflow_data:
+            failed.append((file, "okunamadı"))
+        elif not workflow_data.get("id"):
+            without_id.append((file, workflow_data))
+        else:
+            payload = upload_payload(workflow_data)
+            local.append({"file": file, "id": workflow_data["id"], "payload": payload,
+                          "hash": payload_hash(payload)})
+
+    try:
+        summaries = {summary["id"]: summary for summary in client.iter_workflows(summary=True)
+                     if isinstance(summary, dict) and summary.get("id")}
+    except requests.exceptions.RequestException as e:
+        print(f"N8N API'dan workflow listesi alınırken hata oluştu: {error_message(e)}")
+        return None
+
+    # Uzak hash'i bilinmeyenlerin içeriğini indirip karşılaştır
+    to_upload = []
+    unknown = []
+    skipped = 0
+    for item in local:
+        summary = summaries.get(item["id"])
+        if summary is None:
+            failed.append((item["file"], f"N8N'de {item['id']} ID'li workflow bulunamadı"))
+            continue
+        remote_hash = None if force else cache.remote_hash(summary)
+        if force or (remote_hash is not None and remote_hash != item["hash"]):
+            to_upload.append(item)
+        elif remote_hash == item["hash"]:
+            skipped += 1
+        else:
+            unknown.append(item)
+
+    if unknown:
+        bodies, errors = client.fetch_workflows([item["id"] for item in unknown], workers=workers)
+        for item in unknown:
+            if item["id"] in errors:
+                failed.append((item["file"], errors[item["id"]]))
+                continue
+            remote = bodies[item["id"]]
+            remote_hash = payload_hash(upload_payload(remote))
+            cache.record(remote, remote_hash)
+            if remote_hash == item["hash"]:
+                skipped += 1
+            else:
+                to_upload.append(item)
+
+    uploaded = []
+    limiter = AdaptiveLimiter(workers)
+
+    def upload(item):
+        upload_started = time.perf_counter()
+        try:
+            updated = put_workflow(item["id"], item["payload"], limiter)
+            elapsed = time.perf_counter() - upload_started
+            if isinstance(updated, dict) and updated.get("id"):
+                cache.record(updated, item["hash"])
+            print(f"  ✓ {item['file']} ({elapsed:.2f} sn)")
+            return item["file"], elapsed, None
+        except requests.exceptions.RequestException as e:
+            elapsed = time.perf_counter() - upload_started
+            print(f"  ❌ {item['file']} ({elapsed:.2f} sn): {error_message(e)}")
+            return item["file"], elapsed, error_message(e)
+
+    if to_upload:
+        print(f"\n{len(to_upload)} değişmiş workflow yükleniyor ({workers} işçi)...")
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(to_upload)))) as executor:
+            for file, elapsed, error in executor.map(upload, to_upload):
+                if error:
+                    failed.append((file, error))
+                else:
+                    uploaded.append((file, elapsed))
+
+    cache.save()
+    if uploaded:
+        invalidate_workflow_list()
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{len(uploaded)} workflow yüklendi, {skipped} değişmediği için atlandı, {len(failed)} hata.")
+    if uploaded:
+        slowest = max(uploaded, key=lambda entry: entry[1])
+        average = sum(entry[1] for entry in uploaded) / len(uploaded)
+        print(f"Ortalama yükleme süresi: {average:.2f} sn - en yavaş: {slowest[0]} ({slowest[1]:.2f} sn)")
+    print(f"Toplam süre: {elapsed:.2f} sn")
+
+    return {
+        "uploaded": uploaded,
+        "skipped": skipped,
+        "failed": failed,
+        "without_id": without_id,
+        "seconds": elapsed
+    }
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Değişen workflow dosyalarını eşzamanlı olarak N8N'e yükle")
+    parser.add_argument("--workers", type=int, default=DEFAULT_UPLOAD_WORKERS, help="Eşzamanlı işçi sayısı")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="Kaynak klasör")
+    parser.add_argument("--force", action="store_true", help="Karşılaştırmadan tüm dosyaları yükle")
+    args = parser.parse_args()
+    bulk_upload_workflows(args.workflows_dir or get_workflows_dir(), workers=args.workers, force=args.force)
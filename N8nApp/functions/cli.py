@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Etkileşimsiz, alt komutlu komut satırı arayüzü (cron/CI için)
+
+Her işlem soru sormadan bayraklarla çalışır. Sonuçlar stdout'a satır başına bir
+JSON kaydı (NDJSON) olarak akar; ilerleme ve özet mesajları stderr'e yazılır.
+
+    python -m functions.cli list --active --fields id,name | jq -r .id
+    python -m functions.cli get <id> --save
+    python -m functions.cli deactivate --trigger webhook --dry-run
+    python -m functions.cli sync --prefer file
+"""
+
+import os
+import sys
+import json
+import argparse
+from contextlib import redirect_stdout
+from .utils import set_profile, get_workflows_dir, workflow_file_name
+
+# Liste çıktısında bu kadar kayıtta bir (bir API sayfası) stdout boşaltılır
+LIST_FLUSH_EVERY = 100
+
+
+class NdjsonWriter:
+    """
+    Kayıtları tek satırlık, girintisiz JSON olarak yazar.
+
+    Kayıtlar biriktirilmez; her flush_every kayıtta bir akış boşaltılır, böylece
+    uzun bir liste ilk sayfadan itibaren okuyan araca ulaşır.
+    """
+
+    def __init__(self, stream=None, flush_every=1):
+        self.stream = stream or sys.stdout
+        self.flush_every = max(1, flush_every)
+        self.count = 0
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str) + "\n")
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self.stream.flush()
+
+    def flush(self):
+        self.stream.flush()
+
+
+def _status(message):
+    """İnsan için özet mesajı (stderr)"""
+    print(message, file=sys.stderr)
+
+
+def _project(workflow, fields):
+    """Kaydı sadece istenen alanlara indirger"""
+    return {field: workflow.get(field) for field in fields} if fields else workflow
+
+
+def _read_file(file_path):
+    """Workflow dosyasını okur; (veri, hata) döndürür"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return json.load(f), None
+    except (OSError, ValueError) as e:
+        return None, str(e)
+
+
+def _filter(args):
+    """Filtre bayraklarından (ve konumsal id'lerden) WorkflowFilter oluşturur"""
+    from .workflow_filters import filter_from_args
+    workflow_filter = filter_from_args(args)
+    workflow_filter.ids = (workflow_filter.ids or set()) | set(getattr(args, "workflow_ids", None) or []) or None
+    return workflow_filter
+
+
+def cmd_list(args, out):
+    """Filtreye uyan workflow'ları sayfa sayfa akıtır (liste bellekte tutulmaz)"""
+    from .api_client import get_client, workflow_summary
+    from .workflow_filters import filter_from_args
+    workflow_filter = filter_from_args(args)
+    fields = [field.strip() for field in args.fields.split(",") if field.strip()] if args.fields else None
+    out.flush_every = LIST_FLUSH_EVERY
+
+    emitted = 0
+    for workflow in get_client().iter_workflows(active=workflow_filter.active, prefetch=True):
+        if not workflow_filter.matches(workflow):
+            continue
+        record = workflow if args.full or fields else workflow_summary(workflow)
+        out.write(_project(record, fields))
+        emitted += 1
+        if args.limit and emitted >= args.limit:
+            break
+    _status(f"{emitted} workflow listelendi.")
+    return 0
+
+
+def cmd_get(args, out):
+    """Workflow'ları eşzamanlı getirir; --save ile workflows klasörüne yazar"""
+    from .api_client import get_client
+    from .workflow_projection import write_workflow_file
+    workflows, errors = get_client().fetch_workflows(args.workflow_ids, workers=args.workers)
+    for workflow_id in dict.fromkeys(args.workflow_ids):
+        if workflow_id in errors:
+            out.write({"id": workflow_id, "ok": False, "error": errors[workflow_id]})
+            continue
+        workflow = workflows[workflow_id]
+        if not args.save:
+            out.write(workflow)
+            continue
+        workflows_dir = args.workflows_dir or get_workflows_dir()
+        os.makedirs(workflows_dir, exist_ok=True)
+        file_path = os.path.join(workflows_dir, workflow_file_name(workflow))
+        written, _ = write_workflow_file(file_path, workflow, args.mode)
+        out.write({"id": workflow_id, "name": workflow.get("name"), "ok": True, "file": file_path,
+                   "written": written})
+    return 1 if errors else 0
+
+
+def cmd_create(args, out):
+    """Dosyalardaki workflow'ları N8N'de oluşturur; yeni id dosyaya yazılır"""
+    from .upload_workflow import create_new_workflow
+    if args.name and len(args.files) > 1:
+        _status("--name sadece tek dosyayla kullanılabilir")
+        return 2
+    failed = 0
+    for file_path in args.files:
+        data, error = _read_file(file_path)
+        name = args.name or (data or {}).get("name") or os.path.splitext(os.path.basename(file_path))[0]
+        ok = bool(data) and create_new_workflow(name, data, file_path)
+        new_id = (_read_file(file_path)[0] or {}).get("id") if ok else None
+        record = {"file": file_path, "name": name, "ok": ok, "id": new_id}
+        if error:
+            record["error"] = error
+        out.write(record)
+        failed += not ok
+    return 1 if failed else 0
+
+
+def cmd_update(args, out):
+    """Dosyalardaki workflow'ları içlerindeki id ile (veya --id) günceller"""
+    from .upload_workflow import update_workflow
+    if args.workflow_id and len(args.files) > 1:
+        _status("--id sadece tek dosyayla kullanılabilir")
+        return 2
+    failed = 0
+    for file_path in args.files:
+        data, error = _read_file(file_path)
+        workflow_id = args.workflow_id or (data or {}).get("id")
+        if data and not workflow_id:
+            error = "dosyada workflow id'si yok"
+        ok = not error and update_workflow(workflow_id, data, backup_api_workflow=args.backup)
+        record = {"file": file_path, "id": workflow_id, "ok": bool(ok)}
+        if error:
+            record["error"] = error
+        out.write(record)
+        failed += not ok
+    return 1 if failed else 0
+
+
+def cmd_delete(args, out):
+    """Verilen id'leri siler (--yes zorunlu)"""
+    import requests
+    from .api_client import get_client, error_message
+    from .workflow_cache import invalidate_workflow_list
+    if not args.yes:
+        _status("Silme geri alınamaz; onaylamak için --yes verin")
+        return 2
+    failed = 0
+    for workflow_id in dict.fromkeys(args.workflow_ids):
+        try:
+            response = get_client().delete(f"/workflows/{workflow_id}")
+            response.raise_for_status()
+            out.write({"id": workflow_id, "ok": True})
+        except requests.exceptions.RequestException as e:
+            out.write({"id": workflow_id, "ok": False, "error": error_message(e)})
+            failed += 1
+    if failed < len(set(args.workflow_ids)):
+        invalidate_workflow_list()
+    return 1 if failed else 0
+
+
+def cmd_set_active(args, out):
+    """Seçilen workflow'ları aktif/pasif yapar; her workflow için bir kayıt yazar"""
+    from .bulk_activate import set_active_state
+    from .workflow_filters import select_workflows
+    active = args.command == "activate"
+    workflow_filter = _filter(args)
+    if workflow_filter.is_empty() and not args.all:
+        _status("Tüm workflow'ları etkilemek için --all verin ya da bir filtre/id belirtin")
+        return 2
+    workflows = select_workflows(workflow_filter)
+    report = set_active_state(workflows, active, workers=args.workers, dry_run=args.dry_run,
+                              verify=not args.no_verify)
+
+    unverified = {workflow_id for workflow_id, _ in report["unverified"]}
+    for workflow_id, name in report["changed"]:
+        status = "planned" if args.dry_run else ("unverified" if workflow_id in unverified else "changed")
+        out.write({"id": workflow_id, "name": name, "active": active, "status": status})
+    for workflow_id, name, error in report["refused"]:
+        out.write({"id": workflow_id, "name": name, "status": "refused", "error": error})
+    handled = {workflow_id for workflow_id, _ in report["changed"]} | {entry[0] for entry in report["refused"]}
+    for workflow in workflows:
+        if workflow["id"] not in handled:
+            out.write({"id": workflow["id"], "name": workflow.get("name"), "active": active, "status": "unchanged"})
+    _status(f"{len(report['changed'])} değişti, {report['already']} zaten {'aktif' if active else 'pasif'}, "
+            f"{len(report['refused'])} reddedildi ({report['seconds']:.2f} sn).")
+    return 1 if report["refused"] or report["unverified"] else 0
+
+
+def cmd_upload(args, out):
+    """Sadece değişen dosyaları yükler; id'siz dosyalar --create-missing ile oluşturulur"""
+    from .bulk_upload import bulk_upload_workflows
+    from .upload_workflow import create_new_workflow
+    workflows_dir = args.workflows_dir or get_workflows_dir()
+    report = bulk_upload_workflows(workflows_dir, workers=args.workers, force=args.force)
+    if report is None:
+        return 1
+
+    failed = len(report["failed"])
+    for file_name, seconds in report["uploaded"]:
+        out.write({"file": file_name, "status": "uploaded", "seconds": round(seconds, 3)})
+    for file_name, error in report["failed"]:
+        out.write({"file": file_name, "status": "failed", "error": error})
+    for file_name, data in report["without_id"]:
+        if not args.create_missing:
+            out.write({"file": file_name, "status": "no_id"})
+            continue
+        file_path = os.path.join(workflows_dir, file_name)
+        name = data.get("name") or os.path.splitext(file_name)[0]
+        if create_new_workflow(name, data, file_path):
+            out.write({"file": file_name, "status": "created", "id": (_read_file(file_path)[0] or {}).get("id")})
+        else:
+            out.write({"file": file_name, "status": "failed", "error": "oluşturulamadı"})
+            failed += 1
+    return 1 if failed else 0
+
+
+def cmd_sync(args, out):
+    """Senkron planını çıkarır ve (--dry-run değilse) uygular; her adım için bir kayıt yazar"""
+    from .compare_workflows import collect_sync_state
+    from .sync_plan import build_sync_plan, apply_sync_plan
+
+    def action_record(action):
+        return {key: value for key, value in action.items() if key not in ("diff", "payload")}
+
+    state = collect_sync_state()
+    if not state:
+        return 1
+    plan = build_sync_plan(state, prefer=args.prefer)
+
+    if args.dry_run:
+        for action in plan["actions"]:
+            out.write({**action_record(action), "status": "planned"})
+        return 0
+
+    summary = apply_sync_plan(plan, manifest=state["manifest"], workers=args.workers, backup_api=args.backup)
+    for result in summary["results"]:
+        record = {**action_record(result["action"]), "status": "ok" if result["ok"] else "failed",
+                  "seconds": round(result["seconds"], 3)}
+        if result["error"]:
+            record["error"] = result["error"]
+        out.write(record)
+    for action in plan["actions"]:
+        if action["action"] == "conflict":
+            out.write({**action_record(action), "status": "skipped"})
+    return 1 if summary["failed"] else 0
+
+
+def cmd_tags(args, out):
+    """İşlem verilmezse etiket kataloğunu, verilirse filtreyle seçilenlere toplu etiketlemeyi yazar"""
+    from .tag_engine import get_tag_catalog, apply_tag_operation
+    from .workflow_filters import select_workflows, split_names
+    add, remove = split_names(args.add), split_names(args.remove)
+    set_tags = split_names(args.set_tags) if args.set_tags is not None else None
+
+    if not add and not remove and set_tags is None:
+        for tag_id, name in sorted(get_tag_catalog().tags().items(), key=lambda item: item[1].lower()):
+            out.write({"id": tag_id, "name": name})
+        return 0
+
+    workflow_filter = _filter(args)
+    if workflow_filter.is_empty() and not args.all:
+        _status("Tüm workflow'ları etkilemek için --all verin ya da bir filtre/id belirtin")
+        return 2
+    workflows = select_workflows(workflow_filter)
+    report = apply_tag_operation(workflows, add, remove, set_tags, create_missing=not args.no_create,
+                                 workers=args.workers, dry_run=args.dry_run)
+    for tag in report["new_tags"]:
+        out.write({"tag": tag, "status": "new_tag"})
+    for tag in report["missing_tags"]:
+        out.write({"tag": tag, "status": "missing_tag"})
+    for workflow_id, name, tags in report["changed"]:
+        out.write({"id": workflow_id, "name": name, "tags": tags, "status": "planned" if args.dry_run else "changed"})
+    for workflow_id, name, error in report["failed"]:
+        out.write({"id": workflow_id, "name": name, "status": "failed", "error": error})
+    _status(f"{len(report['changed'])} workflow {'değişecek' if args.dry_run else 'güncellendi'}, "
+            f"{report['unchanged']} zaten güncel, {len(report['failed'])} hata ({report['seconds']:.2f} sn).")
+    return 1 if report["failed"] or report["missing_tags"] else 0
+
+
+COMMANDS = {
+    "list": cmd_list,
+    "get": cmd_get,
+    "create": cmd_create,
+    "update": cmd_update,
+    "delete": cmd_delete,
+    "activate": cmd_set_active,
+    "deactivate": cmd_set_active,
+    "upload": cmd_upload,
+    "sync": cmd_sync,
+    "compare": cmd_sync,
+    "tags": cmd_tags,
+}
+
+
+def build_parser():
+    """Alt komutlu argparse parser'ını oluşturur (filtre ve havuz modülleri burada yüklenir)"""
+    from .api_client import DEFAULT_POOL_SIZE
+    from .sync_plan import PREFER_CHOICES
+    from .workflow_filters import add_filter_arguments
+    from .workflow_projection import EXPORT_MODES
+
+    parser = argparse.ArgumentParser(prog="n8n-cli", description="N8N workflow işlemleri (etkileşimsiz, NDJSON çıktı)")
+    parser.add_argument("--profile", help="Kullanılacak .env.<profil> dosyası")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    def add_workers(sub):
+        sub.add_argument("--workers", type=int, default=DEFAULT_POOL_SIZE, help="Eşzamanlı işçi sayısı")
+
+    sub = subparsers.add_parser("list", help="Workflow'ları listele")
+    sub.add_argument("--full", action="store_true", help="Özet yerine tam içeriği yaz")
+    sub.add_argument("--fields", help="Sadece bu alanları yaz (virgülle ayrılmış)")
+    sub.add_argument("--limit", type=int, default=0, help="En fazla bu kadar kayıt yaz")
+    add_filter_arguments(sub)
+
+    sub = subparsers.add_parser("get", help="Workflow içeriklerini getir")
+    sub.add_argument("workflow_ids", nargs="+", metavar="ID")
+    sub.add_argument("--save", action="store_true", help="workflows klasörüne kaydet, sadece dosya yolunu yaz")
+    sub.add_argument("--dir", dest="workflows_dir", default=None, help="Kayıt klasörü")
+    sub.add_argument("--mode", choices=EXPORT_MODES, default=None, help="Dışa aktarım modu")
+    add_workers(sub)
+
+    sub = subparsers.add_parser("create", help="Dosyalardan yeni workflow oluştur")
+    sub.add_argument("files", nargs="+", metavar="DOSYA")
+    sub.add_argument("--name", help="Workflow ismi (tek dosya için)")
+
+    sub = subparsers.add_parser("update", help="Dosyalardaki workflow'ları güncelle")
+    sub.add_argument("files", nargs="+", metavar="DOSYA")
+    sub.add_argument("--id", dest="workflow_id", help="Güncellenecek workflow id (tek dosya için)")
+    sub.add_argument("--backup", action="store_true", help="Güncellemeden önce API'deki sürümü yedekle")
+
+    sub = subparsers.add_parser("delete", help="Workflow'ları sil")
+    sub.add_argument("workflow_ids", nargs="+", metavar="ID")
+    sub.add_argument("--yes", action="store_true", help="Silmeyi onayla")
+
+    for name, label in (("activate", "aktif"), ("deactivate", "pasif")):
+        sub = subparsers.add_parser(name, help=f"Seçilen workflow'ları {label} yap")
+        sub.add_argument("workflow_ids", nargs="*", metavar="ID")
+        sub.add_argument("--all", action="store_true", help="Filtre olmadan tüm workflow'lar")
+        sub.add_argument("--dry-run", action="store_true", help="Sadece neyin değişeceğini yaz")
+        sub.add_argument("--no-verify", action="store_true", help="Son durumu listelemeden doğrulama")
+        add_workers(sub)
+        add_filter_arguments(sub)
+
+    sub = subparsers.add_parser("upload", help="Değişen workflow dosyalarını yükle")
+    sub.add_argument("--dir", dest="workflows_dir", default=None, help="Kaynak klasör")
+    sub.add_argument("--force", action="store_true", help="Karşılaştırmadan tüm dosyaları yükle")
+    sub.add_argument("--create-missing", action="store_true", help="ID'si olmayan dosyaları yeni workflow olarak oluştur")
+    add_workers(sub)
+
+    sub = subparsers.add_parser("sync", aliases=["compare"], help="Dosya ve API'yi planlı senkronize et")
+    sub.add_argument("--dry-run", action="store_true", help="Planı yaz, uygulama")
+    sub.add_argument("--prefer", choices=PREFER_CHOICES, help="Otomatik birleştirilemeyen farklarda kullanılacak taraf")
+    sub.add_argument("--backup", action="store_true", help="API'yi güncellemeden önce mevcut sürümü yedekle")
+    add_workers(sub)
+
+    sub = subparsers.add_parser("tags", help="Etiket kataloğu ve toplu etiketleme")
+    sub.add_argument("--add", default="", help="Eklenecek etiketler (virgülle ayrılmış)")
+    sub.add_argument("--remove", default="", help="Çıkarılacak etiketler (virgülle ayrılmış)")
+    sub.add_argument("--set", dest="set_tags", default=None, help="Etiket listesini tamamen bununla değiştir")
+    sub.add_argument("--no-create", action="store_true", help="Eksik etiketleri oluşturma")
+    sub.add_argument("--all", action="store_true", help="Filtre olmadan tüm workflow'lar")
+    sub.add_argument("--dry-run", action="store_true", help="Sadece neyin değişeceğini yaz")
+    add_workers(sub)
+    add_filter_arguments(sub)
+    return parser
+
+
+def main(argv=None, stdout=None):
+    """
+    Komutu çalıştırır ve çıkış kodunu döndürür: 0 başarılı, 1 hata, 2 hatalı kullanım.
+
+    Komut modüllerinin print() çıktıları stderr'e yönlendirilir; stdout'a sadece
+    NDJSON kayıtları yazılır.
+    """
+    # Profil, modül seviyesindeki ayarlar (havuz boyutu vb.) okunmadan önce seçilmeli
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument("--profile")
+    known, _ = pre_parser.parse_known_args(argv)
+    if known.profile:
+        set_profile(known.profile)
+
+    args = build_parser().parse_args(argv)
+    import requests
+    from .api_client import error_message
+    out = NdjsonWriter(stdout or sys.stdout)
+    try:
+        with redirect_stdout(sys.stderr):
+            return COMMANDS[args.command](args, out)
+    except requests.exceptions.RequestException as e:
+        _status(f"API isteği başarısız: {error_message(e)}")
+        return 1
+    except BrokenPipeError:
+        # Okuyan araç (ör. head) erken kapandı; kalan çıktı sessizce atılır
+        try:
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        except (OSError, ValueError, AttributeError):
+            pass
+        return 0
+    finally:
+        try:
+            out.flush()
+        except (BrokenPipeError, ValueError):
+            pass
+
+
+if __name__ == "__main__":
+    sys.exit(main())
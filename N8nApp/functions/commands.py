@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Menü komutlarının kaydı; komut modülleri (ve HTTP istemcisi) ilk kullanımda yüklenir
+"""
+
+import importlib
+
+
+class Command:
+    """
+    Menü seçeneği: etiket ve 'modül:fonksiyon' hedefi.
+
+    Modül sadece komut çalıştırılırken içe aktarılır; menüyü göstermek için
+    requests veya komut modüllerinin hiçbiri yüklenmez.
+    """
+
+    def __init__(self, key, label, target):
+        self.key = key
+        self.label = label
+        self.target = target
+
+    def load(self):
+        """Hedef fonksiyonu içe aktarıp döndürür (modül sys.modules'te önbelleklenir)"""
+        module_name, function_name = self.target.split(":")
+        return getattr(importlib.import_module(module_name), function_name)
+
+    def __call__(self, *args, **kwargs):
+        return self.load()(*args, **kwargs)
+
+
+def build_menu(entries):
+    """(etiket, hedef) listesinden 1'den numaralanmış {tuş: Command} sözlüğü oluşturur"""
+    return {str(index): Command(str(index), label, target) for index, (label, target) in enumerate(entries, 1)}
+
+
+# n8nApp.py ana menüsü
+MAIN_MENU = build_menu([
+    ("Tüm workflow'ları listele (ID ve isim)", "functions.list_workflows:list_workflows"),
+    ("Workflow detayını ID ile getir ve JSON olarak kaydet", "functions.get_workflow_details:get_workflow_details"),
+    ("Yeni workflow oluştur", "functions.create_workflow:create_workflow"),
+    ("Var olan workflow'u güncelle", "functions.update_workflow:update_workflow"),
+    ("Workflow sil (ID ile)", "functions.delete_workflow:delete_workflow"),
+    ("Workflow'u aktif et", "functions.activate_workflow:activate_workflow"),
+    ("Workflow'u pasif yap", "functions.activate_workflow:deactivate_workflow"),
+    ("Tüm workflow'ları N8N'e upload et", "functions.upload_workflow:upload_all_workflows"),
+    ("Seçili workflow'u N8N'e upload et", "functions.upload_workflow:upload_selected_workflow"),
+    ("Dosya ve API Karşılaştır & Senkronize Et", "functions.compare_workflows:compare_workflows"),
+    ("Workflow bağlantı grafiklerini analiz et", "functions.workflow_graph:analyze_workflow_files"),
+    ("Workflow klasörünü izle ve değişenleri otomatik yükle", "functions.watch_workflows:watch_workflows"),
+])
+
+# n8nApp_new.py menüsü (etiket işlemleriyle)
+TAG_MENU = build_menu([
+    ("Tüm workflow'ları listele (ID ve isim)", "functions.list_workflows:list_workflows"),
+    ("Workflow detayını ID ile getir ve JSON olarak kaydet", "functions.get_workflow_details:get_workflow_details"),
+    ("Yeni workflow oluştur", "functions.create_workflow:create_workflow"),
+    ("Var olan workflow'u güncelle", "functions.update_workflow:update_workflow"),
+    ("Workflow sil (ID ile)", "functions.delete_workflow:delete_workflow"),
+    ("Workflow'u aktif et", "functions.activate_workflow:activate_workflow"),
+    ("Workflow'u pasif yap", "functions.activate_workflow:deactivate_workflow"),
+    ("Workflow etiketlerini göster", "functions.workflow_tags:get_workflow_tags"),
+    ("Workflow'a etiket ata", "functions.workflow_tags:assign_tag"),
+    ("Workflow'un tüm etiketlerini kaldır", "functions.workflow_tags:remove_tags"),
+])
@@ -3,22 +3,25 @@
 Workflow dosyalarını N8N API'deki karşılıklarıyla karşılaştırma işlevleri
 """
 
-import os
-import json
+import sys
+import argparse
 import requests
-from .utils import N8N_URL, headers, headers_with_content_type
-from .upload_workflow import update_workflow, get_workflow_files, read_workflow_json
+from contextlib import redirect_stdout, nullcontext
+from .api_client import get_client, DEFAULT_POOL_SIZE
+from .upload_workflow import get_workflow_files, read_workflow_json
+from .sync_manifest import SyncManifest, content_hash
+from .workflow_index import get_workflow_index
+from .workflow_diff import diff_workflows, format_diff_text
+from .workflow_merge import format_conflicts_text
+from .sync_plan import (build_sync_plan, resolve_conflict, apply_sync_plan, plan_counts,
+                        plan_to_json, format_plan_text, format_apply_summary, PREFER_CHOICES)
 
-def get_all_workflows_from_api():
-    """N8N API'dan tüm workflow'ları alır"""
+def get_all_workflows_from_api(summary=False):
+    """N8N API'dan tüm workflow'ları alır (summary=True ise sadece id/isim/sürüm alanları)"""
     try:
         print("\nN8N API'dan workflow'lar alınıyor...")
-        response = requests.get(f"{N8N_URL}/api/v1/workflows", headers=headers)
-        response.raise_for_status()
-        
-        data = response.json()
-        # Ensure we're getting the data in the right format - API may return data in a nested structure
-        workflows = data if isinstance(data, list) else data.get("data", [])
+        # Tüm sayfaları nextCursor ile gez
+        workflows = list(get_client().iter_workflows(summary=summary))
         
         if not workflows:
             print("N8N'de hiç workflow bulunamadı.")
@@ -40,173 +43,107 @@ def get_all_workflows_from_api():
         print(f"N8N API'dan workflow'lar alınırken hata oluştu: {error_detail}")
         return []
 
-def save_workflow_to_file(workflow_data, workflow_dir, original_file_path=None):
-    """Workflow verisini dosyaya kaydeder"""
-    if not workflow_data or "id" not in workflow_data or "name" not in workflow_data:
-        print("Geçersiz workflow verisi.")
-        return False
-    
-    # Dosya adını oluştur (ad_id.json formatında)
-    safe_name = workflow_data["name"].lower().replace(" ", "_")
-    new_file_name = f"{safe_name}_{workflow_data['id']}.json"
-    new_file_path = os.path.join(workflow_dir, new_file_name)
-    
-    # Eğer orijinal dosya yolu verilmişse ve yeni dosya adı farklıysa
-    if original_file_path and os.path.exists(original_file_path):
-        original_file_name = os.path.basename(original_file_path)
-        
-        # Yeni dosya adı farklıysa yedekleme seçeneği sun
-        if original_file_name != new_file_name:
-            print(f"\n  ⚠️  Dikkat: Yeni dosya adı farklı olacak: {new_file_name}")
-            while True:
-                backup = input("  Orijinal dosyayı yedeklemek istiyor musunuz? (e/h): ").lower()
-                if backup == 'e':
-                    # Orijinal dosyayı .bck uzantısıyla yedekle
-                    backup_path = f"{original_file_path}.bck"
-                    try:
-                        import shutil
-                        shutil.copy2(original_file_path, backup_path)
-                        print(f"  ✓ Orijinal dosya yedeklendi: {backup_path}")
-                    except Exception as e:
-                        print(f"  ❌ Dosya yedeklenirken hata oluştu: {str(e)}")
-                    break
-                elif backup == 'h':
-                    try:
-                        # Orijinal dosyayı sil
-                        os.remove(original_file_path)
-                        print(f"  ✓ Orijinal dosya silindi: {original_file_name}")
-                    except Exception as e:
-                        print(f"  ❌ Dosya silinirken hata oluştu: {str(e)}")
-                    break
-                else:
-                    print("  ❌ Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
+def fetch_suspected_workflows(api_summaries, file_workflows, manifest):
+    """
+    Özet listesini dosya kayıtlarıyla eşleştirir, sadece değişmiş olabilecek
+    workflow'ların tam içeriğini eşzamanlı olarak indirir.
+
+    Son senkrondan beri değişmeyenler özet haliyle, diğerleri tam içerikle döner.
+    """
+    suspected_ids = []
+    for summary in api_summaries:
+        wf_id = summary.get("id")
+        if not wf_id:
+            continue
+        file_record = file_workflows.get(wf_id)
+        if file_record and manifest.is_unchanged_since_sync(summary, file_record["hash"]):
+            continue
+        suspected_ids.append(wf_id)
     
-    try:
-        with open(new_file_path, 'w', encoding='utf-8') as f:
-            json.dump(workflow_data, f, indent=2)
-        print(f"Workflow başarıyla kaydedildi: {new_file_name}")
-        return True
-    except Exception as e:
-        print(f"Workflow kaydedilirken hata oluştu: {str(e)}")
-        return False
+    bodies, errors = get_client().fetch_workflows(suspected_ids)
+    print(f"{len(bodies)} workflow'un tam içeriği indirildi, "
+          f"{len(api_summaries) - len(suspected_ids)} değişmemiş workflow atlandı.")
+    
+    for wf_id, error in errors.items():
+        print(f"Workflow {wf_id} içeriği alınırken hata oluştu: {error}")
+    
+    return [
+        bodies.get(summary.get("id"), summary)
+        for summary in api_summaries
+        if summary.get("id") not in errors
+    ]
 
 def are_workflows_equal(workflow1, workflow2):
-    """İki workflow arasındaki temel farklılıkları kontrol eder"""
-    # Bu fonksiyon kapsamlı bir karşılaştırma yapar
-    # 1. Sadece önemli alanları karşılaştırır
-    # 2. Karşılaştırma yaparken ayrıntılı inceleme yapar
-    
-    # Workflow güncelleme için gerekli alanları karşılaştır
-    
-    # İsim kontrolü
-    if workflow1.get("name") != workflow2.get("name"):
-        print(f"İsimler farklı: '{workflow1.get('name')}' != '{workflow2.get('name')}'")
-        return False
-    
-    # Nodes kontrolü - sadece kritik özellikleri karşılaştır
-    nodes1 = workflow1.get("nodes", [])
-    nodes2 = workflow2.get("nodes", [])
-    
-    if len(nodes1) != len(nodes2):
-        print(f"Node sayıları farklı: {len(nodes1)} != {len(nodes2)}")
-        return False
-    
-    # Node'lar için kapsamlı karşılaştırma
-    # Önce node1'leri id'lerine göre bir sözlüğe ekle
-    nodes1_dict = {node.get("id"): node for node in nodes1}
-    nodes2_dict = {node.get("id"): node for node in nodes2}
-    
-    # Her bir node'un kritik özelliklerini karşılaştır
-    for node_id, node1 in nodes1_dict.items():
-        if node_id not in nodes2_dict:
-            print(f"Node ID '{node_id}' bir workflow'da var diğerinde yok")
-            return False
-        
-        node2 = nodes2_dict[node_id]
-        
-        # Kritik özellikler
-        critical_props = ["name", "type", "typeVersion", "position", "parameters"]
-        
-        for prop in critical_props:
-            if prop == "parameters":
-                # Parameters karşılaştırması için recursive yapı gerekebilir
-                # Basit bir şekilde JSON string olarak karşılaştıralım
-                try:
-                    params1_str = json.dumps(node1.get(prop, {}), sort_keys=True)
-                    params2_str = json.dumps(node2.get(prop, {}), sort_keys=True)
-                    if params1_str != params2_str:
-                        print(f"Node '{node_id}' parameters farklı")
-                        return False
-                except:
-                    # JSON dönüşümü başarısız olursa farklı kabul et
-                    print(f"Node '{node_id}' parameters karşılaştırma hatası")
-                    return False
-            elif node1.get(prop) != node2.get(prop):
-                print(f"Node '{node_id}' için '{prop}' değeri farklı")
-                return False
-    
-    # Connections kontrolü
-    connections1 = workflow1.get("connections", {})
-    connections2 = workflow2.get("connections", {})
-    
-    try:
-        connections1_str = json.dumps(connections1, sort_keys=True)
-        connections2_str = json.dumps(connections2, sort_keys=True)
-        if connections1_str != connections2_str:
-            print("Connections yapısı farklı")
-            return False
-    except:
-        # JSON dönüşümü başarısız olursa farklı kabul et
-        print("Connections karşılaştırma hatası")
-        return False
-    
-    # Settings kontrolü - sadece executionOrder'ı karşılaştır
-    settings1 = workflow1.get("settings", {})
-    settings2 = workflow2.get("settings", {})
-    
-    if settings1.get("executionOrder") != settings2.get("executionOrder"):
-        print("Settings executionOrder değeri farklı")
-        return False
-    
-    # Tüm kritik kontrolleri geçti, workflow'lar eşit kabul edilebilir
-    return True
+    """İki workflow'un karşılaştırmada önemli alanları eşitse True döner, değilse farkları yazdırır"""
+    diff = diff_workflows(workflow1, workflow2)
+    if not diff["equal"]:
+        print(format_diff_text(diff))
+    return diff["equal"]
 
-def compare_workflows():
-    """N8N API'daki workflow'lar ile dosya sistemindeki workflow'ları karşılaştırır"""
-    # API'den tüm workflow'ları al
-    api_workflows = get_all_workflows_from_api()
-    if not api_workflows:
-        return
+def load_file_data(file_record):
+    """Manifest sayesinde parse edilmemiş bir dosya kaydının içeriğini gerektiğinde okur"""
+    if file_record.get("data") is None:
+        file_record["data"] = read_workflow_json(file_record["file_path"])
+    return file_record["data"]
+
+def diff_against_file(api_wf, file_record, manifest):
+    """
+    API workflow'unu dosyayla önce manifest, sonra hash üzerinden karşılaştırır.
+    
+    Eşitse None, farklıysa n8n'den dosyaya doğru yapısal diff döndürür.
+    """
+    # Son senkrondan beri ne dosya ne de uzak sürüm değiştiyse içerik karşılaştırmaya gerek yok
+    if manifest.is_unchanged_since_sync(api_wf, file_record["hash"]):
+        return None
+    
+    if content_hash(api_wf) == file_record["hash"]:
+        manifest.record_sync(api_wf, file_record["hash"])
+        return None
+    
+    # Hash farklı - neyin değiştiğini göstermek için yapısal diff çıkar
+    file_data = load_file_data(file_record)
+    if not file_data:
+        return None
+    diff = diff_workflows(api_wf, file_data)
+    return None if diff["equal"] else diff
+
+def collect_sync_state():
+    """
+    API ve dosya sistemindeki workflow'ları karşılaştırıp sınıflandırır (hiçbir şey yazmaz, manifest hariç).
+
+    Dönen sözlük build_sync_plan için girdi olarak kullanılır; hata durumunda None döner.
+    """
+    # 1. aşama: API'den sadece özet listeyi al (id, isim, updatedAt, versionId)
+    api_summaries = get_all_workflows_from_api(summary=True)
+    if not api_summaries:
+        return None
     
     # Dosya sistemindeki tüm workflow dosyalarını al
     workflow_files, workflow_dir = get_workflow_files()
     if not workflow_dir:
-        return
+        return None
     
-    # Dosya sistemindeki workflow'ları ID'lerine göre eşleştir
+    manifest = SyncManifest.load(workflow_dir)
+    manifest.prune_files(workflow_files)
+    
+    # Dosyaların id, isim ve içerik hash'i yerel indeksten okunur (get_workflow_files sırasında
+    # sadece stat'ı değişen dosyalar parse edildi); içerik sadece gerektiğinde load_file_data ile okunur
     file_workflows = {}
     files_without_id = []  # ID'si olmayan dosyaları kaydet
     
-    for file in workflow_files:
-        file_path = os.path.join(workflow_dir, file)
-        workflow_data = read_workflow_json(file_path)
-        if workflow_data:
-            if "id" in workflow_data:
-                file_workflows[workflow_data["id"]] = {
-                    "data": workflow_data,
-                    "file_path": file_path,
-                    "file_name": file
-                }
-            else:
-                # ID'si olmayan dosyaları farklı bir listeye ekle
-                files_without_id.append({
-                    "data": workflow_data,
-                    "file_path": file_path,
-                    "file_name": file
-                })
+    for record in get_workflow_index(workflow_dir, refresh=False).file_records():
+        file_record = {**record, "file_path": record["path"], "data": None}
+        if file_record["id"]:
+            file_workflows[file_record["id"]] = file_record
+        else:
+            # ID'si olmayan dosyaları farklı bir listeye ekle
+            files_without_id.append(file_record)
     
     print(f"Dosya sisteminde {len(file_workflows)} workflow dosyası bulundu.")
     
+    # 2. aşama: sadece değişmiş olabilecek workflow'ların tam içeriğini indir
+    api_workflows = fetch_suspected_workflows(api_summaries, file_workflows, manifest)
+    
     # Karşılaştırma sonuçları
     to_update_from_file = []  # Dosya içeriği API'den farklı
     to_create_file = []       # API'de var ama dosyada yok
@@ -221,8 +158,8 @@ def compare_workflows():
             
         if wf_id in file_workflows:
             # Hem API'de hem dosyada var - içerik karşılaştır
-            file_wf = file_workflows[wf_id]["data"]
-            if are_workflows_equal(api_wf, file_wf):
+            diff = diff_against_file(api_wf, file_workflows[wf_id], manifest)
+            if diff is None:
                 # İçerik eşit - eşleşen workflow
                 matching_workflows.append({
                     "api": api_wf,
@@ -232,25 +169,53 @@ def compare_workflows():
                 # İçerik farklı - güncelleme gerekiyor
                 to_update_from_file.append({
                     "api": api_wf,
-                    "file": file_workflows[wf_id]
+                    "file": file_workflows[wf_id],
+                    "diff": diff
                 })
         else:
             # Sadece API'de var - dosya oluşturulmalı
             to_create_file.append(api_wf)
     
-    # Dosya sistemindeki workflow'ları API'dekilerle karşılaştır
-    api_workflow_ids = [wf.get("id") for wf in api_workflows if wf.get("id")]
+    # Dosya sistemindeki workflow'ları API'dekilerle karşılaştır. Bilinen uzak id'ler özet
+    # listesinden alınır: içeriği indirilemeyen bir workflow API'de vardır ve yeniden oluşturulmamalıdır
+    api_workflow_ids = {summary.get("id") for summary in api_summaries if summary.get("id")}
+    fetched_ids = {wf.get("id") for wf in api_workflows if wf.get("id")}
+    fetch_failed = [file_workflows.get(wf_id) or {"id": wf_id, "file_name": None}
+                    for wf_id in sorted(api_workflow_ids - fetched_ids)]
+    if fetch_failed:
+        print(f"{len(fetch_failed)} workflow'un içeriği alınamadığı için bu senkronda atlandı.")
     
-    # ID'si olan workflow'ları kontrol et
+    # ID'si olan workflow'ları kontrol et; API'de bulunmayanlar yeni workflow olarak oluşturulur
     for file_id, file_wf in file_workflows.items():
-        if file_id not in api_workflow_ids:
+        if file_id not in api_workflow_ids and load_file_data(file_wf):
             # Sadece dosyada var - API'ye yüklenmeli
             to_create_api.append(file_wf)
     
     # ID'si olmayan workflow dosyalarını da ekle
     for file_wf in files_without_id:
         # ID olmayan her dosyayı yeni workflow kabul et
-        to_create_api.append(file_wf)
+        if load_file_data(file_wf):
+            to_create_api.append(file_wf)
+    
+    # Karşılaştırma sonuçlarını bir sonraki çalıştırma için kaydet
+    manifest.save()
+    
+    return {
+        "workflow_dir": workflow_dir,
+        "manifest": manifest,
+        "matching_workflows": matching_workflows,
+        "to_update_from_file": to_update_from_file,
+        "to_create_file": to_create_file,
+        "to_create_api": to_create_api,
+        "fetch_failed": fetch_failed
+    }
+
+def print_sync_table(state):
+    """Karşılaştırma sonuçlarını tablo ve özet kutusu olarak gösterir"""
+    matching_workflows = state["matching_workflows"]
+    to_update_from_file = state["to_update_from_file"]
+    to_create_file = state["to_create_file"]
+    to_create_api = state["to_create_api"]
     
     # Sonuçları tablo şeklinde göster - Daha düzenli bir formatta
     print("\n")
@@ -291,11 +256,11 @@ def compare_workflows():
     
     # 4. Sadece dosyada olan workflow'ları göster
     for item in to_create_api:
-        wf = item["data"]
+        wf_name = item["name"] or "İsimsiz Workflow"
         file_name = item["file_name"]
         # Uzun isim ve ID'leri kısalt
         file_name_short = file_name[:26] if len(file_name) > 26 else file_name
-        wf_name_short = wf['name'][:27] if len(wf['name']) > 27 else wf['name']
+        wf_name_short = wf_name[:27] if len(wf_name) > 27 else wf_name
         
         print(f"║ {file_name_short:<28} ║ {'---':<25} ║ {wf_name_short:<29} ║ SADECE DOSYA   ║")
     
@@ -311,137 +276,133 @@ def compare_workflows():
     print(f"║  Sadece API'de olan sayısı:      ║ {len(to_create_file):<23} ║")
     print(f"║  Sadece dosyada olan sayısı:     ║ {len(to_create_api):<23} ║")
     print("╚══════════════════════════════════╩═════════════════════════╝")
-    
-    # Hiç değişiklik gerektiren workflow yoksa bilgilendirme mesajı göster
-    if not to_update_from_file and not to_create_file and not to_create_api:
-        print("\n╔════════════════════════════════════════════════════════════╗")
-        print("║            TÜM WORKFLOW'LAR SENKRON DURUMDA!             ║")
-        print("╚════════════════════════════════════════════════════════════╝")
+
+def resolve_conflicts_interactively(plan, state):
+    """Plandaki çakışmaları kullanıcıya sorarak uygulanabilir adımlara çevirir"""
+    conflicts = [action for action in plan["actions"] if action["action"] == "conflict"]
+    if not conflicts:
         return
     
-    # Kullanıcıya güncelleme yapmak isteyip istemediğini sor
     print("\n╔════════════════════════════════════════════════════════════╗")
-    print("║                   İŞLEM SEÇENEKLERİ                       ║")
+    print("║             FARKLI İÇERİKLİ WORKFLOW'LAR                 ║")
     print("╚════════════════════════════════════════════════════════════╝")
     
-    while True:
-        choice = input("\nGüncelleme yapmak istiyor musunuz? (e/h): ")
-        if choice.lower() == 'h':
-            return
-        elif choice.lower() == 'e':
-            break
-        else:
-            print("❌ Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
-    
-    # Güncelleme işlemlerini gerçekleştir
-    update_count = 0
-    
-    # 1. API ve dosya içeriği farklı olan workflow'ları güncelle
-    if to_update_from_file:
-        print("\n╔════════════════════════════════════════════════════════════╗")
-        print("║             FARKLI İÇERİKLİ WORKFLOW'LAR                 ║")
-        print("╚════════════════════════════════════════════════════════════╝")
-        
-        for i, item in enumerate(to_update_from_file, 1):
-            print(f"{i}. '{item['api']['name']}' (ID: {item['api']['id']})")
-        
-        for item in to_update_from_file:
-            api_wf = item["api"]
-            file_wf = item["file"]["data"]
-            file_path = item["file"]["file_path"]
-            file_name = item["file"]["file_name"]
-            
-            print(f"\n➤ '{api_wf['name']}' (ID: {api_wf['id']}) workflow'u için:")
-            
-            while True:
-                source = input("  Hangi kaynağı kullanmak istiyorsunuz? (dosya/n8n): ").lower()
-                if source == 'dosya':
-                    # API'deki workflow'u yedeklemek isteyip istemediğini sor
-                    backup_choice = input("  API'deki mevcut workflow'u yedeklemek istiyor musunuz? (e/h): ").lower()
-                    backup_api = backup_choice == 'e'
-                    
-                    print(f"  ⟳ Dosya içeriği N8N'e yükleniyor: {file_name}")
-                    if update_workflow(api_wf["id"], file_wf, backup_api_workflow=backup_api):
-                        print("  ✓ Başarıyla güncellendi!")
-                        update_count += 1
-                    break
-                elif source == 'n8n':
-                    print(f"  ⟳ N8N içeriği dosyaya kaydediliyor: {file_path}")
-                    if save_workflow_to_file(api_wf, workflow_dir, original_file_path=file_path):
-                        print("  ✓ Başarıyla güncellendi!")
-                        update_count += 1
-                    break
-                else:
-                    print("  ❌ Geçersiz giriş. Lütfen 'dosya' veya 'n8n' girin.")
-    
-    # 2. Sadece API'de olan workflow'lar için dosya oluştur
-    if to_create_file:
-        print("\n╔════════════════════════════════════════════════════════════╗")
-        print("║             SADECE API'DE OLAN WORKFLOW'LAR               ║")
-        print("╚════════════════════════════════════════════════════════════╝")
-        
-        for i, wf in enumerate(to_create_file, 1):
-            print(f"{i}. '{wf['name']}' (ID: {wf['id']})")
+    for action in conflicts:
+        print(f"\n➤ '{action['name']}' (ID: {action['workflow_id']}) workflow'u için:")
+        print("  Farklar (n8n → dosya):")
+        print(format_diff_text(action["diff"], indent="    "))
+        if action["conflicts"]:
+            print("  ⚠️  Birleştirme çakışmaları:")
+            print(format_conflicts_text(action["conflicts"], indent="    "))
         
         while True:
-            create_files = input("\nBu workflow'lar için dosya oluşturmak istiyor musunuz? (e/h): ")
-            if create_files.lower() == 'e':
-                for wf in to_create_file:
-                    print(f"  ⟳ Workflow dosyası oluşturuluyor: {wf['name']}")
-                    if save_workflow_to_file(wf, workflow_dir):
-                        print("  ✓ Başarıyla kaydedildi!")
-                        update_count += 1
+            source = input("  Hangi kaynağı kullanmak istiyorsunuz? (dosya/n8n/atla): ").lower()
+            if source in ('dosya', 'n8n'):
+                resolve_conflict(plan, action, "file" if source == 'dosya' else "n8n", state)
                 break
-            elif create_files.lower() == 'h':
+            elif source == 'atla':
                 break
             else:
-                print("  ❌ Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
+                print("  ❌ Geçersiz giriş. Lütfen 'dosya', 'n8n' veya 'atla' girin.")
+
+def compare_workflows(dry_run=False, prefer=None, workers=DEFAULT_POOL_SIZE, assume_yes=False, as_json=False):
+    """
+    N8N API'daki workflow'lar ile dosya sistemindeki workflow'ları karşılaştırır.
+    
+    Önce yan etkisiz bir senkron planı oluşturulur ve gösterilir, onaydan sonra
+    plan paralel olarak uygulanır. dry_run=True ise plan sadece gösterilir.
+    """
+    if as_json:
+        # JSON çıktısı temiz kalsın diye ilerleme mesajları stderr'e yazılır
+        with redirect_stdout(sys.stderr):
+            state = collect_sync_state()
+    else:
+        state = collect_sync_state()
+    if not state:
+        return None
+    
+    if not as_json:
+        print_sync_table(state)
+    
+    plan = build_sync_plan(state, prefer=prefer)
     
-    # 3. Sadece dosyada olan workflow'ları API'ye yükle
-    if to_create_api:
-        print("\n╔════════════════════════════════════════════════════════════╗")
-        print("║            SADECE DOSYADA OLAN WORKFLOW'LAR               ║")
-        print("╚════════════════════════════════════════════════════════════╝")
-        
-        for i, item in enumerate(to_create_api, 1):
-            wf = item["data"]
-            wf_name = wf.get("name", "İsimsiz Workflow")
-            print(f"{i}. '{wf_name}' (ID: {wf.get('id', 'Belirtilmemiş')})")
-        
+    # Hiç değişiklik gerektiren workflow yoksa bilgilendirme mesajı göster
+    if not plan["actions"]:
+        if as_json:
+            print(plan_to_json(plan))
+        else:
+            print("\n╔════════════════════════════════════════════════════════════╗")
+            print("║            TÜM WORKFLOW'LAR SENKRON DURUMDA!             ║")
+            print("╚════════════════════════════════════════════════════════════╝")
+        return plan
+    
+    if as_json and dry_run:
+        print(plan_to_json(plan))
+        return plan
+    
+    # JSON modunda insan için çıktılar (plan, sorular, ilerleme, özet) stderr'e yazılır;
+    # stdout'a en sonda plan ve uygulama sonucunu içeren tek bir JSON belgesi yazılır
+    with redirect_stdout(sys.stderr) if as_json else nullcontext():
+        summary = review_and_apply(plan, state, dry_run, prefer, workers, assume_yes)
+    
+    if as_json:
+        print(plan_to_json(plan, summary=summary))
+    return plan
+
+def review_and_apply(plan, state, dry_run, prefer, workers, assume_yes):
+    """Planı gösterir, gerekirse çakışmaları ve onayı sorar, uygular; uygulanmadıysa None döner"""
+    # Etkileşimli modda çakışmalar uygulamadan önce toplu olarak sorulur
+    if not dry_run and not assume_yes and prefer is None:
+        resolve_conflicts_interactively(plan, state)
+    
+    print("\n╔════════════════════════════════════════════════════════════╗")
+    print("║                     SENKRON PLANI                         ║")
+    print("╚════════════════════════════════════════════════════════════╝")
+    print(format_plan_text(plan))
+    print(", ".join(f"{kind}: {count}" for kind, count in sorted(plan_counts(plan).items())))
+    
+    if dry_run:
+        print("\n(dry-run) Hiçbir değişiklik uygulanmadı.")
+        return None
+    
+    backup_api = False
+    if not assume_yes:
         while True:
-            upload_files = input("\nBu workflow'ları N8N'e yüklemek istiyor musunuz? (e/h): ")
-            if upload_files.lower() == 'e':
-                for item in to_create_api:
-                    wf = item["data"]
-                    wf_name = wf.get("name", "İsimsiz Workflow")
-                    
-                    if "id" in wf and wf["id"]:
-                        wf_id = wf["id"]
-                        # API'deki workflow'u yedeklemek isteyip istemediğini sor
-                        backup_choice = input(f"  '{wf_name}' workflow'u için API'deki mevcut halini yedeklemek istiyor musunuz? (e/h): ").lower()
-                        backup_api = backup_choice == 'e'
-                        
-                        print(f"  ⟳ '{wf_name}' (ID: {wf_id}) workflow'u N8N'e yükleniyor...")
-                        if update_workflow(wf_id, wf, backup_api_workflow=backup_api):
-                            print("  ✓ Başarıyla yüklendi!")
-                            update_count += 1
-                    else:
-                        # ID yoksa veya boşsa yeni workflow oluştur
-                        print(f"  ⟳ '{wf_name}' için yeni bir workflow oluşturuluyor...")
-                        from .upload_workflow import create_new_workflow
-                        file_path = item.get("file_path")
-                        if create_new_workflow(wf_name, wf, file_path):
-                            print("  ✓ Yeni workflow başarıyla oluşturuldu ve dosya güncellendi!")
-                            update_count += 1
-                break
-            elif upload_files.lower() == 'h':
+            choice = input("\nPlanı uygulamak istiyor musunuz? (e/h): ")
+            if choice.lower() == 'h':
+                return None
+            elif choice.lower() == 'e':
                 break
             else:
-                print("  ❌ Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
+                print("❌ Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
+        
+        if any(action["action"] == "update_api" for action in plan["actions"]):
+            backup_choice = input("API'deki mevcut workflow'ları güncellemeden önce yedeklemek istiyor musunuz? (e/h): ")
+            backup_api = backup_choice.lower() == 'e'
+    
+    summary = apply_sync_plan(plan, manifest=state["manifest"], workers=workers, backup_api=backup_api)
     
     # Özet sonuç bilgisi
     print("\n╔════════════════════════════════════════════════════════════╗")
     print("║                     İŞLEM SONUCU                          ║")
-    print("╠══════════════════════════════════════════╦═════════════════╣")
-    print(f"║  Toplam güncellenen workflow sayısı:     ║ {update_count:<15} ║")
-    print("╚══════════════════════════════════════════╩═════════════════╝")
\ No newline at end of file
+    print("╚════════════════════════════════════════════════════════════╝")
+    print(format_apply_summary(summary))
+    return summary
+
+def main(argv=None):
+    """Komut satırından planlı senkronizasyon"""
+    parser = argparse.ArgumentParser(description="N8N ve dosya sistemi arasında planlı workflow senkronizasyonu")
+    parser.add_argument("--dry-run", action="store_true", help="Planı göster, hiçbir değişiklik uygulama")
+    parser.add_argument("--prefer", choices=PREFER_CHOICES,
+                        help="Otomatik birleştirilemeyen farklarda kullanılacak taraf")
+    parser.add_argument("--workers", type=int, default=DEFAULT_POOL_SIZE, help="Paralel işçi sayısı")
+    parser.add_argument("--yes", action="store_true", help="Onay sormadan uygula (çakışmalar atlanır)")
+    parser.add_argument("--json", action="store_true", help="Planı JSON olarak yazdır")
+    args = parser.parse_args(argv)
+    
+    compare_workflows(dry_run=args.dry_run, prefer=args.prefer, workers=args.workers,
+                      assume_yes=args.yes, as_json=args.json)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
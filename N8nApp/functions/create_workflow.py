@@ -5,7 +5,8 @@ Yeni workflow oluşturma işlevleri
 
 import json
 import requests
-from functions.utils import N8N_URL, headers_with_content_type
+from functions.api_client import get_client
+from functions.workflow_cache import invalidate_workflow_list
 
 def create_workflow():
     """Kullanıcıdan isim alarak yeni bir workflow oluştur"""
@@ -39,9 +40,8 @@ def create_workflow():
         print(f"\n'{workflow_name}' isimli yeni workflow oluşturuluyor...")
         
         # JSON formatında veri gönder (data yerine json parametresi kullan)
-        response = requests.post(
-            f"{N8N_URL}/api/v1/workflows",
-            headers=headers_with_content_type,
+        response = get_client().post(
+            "/workflows",
             json=workflow_template  # data=json.dumps yerine doğrudan json kullan
         )
         
@@ -50,9 +50,9 @@ def create_workflow():
             print(f"Hata Kodu: {response.status_code}")
             print(f"Hata Detayı: {response.text}")
             print(f"Gönderilen veri: {json.dumps(workflow_template, indent=2)}")
-            print(f"Headers: {headers_with_content_type}")
         
         response.raise_for_status()
+        invalidate_workflow_list()
         
         new_workflow = response.json()
         print(f"\nWorkflow başarıyla oluşturuldu!")
@@ -4,36 +4,18 @@ Workflow silme işlevleri
 """
 
 import requests
-from functions.utils import N8N_URL, headers
+from functions.api_client import get_client
+from functions.workflow_cache import show_workflow_list, invalidate_workflow_list
 
 def delete_workflow():
     """ID ile workflow sil"""
-    # Doğrudan API'den workflow listesini al
-    try:
-        print("\nWorkflow'lar getiriliyor...")
-        response = requests.get(
-            f"{N8N_URL}/api/v1/workflows",
-            headers=headers
-        )
-        response.raise_for_status()
-        
-        data = response.json()
-        # Ensure we're getting the data in the right format - API may return data in a nested structure
-        workflows = data if isinstance(data, list) else data.get("data", [])
-        
-        if not workflows:
-            print("Hiç workflow bulunamadı.")
-            return
-        
-        print(f"\nToplam {len(workflows)} workflow bulundu:\n")
-        
-        for i, workflow in enumerate(workflows, 1):
-            if isinstance(workflow, dict):
-                status = "Aktif" if workflow.get("active", False) else "Pasif"
-                print(f"{i}. [{status}] ID: {workflow.get('id')} - İsim: {workflow.get('name')}")
-            else:
-                print(f"{i}. [Bilinmiyor] - {workflow}")
+    # Seçim listesi oturum önbelleğinden gelir; menü seçenekleri arasında tekrar istenmez
+    workflows = show_workflow_list()
     
+    if not workflows:
+        return
+    
+    try:
         choice = int(input("\nSILMEK istediğiniz workflow'un numarasını girin (0 iptal): "))
         if choice == 0:
             return
@@ -62,11 +44,9 @@ def delete_workflow():
             return
         
         print(f"\nWorkflow ID: {workflow_id} siliniyor...")
-        response = requests.delete(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}",
-            headers=headers
-        )
+        response = get_client().delete(f"/workflows/{workflow_id}")
         response.raise_for_status()
+        invalidate_workflow_list()
         
         print("\nWorkflow başarıyla silindi!")
     
@@ -3,50 +3,23 @@
 Workflow detayı getirme işlevleri
 """
 
-import json
 import os
 import requests
 import subprocess
-from datetime import datetime
 
 def get_workflow_details():
     """ID ile workflow detayını getir ve JSON olarak kaydet"""
     # list_workflows fonksiyonunu çağırırken, dönüş değerini kullanma
     # sadece kullanıcıya workflow listesini göster
     from functions.list_workflows import list_workflows
-    from functions.utils import N8N_URL, headers
+    from functions.api_client import get_client
+    from functions.workflow_cache import show_workflow_list
+    from functions.workflow_projection import write_workflow_file
     
-    print("\nWorkflow'lar getiriliyor...\n")
+    # Seçim listesi oturum önbelleğinden gelir; menü seçenekleri arasında tekrar istenmez
+    workflows = show_workflow_list()
     
-    try:
-        response = requests.get(f"{N8N_URL}/api/v1/workflows?excludePinnedData=true&limit=100", headers=headers)
-        response.raise_for_status()
-        
-        response_data = response.json()
-        
-        # API yanıt formatını kontrol et
-        if isinstance(response_data, dict) and "data" in response_data:
-            # Yeni API formatı - 'data' içinde workflow array'i var
-            workflows = response_data["data"]
-        else:
-            # Eski API formatı - doğrudan workflow array'i
-            workflows = response_data
-        
-        if not workflows or len(workflows) == 0:
-            print("Hiç workflow bulunamadı.")
-            return
-        
-        print(f"Toplam {len(workflows)} workflow bulundu:\n")
-        for idx, workflow in enumerate(workflows, 1):
-            # Tip kontrolü ekle
-            if isinstance(workflow, dict):
-                active_status = "[Aktif]" if workflow.get("active", False) else "[Pasif]"
-                print(f"{idx}. {active_status} ID: {workflow['id']} - İsim: {workflow['name']}")
-            else:
-                print(f"{idx}. Geçersiz workflow verisi: {workflow}")
-    
-    except requests.exceptions.RequestException as e:
-        print(f"Workflow'ları getirirken hata oluştu: {str(e)}")
+    if not workflows:
         return
     
     try:
@@ -63,10 +36,7 @@ def get_workflow_details():
         workflow_name = selected_workflow["name"].replace(" ", "_").lower()
         
         print(f"\nWorkflow ID: {workflow_id} için detaylar getiriliyor...")
-        response = requests.get(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}?excludePinnedData=true",
-            headers=headers
-        )
+        response = get_client().get(f"/workflows/{workflow_id}?excludePinnedData=true")
         response.raise_for_status()
         
         workflow = response.json()
@@ -110,16 +80,15 @@ def get_workflow_details():
                     print(f"Mevcut dosya git staging'e eklendi: {file_path}")
                 except subprocess.SubprocessError as e:
                     print(f"Git komutu çalıştırılırken hata oluştu: {str(e)}")
-            
-            # Eski dosyayı sil
-            os.remove(file_path)
-            print(f"Eski dosya silindi: {file_path}")
         
-        # Yeni dosyayı oluştur ve kaydet
-        with open(file_path, 'w', encoding='utf-8') as file:
-            json.dump(workflow, file, indent=2, ensure_ascii=False)
+        # Dosyayı kanonik biçimde kaydet (N8N_EXPORT_MODE'a göre değişken alanlar ayrılır);
+        # eski dosya silinmeden atomik olarak değiştirilir, içerik aynıysa dokunulmaz
+        written, _ = write_workflow_file(file_path, workflow)
         
-        print(f"\nWorkflow detayları başarıyla kaydedildi: {file_path}")
+        if written:
+            print(f"\nWorkflow detayları başarıyla kaydedildi: {file_path}")
+        else:
+            print(f"\nWorkflow dosyası zaten güncel, değişiklik yapılmadı: {file_path}")
     
     except ValueError:
         print("Lütfen geçerli bir sayı girin.")
@@ -4,34 +4,28 @@ Workflow listeleme işlevleri
 """
 
 import os
-import json
 import subprocess
 import requests
-from functions.utils import N8N_URL, headers
+from functions.api_client import get_client
+from functions.bulk_export import export_all_workflows
+from functions.workflow_projection import write_workflow_file
+from functions.workflow_cache import get_workflow_cache
 
 def list_workflows():
     """Tüm workflow'ları ID ve isimleriyle listeler"""
     print("\nWorkflow'lar getiriliyor...\n")
     
     try:
-        # API isteğini güncellenen endpoint ile yap (tüm workflow'ları getir)
-        response = requests.get(f"{N8N_URL}/api/v1/workflows?excludePinnedData=true&limit=100", headers=headers)
-        response.raise_for_status()
-        
-        response_data = response.json()
-        
-        # API yanıt formatını kontrol et
-        if isinstance(response_data, dict) and "data" in response_data:
-            # Yeni API formatı - 'data' içinde workflow array'i var
-            workflows = response_data["data"]
-        else:
-            # Eski API formatı - doğrudan workflow array'i
-            workflows = response_data
+        # Tüm sayfaları nextCursor ile gez (100 workflow sınırı yok)
+        workflows = list(get_client().iter_workflows())
         
         if not workflows or len(workflows) == 0:
             print("Hiç workflow bulunamadı.")
             return
         
+        # Tam liste zaten elimizde; diğer menü seçenekleri için özet önbelleğini tazele
+        get_workflow_cache().store(workflows)
+        
         print(f"Toplam {len(workflows)} workflow bulundu:\n")
         for idx, workflow in enumerate(workflows, 1):
             # Tip kontrolü ekle
@@ -43,9 +37,13 @@ def list_workflows():
         
         # Kullanıcıya workflow'ları kaydetme seçeneği sun - Geçerli giriş için while döngüsü ekle
         while True:
-            save_option = input("\nTüm workflow'ları ayrı dosyalar halinde kaydetmek ister misiniz? (e/h): ")
+            save_option = input("\nTüm workflow'ları ayrı dosyalar halinde kaydetmek ister misiniz? (e/h, t=toplu/sormadan): ")
             
-            if save_option.lower() == 'e':
+            if save_option.lower() == 't':
+                # Soru sormadan, tam detaylarla ve eşzamanlı olarak dışa aktar
+                export_all_workflows()
+                break
+            elif save_option.lower() == 'e':
                 # workflows dizinini oluştur (eğer yoksa)
                 # Proje kök dizinini al ve tam yolu oluştur
                 base_dir = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
@@ -92,11 +90,13 @@ def list_workflows():
                         
                         # Tam workflow detaylarını kullan (zaten elimizdeki JSON'da tüm detaylar var)
                         try:
-                            # Dosyaya kaydet
-                            with open(filename, 'w', encoding='utf-8') as file:
-                                json.dump(workflow, file, indent=2, ensure_ascii=False)
+                            # Dosyaya kanonik biçimde kaydet; içerik aynıysa dosyaya dokunulmaz
+                            written, _ = write_workflow_file(filename, workflow)
                             
-                            print(f"Workflow '{workflow_name}' başarıyla kaydedildi: {filename}")
+                            if written:
+                                print(f"Workflow '{workflow_name}' başarıyla kaydedildi: {filename}")
+                            else:
+                                print(f"Workflow '{workflow_name}' değişmediği için dosyaya yazılmadı: {filename}")
                         
                         except Exception as e:
                             print(f"Workflow {workflow_id} kaydedilirken hata oluştu: {str(e)}")
@@ -107,7 +107,7 @@ def list_workflows():
                 print("\nWorkflow'lar kaydedilmedi. Ana menüye dönülüyor.")
                 break
             else:
-                print("Geçersiz giriş! Lütfen 'e' veya 'h' girin.")
+                print("Geçersiz giriş! Lütfen 'e', 'h' veya 't' girin.")
         
         # Olası ileri kullanım için workflow'ları döndür
         return workflows
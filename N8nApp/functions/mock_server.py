@@ -0,0 +1,720 @@
+#!/usr/bin/env python3
+"""
+Kıyaslama ve ağsız entegrasyon testleri için yerel n8n API taklit sunucusu
+
+Aracın kullandığı public API alt kümesini (workflow CRUD ve cursor'lı sayfalama,
+aktif/pasif yapma, etiketler, çalıştırmalar) bellekte tutulan bir depo üzerinden
+sunar. Gecikme ve hata (429, 500, zaman aşımı) enjeksiyonu ayarlanabilir.
+
+    python -m functions.mock_server --synthetic 10000 --latency 0.02 --rate-limit-rate 0.05
+    N8N_URL=http://127.0.0.1:5679 API_KEY=test python -m functions.cli list | wc -l
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import base64
+import random
+import string
+import hashlib
+import argparse
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlsplit, parse_qs
+from .utils import get_workflows_dir, encode_json_body
+from .workflow_index import is_trigger_node, short_node_type
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 5679
+
+# n8n ile aynı sayfa boyutu sınırları
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 250
+
+# Oluşturma/güncellemede kabul edilen üst düzey alanlar; diğerleri n8n'deki gibi 400 döner
+WRITABLE_FIELDS = ("name", "nodes", "connections", "settings", "staticData")
+
+# Tetikleyici sayılsa da workflow'u aktif etmeye yetmeyen node'lar
+MANUAL_TRIGGER_TYPES = {"manualTrigger"}
+
+SYNTHETIC_TAGS = ("prod", "staging", "billing", "marketing", "internal")
+
+
+def _now():
+    return time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+
+
+def _new_id(rng, length=16):
+    """n8n tarzı rastgele workflow/etiket id'si"""
+    return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+
+def _encode_cursor(offset):
+    return base64.urlsafe_b64encode(json.dumps({"offset": offset}).encode('utf-8')).decode('ascii')
+
+
+def _decode_cursor(cursor):
+    try:
+        return int(json.loads(base64.urlsafe_b64decode(cursor.encode('ascii')))["offset"])
+    except (ValueError, KeyError, TypeError):
+        return None
+
+
+def _paginate(items, params):
+    """Listeyi limit/cursor parametrelerine göre keser; (durum, gövde) döndürür"""
+    try:
+        limit = int(params.get("limit") or DEFAULT_LIMIT)
+    except ValueError:
+        return 400, {"message": "request/query/limit must be integer"}
+    if limit < 1 or limit > MAX_LIMIT:
+        return 400, {"message": f"request/query/limit must be <= {MAX_LIMIT}"}
+    offset = 0
+    if params.get("cursor"):
+        offset = _decode_cursor(params["cursor"])
+        if offset is None:
+            return 400, {"message": "An invalid cursor was provided"}
+    page = items[offset:offset + limit]
+    next_offset = offset + limit
+    return 200, {"data": page, "nextCursor": _encode_cursor(next_offset) if next_offset < len(items) else None}
+
+
+def _validate_body(body):
+    """Workflow yazma gövdesini n8n'in şemasına göre kontrol eder; hata mesajı veya None döndürür"""
+    if not isinstance(body, dict):
+        return "request/body must be object"
+    extra = sorted(set(body) - set(WRITABLE_FIELDS))
+    if extra:
+        return "request/body must NOT have additional properties"
+    for field, kind in (("name", str), ("nodes", list), ("connections", dict), ("settings", dict)):
+        if field not in body:
+            return f"request/body must have required property '{field}'"
+        if not isinstance(body[field], kind):
+            return f"request/body/{field} must be {kind.__name__.replace('str', 'string')}"
+    return None
+
+
+def can_activate(workflow):
+    """Workflow'da manuel olmayan bir tetikleyici varsa True döner (n8n aksi halde reddeder)"""
+    return any(isinstance(node, dict) and is_trigger_node(node.get("type", ""))
+               and short_node_type(node.get("type", "")) not in MANUAL_TRIGGER_TYPES
+               for node in workflow.get("nodes", []) or [])
+
+
+class WorkflowStore:
+    """
+    Workflow, etiket ve çalıştırmaları bellekte tutan, thread-safe depo.
+
+    İşlem metodları (durum kodu, gövde) döndürür; HTTP katmanı sadece bunları
+    JSON'a çevirir. version her yazmada artar ve listeleme ETag'inde kullanılır.
+    """
+
+    def __init__(self, seed=None):
+        self.lock = threading.RLock()
+        self.rng = random.Random(seed)
+        self.workflows = {}
+        self.tags = {}
+        self.executions = {}
+        self.version = 0
+        self._next_execution_id = 1
+
+    # --- yükleme ---
+
+    def add_workflow(self, workflow):
+        """Workflow'u olduğu gibi ekler (id ve etiketler korunur, etiketler katalogda yoksa oluşturulur)"""
+        with self.lock:
+            workflow_id = workflow.get("id") or _new_id(self.rng)
+            timestamp = _now()
+            tags = []
+            for tag in workflow.get("tags", []) or []:
+                # Dosyalarda etiketler {id, name} sözlüğü, sentetik veride düz isim olabilir
+                name, tag_id = (tag.get("name"), tag.get("id")) if isinstance(tag, dict) else (tag, None)
+                if name:
+                    tags.append(self._tag_by_name(name) or self._add_tag(name, tag_id))
+            stored = {
+                **{key: value for key, value in workflow.items() if key != "tags"},
+                "id": workflow_id,
+                "active": bool(workflow.get("active")),
+                "nodes": workflow.get("nodes", []) or [],
+                "connections": workflow.get("connections", {}) or {},
+                "settings": workflow.get("settings", {}) or {},
+                "tags": tags,
+                "createdAt": workflow.get("createdAt") or timestamp,
+                "updatedAt": workflow.get("updatedAt") or timestamp,
+                "versionId": workflow.get("versionId") or _new_id(self.rng, 32),
+            }
+            self.workflows[workflow_id] = stored
+            self.version += 1
+            return stored
+
+    def load_directory(self, workflows_dir):
+        """Klasördeki *.json workflow dosyalarını yükler; okunamayanlar atlanır. Yüklenen sayıyı döndürür"""
+        count = 0
+        for file_name in sorted(os.listdir(workflows_dir)):
+            if not file_name.endswith(".json") or file_name.startswith("."):
+                continue
+            try:
+                with open(os.path.join(workflows_dir, file_name), 'r', encoding='utf-8') as f:
+                    workflow = json.load(f)
+            except (OSError, ValueError):
+                continue
+            if isinstance(workflow, dict) and isinstance(workflow.get("nodes"), list):
+                self.add_workflow({**workflow, "name": workflow.get("name") or os.path.splitext(file_name)[0]})
+                count += 1
+        return count
+
+    def add_executions(self, per_workflow):
+        """Her workflow için sentetik çalıştırma kayıtları ekler"""
+        with self.lock:
+            for workflow_id in list(self.workflows):
+                for _ in range(per_workflow):
+                    execution_id = str(self._next_execution_id)
+                    self._next_execution_id += 1
+                    status = self.rng.choice(("success", "success", "success", "error", "waiting"))
+                    self.executions[execution_id] = {
+                        "id": execution_id, "workflowId": workflow_id, "mode": "trigger",
+                        "finished": status == "success", "status": status, "retryOf": None,
+                        "startedAt": _now(), "stoppedAt": None if status == "waiting" else _now(),
+                    }
+
+    # --- workflow'lar ---
+
+    def list_workflows(self, params):
+        with self.lock:
+            items = list(self.workflows.values())
+        if params.get("active") in ("true", "false"):
+            active = params["active"] == "true"
+            items = [workflow for workflow in items if workflow["active"] == active]
+        if params.get("name"):
+            items = [workflow for workflow in items if workflow["name"] == params["name"]]
+        if params.get("tags"):
+            wanted = {name.strip() for name in params["tags"].split(",") if name.strip()}
+            items = [workflow for workflow in items
+                     if wanted <= {tag["name"] for tag in workflow["tags"]}]
+        if params.get("excludePinnedData") == "true":
+            items = [{key: value for key, value in workflow.items() if key != "pinData"} for workflow in items]
+        return _paginate(items, params)
+
+    def get_workflow(self, params, workflow_id):
+        with self.lock:
+            workflow = self.workflows.get(workflow_id)
+        if workflow is None:
+            return 404, {"message": "Not Found"}
+        if params.get("excludePinnedData") == "true":
+            workflow = {key: value for key, value in workflow.items() if key != "pinData"}
+        return 200, workflow
+
+    def create_workflow(self, params, body):
+        error = _validate_body(body)
+        if error:
+            return 400, {"message": error}
+        with self.lock:
+            return 200, self.add_workflow({**body, "id": None, "active": False, "createdAt": None,
+                                           "updatedAt": None, "versionId": None})
+
+    def update_workflow(self, params, body, workflow_id):
+        error = _validate_body(body)
+        if error:
+            return 400, {"message": error}
+        with self.lock:
+            workflow = self.workflows.get(workflow_id)
+            if workflow is None:
+                return 404, {"message": "Not Found"}
+            workflow.update(body)
+            workflow["updatedAt"] = _now()
+            workflow["versionId"] = _new_id(self.rng, 32)
+            self.version += 1
+            return 200, workflow
+
+    def delete_workflow(self, params, body, workflow_id):
+        with self.lock:
+            workflow = self.workflows.pop(workflow_id, None)
+            if workflow is None:
+                return 404, {"message": "Not Found"}
+            self.version += 1
+            return 200, workflow
+
+    def set_active(self, workflow_id, active):
+        with self.lock:
+            workflow = self.workflows.get(workflow_id)
+            if workflow is None:
+                return 404, {"message": "Not Found"}
+            if active and not can_activate(workflow):
+                return 400, {"message": "Workflow has no node to start the workflow - at least one trigger, "
+                                        "poller or webhook node is required"}
+            if workflow["active"] != active:
+                workflow["active"] = active
+                workflow["updatedAt"] = _now()
+                self.version += 1
+            return 200, workflow
+
+    def activate_workflow(self, params, body, workflow_id):
+        return self.set_active(workflow_id, True)
+
+    def deactivate_workflow(self, params, body, workflow_id):
+        return self.set_active(workflow_id, False)
+
+    def get_workflow_tags(self, params, workflow_id):
+        with self.lock:
+            workflow = self.workflows.get(workflow_id)
+            if workflow is None:
+                return 404, {"message": "Not Found"}
+            return 200, list(workflow["tags"])
+
+    def set_workflow_tags(self, params, body, workflow_id):
+        if not isinstance(body, list) or not all(isinstance(item, dict) and item.get("id") for item in body):
+            return 400, {"message": "request/body must be array of {id}"}
+        with self.lock:
+            workflow = self.workflows.get(workflow_id)
+            if workflow is None:
+                return 404, {"message": "Not Found"}
+            unknown = [item["id"] for item in body if item["id"] not in self.tags]
+            if unknown:
+                return 404, {"message": f"Some tags not found: {', '.join(unknown)}"}
+            workflow["tags"] = [dict(self.tags[tag_id]) for tag_id in dict.fromkeys(item["id"] for item in body)]
+            workflow["updatedAt"] = _now()
+            self.version += 1
+            return 200, list(workflow["tags"])
+
+    # --- etiketler ---
+
+    def _tag_by_name(self, name):
+        for tag in self.tags.values():
+            if tag["name"] == name:
+                return dict(tag)
+        return None
+
+    def _add_tag(self, name, tag_id=None):
+        timestamp = _now()
+        tag = {"id": tag_id or _new_id(self.rng), "name": name, "createdAt": timestamp, "updatedAt": timestamp}
+        self.tags[tag["id"]] = tag
+        return dict(tag)
+
+    def list_tags(self, params):
+        with self.lock:
+            items = [dict(tag) for tag in self.tags.values()]
+        return _paginate(items, params)
+
+    def create_tag(self, params, body):
+        name = body.get("name") if isinstance(body, dict) else None
+        if not isinstance(name, str) or not name.strip():
+            return 400, {"message": "request/body must have required property 'name'"}
+        with self.lock:
+            if self._tag_by_name(name):
+                return 409, {"message": "Tag already exists"}
+            tag = self._add_tag(name)
+            self.version += 1
+            return 201, tag
+
+    def get_tag(self, params, tag_id):
+        with self.lock:
+            tag = self.tags.get(tag_id)
+        return (200, dict(tag)) if tag else (404, {"message": "Not Found"})
+
+    def delete_tag(self, params, body, tag_id):
+        with self.lock:
+            tag = self.tags.pop(tag_id, None)
+            if tag is None:
+                return 404, {"message": "Not Found"}
+            for workflow in self.workflows.values():
+                workflow["tags"] = [entry for entry in workflow["tags"] if entry["id"] != tag_id]
+            self.version += 1
+            return 200, tag
+
+    # --- çalıştırmalar ---
+
+    def list_executions(self, params):
+        with self.lock:
+            items = sorted(self.executions.values(), key=lambda execution: -int(execution["id"]))
+        if params.get("workflowId"):
+            items = [execution for execution in items if execution["workflowId"] == params["workflowId"]]
+        if params.get("status"):
+            items = [execution for execution in items if execution["status"] == params["status"]]
+        return _paginate(items, params)
+
+    def get_execution(self, params, execution_id):
+        with self.lock:
+            execution = self.executions.get(execution_id)
+        return (200, execution) if execution else (404, {"message": "Not Found"})
+
+    def delete_execution(self, params, body, execution_id):
+        with self.lock:
+            execution = self.executions.pop(execution_id, None)
+        return (200, execution) if execution else (404, {"message": "Not Found"})
+
+
+def synthetic_workflows(count, nodes=6, seed=0, active_ratio=0.3):
+    """
+    Kıyaslama için tekrarlanabilir sentetik workflow'lar üretir.
+
+    Her workflow bir tetikleyiciyle başlayan doğrusal bir node zinciridir; her
+    onuncusu sadece manuel tetikleyici içerir (aktif edilemez). Etiketler
+    SYNTHETIC_TAGS arasından seçilir.
+    """
+    rng = random.Random(seed)
+    triggers = ("n8n-nodes-base.webhook", "n8n-nodes-base.scheduleTrigger", "@n8n/n8n-nodes-langchain.chatTrigger")
+    steps = ("n8n-nodes-base.set", "n8n-nodes-base.httpRequest", "n8n-nodes-base.code", "n8n-nodes-base.if",
+             "n8n-nodes-base.postgres")
+    workflows = []
+    for index in range(count):
+        trigger = "n8n-nodes-base.manualTrigger" if index % 10 == 9 else rng.choice(triggers)
+        chain = [trigger] + [rng.choice(steps) for _ in range(max(0, nodes - 1))]
+        node_list = [{"id": f"n{position}", "name": f"{short_node_type(node_type)} {position}", "type": node_type,
+                      "typeVersion": 1, "position": [position * 220, 0], "parameters": {}}
+                     for position, node_type in enumerate(chain)]
+        connections = {node_list[position]["name"]: {"main": [[{"node": node_list[position + 1]["name"],
+                                                                "type": "main", "index": 0}]]}
+                       for position in range(len(node_list) - 1)}
+        workflows.append({
+            "id": f"syn{index:06d}",
+            "name": f"Sentetik {index:05d}",
+            "active": trigger != "n8n-nodes-base.manualTrigger" and rng.random() < active_ratio,
+            "nodes": node_list,
+            "connections": connections,
+            "settings": {"executionOrder": "v1"},
+            "tags": rng.sample(SYNTHETIC_TAGS, rng.randint(0, 2)),
+        })
+    return workflows
+
+
+class FaultInjector:
+    """
+    İsteklere gecikme ve hata ekler.
+
+    latency + [0, jitter) saniye bekletilir. error_rate / rate_limit_rate /
+    timeout_rate olasılıklarıyla 500, 429 (Retry-After ile) veya hang_seconds
+    boyunca yanıtsız kalma uygulanır. fail_next() ile belirli sayıda isteğe
+    kesin hata planlanabilir (testler için).
+    """
+
+    def __init__(self, latency=0.0, jitter=0.0, error_rate=0.0, rate_limit_rate=0.0, timeout_rate=0.0,
+                 hang_seconds=30.0, retry_after=None, seed=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.timeout_rate = timeout_rate
+        self.hang_seconds = hang_seconds
+        self.retry_after = retry_after
+        self.rng = random.Random(seed)
+        self.scripted = []
+        self.lock = threading.Lock()
+
+    def fail_next(self, fault, count=1, method=None, path=None):
+        """Sonraki count eşleşen isteğe fault (429, 500 veya 'timeout') uygular"""
+        with self.lock:
+            self.scripted.append({"fault": fault, "remaining": count, "method": method, "path": path})
+
+    def pick(self, method, path):
+        """İstek için uygulanacak hatayı seçer (None: hata yok)"""
+        with self.lock:
+            for entry in self.scripted:
+                if entry["method"] not in (None, method) or (entry["path"] and not path.startswith(entry["path"])):
+                    continue
+                entry["remaining"] -= 1
+                if entry["remaining"] <= 0:
+                    self.scripted.remove(entry)
+                return entry["fault"]
+            roll = self.rng.random()
+        for fault, rate in (("timeout", self.timeout_rate), (429, self.rate_limit_rate), (500, self.error_rate)):
+            if roll < rate:
+                return fault
+            roll -= rate
+        return None
+
+    def delay(self):
+        """Yapılandırılan gecikme süresi (saniye)"""
+        if not self.jitter:
+            return self.latency
+        with self.lock:
+            return self.latency + self.rng.uniform(0, self.jitter)
+
+
+class ServerStats:
+    """İstek sayıları, hata sayıları ve en yüksek eşzamanlılık"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.requests = {}
+            self.faults = {}
+            self.in_flight = 0
+            self.max_in_flight = 0
+            self.bytes_sent = 0
+
+    def begin(self, method, route):
+        with self.lock:
+            key = f"{method} {route}"
+            self.requests[key] = self.requests.get(key, 0) + 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def end(self, sent):
+        with self.lock:
+            self.in_flight -= 1
+            self.bytes_sent += sent
+
+    def fault(self, fault):
+        with self.lock:
+            self.faults[str(fault)] = self.faults.get(str(fault), 0) + 1
+
+    def total(self, method=None, route=None):
+        """Verilen metod/yol için (verilmezse hepsi) istek sayısı"""
+        with self.lock:
+            return sum(count for key, count in self.requests.items()
+                       if (method is None or key.split(" ", 1)[0] == method)
+                       and (route is None or key.split(" ", 1)[1] == route))
+
+    def snapshot(self):
+        with self.lock:
+            return {"requests": dict(self.requests), "faults": dict(self.faults),
+                    "max_in_flight": self.max_in_flight, "bytes_sent": self.bytes_sent}
+
+
+# (metod, yol şablonu, depo metodu); yol /api/v1 sonrasıdır
+ROUTES = [
+    ("GET", "/workflows", "list_workflows"),
+    ("POST", "/workflows", "create_workflow"),
+    ("GET", "/workflows/{id}", "get_workflow"),
+    ("PUT", "/workflows/{id}", "update_workflow"),
+    ("DELETE", "/workflows/{id}", "delete_workflow"),
+    ("POST", "/workflows/{id}/activate", "activate_workflow"),
+    ("POST", "/workflows/{id}/deactivate", "deactivate_workflow"),
+    ("GET", "/workflows/{id}/tags", "get_workflow_tags"),
+    ("PUT", "/workflows/{id}/tags", "set_workflow_tags"),
+    ("GET", "/tags", "list_tags"),
+    ("POST", "/tags", "create_tag"),
+    ("GET", "/tags/{id}", "get_tag"),
+    ("DELETE", "/tags/{id}", "delete_tag"),
+    ("GET", "/executions", "list_executions"),
+    ("GET", "/executions/{id}", "get_execution"),
+    ("DELETE", "/executions/{id}", "delete_execution"),
+]
+
+_COMPILED_ROUTES = [(method, template, re.compile("^/api/v1" + template.replace("{id}", "([^/]+)") + "$"), handler)
+                    for method, template, handler in ROUTES]
+
+
+def match_route(method, path):
+    """(yol şablonu, depo metodu adı, id) döndürür; eşleşme yoksa None"""
+    for route_method, template, pattern, handler in _COMPILED_ROUTES:
+        match = pattern.match(path)
+        if match and route_method == method:
+            return template, handler, match.group(1) if match.groups() else None
+    return None
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    """Depoya yönlendiren HTTP katmanı; keep-alive için HTTP/1.1 ve Content-Length kullanır"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "n8n-mock"
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status, body=None, headers=None):
+        payload = body if isinstance(body, bytes) else b"" if body is None else encode_json_body(body)
+        self.send_response(status)
+        if body is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(payload)
+        return len(payload)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return None
+        return json.loads(self.rfile.read(length).decode('utf-8'))
+
+    def _handle(self, method):
+        mock = self.server.mock
+        url = urlsplit(self.path)
+        if url.path == "/__stats":
+            self._send(200, mock.stats.snapshot())
+            return
+
+        route = match_route(method, url.path)
+        template = route[0] if route else "?"
+        mock.stats.begin(method, template)
+        sent = 0
+        try:
+            # Gövde her durumda okunur; okunmazsa keep-alive bağlantısında sonraki istek bozulur
+            try:
+                body = self._read_body()
+            except ValueError:
+                sent = self._send(400, {"message": "request body is not valid JSON"})
+                return
+
+            delay = mock.faults.delay()
+            if delay:
+                time.sleep(delay)
+            if mock.api_key and self.headers.get("X-N8N-API-KEY") != mock.api_key:
+                sent = self._send(401, {"message": "unauthorized"})
+                return
+            fault = mock.faults.pick(method, url.path[len("/api/v1"):])
+            if fault is not None:
+                mock.stats.fault(fault)
+                if fault == "timeout":
+                    time.sleep(mock.faults.hang_seconds)
+                    self.close_connection = True
+                    return
+                headers = None
+                if fault == 429 and mock.faults.retry_after is not None:
+                    headers = {"Retry-After": str(mock.faults.retry_after)}
+                message = "Too Many Requests" if fault == 429 else "Internal Server Error"
+                sent = self._send(fault, {"message": message}, headers)
+                return
+            if route is None:
+                sent = self._send(404, {"message": "not found"})
+                return
+
+            params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+            operation = getattr(mock.store, route[1])
+            args = [params] + ([body] if method in ("POST", "PUT", "DELETE") else []) + ([route[2]] if route[2] else [])
+            # Dönen kayıtlar depodaki canlı sözlükler; eşzamanlı yazmalarla karışmasın diye kilit altında kodlanır
+            with mock.store.lock:
+                status, result = operation(*args)
+                result = encode_json_body(result)
+                version = mock.store.version
+
+            headers = None
+            if route[1] == "list_workflows" and status == 200:
+                etag = '"' + hashlib.sha1(f"{version}?{url.query}".encode('utf-8')).hexdigest()[:20] + '"'
+                if self.headers.get("If-None-Match") == etag:
+                    sent = self._send(304, None, {"ETag": etag})
+                    return
+                headers = {"ETag": etag}
+            sent = self._send(status, result, headers)
+        except (BrokenPipeError, ConnectionResetError):
+            # İstemci zaman aşımıyla bağlantıyı kapatmış olabilir
+            self.close_connection = True
+        finally:
+            mock.stats.end(sent)
+
+    def do_GET(self):
+        self._handle("GET")
+
+    def do_POST(self):
+        self._handle("POST")
+
+    def do_PUT(self):
+        self._handle("PUT")
+
+    def do_DELETE(self):
+        self._handle("DELETE")
+
+
+class _HttpServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # Yanıtsız bekleyen (zaman aşımı enjeksiyonu) thread'ler kapanışı bekletmez
+    block_on_close = False
+
+
+class MockN8nServer:
+    """
+    Depoyu ve hata enjeksiyonunu bir HTTP sunucusunda yayınlar.
+
+    port=0 ise boş bir port seçilir. url, N8N_URL olarak kullanılacak kök
+    adrestir (/api/v1 olmadan). Arka planda çalıştırmak için start()/stop() ya da
+    'with' bloğu kullanılır.
+    """
+
+    def __init__(self, store=None, faults=None, host=DEFAULT_HOST, port=0, api_key=None, verbose=False):
+        self.store = store or WorkflowStore()
+        self.faults = faults or FaultInjector()
+        self.stats = ServerStats()
+        self.api_key = api_key
+        self.httpd = _HttpServer((host, port), _RequestHandler)
+        self.httpd.mock = self
+        self.httpd.verbose = verbose
+        self.thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """Sunucuyu arka plan thread'inde başlatır ve kök adresi döndürür"""
+        # Kısa yoklama aralığı stop()'un beklemeden dönmesini sağlar (testlerde sunucu sık açılıp kapanır)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, kwargs={"poll_interval": 0.05},
+                                       name="n8n-mock", daemon=True)
+        self.thread.start()
+        return self.url
+
+    def stop(self):
+        """Sunucuyu durdurur ve portu serbest bırakır"""
+        if self.thread:
+            self.httpd.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.httpd.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main(argv=None):
+    """Komut satırından sunucuyu başlatır (Ctrl+C ile durur)"""
+    parser = argparse.ArgumentParser(description="Yerel n8n API taklit sunucusu (kıyaslama ve ağsız testler için)")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--dir", dest="workflows_dir", default=None,
+                        help="Workflow dosyalarının yükleneceği klasör (--synthetic yoksa varsayılan workflows/)")
+    parser.add_argument("--synthetic", type=int, default=0, help="Bu kadar sentetik workflow üret")
+    parser.add_argument("--nodes", type=int, default=6, help="Sentetik workflow başına node sayısı")
+    parser.add_argument("--executions", type=int, default=0, help="Workflow başına sentetik çalıştırma sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgelelik tohumu (tekrarlanabilir veri ve hatalar)")
+    parser.add_argument("--api-key", default=None, help="Verilirse X-N8N-API-KEY başlığı bu değerle eşleşmeli")
+    parser.add_argument("--latency", type=float, default=0.0, help="İstek başına sabit gecikme (sn)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Gecikmeye eklenen rastgele süre üst sınırı (sn)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 dönen isteklerin oranı (0-1)")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="429 dönen isteklerin oranı (0-1)")
+    parser.add_argument("--retry-after", type=float, default=None, help="429 yanıtlarına eklenecek Retry-After (sn)")
+    parser.add_argument("--timeout-rate", type=float, default=0.0, help="Yanıtsız kalan isteklerin oranı (0-1)")
+    parser.add_argument("--hang", type=float, default=30.0, help="Zaman aşımı enjeksiyonunda bekleme süresi (sn)")
+    parser.add_argument("--verbose", action="store_true", help="Her isteği stderr'e yaz")
+    args = parser.parse_args(argv)
+
+    store = WorkflowStore(seed=args.seed)
+    if args.workflows_dir or not args.synthetic:
+        workflows_dir = args.workflows_dir or get_workflows_dir()
+        if os.path.isdir(workflows_dir):
+            print(f"{store.load_directory(workflows_dir)} workflow {workflows_dir} klasöründen yüklendi.")
+    for workflow in synthetic_workflows(args.synthetic, nodes=args.nodes, seed=args.seed):
+        store.add_workflow(workflow)
+    if args.executions:
+        store.add_executions(args.executions)
+
+    faults = FaultInjector(latency=args.latency, jitter=args.jitter, error_rate=args.error_rate,
+                           rate_limit_rate=args.rate_limit_rate, timeout_rate=args.timeout_rate,
+                           hang_seconds=args.hang, retry_after=args.retry_after, seed=args.seed)
+    server = MockN8nServer(store, faults, host=args.host, port=args.port, api_key=args.api_key,
+                           verbose=args.verbose)
+    print(f"{len(store.workflows)} workflow ile {server.url} adresinde dinleniyor "
+          f"(N8N_URL={server.url}, istatistikler: {server.url}/__stats). Durdurmak için Ctrl+C.")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
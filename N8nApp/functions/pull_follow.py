@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+N8N'deki değişiklikleri yoklayarak yerel workflow dosyalarına artımlı olarak yansıtma işlevleri
+"""
+
+import os
+import sys
+import json
+import time
+import argparse
+import subprocess
+import requests
+from .api_client import get_client, DEFAULT_POOL_SIZE
+from .utils import get_workflows_dir, workflow_file_name, atomic_write_json
+from .sync_manifest import SyncManifest, content_hash, remote_version
+from .workflow_projection import write_workflow_file, load_sidecar, merge_volatile
+
+# Son yoklamada görülen uzak sürümlerin tutulduğu gizli dosya (workflows klasöründe)
+PULL_STATE_FILE = ".pull-state.json"
+PULL_STATE_VERSION = 1
+
+# --follow modunda yoklamalar arası varsayılan süre (saniye)
+DEFAULT_PULL_INTERVAL = 10.0
+
+
+class PullState:
+    """
+    Workflow id'sine göre son çekilen uzak sürümü, dosya adını ve yazılan içeriğin hash'ini tutar.
+
+    'etag' tek sayfalık listenin son ETag değeridir; koşullu istekte kullanılır.
+    'conflicts' yerel değişiklik yüzünden yazılmayan workflow'ların görülen uzak
+    sürümünü ve yerel hash'i tutar; ikisi de değişmedikçe tekrar indirilmezler.
+    """
+
+    def __init__(self, workflows_dir):
+        self.workflows_dir = workflows_dir
+        self.path = os.path.join(workflows_dir, PULL_STATE_FILE)
+        self.etag = None
+        self.workflows = {}
+        self.conflicts = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, workflows_dir):
+        """Durumu diskten yükler; yoksa veya bozuksa boş döndürür"""
+        state = cls(workflows_dir)
+        try:
+            with open(state.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == PULL_STATE_VERSION:
+                state.etag = data.get("etag")
+                state.workflows = data.get("workflows", {})
+                state.conflicts = data.get("conflicts", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return state
+
+    def save(self):
+        """Değişiklik varsa durumu atomik olarak yazar"""
+        if self.dirty:
+            atomic_write_json(self.path, {"version": PULL_STATE_VERSION, "etag": self.etag,
+                                          "workflows": self.workflows, "conflicts": self.conflicts})
+            self.dirty = False
+
+    def is_current(self, summary):
+        """Uzak sürüm son çekilenle aynıysa True döner"""
+        return _same_version(self.workflows.get(summary.get("id")), summary)
+
+    def is_parked(self, summary):
+        """Çakışma olarak kaydedilmiş workflow'un ne uzak sürümü ne de yerel dosyası değiştiyse True döner"""
+        entry = self.conflicts.get(summary.get("id"))
+        if not _same_version(entry, summary):
+            return False
+        return _local_hash(os.path.join(self.workflows_dir, entry["file"])) == entry["local_hash"]
+
+    def record(self, workflow, file_name, hash_value):
+        version_id, updated_at = remote_version(workflow)
+        self.workflows[workflow["id"]] = {"file": file_name, "versionId": version_id,
+                                          "updatedAt": updated_at, "hash": hash_value}
+        self.conflicts.pop(workflow["id"], None)
+        self.dirty = True
+
+    def park(self, workflow, file_name, local_hash):
+        """Yerel değişiklik nedeniyle yazılmayan workflow'un uzak sürümünü ve yerel hash'ini kaydeder"""
+        version_id, updated_at = remote_version(workflow)
+        self.conflicts[workflow["id"]] = {"file": file_name, "versionId": version_id,
+                                          "updatedAt": updated_at, "local_hash": local_hash}
+        self.dirty = True
+
+
+def _same_version(entry, summary):
+    """Kayıttaki uzak sürüm özetteki sürümle aynıysa True döner"""
+    if not entry:
+        return False
+    version_id, updated_at = remote_version(summary)
+    if version_id:
+        return entry.get("versionId") == version_id
+    return updated_at is not None and entry.get("updatedAt") == updated_at
+
+
+def _local_hash(file_path):
+    """Yerel dosyanın içerik hash'i (okunamazsa None)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return content_hash(merge_volatile(json.load(f), load_sidecar(file_path)))
+    except (OSError, ValueError):
+        return None
+
+
+def git_commit_files(file_paths, message):
+    """Dosyaları tek bir commit'te toplar (sadece verilen yollar commit'lenir)"""
+    if not file_paths:
+        return False
+    cwd = os.path.dirname(os.path.abspath(file_paths[0]))
+    try:
+        # Silinmiş yollardan (yeniden adlandırmanın eski adı) sadece git'in izlediği olanlar eklenebilir;
+        # izlenmeyen bir yol verilirse git add/commit tamamen başarısız olur
+        missing = [path for path in file_paths if not os.path.exists(path)]
+        if missing:
+            listed = subprocess.run(['git', 'ls-files', '-z', '--'] + missing, check=True, cwd=cwd,
+                                    capture_output=True, text=True).stdout
+            tracked = {os.path.abspath(os.path.join(cwd, path)) for path in listed.split("\0") if path}
+            file_paths = [path for path in file_paths
+                          if os.path.exists(path) or os.path.abspath(path) in tracked]
+        if not file_paths:
+            return False
+        subprocess.run(['git', 'add', '--all', '--'] + list(file_paths), check=True, cwd=cwd,
+                       stdout=subprocess.DEVNULL)
+        result = subprocess.run(['git', 'commit', '-q', '-m', message, '--'] + list(file_paths), cwd=cwd,
+                                stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return result.returncode == 0
+    except (OSError, subprocess.SubprocessError) as e:
+        print(f"Git komutu çalıştırılırken hata oluştu: {str(e)}")
+        return False
+
+
+def pull_changes(workflows_dir=None, state=None, workers=DEFAULT_POOL_SIZE, git=False):
+    """
+    Tek bir yoklama yapar ve değişen workflow'ları dosyalara yazar.
+
+    Özet listesi koşullu istekle alınır; sadece sürümü değişenlerin tam içeriği
+    indirilip kanonik biçimde yazılır. Son çekimden sonra yerelde değiştirilmiş
+    dosyaların üzerine yazılmaz ('conflicts'); bunlar uzak sürüm veya yerel dosya
+    değişene kadar tekrar indirilip raporlanmaz. Uzakta silinen workflow'ların
+    dosyalarına dokunulmaz, 'removed' listesinde raporlanır.
+    """
+    workflows_dir = workflows_dir or get_workflows_dir()
+    os.makedirs(workflows_dir, exist_ok=True)
+    state = state or PullState.load(workflows_dir)
+    client = get_client()
+
+    report = {"not_modified": False, "written": [], "renamed": [], "conflicts": [], "removed": [], "failed": []}
+    summaries, state.etag = client.workflow_summaries(state.etag)
+    if summaries is None:
+        report["not_modified"] = True
+        return report
+    state.dirty = True
+
+    summaries = [summary for summary in summaries if isinstance(summary, dict) and summary.get("id")]
+    remote_ids = {summary["id"] for summary in summaries}
+    report["removed"] = sorted(workflow_id for workflow_id in state.workflows if workflow_id not in remote_ids)
+    changed = [summary["id"] for summary in summaries
+               if not state.is_current(summary) and not state.is_parked(summary)]
+
+    bodies, errors = client.fetch_workflows(changed, workers=workers)
+    report["failed"] = sorted(errors.items())
+    if errors:
+        # Başarısız olanlar bir sonraki yoklamada 304'e takılmadan tekrar denensin
+        state.etag = None
+
+    manifest = SyncManifest.load(workflows_dir)
+    written_paths = []
+    for workflow_id in changed:
+        workflow = bodies.get(workflow_id)
+        if workflow is None:
+            continue
+        entry = state.workflows.get(workflow_id, {})
+        file_name = workflow_file_name(workflow)
+        file_path = os.path.join(workflows_dir, file_name)
+        old_path = os.path.join(workflows_dir, entry["file"]) if entry.get("file") else file_path
+
+        # Son çekimden beri yerelde düzenlenmiş (veya hiç çekilmemiş ve farklı olan)
+        # dosyanın üzerine yazma; bu dosyalar senkron menüsüyle birleştirilmeli
+        new_hash = content_hash(workflow)
+        local_hash = _local_hash(old_path) if os.path.exists(old_path) else None
+        if local_hash is not None and local_hash not in (new_hash, entry.get("hash")):
+            report["conflicts"].append(os.path.basename(old_path))
+            state.park(workflow, os.path.basename(old_path), local_hash)
+            continue
+
+        if old_path != file_path and os.path.exists(old_path):
+            os.replace(old_path, file_path)
+            report["renamed"].append((entry["file"], file_name))
+            written_paths.extend([old_path, file_path])
+
+        written, _ = write_workflow_file(file_path, workflow)
+        state.record(workflow, file_name, new_hash)
+        manifest.record_sync(workflow, new_hash)
+        if written:
+            report["written"].append(file_name)
+            if file_path not in written_paths:
+                written_paths.append(file_path)
+
+    for workflow_id in report["removed"]:
+        del state.workflows[workflow_id]
+    for workflow_id in set(state.conflicts) - remote_ids:
+        del state.conflicts[workflow_id]
+    state.save()
+    manifest.save()
+
+    if git and written_paths:
+        message = f"n8n: {len(report['written'])} workflow güncellendi"
+        report["committed"] = git_commit_files(written_paths, message)
+    return report
+
+
+def format_pull_report(report):
+    """Yoklama raporunu kısa bir satıra çevirir"""
+    if report["not_modified"]:
+        return "Değişiklik yok (304)."
+    parts = [f"{len(report['written'])} dosya yazıldı"]
+    if report["renamed"]:
+        parts.append(f"{len(report['renamed'])} yeniden adlandırıldı")
+    if report["conflicts"]:
+        parts.append(f"{len(report['conflicts'])} yerel değişiklik korundu ({', '.join(report['conflicts'])})")
+    if report["removed"]:
+        parts.append(f"{len(report['removed'])} uzakta silindi ({', '.join(report['removed'])})")
+    if report["failed"]:
+        parts.append(f"{len(report['failed'])} hata")
+    return ", ".join(parts) + "."
+
+
+def follow(workflows_dir=None, interval=DEFAULT_PULL_INTERVAL, git=False, max_polls=None):
+    """Ctrl+C'ye (veya max_polls yoklamaya) kadar belirli aralıklarla pull_changes çalıştırır"""
+    workflows_dir = workflows_dir or get_workflows_dir()
+    state = PullState.load(workflows_dir)
+    print(f"N8N değişiklikleri {interval:g} sn aralıkla {workflows_dir} klasörüne çekiliyor. Durdurmak için Ctrl+C.")
+    polls = 0
+    try:
+        while max_polls is None or polls < max_polls:
+            started = time.monotonic()
+            try:
+                report = pull_changes(workflows_dir, state, git=git)
+                if not report["not_modified"] and (report["written"] or report["conflicts"]
+                                                   or report["removed"] or report["failed"]):
+                    print(f"[{time.strftime('%H:%M:%S')}] {format_pull_report(report)}")
+            except requests.exceptions.RequestException as e:
+                print(f"[{time.strftime('%H:%M:%S')}] N8N API'ye ulaşılamadı: {str(e)}")
+            polls += 1
+            if max_polls is None or polls < max_polls:
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+    except KeyboardInterrupt:
+        print("\nTakip durduruldu.")
+    return polls
+
+
+def main(argv=None):
+    """Komut satırından tek seferlik veya sürekli (--follow) çekme"""
+    parser = argparse.ArgumentParser(description="N8N'deki değişiklikleri yerel workflow dosyalarına çek")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="Hedef klasör")
+    parser.add_argument("--follow", action="store_true", help="Sürekli yokla ve değişiklikleri yansıt")
+    parser.add_argument("--interval", type=float, default=DEFAULT_PULL_INTERVAL, help="Yoklama aralığı (saniye)")
+    parser.add_argument("--git", action="store_true", help="Yazılan dosyaları her yoklamada tek commit'te topla")
+    args = parser.parse_args(argv)
+
+    if args.follow:
+        follow(args.workflows_dir, args.interval, git=args.git)
+        return 0
+    try:
+        report = pull_changes(args.workflows_dir, git=args.git)
+    except requests.exceptions.RequestException as e:
+        print(f"N8N API'ye ulaşılamadı: {str(e)}")
+        return 1
+    print(format_pull_report(report))
+    return 0 if not report["failed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
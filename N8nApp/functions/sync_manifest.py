@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Artımlı senkronizasyon için kalıcı manifest ve içerik hash işlevleri
+"""
+
+import os
+import json
+import hashlib
+from .utils import atomic_write_json
+
+# Manifest workflows klasöründe gizli bir dosya olarak tutulur
+MANIFEST_FILE = ".sync-manifest.json"
+MANIFEST_VERSION = 1
+
+# Üç yönlü birleştirme için son senkron tabanlarının tutulduğu gizli klasör
+BASE_DIR = ".sync-base"
+BASE_FIELDS = ("id", "name", "nodes", "connections", "settings")
+
+# Karşılaştırmada dikkate alınan node alanları (are_workflows_equal ile aynı)
+NODE_HASH_FIELDS = ("id", "name", "type", "typeVersion", "position", "parameters")
+
+
+def canonical_content(workflow):
+    """Workflow'un karşılaştırmada önemli kısmını (name/nodes/connections/settings) kanonik hale getirir"""
+    nodes = [
+        {field: node.get(field) for field in NODE_HASH_FIELDS}
+        for node in workflow.get("nodes", []) or []
+        if isinstance(node, dict)
+    ]
+    # Node sırası karşılaştırmada önemsiz, id'ye göre sırala
+    nodes.sort(key=lambda node: str(node.get("id")))
+
+    return {
+        "name": workflow.get("name"),
+        "nodes": nodes,
+        "connections": workflow.get("connections", {}) or {},
+        "settings": {"executionOrder": (workflow.get("settings") or {}).get("executionOrder")}
+    }
+
+
+def content_hash(workflow):
+    """Workflow içeriğinin kanonik SHA-256 hash'ini döndürür"""
+    payload = json.dumps(canonical_content(workflow), sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def remote_version(workflow):
+    """API workflow'unun sürüm bilgisini (versionId, updatedAt) döndürür"""
+    return workflow.get("versionId"), workflow.get("updatedAt")
+
+
+class SyncManifest:
+    """
+    Dosya stat bilgisi, içerik hash'i ve son senkronizasyondaki uzak sürümü tutan manifest.
+
+    'files' dosya adına göre (mtime_ns, size, id, name, hash), 'workflows' ise
+    workflow id'sine göre son senkron durumunu (hash, versionId, updatedAt) saklar.
+    """
+
+    def __init__(self, workflows_dir):
+        self.workflows_dir = workflows_dir
+        self.path = os.path.join(workflows_dir, MANIFEST_FILE)
+        self.files = {}
+        self.workflows = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, workflows_dir):
+        """Manifesti diskten yükler; yoksa veya bozuksa boş manifest döndürür"""
+        manifest = cls(workflows_dir)
+        try:
+            with open(manifest.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == MANIFEST_VERSION:
+                manifest.files = data.get("files", {})
+                manifest.workflows = data.get("workflows", {})
+        except (OSError, ValueError, AttributeError):
+            pass
+        return manifest
+
+    def save(self):
+        """Değişiklik varsa manifesti atomik olarak diske yazar"""
+        if not self.dirty:
+            return
+        atomic_write_json(self.path, {
+            "version": MANIFEST_VERSION,
+            "files": self.files,
+            "workflows": self.workflows
+        })
+        self.dirty = False
+
+    def scan_file(self, file_name, read_json):
+        """
+        Dosyanın kaydını döndürür; stat değişmemişse dosya parse edilmez.
+
+        Dönen kayıtta 'data' sadece dosya yeniden okunduysa doludur, aksi halde None'dır.
+        read_json geçersiz dosyalarda None döndürmelidir.
+        """
+        file_path = os.path.join(self.workflows_dir, file_name)
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+
+        cached = self.files.get(file_name)
+        if cached and cached.get("mtime_ns") == stat.st_mtime_ns and cached.get("size") == stat.st_size:
+            return {**cached, "file_name": file_name, "file_path": file_path, "data": None}
+
+        data = read_json(file_path)
+        if not isinstance(data, dict):
+            self.files.pop(file_name, None)
+            self.dirty = True
+            return None
+
+        entry = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "id": data.get("id"),
+            "name": data.get("name"),
+            "hash": content_hash(data)
+        }
+        self.files[file_name] = entry
+        self.dirty = True
+        return {**entry, "file_name": file_name, "file_path": file_path, "data": data}
+
+    def prune_files(self, existing_files):
+        """Artık var olmayan dosyaların kayıtlarını siler"""
+        for file_name in set(self.files) - set(existing_files):
+            del self.files[file_name]
+            self.dirty = True
+
+    def is_unchanged_since_sync(self, api_workflow, file_hash):
+        """Uzak sürüm ve dosya hash'i son senkronizasyondakiyle aynıysa True döner"""
+        entry = self.workflows.get(api_workflow.get("id"))
+        if not entry or entry.get("hash") != file_hash:
+            return False
+        version_id, updated_at = remote_version(api_workflow)
+        if version_id:
+            return entry.get("versionId") == version_id
+        return updated_at is not None and entry.get("updatedAt") == updated_at
+
+    def record_sync(self, api_workflow, synced_hash):
+        """Dosya ile API'nin eşit olduğu son durumu kaydeder, tam içerik varsa tabanı da saklar"""
+        version_id, updated_at = remote_version(api_workflow)
+        entry = {"hash": synced_hash, "versionId": version_id, "updatedAt": updated_at}
+        previous = self.workflows.get(api_workflow["id"])
+        if previous != entry:
+            self.workflows[api_workflow["id"]] = entry
+            self.dirty = True
+        if "nodes" in api_workflow and (not previous or previous.get("hash") != synced_hash
+                                        or not os.path.exists(self.base_path(api_workflow["id"]))):
+            self.save_base(api_workflow)
+
+    def base_path(self, workflow_id):
+        """Workflow'un taban anlık görüntüsünün dosya yolunu döndürür"""
+        return os.path.join(self.workflows_dir, BASE_DIR, f"{workflow_id}.json")
+
+    def save_base(self, workflow):
+        """Senkron durumdaki workflow içeriğini üç yönlü birleştirme tabanı olarak saklar"""
+        path = self.base_path(workflow["id"])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        atomic_write_json(path, {field: workflow.get(field) for field in BASE_FIELDS})
+
+    def load_base(self, workflow_id):
+        """Son senkron tabanını döndürür (yoksa None)"""
+        try:
+            with open(self.base_path(workflow_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def forget(self, workflow_id):
+        """Workflow'un senkron kaydını siler (bir sonraki karşılaştırmada tam kontrol yapılır)"""
+        if self.workflows.pop(workflow_id, None) is not None:
+            self.dirty = True
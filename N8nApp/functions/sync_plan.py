@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Senkronizasyon planı oluşturma ve planı paralel uygulama işlevleri
+"""
+
+import os
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .api_client import DEFAULT_POOL_SIZE
+from .utils import workflow_file_name, write_canonical_json
+from .upload_workflow import update_workflow, create_new_workflow
+from .sync_manifest import content_hash, remote_version
+from .workflow_merge import merge_workflows
+
+# Plan adımlarının uygulama sırası (aynı workflow içinde)
+ACTION_ORDER = {"update_api": 0, "create_api": 1, "rename_file": 2, "write_file": 3}
+
+# Çakışmalarda kullanılabilecek tercih değerleri
+PREFER_CHOICES = ("file", "n8n")
+
+
+def _action_key(action):
+    """Aynı workflow'a ait adımları gruplamak için anahtar"""
+    return action.get("workflow_id") or action.get("file_name")
+
+
+def _file_actions(workflow, workflow_id, name, file_record, reason):
+    """Workflow'u dosyaya yazmak için gereken (gerekirse yeniden adlandırma dahil) adımları döndürür"""
+    target = workflow_file_name(workflow)
+    actions = []
+    if file_record and file_record["file_name"] != target:
+        actions.append({
+            "action": "rename_file", "workflow_id": workflow_id, "name": name,
+            "from": file_record["file_name"], "to": target
+        })
+    actions.append({
+        "action": "write_file", "workflow_id": workflow_id, "name": name,
+        "file_name": target, "reason": reason, "payload": workflow
+    })
+    return actions
+
+
+def build_sync_plan(state, prefer=None):
+    """
+    Karşılaştırma sonucundan (collect_sync_state) yan etkisiz bir senkron planı üretir.
+
+    Farklı workflow'lar için önce üç yönlü birleştirme denenir; çakışma varsa
+    prefer ('file' veya 'n8n') verilmişse o taraf seçilir, verilmemişse
+    'conflict' adımı eklenir ve bu adım uygulanmaz.
+    """
+    manifest = state["manifest"]
+    actions = []
+
+    for item in state["to_update_from_file"]:
+        api_wf = item["api"]
+        file_record = item["file"]
+        file_wf = file_record["data"]
+        wf_id = api_wf["id"]
+        name = api_wf.get("name")
+
+        base = manifest.load_base(wf_id)
+        merge_result = merge_workflows(base, file_wf, api_wf) if base else None
+
+        if merge_result and not merge_result["conflicts"]:
+            merged = merge_result["merged"]
+            merged_hash = content_hash(merged)
+            # Birleştirilmiş içerik sadece farklı olan taraf(lar)a yazılır
+            if merged_hash != content_hash(api_wf):
+                actions.append({
+                    "action": "update_api", "workflow_id": wf_id, "name": name,
+                    "file_name": file_record["file_name"], "reason": "merge", "payload": merged
+                })
+            if merged_hash != file_record["hash"]:
+                actions.extend(_file_actions(merged, wf_id, name, file_record, "merge"))
+        elif prefer == "file":
+            actions.append({
+                "action": "update_api", "workflow_id": wf_id, "name": name,
+                "file_name": file_record["file_name"], "reason": "file", "payload": {**file_wf, "id": wf_id}
+            })
+        elif prefer == "n8n":
+            actions.extend(_file_actions(api_wf, wf_id, name, file_record, "n8n"))
+        else:
+            actions.append({
+                "action": "conflict", "workflow_id": wf_id, "name": name,
+                "file_name": file_record["file_name"],
+                "conflicts": merge_result["conflicts"] if merge_result else [],
+                "has_base": bool(base),
+                "diff": item.get("diff")
+            })
+
+    for api_wf in state["to_create_file"]:
+        actions.extend(_file_actions(api_wf, api_wf["id"], api_wf.get("name"), None, "new"))
+
+    for file_record in state["to_create_api"]:
+        actions.append({
+            "action": "create_api", "workflow_id": None, "name": file_record["name"] or "İsimsiz Workflow",
+            "file_name": file_record["file_name"], "payload": file_record["data"]
+        })
+
+    return {
+        "workflow_dir": state["workflow_dir"],
+        "matching": len(state["matching_workflows"]),
+        "actions": actions
+    }
+
+
+def resolve_conflict(plan, action, prefer, state):
+    """Bir 'conflict' adımını seçilen tarafa göre uygulanabilir adımlarla değiştirir"""
+    item = next(entry for entry in state["to_update_from_file"] if entry["api"]["id"] == action["workflow_id"])
+    replacement = build_sync_plan({
+        **state,
+        "to_update_from_file": [item],
+        "to_create_file": [],
+        "to_create_api": []
+    }, prefer=prefer)["actions"]
+    index = plan["actions"].index(action)
+    plan["actions"][index:index + 1] = replacement
+
+
+def plan_counts(plan):
+    """Plan adımlarını türüne göre sayar"""
+    counts = {}
+    for action in plan["actions"]:
+        counts[action["action"]] = counts.get(action["action"], 0) + 1
+    return counts
+
+
+def _action_entry(action, include_payloads=False):
+    entry = {key: value for key, value in action.items() if key != "diff"}
+    if not include_payloads:
+        entry.pop("payload", None)
+    return entry
+
+
+def apply_summary_to_dict(summary):
+    """apply_sync_plan sonucunu JSON'a yazılabilir sözlüğe çevirir (içerikler hariç)"""
+    return {
+        "succeeded": summary["succeeded"],
+        "failed": [{**_action_entry(result["action"]), "error": result["error"]} for result in summary["failed"]],
+        "skipped_conflicts": summary["skipped_conflicts"],
+        "seconds": round(summary["seconds"], 3)
+    }
+
+
+def plan_to_json(plan, include_payloads=False, summary=None):
+    """
+    Planı JSON metnine çevirir (varsayılan olarak workflow içerikleri hariç).
+
+    summary verilirse (apply_sync_plan sonucu) 'result' alanına eklenir.
+    """
+    data = {
+        "workflow_dir": plan["workflow_dir"],
+        "matching": plan["matching"],
+        "counts": plan_counts(plan),
+        "actions": [_action_entry(action, include_payloads) for action in plan["actions"]]
+    }
+    if summary is not None:
+        data["result"] = apply_summary_to_dict(summary)
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def format_plan_text(plan):
+    """Planı satır bazlı okunabilir bir metne çevirir"""
+    labels = {
+        "update_api": "N8N güncelle",
+        "create_api": "N8N'de oluştur",
+        "write_file": "Dosyaya yaz",
+        "rename_file": "Dosyayı yeniden adlandır",
+        "conflict": "ÇAKIŞMA (atlanacak)"
+    }
+    lines = []
+    for action in plan["actions"]:
+        label = labels.get(action["action"], action["action"])
+        if action["action"] == "rename_file":
+            detail = f"{action['from']} → {action['to']}"
+        else:
+            detail = action.get("file_name") or ""
+        reason = f" [{action['reason']}]" if action.get("reason") else ""
+        lines.append(f"  • {label:<26} '{action.get('name')}' {detail}{reason}")
+    if not lines:
+        lines.append("  Yapılacak işlem yok.")
+    return "\n".join(lines)
+
+
+def _run_action(action, workflow_dir, backup_api):
+    """Tek bir plan adımını çalıştırır, başarılıysa True döner"""
+    kind = action["action"]
+    if kind == "update_api":
+        return update_workflow(action["workflow_id"], action["payload"], backup_api_workflow=backup_api)
+    if kind == "create_api":
+        file_path = os.path.join(workflow_dir, action["file_name"])
+        return create_new_workflow(action["name"], action["payload"], file_path)
+    if kind == "rename_file":
+        source = os.path.join(workflow_dir, action["from"])
+        target = os.path.join(workflow_dir, action["to"])
+        if os.path.exists(source):
+            os.replace(source, target)
+        return True
+    if kind == "write_file":
+        write_canonical_json(os.path.join(workflow_dir, action["file_name"]), action["payload"])
+        return True
+    return False
+
+
+def apply_sync_plan(plan, manifest=None, workers=DEFAULT_POOL_SIZE, backup_api=False):
+    """
+    Planı thread havuzuyla uygular.
+
+    Aynı workflow'a ait adımlar sırayla, farklı workflow'lar paralel çalışır.
+    Bir adım başarısız olursa o workflow'un kalan adımları atlanır. Başarılı
+    güncellemeler manifeste senkron durumu (uzak sürüm ve dosya hash'i) olarak
+    kaydedilir, içerikleri yeni birleştirme tabanı olur; manifest sonunda bir kez yazılır.
+    """
+    groups = {}
+    for action in plan["actions"]:
+        if action["action"] == "conflict":
+            continue
+        groups.setdefault(_action_key(action), []).append(action)
+
+    results = []
+    results_lock = threading.Lock()
+
+    def run_group(group):
+        synced = remote = None
+        for action in sorted(group, key=lambda entry: ACTION_ORDER.get(entry["action"], 99)):
+            started = time.perf_counter()
+            try:
+                outcome = _run_action(action, plan["workflow_dir"], backup_api)
+                ok = bool(outcome)
+                error = None if ok else "işlem başarısız"
+            except Exception as e:
+                ok, error = False, str(e)
+            elapsed = time.perf_counter() - started
+            with results_lock:
+                results.append({"action": action, "ok": ok, "error": error, "seconds": elapsed})
+            if not ok:
+                return
+            if action.get("workflow_id") and action["action"] in ("update_api", "write_file"):
+                workflow_id, synced = action["workflow_id"], action["payload"]
+                # Uzak sürüm: PUT yanıtı, yoksa dosyaya yazılan API gövdesi
+                if action["action"] == "update_api" and isinstance(outcome, dict):
+                    remote = outcome
+                elif remote is None:
+                    remote = action["payload"]
+        if manifest and synced is not None:
+            workflow = {**synced, "id": workflow_id}
+            version_id, updated_at = remote_version(remote)
+            with results_lock:
+                if version_id or updated_at:
+                    # Sonraki karşılaştırmada bu workflow değişmemiş sayılır ve içeriği indirilmez
+                    manifest.record_sync({**workflow, "versionId": version_id, "updatedAt": updated_at},
+                                         content_hash(synced))
+                else:
+                    manifest.save_base(workflow)
+
+    started = time.perf_counter()
+    if groups:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(groups)))) as executor:
+            list(executor.map(run_group, groups.values()))
+    if manifest:
+        manifest.save()
+    elapsed = time.perf_counter() - started
+
+    return {
+        "results": results,
+        "succeeded": sum(1 for result in results if result["ok"]),
+        "failed": [result for result in results if not result["ok"]],
+        "skipped_conflicts": sum(1 for action in plan["actions"] if action["action"] == "conflict"),
+        "seconds": elapsed
+    }
+
+
+def format_apply_summary(summary):
+    """Uygulama sonucunu süre ve hatalarla birlikte özetler"""
+    lines = [
+        f"Başarılı adım: {summary['succeeded']}",
+        f"Başarısız adım: {len(summary['failed'])}",
+        f"Atlanan çakışma: {summary['skipped_conflicts']}",
+        f"Toplam süre: {summary['seconds']:.2f} sn"
+    ]
+    if summary["results"]:
+        slowest = max(summary["results"], key=lambda result: result["seconds"])
+        lines.append(f"En yavaş adım: {slowest['action']['action']} '{slowest['action'].get('name')}' "
+                     f"({slowest['seconds']:.2f} sn)")
+    for result in summary["failed"]:
+        action = result["action"]
+        lines.append(f"  ❌ {action['action']} '{action.get('name')}': {result['error']}")
+    return "\n".join(lines)
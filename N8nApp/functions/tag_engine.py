@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+Önbellekli etiket kataloğu ve isimle, eşzamanlı toplu etiketleme işlevleri
+"""
+
+import sys
+import time
+import argparse
+import threading
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from .api_client import get_client, error_message, DEFAULT_POOL_SIZE
+from .utils import getenv
+from .workflow_cache import invalidate_workflow_list
+from .workflow_filters import select_workflows, add_filter_arguments, filter_from_args, split_names
+
+# Etiket kataloğunun önbellekte geçerli kalacağı süre (saniye)
+DEFAULT_TAG_CACHE_TTL = float(getenv("N8N_TAG_CACHE_TTL", "300"))
+
+# /tags sayfa boyutu
+TAG_PAGE_SIZE = 100
+
+
+class TagCatalog:
+    """
+    İsim -> id etiket kataloğu; TTL dolana veya invalidate() çağrılana kadar önbellekten okunur.
+
+    İsimler büyük/küçük harf duyarsız eşleşir; eksik etiketler istenirse oluşturulur.
+    """
+
+    def __init__(self, client=None, ttl=DEFAULT_TAG_CACHE_TTL):
+        self.client = client
+        self.ttl = ttl
+        self.by_name = {}
+        self.by_id = {}
+        self.loaded_at = None
+        self.lock = threading.RLock()
+
+    def _client(self):
+        return self.client or get_client()
+
+    def invalidate(self):
+        """Bir sonraki erişimde kataloğun yeniden yüklenmesini sağlar"""
+        with self.lock:
+            self.loaded_at = None
+
+    def refresh(self):
+        """Tüm etiketleri (cursor ile sayfa sayfa) yeniden yükler"""
+        tags = []
+        params = {"limit": TAG_PAGE_SIZE}
+        while True:
+            response = self._client().get("/tags", params=params)
+            response.raise_for_status()
+            data = response.json()
+            if isinstance(data, dict) and "data" in data:
+                tags.extend(data["data"])
+                cursor = data.get("nextCursor")
+            else:
+                tags.extend(data or [])
+                cursor = None
+            if not cursor:
+                break
+            params = {**params, "cursor": cursor}
+
+        with self.lock:
+            self.by_id = {tag["id"]: tag["name"] for tag in tags if isinstance(tag, dict) and tag.get("id")}
+            self.by_name = {name.lower(): tag_id for tag_id, name in self.by_id.items()}
+            self.loaded_at = time.monotonic()
+        return self.by_id
+
+    def _ensure_loaded(self):
+        with self.lock:
+            if self.loaded_at is None or time.monotonic() - self.loaded_at > self.ttl:
+                self.refresh()
+
+    def tags(self):
+        """{id: isim} kataloğunu döndürür"""
+        self._ensure_loaded()
+        return dict(self.by_id)
+
+    def lookup(self, name_or_id):
+        """Etiket ismini veya id'sini id'ye çevirir; yoksa None"""
+        self._ensure_loaded()
+        with self.lock:
+            if name_or_id in self.by_id:
+                return name_or_id
+            return self.by_name.get(str(name_or_id).lower())
+
+    def create(self, name):
+        """Etiketi oluşturur; başka biri aynı anda oluşturduysa (409) mevcut id'yi döndürür"""
+        with self.lock:
+            existing = self.lookup(name)
+            if existing:
+                return existing
+            response = self._client().post("/tags", json={"name": name})
+            if response.status_code == 409:
+                self.refresh()
+                existing = self.by_name.get(name.lower())
+                if existing:
+                    return existing
+            response.raise_for_status()
+            tag = response.json()
+            self.by_id[tag["id"]] = tag["name"]
+            self.by_name[tag["name"].lower()] = tag["id"]
+            return tag["id"]
+
+    def resolve(self, names, create_missing=False):
+        """
+        İsimleri id'lere çevirir: (isim -> id, eksik isimler).
+
+        create_missing=True ise katalogda olmayan etiketler oluşturulur.
+        """
+        resolved = {}
+        missing = []
+        for name in names:
+            tag_id = self.lookup(name)
+            if tag_id is None and create_missing:
+                tag_id = self.create(name)
+            if tag_id is None:
+                missing.append(name)
+            else:
+                resolved[name] = tag_id
+        return resolved, missing
+
+
+_catalog = None
+_catalog_lock = threading.Lock()
+
+
+def get_tag_catalog():
+    """Süreç genelinde paylaşılan TagCatalog örneğini döndürür"""
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                _catalog = TagCatalog()
+    return _catalog
+
+
+def current_tag_ids(workflow):
+    """Workflow'un mevcut etiket id'leri (sırası korunarak)"""
+    return [tag["id"] for tag in workflow.get("tags", []) or [] if isinstance(tag, dict) and tag.get("id")]
+
+
+def merge_tag_ids(current, add_ids=(), remove_ids=(), set_ids=None):
+    """
+    Yeni etiket listesini hesaplar; mevcut etiketler korunur (set_ids verilmedikçe).
+
+    Değişiklik yoksa None döndürür.
+    """
+    base = list(set_ids) if set_ids is not None else list(current)
+    merged = [tag_id for tag_id in dict.fromkeys(base + list(add_ids)) if tag_id not in set(remove_ids)]
+    return None if set(merged) == set(current) else merged
+
+
+def put_workflow_tags(workflow_id, tag_ids, client=None):
+    """Workflow'un etiket listesini verilen id'lerle değiştirir"""
+    response = (client or get_client()).put(f"/workflows/{workflow_id}/tags",
+                                            json=[{"id": tag_id} for tag_id in tag_ids])
+    response.raise_for_status()
+    return response
+
+
+def apply_tag_operation(workflows, add=(), remove=(), set_tags=None, create_missing=True,
+                        workers=DEFAULT_POOL_SIZE, dry_run=False, catalog=None):
+    """
+    Etiket ekleme/çıkarma/ayarlama işlemini workflow'lara eşzamanlı uygular.
+
+    workflows listeleme kayıtlarıdır (mevcut 'tags' alanıyla). Etiketler isim
+    veya id ile verilebilir; eklenecek/ayarlanacak eksik etiketler create_missing
+    ile oluşturulur, çıkarılacak olanlardan bilinmeyenler yok sayılır. Etiketleri
+    zaten istenen durumda olan workflow'lara istek atılmaz; değişiklik olursa önbellekteki
+    workflow listesi geçersiz kılınır. dry_run'da oluşturulacak
+    etiketler 'new_tags' içinde raporlanır ve planda "(yeni)" olarak görünür.
+    """
+    started = time.perf_counter()
+    catalog = catalog or get_tag_catalog()
+    creatable = list(add) + list(set_tags or [])
+    resolved, missing = catalog.resolve(creatable, create_missing=create_missing and not dry_run)
+    removable, _ = catalog.resolve(remove)
+
+    new_tags = []
+    if dry_run and create_missing:
+        # Oluşturulmayan etiketler plan için isimlerinden türetilen yer tutucu id'lerle eklenir
+        new_tags, missing = list(dict.fromkeys(missing)), []
+        resolved.update({name: f"{name} (yeni)" for name in new_tags})
+
+    report = {"changed": [], "unchanged": 0, "failed": [], "missing_tags": missing, "new_tags": new_tags,
+              "seconds": 0.0}
+    if missing and not dry_run:
+        report["seconds"] = time.perf_counter() - started
+        return report
+
+    add_ids = [resolved[name] for name in add if name in resolved]
+    set_ids = [resolved[name] for name in set_tags if name in resolved] if set_tags is not None else None
+    remove_ids = list(removable.values())
+
+    planned = []
+    for workflow in workflows:
+        new_ids = merge_tag_ids(current_tag_ids(workflow), add_ids, remove_ids, set_ids)
+        if new_ids is None:
+            report["unchanged"] += 1
+        else:
+            planned.append((workflow, new_ids))
+
+    def apply(item):
+        workflow, new_ids = item
+        try:
+            if not dry_run:
+                put_workflow_tags(workflow["id"], new_ids)
+            return workflow, new_ids, None
+        except requests.exceptions.RequestException as e:
+            return workflow, new_ids, error_message(e)
+
+    if planned:
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(planned)))) as executor:
+            for workflow, new_ids, error in executor.map(apply, planned):
+                if error:
+                    report["failed"].append((workflow["id"], workflow.get("name"), error))
+                else:
+                    names = catalog.tags()
+                    report["changed"].append((workflow["id"], workflow.get("name"),
+                                              [names.get(tag_id, tag_id) for tag_id in new_ids]))
+    if report["changed"] and not dry_run:
+        # Etiketleri değişen workflow'lar önbellekteki listede eski etiketleriyle kalmasın
+        invalidate_workflow_list()
+    report["seconds"] = time.perf_counter() - started
+    return report
+
+
+def format_tag_report(report, dry_run=False):
+    """Etiketleme raporunu metne çevirir"""
+    lines = []
+    verb = "değişecek" if dry_run else "güncellendi"
+    for workflow_id, name, tags in report["changed"]:
+        lines.append(f"  ✓ {name} ({workflow_id}): {', '.join(tags) or '(etiket yok)'}")
+    for workflow_id, name, error in report["failed"]:
+        lines.append(f"  ❌ {name} ({workflow_id}): {error}")
+    if report.get("new_tags"):
+        lines.append(f"Oluşturulacak etiketler: {', '.join(f'{name} (yeni)' for name in report['new_tags'])}")
+    if report["missing_tags"]:
+        lines.append(f"Bulunamayan etiketler: {', '.join(report['missing_tags'])}")
+    lines.append(f"{len(report['changed'])} workflow {verb}, {report['unchanged']} zaten güncel, "
+                 f"{len(report['failed'])} hata ({report['seconds']:.2f} sn).")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Komut satırından filtreyle seçilen workflow'lara toplu etiket işlemi"""
+    parser = argparse.ArgumentParser(description="Workflow'ları isimle ve toplu olarak etiketle")
+    parser.add_argument("--add", default="", help="Eklenecek etiketler (virgülle ayrılmış)")
+    parser.add_argument("--remove", default="", help="Çıkarılacak etiketler (virgülle ayrılmış)")
+    parser.add_argument("--set", dest="set_tags", default=None, help="Etiket listesini tamamen bununla değiştir")
+    parser.add_argument("--no-create", action="store_true", help="Eksik etiketleri oluşturma")
+    parser.add_argument("--workers", type=int, default=DEFAULT_POOL_SIZE, help="Eşzamanlı işçi sayısı")
+    parser.add_argument("--dry-run", action="store_true", help="Sadece neyin değişeceğini göster")
+    parser.add_argument("--list", action="store_true", help="Etiket kataloğunu listele")
+    parser.add_argument("--all", action="store_true", help="Filtre olmadan tüm workflow'lar")
+    add_filter_arguments(parser)
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for tag_id, name in sorted(get_tag_catalog().tags().items(), key=lambda item: item[1].lower()):
+            print(f"{tag_id:<20} {name}")
+        return 0
+
+    add, remove = split_names(args.add), split_names(args.remove)
+    set_tags = split_names(args.set_tags) if args.set_tags is not None else None
+    if not add and not remove and set_tags is None:
+        parser.error("--add, --remove veya --set seçeneklerinden en az biri gerekli")
+    workflow_filter = filter_from_args(args)
+    if workflow_filter.is_empty() and not args.all:
+        parser.error("en az bir filtre (ör. --tag prod, --name rapor) veya --all gerekli")
+
+    try:
+        workflows = select_workflows(workflow_filter)
+        print(f"{len(workflows)} workflow seçildi ({workflow_filter.describe()}).")
+        report = apply_tag_operation(workflows, add, remove, set_tags, create_missing=not args.no_create,
+                                     workers=args.workers, dry_run=args.dry_run)
+    except requests.exceptions.RequestException as e:
+        print(f"Etiket işlemi sırasında hata oluştu: {error_message(e)}")
+        return 1
+    print(format_tag_report(report, args.dry_run))
+    return 0 if not report["failed"] and not report["missing_tags"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
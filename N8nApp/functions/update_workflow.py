@@ -3,14 +3,14 @@
 Workflow güncelleme işlevleri
 """
 
-import json
 import requests
-from functions.utils import N8N_URL, headers, headers_with_content_type
-from functions.list_workflows import list_workflows
+from functions.api_client import get_client
+from functions.workflow_cache import show_workflow_list, invalidate_workflow_list
 
 def update_workflow():
     """Var olan bir workflow'u şablonla güncelle"""
-    workflows = list_workflows()
+    # Seçim listesi oturum önbelleğinden gelir; kaydetme sorusu sorulmaz
+    workflows = show_workflow_list()
     
     if not workflows:
         return
@@ -28,10 +28,7 @@ def update_workflow():
         workflow_id = selected_workflow["id"]
         
         # Değiştirilecek mevcut workflow'u al
-        response = requests.get(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}?excludePinnedData=true",
-            headers=headers
-        )
+        response = get_client().get(f"/workflows/{workflow_id}?excludePinnedData=true")
         response.raise_for_status()
         current_workflow = response.json()
         
@@ -42,12 +39,12 @@ def update_workflow():
         
         # Güncellenmiş workflow'u gönder
         print(f"\nWorkflow ID: {workflow_id} güncelleniyor...")
-        update_response = requests.put(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}",
-            headers=headers_with_content_type,
-            data=json.dumps(current_workflow)
+        update_response = get_client().put(
+            f"/workflows/{workflow_id}",
+            json=current_workflow
         )
         update_response.raise_for_status()
+        invalidate_workflow_list()
         
         print("\nWorkflow başarıyla güncellendi!")
     
@@ -6,8 +6,10 @@ Workflow yükleme işlevleri
 import os
 import json
 import requests
-import datetime
-from .utils import N8N_URL, headers, headers_with_content_type
+from .api_client import get_client
+from .backup_store import get_backup_store
+from .utils import write_canonical_json, upload_payload
+from .workflow_cache import invalidate_workflow_list
 
 def get_workflow_files():
     """Workflow dizinindeki tüm JSON dosyalarını listeler"""
@@ -16,8 +18,11 @@ def get_workflow_files():
         print("\nWorkflow dizini bulunamadı.")
         return []
     
-    workflow_files = [f for f in os.listdir(workflow_dir) if f.endswith('.json')]
-    return workflow_files, workflow_dir
+    # Klasör taraması yerel indeksin güncellenmesiyle tek geçişte yapılır; sadece değişen dosyalar parse
+    # edilir ve komutun geri kalanındaki id -> dosya aramaları dosya okumadan indeksten yanıtlanır.
+    # Gizli dosyalar (geçici yazım dosyaları vb.) workflow sayılmaz
+    from .workflow_index import get_workflow_index
+    return list(get_workflow_index(workflow_dir).file_names), workflow_dir
 
 def read_workflow_json(file_path):
     """JSON dosyasını okur ve içeriğini döndürür"""
@@ -31,31 +36,34 @@ def read_workflow_json(file_path):
         print(f"\n{os.path.basename(file_path)} okunurken hata oluştu: {str(e)}")
         return None
 
-def create_new_workflow(workflow_name, workflow_data, file_path=None):
-    """Yeni bir workflow oluşturur"""
+def validate_before_upload(workflow_data, label):
+    """Yükleme gövdesini yerelde doğrular; hata varsa yazdırıp False döner (API'ye istek atılmaz)"""
+    from .workflow_validator import validate_workflow, has_errors, format_issues_text
+    issues = validate_workflow(workflow_data)
+    if has_errors(issues):
+        print(f"\n{label} doğrulamadan geçemedi, yükleme yapılmadı:")
+        print(format_issues_text([issue for issue in issues if issue["level"] == "error"]))
+        return False
+    return True
+
+def create_new_workflow(workflow_name, workflow_data, file_path=None, validate=True):
+    """Yeni bir workflow oluşturur (validate=False: çağıran gövdeyi zaten doğruladı)"""
     # Gerekli alanları hazırla
     if "nodes" not in workflow_data:
         print("Workflow verisi geçersiz, 'nodes' bulunamadı.")
         return False
+    if validate and not validate_before_upload({**workflow_data, "name": workflow_name}, f"'{workflow_name}'"):
+        return False
     
     # Sadece temel alanları al
-    allowed_data = {
-        "name": workflow_name,
-        "nodes": workflow_data["nodes"],
-        "connections": workflow_data.get("connections", {}),
-        "settings": {"executionOrder": "v1"},
-        "staticData": {}
-    }
+    allowed_data = upload_payload(workflow_data, workflow_name)
     
     try:
         # API isteği gönder
         print(f"\nWorkflow oluşturuluyor: {workflow_name}")
-        response = requests.post(
-            f"{N8N_URL}/api/v1/workflows",
-            headers=headers_with_content_type,
-            json=allowed_data
-        )
+        response = get_client().post("/workflows", json=allowed_data)
         response.raise_for_status()
+        invalidate_workflow_list()
         result = response.json()
         new_id = result.get('id')
         print(f"\nYeni workflow başarıyla oluşturuldu. ID: {new_id}")
@@ -70,9 +78,8 @@ def create_new_workflow(workflow_name, workflow_data, file_path=None):
                 # ID'yi ekleyelim
                 file_data["id"] = new_id
                 
-                # Güncellenmiş dosyayı geri yazalım
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(file_data, f, indent=2)
+                # Güncellenmiş dosyayı kanonik biçimde geri yazalım
+                write_canonical_json(file_path, file_data)
                 print(f"Workflow dosyası ID ile güncellendi: {file_path}")
             except Exception as e:
                 print(f"Dosya güncellenirken hata oluştu: {str(e)}")
@@ -91,56 +98,48 @@ def create_new_workflow(workflow_name, workflow_data, file_path=None):
         print(f"\nWorkflow oluşturulurken hata oluştu: {error_detail}")
         return False
 
-def update_workflow(workflow_id, workflow_data, backup_api_workflow=False):
-    """Mevcut bir workflow'u günceller"""
+def update_workflow(workflow_id, workflow_data, backup_api_workflow=False, validate=True):
+    """
+    Mevcut bir workflow'u günceller; başarılıysa API'nin döndürdüğü güncel workflow'u (yoksa True) döndürür.
+
+    validate=False, gövdeyi zaten doğrulamış çağıranlar içindir.
+    """
+    if validate and not validate_before_upload(workflow_data, f"Workflow ID {workflow_id}"):
+        return False
     try:
         # API'deki mevcut workflow'u yedeklemek için isteğe bağlı olarak önce alalım
         if backup_api_workflow:
             try:
-                # Mevcut workflow'u getir
-                backup_response = requests.get(
-                    f"{N8N_URL}/api/v1/workflows/{workflow_id}",
-                    headers=headers
-                )
+                # Mevcut workflow'u pinData dahil tam olarak getir (sıkıştırılmış yedek nesnesinde saklanır)
+                backup_response = get_client().get(f"/workflows/{workflow_id}")
                 backup_response.raise_for_status()
                 backup_workflow = backup_response.json()
                 
-                # Workflow'u yedekle - otomatik oluşturulan bir dosya adıyla
-                backup_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "backups")
-                if not os.path.exists(backup_dir):
-                    os.makedirs(backup_dir)
-                    
-                backup_name = backup_workflow.get("name", "unknown").lower().replace(" ", "_")
-                timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_file = f"{backup_name}_{backup_workflow.get('id')}_{timestamp}.json"
-                backup_path = os.path.join(backup_dir, backup_file)
-                
-                with open(backup_path, 'w', encoding='utf-8') as f:
-                    json.dump(backup_workflow, f, indent=2)
-                print(f"  ✓ API workflow yedeklendi: {backup_file}")
+                # İçerik adresli depoya yedekle - aynı içerik ikinci kez yazılmaz
+                entry = get_backup_store().add(backup_workflow)
+                if entry["new"]:
+                    print(f"  ✓ API workflow yedeklendi: {entry['hash'][:12]} ({entry['timestamp']})")
+                else:
+                    print(f"  ✓ API workflow zaten yedekli: {entry['hash'][:12]} ({entry['timestamp']})")
                 
             except Exception as e:
                 print(f"  ⚠️ API workflow yedeklenirken hata oluştu: {str(e)}")
         
         # Sadece temel alanları al
-        allowed_data = {
-            "name": workflow_data.get("name", ""),
-            "nodes": workflow_data.get("nodes", []),
-            "connections": workflow_data.get("connections", {}),
-            "settings": {"executionOrder": "v1"},
-            "staticData": {}
-        }
+        allowed_data = upload_payload(workflow_data)
         
         # API isteği gönder
         print(f"\nWorkflow güncelleniyor: ID {workflow_id}")
-        response = requests.put(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}",
-            headers=headers_with_content_type,
-            json=allowed_data
-        )
+        response = get_client().put(f"/workflows/{workflow_id}", json=allowed_data)
         response.raise_for_status()
+        invalidate_workflow_list()
         print(f"\nWorkflow ID: {workflow_id} başarıyla güncellendi!")
-        return True
+        # Yeni versionId/updatedAt, senkron manifestine kaydedilebilsin diye yanıt gövdesi döndürülür
+        try:
+            updated = response.json()
+        except ValueError:
+            updated = None
+        return updated if isinstance(updated, dict) and updated else True
     except requests.exceptions.RequestException as e:
         error_detail = str(e)
         try:
@@ -176,49 +175,39 @@ def upload_all_workflows():
         else:
             print("Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
     
-    success_count = 0
-    fail_count = 0
+    # ID'si olan dosyalar eşzamanlı yüklenir; uzaktakiyle aynı olanlar atlanır
+    from .bulk_upload import bulk_upload_workflows
+    report = bulk_upload_workflows(workflow_dir)
+    if report is None:
+        return
+    
+    success_count = len(report["uploaded"])
+    fail_count = len(report["failed"])
+    skip_count = report["skipped"]
     create_count = 0
     
-    for file in workflow_files:
-        file_path = os.path.join(workflow_dir, file)
-        workflow_data = read_workflow_json(file_path)
-        
-        if not workflow_data:
-            fail_count += 1
-            continue
+    for file, workflow_data in report["without_id"]:
+        # ID yoksa yeni workflow oluştur
+        print(f"\nDosyada ({file}) workflow ID'si bulunamadı. Yeni bir workflow oluşturulması gerekiyor.")
         
-        # Workflow ID kontrol et
-        if "id" in workflow_data:
-            workflow_id = workflow_data["id"]
-            workflow_name = workflow_data.get("name", "İsimsiz Workflow")
-            print(f"\n'{workflow_name}' (ID: {workflow_id}) güncelleniyor...")
-            
-            if update_workflow(workflow_id, workflow_data):
-                success_count += 1
-            else:
-                fail_count += 1
-        else:
-            # ID yoksa yeni workflow oluştur
-            print(f"\nDosyada ({file}) workflow ID'si bulunamadı. Yeni bir workflow oluşturulması gerekiyor.")
-            
-            while True:
-                create_new = input("Yeni bir workflow oluşturmak istiyor musunuz? (e/h): ")
-                if create_new.lower() == 'e':
-                    workflow_name = input("Yeni workflow için bir isim girin: ")
-                    if create_new_workflow(workflow_name, workflow_data):
-                        create_count += 1
-                    else:
-                        fail_count += 1
-                    break
-                elif create_new.lower() == 'h':
-                    print("Bu dosya atlanıyor.")
-                    break
+        while True:
+            create_new = input("Yeni bir workflow oluşturmak istiyor musunuz? (e/h): ")
+            if create_new.lower() == 'e':
+                workflow_name = input("Yeni workflow için bir isim girin: ")
+                if create_new_workflow(workflow_name, workflow_data):
+                    create_count += 1
                 else:
-                    print("Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
+                    fail_count += 1
+                break
+            elif create_new.lower() == 'h':
+                print("Bu dosya atlanıyor.")
+                break
+            else:
+                print("Geçersiz giriş. Lütfen 'e' veya 'h' girin.")
     
     print(f"\nİşlem tamamlandı.")
     print(f"- {success_count} workflow güncellendi.")
+    print(f"- {skip_count} workflow değişmediği için atlandı.")
     print(f"- {create_count} yeni workflow oluşturuldu.")
     print(f"- {fail_count} dosyada hata oluştu.")
 
@@ -4,33 +4,200 @@ Yardımcı fonksiyonlar ve ortak kullanılan yapılar
 """
 
 import os
+import sys
 import json
-import requests
-from dotenv import load_dotenv
+import tempfile
+import threading
 
-# .env dosyasından çevre değişkenlerini yükle
-load_dotenv()
+# .env ve profil dosyalarının (.env.<profil>) arandığı proje kök dizini
+BASE_DIR = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
 
-# API kimlik bilgilerini çevre değişkenlerinden al
-API_KEY = os.getenv("API_KEY")
-N8N_URL = os.getenv("N8N_URL")
+_env_loaded = False
+_profile = None
+_config = None
+_config_lock = threading.RLock()
 
-if not API_KEY or not N8N_URL:
-    print("Hata: API_KEY veya N8N_URL .env dosyasında bulunamadı")
-    exit(1)
+def set_profile(profile):
+    """Kullanılacak isimli profili seçer (N8N_PROFILE'dan önce gelir); ilk API erişiminden önce çağrılmalı"""
+    global _profile, _env_loaded, _config
+    with _config_lock:
+        _profile = profile or None
+        _env_loaded = False
+        _config = None
 
-# Tüm API isteklerinde kullanılan başlıklar
-headers = {
-    "accept": "application/json",
-    "X-N8N-API-KEY": API_KEY
-}
+def env_file_path(profile=None):
+    """Genel .env dosyasının veya verilen profilin .env.<profil> dosyasının yolu"""
+    return os.path.join(BASE_DIR, f".env.{profile}" if profile else ".env")
+
+def load_env():
+    """
+    .env ve seçili profilin .env.<profil> dosyasını ilk çağrıda os.environ'a yükler.
+
+    Öncelik: gerçek ortam değişkenleri > .env.<profil> > .env. Profil
+    set_profile() ile, yoksa N8N_PROFILE değişkeniyle (ortamda veya .env'de) seçilir.
+    """
+    global _env_loaded
+    if _env_loaded:
+        return
+    with _config_lock:
+        if _env_loaded:
+            return
+        from dotenv import dotenv_values
+
+        values = {}
+        if os.path.exists(env_file_path()):
+            values.update(dotenv_values(env_file_path()))
+        profile = _profile or os.environ.get("N8N_PROFILE") or values.get("N8N_PROFILE")
+        if profile:
+            if not os.path.exists(env_file_path(profile)):
+                print(f"Hata: '{profile}' profili için {env_file_path(profile)} dosyası bulunamadı")
+                sys.exit(1)
+            values.update(dotenv_values(env_file_path(profile)))
+            values["N8N_PROFILE"] = profile
+        for key, value in values.items():
+            if value is not None:
+                os.environ.setdefault(key, value)
+        _env_loaded = True
+
+def getenv(name, default=None):
+    """.env dosyaları yüklendikten sonra çevre değişkenini okur"""
+    load_env()
+    return os.getenv(name, default)
+
+def has_credentials():
+    """API_KEY ve N8N_URL tanımlıysa True döner (eksikse get_config gibi çıkmaz)"""
+    load_env()
+    return bool(os.getenv("API_KEY") and os.getenv("N8N_URL"))
 
-# Content-Type içeren POST/PUT istekleri için başlıklar
-headers_with_content_type = {
-    **headers,
-    "Content-Type": "application/json"
+class Config:
+    """Seçili profile göre çözülmüş API bağlantı ayarları"""
+
+    def __init__(self, api_key, n8n_url, profile=None):
+        self.api_key = api_key
+        self.n8n_url = n8n_url
+        self.profile = profile
+        # Tüm API isteklerinde kullanılan başlıklar
+        self.headers = {
+            "accept": "application/json",
+            "X-N8N-API-KEY": api_key
+        }
+        # Content-Type içeren POST/PUT istekleri için başlıklar
+        self.headers_with_content_type = {
+            **self.headers,
+            "Content-Type": "application/json"
+        }
+
+def get_config():
+    """
+    API kimlik bilgilerini ilk ihtiyaç anında çözer ve önbelleğe alır.
+
+    API_KEY veya N8N_URL yoksa hata mesajı yazıp çıkar; API'ye hiç gitmeyen
+    komutlar (yerel doğrulama, analiz) bu yüzden kimlik bilgisi olmadan çalışır.
+    """
+    global _config
+    if _config is None:
+        with _config_lock:
+            if _config is None:
+                load_env()
+                api_key = os.getenv("API_KEY")
+                n8n_url = os.getenv("N8N_URL")
+                if not api_key or not n8n_url:
+                    print("Hata: API_KEY veya N8N_URL .env dosyasında bulunamadı")
+                    sys.exit(1)
+                _config = Config(api_key, n8n_url, os.getenv("N8N_PROFILE"))
+    return _config
+
+# Eski modül seviyesi isimler (utils.API_KEY vb.) ilk erişimde çözülür
+_CONFIG_ATTRIBUTES = {
+    "API_KEY": "api_key",
+    "N8N_URL": "n8n_url",
+    "headers": "headers",
+    "headers_with_content_type": "headers_with_content_type",
 }
 
+def __getattr__(name):
+    if name in _CONFIG_ATTRIBUTES:
+        return getattr(get_config(), _CONFIG_ATTRIBUTES[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def clear_screen():
     """Terminal ekranını temizler"""
     os.system('clear' if os.name != 'nt' else 'cls')
+
+def get_workflows_dir():
+    """Proje kök dizinindeki workflows klasörünün tam yolunu döndürür"""
+    return os.path.join(BASE_DIR, "workflows")
+
+def get_backups_dir():
+    """Proje kök dizinindeki backups klasörünün tam yolunu döndürür"""
+    return os.path.join(BASE_DIR, "backups")
+
+def workflow_file_name(workflow):
+    """Workflow için standart dosya adını oluşturur (isim_id.json)"""
+    workflow_name = workflow["name"].replace(" ", "_").lower()
+    return f"{workflow_name}_{workflow['id']}.json"
+
+def atomic_write_bytes(file_path, content):
+    """Byte içeriğini önce geçici dosyaya yazıp rename ile yerine koyar, yazılan byte sayısını döndürür"""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp_", suffix=".json")
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(content)
+        os.replace(temp_path, file_path)
+    except Exception:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return len(content)
+
+def atomic_write_json(file_path, data):
+    """JSON verisini önce geçici dosyaya yazıp rename ile yerine koyar, yazılan byte sayısını döndürür"""
+    return atomic_write_bytes(file_path, json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8'))
+
+def canonical_workflow_json(workflow):
+    """
+    Workflow'un kanonik dosya içeriğini (byte) döndürür.
+
+    Anahtarlar sıralanır, node'lar id'ye (yoksa isme) göre dizilir ve Türkçe
+    karakterler kaçışsız UTF-8 yazılır; aynı içerik her zaman aynı byte'ları verir.
+    """
+    data = dict(workflow)
+    nodes = data.get("nodes")
+    if isinstance(nodes, list) and all(isinstance(node, dict) for node in nodes):
+        data["nodes"] = sorted(nodes, key=lambda node: (str(node.get("id") or ""), str(node.get("name") or "")))
+    return json.dumps(data, indent=2, ensure_ascii=False, sort_keys=True).encode('utf-8')
+
+def write_canonical_json(file_path, workflow):
+    """
+    Workflow'u kanonik biçimde yazar; dosya zaten aynı byte'lara sahipse dokunmaz.
+
+    Yazılan byte sayısını, içerik değişmemişse 0 döndürür (mtime ve git durumu korunur).
+    """
+    content = canonical_workflow_json(workflow)
+    try:
+        with open(file_path, 'rb') as file:
+            if file.read() == content:
+                return 0
+    except OSError:
+        pass
+    return atomic_write_bytes(file_path, content)
+
+def upload_payload(workflow_data, workflow_name=None):
+    """API'ye yüklenecek temel workflow alanlarını (allowed_data) döndürür"""
+    return {
+        "name": workflow_data.get("name", "") if workflow_name is None else workflow_name,
+        "nodes": workflow_data.get("nodes", []),
+        "connections": workflow_data.get("connections", {}),
+        "settings": {"executionOrder": "v1"},
+        "staticData": {}
+    }
+
+def encode_json_body(data):
+    """
+    İstek gövdesini boşluksuz ve UTF-8 olarak kodlar.
+
+    requests'in json= parametresi ', ' ayraçları ve \\uXXXX kaçışlarıyla
+    (Türkçe karakter başına 6 byte) gönderir; bu kodlama aynı içeriği daha az byte ile taşır.
+    """
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode('utf-8')
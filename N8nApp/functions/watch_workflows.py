@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""
+workflows klasörünü izleyip değişen dosyaları otomatik olarak N8N'e yükleme işlevleri
+"""
+
+import os
+import sys
+import time
+import errno
+import ctypes
+import ctypes.util
+import select
+import struct
+import argparse
+from .utils import get_workflows_dir
+from .bulk_upload import payload_hash
+from .upload_workflow import read_workflow_json, upload_payload, update_workflow, create_new_workflow
+from .workflow_validator import validate_workflow, has_errors, format_issues_text
+
+# Son değişiklikten sonra bu kadar saniye sessizlik olunca dosya yüklenir
+DEFAULT_DEBOUNCE = 0.3
+
+# inotify kullanılamadığında stat taramaları arasındaki süre (saniye)
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Linux inotify sabitleri (sys/inotify.h)
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+def is_workflow_file(file_name):
+    """İzlenen dosya mı? (gizli/geçici dosyalar hariç .json)"""
+    return file_name.endswith(".json") and not file_name.startswith(".")
+
+
+def scan_directory(workflows_dir):
+    """Klasördeki workflow dosyalarının {isim: (mtime_ns, boyut)} haritasını döndürür"""
+    stats = {}
+    with os.scandir(workflows_dir) as entries:
+        for entry in entries:
+            if is_workflow_file(entry.name) and entry.is_file():
+                stat = entry.stat()
+                stats[entry.name] = (stat.st_mtime_ns, stat.st_size)
+    return stats
+
+
+class PollingWatcher:
+    """Klasörü periyodik stat taramasıyla izler (her platformda çalışır)"""
+
+    name = "stat"
+
+    def __init__(self, workflows_dir, interval=DEFAULT_POLL_INTERVAL):
+        self.workflows_dir = workflows_dir
+        self.interval = interval
+        self.stats = scan_directory(workflows_dir)
+
+    def poll(self, timeout):
+        """timeout süresince bekler; eklenen veya değişen dosya isimlerini döndürür"""
+        time.sleep(min(timeout, self.interval))
+        current = scan_directory(self.workflows_dir)
+        changed = {name for name, stat in current.items() if self.stats.get(name) != stat}
+        self.stats = current
+        return changed
+
+    def close(self):
+        pass
+
+
+class InotifyWatcher:
+    """
+    Klasörü Linux inotify ile izler (ek bağımlılık olmadan, libc üzerinden).
+
+    Düzenleyicilerin yerinde yazması IN_CLOSE_WRITE, atomik yazım (geçici dosya +
+    rename) ise IN_MOVED_TO olayı üretir; ikisi de değişiklik sayılır.
+    """
+
+    name = "inotify"
+
+    def __init__(self, workflows_dir):
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 başarısız")
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        if libc.inotify_add_watch(self.fd, os.fsencode(workflows_dir), mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, "inotify_add_watch başarısız")
+
+    def poll(self, timeout):
+        """Olay gelene veya timeout dolana kadar bekler; değişen dosya isimlerini döndürür"""
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        try:
+            data = os.read(self.fd, 64 * 1024)
+        except OSError as e:
+            if e.errno == errno.EAGAIN:
+                return set()
+            raise
+        changed = set()
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            _, _, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if name and is_workflow_file(name):
+                changed.add(name)
+        return changed
+
+    def close(self):
+        os.close(self.fd)
+
+
+def create_watcher(workflows_dir, interval=DEFAULT_POLL_INTERVAL, use_inotify=True):
+    """Mümkünse inotify, değilse stat taramalı izleyici döndürür"""
+    if use_inotify and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(workflows_dir)
+        except (OSError, AttributeError):
+            pass
+    return PollingWatcher(workflows_dir, interval)
+
+
+class Debouncer:
+    """Aynı dosyaya art arda gelen olayları, dosya 'delay' saniye sessiz kalana kadar biriktirir"""
+
+    def __init__(self, delay=DEFAULT_DEBOUNCE):
+        self.delay = delay
+        self.pending = {}
+
+    def add(self, names, now):
+        for name in names:
+            self.pending[name] = now
+
+    def ready(self, now):
+        """Sessizlik süresi dolan dosya isimlerini döndürür ve bekleyenlerden çıkarır"""
+        names = sorted(name for name, last in self.pending.items() if now - last >= self.delay)
+        for name in names:
+            del self.pending[name]
+        return names
+
+    def next_timeout(self, now, default):
+        """Bir sonraki dosyanın hazır olmasına kalan süre (bekleyen yoksa default)"""
+        if not self.pending:
+            return default
+        return max(0.0, min(self.pending.values()) + self.delay - now)
+
+
+class WorkflowPusher:
+    """
+    Değişen dosyayı doğrulayıp yükler.
+
+    Yükleme gövdesi hash'i dosya başına tutulur; içerik değişmeden gelen olaylar
+    (ör. kaydetmeden dokunma, oluşturma sonrası id'nin dosyaya yazılması) atlanır.
+    """
+
+    def __init__(self, workflows_dir):
+        self.workflows_dir = workflows_dir
+        self.hashes = {}
+        self.pushed = 0
+        self.failed = 0
+
+    def remember_all(self):
+        """Başlangıçtaki dosyaların hash'lerini kaydeder; sadece sonraki değişiklikler yüklenir"""
+        for name in scan_directory(self.workflows_dir):
+            workflow_data = read_workflow_json(os.path.join(self.workflows_dir, name))
+            if workflow_data:
+                self.hashes[name] = payload_hash(upload_payload(workflow_data))
+
+    def push(self, file_name):
+        """Dosyayı yükler; 'pushed', 'unchanged', 'invalid', 'failed' veya 'missing' döndürür"""
+        file_path = os.path.join(self.workflows_dir, file_name)
+        if not os.path.exists(file_path):
+            self.hashes.pop(file_name, None)
+            return "missing"
+        workflow_data = read_workflow_json(file_path)
+        if not workflow_data:
+            self.failed += 1
+            return "invalid"
+
+        current_hash = payload_hash(upload_payload(workflow_data))
+        if self.hashes.get(file_name) == current_hash:
+            return "unchanged"
+
+        issues = validate_workflow(workflow_data)
+        if has_errors(issues):
+            print(f"\n{file_name} doğrulamadan geçemedi, yüklenmedi:")
+            print(format_issues_text([issue for issue in issues if issue["level"] == "error"]))
+            self.failed += 1
+            return "invalid"
+
+        started = time.perf_counter()
+        if workflow_data.get("id"):
+            success = update_workflow(workflow_data["id"], workflow_data, validate=False)
+        elif workflow_data.get("name"):
+            success = create_new_workflow(workflow_data["name"], workflow_data, file_path, validate=False)
+        else:
+            print(f"\n{file_name}: id ve isim olmadığı için yüklenmedi.")
+            success = False
+
+        if not success:
+            self.failed += 1
+            return "failed"
+        self.hashes[file_name] = current_hash
+        self.pushed += 1
+        print(f"  ✓ {file_name} yüklendi ({time.perf_counter() - started:.2f} sn)")
+        return "pushed"
+
+
+def watch_workflows(workflows_dir=None, debounce=DEFAULT_DEBOUNCE, interval=DEFAULT_POLL_INTERVAL,
+                    use_inotify=True, max_seconds=None):
+    """
+    workflows klasörünü izler ve kaydedilen dosyaları otomatik olarak yükler.
+
+    Ctrl+C ile (veya max_seconds dolunca) durur; tüm istekler paylaşılan
+    bağlantı havuzunu kullanır. Özet sayıları döndürür.
+    """
+    workflows_dir = workflows_dir or get_workflows_dir()
+    if not os.path.isdir(workflows_dir):
+        print(f"\nWorkflow dizini bulunamadı: {workflows_dir}")
+        return None
+
+    pusher = WorkflowPusher(workflows_dir)
+    pusher.remember_all()
+    watcher = create_watcher(workflows_dir, interval, use_inotify)
+    debouncer = Debouncer(debounce)
+    print(f"\n{workflows_dir} izleniyor ({watcher.name}, {len(pusher.hashes)} dosya). Durdurmak için Ctrl+C.")
+
+    started = time.monotonic()
+    try:
+        while max_seconds is None or time.monotonic() - started < max_seconds:
+            timeout = debouncer.next_timeout(time.monotonic(), 1.0)
+            changed = watcher.poll(timeout)
+            now = time.monotonic()
+            debouncer.add(changed, now)
+            for file_name in debouncer.ready(now):
+                pusher.push(file_name)
+    except KeyboardInterrupt:
+        print("\nİzleme durduruldu.")
+    finally:
+        watcher.close()
+
+    print(f"{pusher.pushed} workflow yüklendi, {pusher.failed} hata.")
+    return {"pushed": pusher.pushed, "failed": pusher.failed}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="workflows klasörünü izle ve değişen dosyaları N8N'e yükle")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="İzlenecek klasör")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE, help="Sessizlik süresi (saniye)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_POLL_INTERVAL, help="Stat tarama aralığı (saniye)")
+    parser.add_argument("--poll", action="store_true", help="inotify yerine stat taraması kullan")
+    args = parser.parse_args()
+    watch_workflows(args.workflows_dir, args.debounce, args.interval, use_inotify=not args.poll)
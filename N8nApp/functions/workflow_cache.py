@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Etkileşimli menü için oturum boyunca tutulan workflow özet listesi önbelleği
+"""
+
+import os
+import json
+import time
+import threading
+from .utils import getenv, has_credentials, get_workflows_dir, atomic_write_bytes
+
+# Listenin taze sayıldığı süre (saniye); bu süre içinde API'ye hiç gidilmez
+DEFAULT_LIST_CACHE_TTL = float(getenv("N8N_LIST_CACHE_TTL", "30"))
+
+# Bu süreye kadar eski liste hemen gösterilir ve arka planda yenilenir; daha eskiyse beklenir
+DEFAULT_LIST_CACHE_MAX_STALE = float(getenv("N8N_LIST_CACHE_MAX_STALE", "600"))
+
+# Son başarılı listenin açılışta hemen gösterilmek üzere saklandığı gizli dosya (workflows klasöründe)
+SNAPSHOT_FILE = ".list-snapshot.jsonl"
+SNAPSHOT_VERSION = 1
+
+# Açılışta son bilinen listeden gösterilecek en fazla satır
+STARTUP_PREVIEW = 10
+
+
+def save_snapshot(path, workflows, etag=None, base_url=None):
+    """
+    Özet listesini JSON lines olarak atomik yazar.
+
+    İlk satır sürüm, N8N adresi, kayıt zamanı ve ETag'i tutan başlıktır; her
+    sonraki satır tek bir workflow özetidir.
+    """
+    header = {"version": SNAPSHOT_VERSION, "url": base_url or getenv("N8N_URL"), "savedAt": time.time(), "etag": etag}
+    lines = [json.dumps(header, separators=(",", ":"), ensure_ascii=False)]
+    lines.extend(json.dumps(workflow, separators=(",", ":"), ensure_ascii=False) for workflow in workflows)
+    return atomic_write_bytes(path, ("\n".join(lines) + "\n").encode('utf-8'))
+
+
+def load_snapshot(path, base_url=None):
+    """
+    Kayıtlı listeyi okur: (özetler, kayıt zamanı, etag).
+
+    Dosya yoksa, bozuksa veya başka bir N8N adresine aitse None döner.
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            header = json.loads(f.readline())
+            if header.get("version") != SNAPSHOT_VERSION or header.get("url") != (base_url or getenv("N8N_URL")):
+                return None
+            workflows = [json.loads(line) for line in f if line.strip()]
+    except (OSError, ValueError, AttributeError):
+        return None
+    return workflows, header.get("savedAt"), header.get("etag")
+
+
+def format_age(seconds):
+    """Saniyeyi kısa okunur süreye çevirir (ör. '45 sn', '3 dk', '2 sa', '5 gün')"""
+    seconds = max(0, int(seconds))
+    if seconds < 60:
+        return f"{seconds} sn"
+    if seconds < 3600:
+        return f"{seconds // 60} dk"
+    if seconds < 86400:
+        return f"{seconds // 3600} sa"
+    return f"{seconds // 86400} gün"
+
+
+class WorkflowListCache:
+    """
+    Workflow özet listesini (id, isim, aktiflik, sürüm) süreç içinde önbellekler.
+
+    TTL içinde liste doğrudan önbellekten döner. TTL geçmiş ama max_stale
+    dolmamışsa eski liste hemen döner ve arka planda tek bir thread listeyi
+    koşullu istekle (ETag) yeniler. invalidate() sonrası ilk erişim yeni listeyi
+    bekler; değişiklik yapan işlemler (oluşturma, güncelleme, silme,
+    aktifleştirme) bu yüzden invalidate() çağırır.
+
+    snapshot_path verilirse API'den gelen her yeni liste diske yazılır ve
+    warm_start() ile bir sonraki açılışta 'stale' olarak hemen kullanılır.
+    """
+
+    def __init__(self, client=None, ttl=DEFAULT_LIST_CACHE_TTL, max_stale=DEFAULT_LIST_CACHE_MAX_STALE,
+                 snapshot_path=None):
+        self.client = client
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.snapshot_path = snapshot_path
+        self.workflows = None
+        self.etag = None
+        self.loaded_at = None
+        # Liste önceki oturumun kaydından geldiyse True; API'den ilk liste gelince False olur
+        self.stale = False
+        self.snapshot_saved_at = None
+        # invalidate() her çağrıldığında artar; öncesinde başlamış yenilemelerin sonucu yazılmaz
+        self.generation = 0
+        self.refreshing = None
+        self.lock = threading.Lock()
+
+    def _client(self):
+        # HTTP istemcisi ilk istekte yüklenir; açılışta kayıtlı liste requests olmadan gösterilir
+        from .api_client import get_client
+        return self.client or get_client()
+
+    def age(self):
+        """Listenin yaşı (saniye); liste yoksa veya geçersizse None"""
+        with self.lock:
+            if self.workflows is None or self.loaded_at is None:
+                return None
+            return time.monotonic() - self.loaded_at
+
+    def store(self, workflows, etag=None, generation=None, persist=True):
+        """Listeyi önbelleğe (ve varsa diske) yazar; verilen nesil güncel değilse yazmaz ve False döner"""
+        from .api_client import workflow_summary
+        with self.lock:
+            if generation is not None and generation != self.generation:
+                return False
+            self.workflows = [workflow_summary(workflow) for workflow in workflows]
+            self.etag = etag
+            self.loaded_at = time.monotonic()
+            self.stale = False
+            summaries = self.workflows
+        if persist and self.snapshot_path:
+            try:
+                save_snapshot(self.snapshot_path, summaries, etag)
+            except OSError:
+                # Kayıt sadece sonraki açılışı hızlandırır; yazılamaması işlemi bozmaz
+                pass
+        return True
+
+    def refresh(self):
+        """Listeyi API'den (mümkünse 304 ile) yeniler ve döndürür"""
+        with self.lock:
+            generation = self.generation
+            current = self.workflows
+            etag = self.etag if current is not None else None
+        summaries, etag = self._client().workflow_summaries(etag)
+        if summaries is None:
+            # 304: liste değişmemiş; diskteki kayıt zaten aynı içeriği tutuyor
+            self.store(current, etag, generation, persist=False)
+            return list(current)
+        self.store(summaries, etag, generation)
+        return list(summaries)
+
+    def _refresh_quietly(self):
+        import requests
+        try:
+            self.refresh()
+        except requests.exceptions.RequestException:
+            # Eski liste kullanılmaya devam eder; bir sonraki erişimde tekrar denenir
+            pass
+
+    def refresh_in_background(self):
+        """Çalışan bir yenileme yoksa listeyi arka plan thread'inde yeniler"""
+        with self.lock:
+            if self.refreshing is not None and self.refreshing.is_alive():
+                return self.refreshing
+            self.refreshing = threading.Thread(target=self._refresh_quietly, daemon=True)
+            self.refreshing.start()
+            return self.refreshing
+
+    def warm_start(self):
+        """
+        Diskteki son listeyi 'stale' olarak yükler ve güncel listeyi arka planda istemeye başlar.
+
+        Kayıt yoksa sadece arka plan isteği başlar; kimlik bilgisi yoksa istek
+        başlatılmaz (hata, bir API komutu seçildiğinde gösterilir). Kayıt yüklendiyse True döner.
+        """
+        loaded = False
+        snapshot = load_snapshot(self.snapshot_path) if self.snapshot_path else None
+        with self.lock:
+            if self.workflows is None and snapshot is not None:
+                self.workflows, self.snapshot_saved_at, self.etag = snapshot
+                self.loaded_at = time.monotonic()
+                self.stale = True
+                loaded = True
+        if self.client is not None or has_credentials():
+            self.refresh_in_background()
+        return loaded
+
+    def get(self):
+        """Özet listesini döndürür (taze, eski ama yenileniyor ya da yeni getirilmiş)"""
+        age = self.age()
+        if age is None or age > self.max_stale:
+            return self.refresh()
+        if age > self.ttl or self.stale:
+            self.refresh_in_background()
+        with self.lock:
+            return list(self.workflows)
+
+    def invalidate(self):
+        """Bir sonraki erişimde listenin API'den yeniden alınmasını sağlar"""
+        with self.lock:
+            self.generation += 1
+            self.loaded_at = None
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_workflow_cache():
+    """Süreç genelinde paylaşılan WorkflowListCache örneğini döndürür"""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = WorkflowListCache(snapshot_path=os.path.join(get_workflows_dir(), SNAPSHOT_FILE))
+    return _cache
+
+
+def invalidate_workflow_list():
+    """Değişiklik yapan işlemlerden sonra paylaşılan liste önbelleğini geçersiz kılar"""
+    get_workflow_cache().invalidate()
+
+
+def show_workflow_list():
+    """Workflow'ları (önbellekten) numaralı olarak listeler ve döndürür; kaydetme sorusu sormaz"""
+    import requests
+    cache = get_workflow_cache()
+    if cache.age() is None:
+        print("\nWorkflow'lar getiriliyor...\n")
+
+    try:
+        workflows = cache.get()
+    except requests.exceptions.RequestException as e:
+        print(f"Workflow'ları getirirken hata oluştu: {str(e)}")
+        return None
+
+    if not workflows:
+        print("Hiç workflow bulunamadı.")
+        return None
+
+    if cache.stale and cache.snapshot_saved_at:
+        age = format_age(time.time() - cache.snapshot_saved_at)
+        print(f"(Son bilinen liste, {age} önce kaydedildi; güncel liste arka planda yükleniyor)")
+    print(f"Toplam {len(workflows)} workflow bulundu:\n")
+    for idx, workflow in enumerate(workflows, 1):
+        # Tip kontrolü ekle
+        if isinstance(workflow, dict):
+            active_status = "[Aktif]" if workflow.get("active", False) else "[Pasif]"
+            print(f"{idx}. {active_status} ID: {workflow['id']} - İsim: {workflow['name']}")
+        else:
+            print(f"{idx}. Geçersiz workflow verisi: {workflow}")
+    return workflows
+
+
+def show_startup_snapshot(limit=STARTUP_PREVIEW):
+    """
+    Açılışta son bilinen listeyi API'yi beklemeden özetler.
+
+    Güncel liste arka planda yüklenir ve hazır olunca menü seçenekleri onu
+    kullanır. Kayıt yoksa hiçbir şey yazmaz ve False döner.
+    """
+    cache = get_workflow_cache()
+    if not cache.warm_start():
+        return False
+
+    with cache.lock:
+        workflows = list(cache.workflows)
+        saved_at = cache.snapshot_saved_at
+    active = sum(1 for workflow in workflows if isinstance(workflow, dict) and workflow.get("active"))
+    age = format_age(time.time() - saved_at) if saved_at else "?"
+    print(f"\nSon bilinen liste ({age} önce, eski olabilir): {len(workflows)} workflow, {active} aktif")
+    for workflow in workflows[:limit]:
+        if isinstance(workflow, dict):
+            active_status = "[Aktif]" if workflow.get("active", False) else "[Pasif]"
+            print(f"  {active_status} ID: {workflow.get('id')} - İsim: {workflow.get('name')}")
+    if len(workflows) > limit:
+        print(f"  ... ve {len(workflows) - limit} workflow daha")
+    return True
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Workflow'lar arasında node ve bağlantı seviyesinde yapısal fark (diff) işlevleri
+"""
+
+import json
+from .sync_manifest import canonical_content
+from .workflow_graph import compile_graph
+
+# Metin raporunda değerlerin kısaltılacağı uzunluk
+MAX_VALUE_LENGTH = 60
+
+
+def _pointer_token(key):
+    """JSON Pointer (RFC 6901) için anahtarı kaçışlar"""
+    return str(key).replace("~", "~0").replace("/", "~1")
+
+
+def _diff_values(old, new, path, changes):
+    """İki değeri özyinelemeli olarak karşılaştırır, farkları JSON Pointer yollarıyla ekler"""
+    if old == new:
+        return
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old.keys() | new.keys():
+            child_path = f"{path}/{_pointer_token(key)}"
+            if key not in new:
+                changes.append({"op": "remove", "path": child_path, "old": old[key]})
+            elif key not in old:
+                changes.append({"op": "add", "path": child_path, "new": new[key]})
+            else:
+                _diff_values(old[key], new[key], child_path, changes)
+    elif isinstance(old, list) and isinstance(new, list):
+        common = min(len(old), len(new))
+        for index in range(common):
+            _diff_values(old[index], new[index], f"{path}/{index}", changes)
+        for index in range(common, len(old)):
+            changes.append({"op": "remove", "path": f"{path}/{index}", "old": old[index]})
+        for index in range(common, len(new)):
+            changes.append({"op": "add", "path": f"{path}/{index}", "new": new[index]})
+    else:
+        changes.append({"op": "replace", "path": path, "old": old, "new": new})
+
+
+def index_nodes(workflow):
+    """Node'ları id'ye göre indeksler (id yoksa isim kullanılır)"""
+    return {
+        node.get("id") or node.get("name"): node
+        for node in workflow.get("nodes", []) or []
+        if isinstance(node, dict)
+    }
+
+
+def connection_edges(workflow, name_to_key=None):
+    """
+    Bağlantıları (kaynak, tip, çıkış indeksi, hedef, giriş indeksi) kenar kümesine çevirir.
+
+    Kenarlar derlenmiş graftan (kopuk olanlar dahil) okunur. name_to_key verilirse
+    node isimleri node anahtarlarına (id) çevrilir, böylece yeniden adlandırılan
+    node'lar sahte bağlantı farkı üretmez.
+    """
+    name_to_key = name_to_key or {}
+    graph = compile_graph(workflow)
+    return {
+        (name_to_key.get(source, source), connection_type, output_index,
+         name_to_key.get(target, target), target_index)
+        for source, connection_type, output_index, target, target_index in graph.edges + graph.dangling
+    }
+
+
+def diff_workflows(old, new):
+    """
+    İki workflow arasındaki yapısal farkı tek geçişte hesaplar.
+
+    Karşılaştırma, içerik hash'iyle aynı kanonik alanlar üzerinden yapılır.
+    Dönen sözlük JSON'a çevrilebilir: isim değişimi, eklenen/silinen/yeniden
+    adlandırılan node'lar, node başına JSON Pointer yollu değişiklikler,
+    bağlantı tipine göre eklenen/silinen kenarlar ve settings farkları.
+    """
+    old_content = canonical_content(old)
+    new_content = canonical_content(new)
+
+    old_nodes = index_nodes(old_content)
+    new_nodes = index_nodes(new_content)
+
+    added = [new_nodes[key] for key in new_nodes.keys() - old_nodes.keys()]
+    removed = [old_nodes[key] for key in old_nodes.keys() - new_nodes.keys()]
+    renamed = []
+    changed = {}
+
+    for key in old_nodes.keys() & new_nodes.keys():
+        old_node = old_nodes[key]
+        new_node = new_nodes[key]
+        if old_node == new_node:
+            continue
+        if old_node.get("name") != new_node.get("name"):
+            renamed.append({"id": key, "from": old_node.get("name"), "to": new_node.get("name")})
+        node_changes = []
+        for field in old_node.keys() | new_node.keys():
+            if field in ("id", "name"):
+                continue
+            _diff_values(old_node.get(field), new_node.get(field), f"/{_pointer_token(field)}", node_changes)
+        if node_changes:
+            changed[new_node.get("name") or key] = sorted(node_changes, key=lambda change: change["path"])
+
+    # Bağlantıları node anahtarları üzerinden kıyasla, raporda güncel isimleri göster.
+    # Bir taraftaki isim o tarafta yoksa (kopuk bağlantı) diğer tarafın eşlemesi kullanılır.
+    old_names = {node.get("name"): key for key, node in old_nodes.items()}
+    new_names = {node.get("name"): key for key, node in new_nodes.items()}
+    old_edges = connection_edges(old_content, {**new_names, **old_names})
+    new_edges = connection_edges(new_content, {**old_names, **new_names})
+    key_to_name = {key: node.get("name") for key, node in old_nodes.items()}
+    key_to_name.update({key: node.get("name") for key, node in new_nodes.items()})
+
+    connections = {}
+    for label, edges in (("added", new_edges - old_edges), ("removed", old_edges - new_edges)):
+        for source, connection_type, output_index, target, input_index in sorted(edges, key=str):
+            connections.setdefault(connection_type, {"added": [], "removed": []})[label].append({
+                "from": key_to_name.get(source, source),
+                "output": output_index,
+                "to": key_to_name.get(target, target),
+                "input": input_index
+            })
+
+    settings = []
+    _diff_values(old_content["settings"], new_content["settings"], "/settings", settings)
+
+    diff = {
+        "name": None if old_content["name"] == new_content["name"]
+        else {"old": old_content["name"], "new": new_content["name"]},
+        "nodes": {
+            "added": sorted((node.get("name") for node in added), key=str),
+            "removed": sorted((node.get("name") for node in removed), key=str),
+            "renamed": sorted(renamed, key=lambda item: str(item["from"])),
+            "changed": changed
+        },
+        "connections": connections,
+        "settings": settings
+    }
+    diff["equal"] = is_empty_diff(diff)
+    return diff
+
+
+def is_empty_diff(diff):
+    """Diff hiçbir fark içermiyorsa True döner"""
+    nodes = diff["nodes"]
+    return not (diff["name"] or nodes["added"] or nodes["removed"] or nodes["renamed"]
+                or nodes["changed"] or diff["connections"] or diff["settings"])
+
+
+def _short(value):
+    text = json.dumps(value, ensure_ascii=False, sort_keys=True)
+    return text if len(text) <= MAX_VALUE_LENGTH else text[:MAX_VALUE_LENGTH - 3] + "..."
+
+
+def format_diff_text(diff, indent="  "):
+    """Diff'i kısa, satır bazlı bir metin raporuna çevirir"""
+    if diff["equal"]:
+        return f"{indent}Fark yok."
+
+    lines = []
+    if diff["name"]:
+        lines.append(f"~ isim: '{diff['name']['old']}' → '{diff['name']['new']}'")
+
+    nodes = diff["nodes"]
+    lines.extend(f"+ node '{name}'" for name in nodes["added"])
+    lines.extend(f"- node '{name}'" for name in nodes["removed"])
+    lines.extend(f"~ node '{item['from']}' → '{item['to']}' (yeniden adlandırıldı)" for item in nodes["renamed"])
+    for node_name, changes in sorted(nodes["changed"].items()):
+        for change in changes:
+            if change["op"] == "add":
+                detail = f"eklendi: {_short(change['new'])}"
+            elif change["op"] == "remove":
+                detail = f"silindi (önceki: {_short(change['old'])})"
+            else:
+                detail = f"{_short(change['old'])} → {_short(change['new'])}"
+            lines.append(f"~ node '{node_name}' {change['path']}: {detail}")
+
+    for connection_type, edges in sorted(diff["connections"].items()):
+        for label, sign in (("added", "+"), ("removed", "-")):
+            for edge in edges[label]:
+                lines.append(f"{sign} bağlantı [{connection_type}] "
+                             f"{edge['from']}[{edge['output']}] → {edge['to']}[{edge['input']}]")
+
+    for change in diff["settings"]:
+        lines.append(f"~ {change['path']}: {_short(change.get('old'))} → {_short(change.get('new'))}")
+
+    return "\n".join(f"{indent}{line}" for line in lines)
+
+
+def format_diff_json(diff):
+    """Diff'i tek satırlık JSON metnine çevirir"""
+    return json.dumps(diff, ensure_ascii=False, sort_keys=True, default=str)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Toplu işlemler için workflow seçme (filtreleme) işlevleri
+"""
+
+import re
+from .api_client import get_client
+from .workflow_index import short_node_type, trigger_key, is_trigger_node, tag_names
+
+
+class WorkflowFilter:
+    """
+    Etiket, isim regex'i, node tipi, tetikleyici tipi, aktiflik ve id'ye göre workflow seçici.
+
+    Verilen tüm koşullar birlikte (VE) uygulanır; etiketlerde workflow'un verilen
+    etiketlerin hepsine sahip olması gerekir. Node tipi tam ya da kısa
+    ('webhook', 'embeddingsOllama') olarak verilebilir.
+    """
+
+    def __init__(self, tags=None, name=None, node_type=None, trigger=None, active=None, ids=None):
+        self.tags = [tag.lower() for tag in tags or []]
+        self.name = re.compile(name, re.IGNORECASE) if name else None
+        self.node_type = node_type.lower() if node_type else None
+        self.trigger = trigger_key(trigger) if trigger else None
+        self.active = active
+        self.ids = set(ids) if ids else None
+
+    def is_empty(self):
+        """Hiç koşul verilmemişse True döner"""
+        return not (self.tags or self.name or self.node_type or self.trigger
+                    or self.active is not None or self.ids)
+
+    def matches(self, workflow):
+        """Workflow tüm koşulları sağlıyorsa True döner"""
+        if not isinstance(workflow, dict):
+            return False
+        if self.ids is not None and workflow.get("id") not in self.ids:
+            return False
+        if self.active is not None and bool(workflow.get("active")) != self.active:
+            return False
+        if self.name and not self.name.search(workflow.get("name") or ""):
+            return False
+        if self.tags:
+            names = {name.lower() for name in tag_names(workflow)}
+            if not all(tag in names for tag in self.tags):
+                return False
+        if self.node_type or self.trigger:
+            node_types = [node.get("type") for node in workflow.get("nodes", []) or []
+                          if isinstance(node, dict) and node.get("type")]
+            if self.node_type and not any(self.node_type in (node_type.lower(), short_node_type(node_type).lower())
+                                          for node_type in node_types):
+                return False
+            if self.trigger and not any(is_trigger_node(node_type) and trigger_key(node_type) == self.trigger
+                                        for node_type in node_types):
+                return False
+        return True
+
+    def describe(self):
+        """Filtrenin kısa metin açıklaması"""
+        parts = []
+        if self.ids:
+            parts.append(f"id: {', '.join(sorted(self.ids))}")
+        if self.tags:
+            parts.append(f"etiket: {', '.join(self.tags)}")
+        if self.name:
+            parts.append(f"isim ~ /{self.name.pattern}/")
+        if self.node_type:
+            parts.append(f"node: {self.node_type}")
+        if self.trigger:
+            parts.append(f"tetikleyici: {self.trigger}")
+        if self.active is not None:
+            parts.append("aktif" if self.active else "pasif")
+        return ", ".join(parts) or "tümü"
+
+
+def select_workflows(workflow_filter, client=None):
+    """
+    Listeleme üzerinden filtreye uyan workflow'ları döndürür.
+
+    Aktiflik koşulu sunucuya sorgu parametresi olarak iletilir; diğer koşullar
+    listelemede gelen node ve etiketlere göre yerelde uygulanır.
+    """
+    client = client or get_client()
+    return [workflow for workflow in client.iter_workflows(active=workflow_filter.active)
+            if workflow_filter.matches(workflow)]
+
+
+def split_names(value):
+    """'a, b,c' -> ['a', 'b', 'c']"""
+    return [part.strip() for part in (value or "").split(",") if part.strip()]
+
+
+def add_filter_arguments(parser):
+    """argparse parser'ına ortak filtre seçeneklerini ekler"""
+    group = parser.add_argument_group("filtreler")
+    group.add_argument("--tag", action="append", default=[], help="Etiket ismi (tekrarlanabilir, hepsi gerekir)")
+    group.add_argument("--name", help="İsim için regex (büyük/küçük harf duyarsız)")
+    group.add_argument("--node-type", help="İçerdiği node tipi (tam veya kısa, ör. postgres)")
+    group.add_argument("--trigger", help="Tetikleyici tipi (ör. webhook, schedule, chat)")
+    group.add_argument("--id", dest="ids", action="append", default=[], help="Workflow id (tekrarlanabilir)")
+    state = group.add_mutually_exclusive_group()
+    state.add_argument("--active", dest="active", action="store_const", const=True, default=None,
+                       help="Sadece aktif workflow'lar")
+    state.add_argument("--inactive", dest="active", action="store_const", const=False,
+                       help="Sadece pasif workflow'lar")
+    return group
+
+
+def filter_from_args(args):
+    """add_filter_arguments ile eklenen seçeneklerden WorkflowFilter oluşturur"""
+    tags = [name for value in args.tag for name in split_names(value)]
+    return WorkflowFilter(tags=tags, name=args.name, node_type=args.node_type, trigger=args.trigger,
+                          active=args.active, ids=args.ids)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Workflow bağlantılarını grafa derleyip topoloji, erişilebilirlik ve kritik yol analizi yapma işlevleri
+"""
+
+import os
+import sys
+import json
+import argparse
+from collections import deque
+from .utils import get_workflows_dir
+from .workflow_index import is_trigger_node
+
+# Veri akışını taşıyan bağlantı tipi; ai_* tipleri alt node'ları (model, araç, hafıza) bağlar
+MAIN_CONNECTION = "main"
+
+# Grafa dahil edilmeyen, sadece görsel amaçlı node tipleri
+IGNORED_NODE_TYPES = {"n8n-nodes-base.stickyNote"}
+
+# Fan-in/fan-out değeri bu sayıya ulaşan node'lar yoğun nokta sayılır
+HOTSPOT_THRESHOLD = 3
+
+
+class WorkflowGraph:
+    """
+    Workflow'un isim anahtarlı bağlantı haritasından bir kez derlenen komşuluk indeksi.
+
+    edges (kaynak, tip, çıkış indeksi, hedef, giriş indeksi) demetleridir;
+    outgoing/incoming node ismine göre bu kenarları tutar.
+    """
+
+    def __init__(self, workflow):
+        self.name = workflow.get("name")
+        self.nodes = {}
+        self.types = {}
+        for node in workflow.get("nodes", []) or []:
+            if isinstance(node, dict) and node.get("name") and node.get("type") not in IGNORED_NODE_TYPES:
+                self.nodes[node["name"]] = node
+                self.types[node["name"]] = node.get("type") or ""
+
+        self.edges = []
+        self.dangling = []
+        self.outgoing = {name: [] for name in self.nodes}
+        self.incoming = {name: [] for name in self.nodes}
+
+        for source, outputs in (workflow.get("connections", {}) or {}).items():
+            if not isinstance(outputs, dict):
+                continue
+            for connection_type, output_list in outputs.items():
+                for output_index, targets in enumerate(output_list or []):
+                    for target in targets or []:
+                        if not isinstance(target, dict):
+                            continue
+                        edge = (source, connection_type, output_index, target.get("node"), target.get("index", 0))
+                        if source not in self.nodes or edge[3] not in self.nodes:
+                            # Var olmayan node'a (veya node'dan) giden bağlantı
+                            self.dangling.append(edge)
+                            continue
+                        self.edges.append(edge)
+                        self.outgoing[source].append(edge)
+                        self.incoming[edge[3]].append(edge)
+
+    def successors(self, name, connection_type=None):
+        return [edge[3] for edge in self.outgoing.get(name, [])
+                if connection_type is None or edge[1] == connection_type]
+
+    def triggers(self):
+        """Tetikleyici node isimleri"""
+        return [name for name, node_type in self.types.items() if is_trigger_node(node_type)]
+
+    def _position_key(self, name):
+        position = self.nodes[name].get("position") or [0, 0]
+        return (position[0] if len(position) > 0 else 0, position[1] if len(position) > 1 else 0, name)
+
+    def topological_order(self):
+        """
+        Kahn algoritmasıyla topolojik sıra döndürür: (sıra, döngüde kalan node'lar).
+
+        Eşit durumda kanvastaki konuma (soldan sağa) göre sıralanır; döngüdeki
+        node'lar sıraya eklenmez, ikinci değer olarak döner.
+        """
+        in_degree = {name: len(self.incoming[name]) for name in self.nodes}
+        ready = sorted((name for name, degree in in_degree.items() if degree == 0), key=self._position_key)
+        queue = deque(ready)
+        order = []
+        while queue:
+            name = queue.popleft()
+            order.append(name)
+            released = []
+            for target in self.successors(name):
+                in_degree[target] -= 1
+                if in_degree[target] == 0:
+                    released.append(target)
+            queue.extend(sorted(released, key=self._position_key))
+        remaining = sorted((name for name in self.nodes if name not in set(order)), key=self._position_key)
+        return order, remaining
+
+    def cycles(self):
+        """Döngü oluşturan güçlü bağlı bileşenleri (Tarjan) döndürür"""
+        index_of = {}
+        low = {}
+        stack = []
+        on_stack = set()
+        components = []
+        counter = [0]
+
+        for root in self.nodes:
+            if root in index_of:
+                continue
+            # Özyinelemesiz Tarjan: (node, ardılların iteratörü)
+            work = [(root, iter(self.successors(root)))]
+            index_of[root] = low[root] = counter[0]
+            counter[0] += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                name, children = work[-1]
+                advanced = False
+                for child in children:
+                    if child not in index_of:
+                        index_of[child] = low[child] = counter[0]
+                        counter[0] += 1
+                        stack.append(child)
+                        on_stack.add(child)
+                        work.append((child, iter(self.successors(child))))
+                        advanced = True
+                        break
+                    if child in on_stack:
+                        low[name] = min(low[name], index_of[child])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    low[parent] = min(low[parent], low[name])
+                if low[name] == index_of[name]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == name:
+                            break
+                    if len(component) > 1 or name in self.successors(name):
+                        components.append(sorted(component))
+        return sorted(components)
+
+    def reachable(self):
+        """
+        Tetikleyicilerden erişilebilen node'lar.
+
+        main bağlantıları ileri yönde izlenir; ai_* bağlantılarıyla erişilebilir
+        bir node'a bağlanan alt node'lar (model, araç, hafıza) da erişilebilir sayılır.
+        """
+        seen = set(self.triggers())
+        queue = deque(seen)
+        while queue:
+            name = queue.popleft()
+            neighbours = self.successors(name, MAIN_CONNECTION)
+            neighbours += [edge[0] for edge in self.incoming[name] if edge[1] != MAIN_CONNECTION]
+            for neighbour in neighbours:
+                if neighbour not in seen:
+                    seen.add(neighbour)
+                    queue.append(neighbour)
+        return seen
+
+    def orphans(self):
+        """Hiçbir bağlantısı olmayan node'lar"""
+        return sorted(name for name in self.nodes if not self.incoming[name] and not self.outgoing[name])
+
+    def fan_counts(self):
+        """Node başına (fan-in, fan-out) sayıları"""
+        return {name: (len(self.incoming[name]), len(self.outgoing[name])) for name in self.nodes}
+
+    def longest_path(self):
+        """
+        main bağlantıları üzerinde tetikleyiciden uca (çıkışı olmayan node) en uzun yolu döndürür.
+
+        Kahn sırası üzerinde sondan başa dinamik programlama ile, özyinelemesiz hesaplanır.
+        Döngüdeki node'lar kanvas konumuna göre sıranın sonuna eklenir; sırada geriye giden
+        kenarlar (ör. Loop Over Items dönüşü) yok sayılır. Yol yoksa boş liste döner.
+        """
+        order, remaining = self.topological_order()
+        order += remaining
+        position = {name: index for index, name in enumerate(order)}
+
+        # (uzunluk, sonraki node) - her node için kendisinden uca en uzun yol
+        best = {}
+        for name in reversed(order):
+            result = (0, None)
+            for target in self.successors(name, MAIN_CONNECTION):
+                if position[target] <= position[name]:
+                    continue
+                if best[target][0] + 1 > result[0]:
+                    result = (best[target][0] + 1, target)
+            best[name] = result
+
+        start = max(sorted(self.triggers()), key=lambda name: best[name][0], default=None)
+        if start is None or not best[start][0]:
+            return []
+        path = [start]
+        while best[path[-1]][1] is not None:
+            path.append(best[path[-1]][1])
+        return path
+
+
+def compile_graph(workflow):
+    """Workflow'dan WorkflowGraph oluşturur"""
+    return WorkflowGraph(workflow)
+
+
+def analyze_graph(graph, hotspot_threshold=HOTSPOT_THRESHOLD):
+    """Derlenmiş graf için topoloji, döngü, erişilebilirlik, yoğun nokta ve kritik yol raporu üretir"""
+    order, blocked = graph.topological_order()
+    reachable = graph.reachable()
+    fan = graph.fan_counts()
+    hotspots = sorted(
+        ({"node": name, "fan_in": fan_in, "fan_out": fan_out}
+         for name, (fan_in, fan_out) in fan.items()
+         if fan_in >= hotspot_threshold or fan_out >= hotspot_threshold),
+        key=lambda item: (-(item["fan_in"] + item["fan_out"]), item["node"])
+    )
+    critical_path = graph.longest_path()
+    return {
+        "name": graph.name,
+        "node_count": len(graph.nodes),
+        "edge_count": len(graph.edges),
+        "triggers": sorted(graph.triggers()),
+        "topological_order": order,
+        "cycles": graph.cycles(),
+        "unreachable": sorted(name for name in graph.nodes if name not in reachable),
+        "orphans": graph.orphans(),
+        "hotspots": hotspots,
+        "critical_path": critical_path,
+        "critical_path_length": max(len(critical_path) - 1, 0),
+        "dangling_connections": [{"from": edge[0], "type": edge[1], "to": edge[3]} for edge in graph.dangling],
+        "blocked_by_cycles": blocked
+    }
+
+
+def analyze_workflow(workflow, hotspot_threshold=HOTSPOT_THRESHOLD):
+    """Workflow'u grafa derleyip analiz raporunu döndürür"""
+    return analyze_graph(compile_graph(workflow), hotspot_threshold)
+
+
+def format_analysis_text(analysis, indent="  "):
+    """Analiz raporunu kısa bir metne çevirir"""
+    lines = [
+        f"'{analysis['name']}': {analysis['node_count']} node, {analysis['edge_count']} bağlantı",
+        f"{indent}Tetikleyiciler: {', '.join(analysis['triggers']) or 'yok'}",
+        f"{indent}Kritik yol ({analysis['critical_path_length']} adım): "
+        f"{' → '.join(analysis['critical_path']) or 'yok'}"
+    ]
+    if analysis["cycles"]:
+        lines.append(f"{indent}Döngüler: " + "; ".join(" ↔ ".join(cycle) for cycle in analysis["cycles"]))
+    if analysis["unreachable"]:
+        lines.append(f"{indent}Erişilemeyen node'lar: {', '.join(analysis['unreachable'])}")
+    if analysis["orphans"]:
+        lines.append(f"{indent}Bağlantısız node'lar: {', '.join(analysis['orphans'])}")
+    for hotspot in analysis["hotspots"]:
+        lines.append(f"{indent}Yoğun nokta: {hotspot['node']} (giriş {hotspot['fan_in']}, çıkış {hotspot['fan_out']})")
+    for edge in analysis["dangling_connections"]:
+        lines.append(f"{indent}Kopuk bağlantı [{edge['type']}]: {edge['from']} → {edge['to']}")
+    return "\n".join(lines)
+
+
+def analyze_workflow_files():
+    """Menüden çağrılır: workflows klasöründeki tüm dosyaların graf analizini gösterir"""
+    from .upload_workflow import get_workflow_files, read_workflow_json
+
+    listing = get_workflow_files()
+    if not listing or not listing[0]:
+        print("\nAnaliz edilecek workflow dosyası bulunamadı.")
+        return
+    workflow_files, workflow_dir = listing
+    for file in sorted(workflow_files):
+        workflow = read_workflow_json(os.path.join(workflow_dir, file))
+        if workflow:
+            print("\n" + format_analysis_text(analyze_workflow(workflow)))
+
+
+def main(argv=None):
+    """Komut satırından graf analizi"""
+    parser = argparse.ArgumentParser(description="Workflow bağlantı grafiği analizi")
+    parser.add_argument("paths", nargs="*", help="Workflow JSON dosyaları (varsayılan: workflows klasörü)")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    parser.add_argument("--hotspot", type=int, default=HOTSPOT_THRESHOLD, help="Yoğun nokta eşiği")
+    args = parser.parse_args(argv)
+
+    paths = args.paths
+    if not paths:
+        workflows_dir = get_workflows_dir()
+        paths = [os.path.join(workflows_dir, name) for name in sorted(os.listdir(workflows_dir))
+                 if name.endswith(".json") and not name.startswith(".")]
+
+    results = []
+    for path in paths:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                workflow = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{path} okunamadı: {e}", file=sys.stderr)
+            continue
+        analysis = analyze_workflow(workflow, args.hotspot)
+        analysis["file"] = os.path.basename(path)
+        results.append(analysis)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        print("\n\n".join(format_analysis_text(analysis) for analysis in results))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+workflows/ klasörü için SQLite tabanlı, artımlı güncellenen yerel indeks
+"""
+
+import os
+import sys
+import json
+import sqlite3
+import argparse
+import threading
+from .utils import get_workflows_dir
+from .sync_manifest import content_hash
+
+# İndeks veritabanı workflows klasöründe gizli bir dosya olarak tutulur
+INDEX_DB_FILE = ".workflow-index.sqlite"
+
+# Şema değişirse artırılır; eski sürümlü veritabanı baştan kurulur
+SCHEMA_VERSION = 1
+
+# Tipi 'Trigger' ile bitmeyen ama workflow'u başlatan node'lar
+TRIGGER_NODE_TYPES = {"webhook", "start", "cron", "interval"}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS workflows (
+    file_name TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    id TEXT,
+    name TEXT,
+    hash TEXT,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    node_count INTEGER NOT NULL,
+    active INTEGER NOT NULL,
+    tags TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_workflows_id ON workflows(id);
+CREATE INDEX IF NOT EXISTS idx_workflows_name ON workflows(name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_workflows_active ON workflows(active);
+
+CREATE TABLE IF NOT EXISTS node_types (
+    file_name TEXT NOT NULL REFERENCES workflows(file_name) ON DELETE CASCADE,
+    node_type TEXT NOT NULL,
+    short_type TEXT NOT NULL,
+    PRIMARY KEY (file_name, node_type)
+);
+CREATE INDEX IF NOT EXISTS idx_node_types_short ON node_types(short_type COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS idx_node_types_type ON node_types(node_type);
+
+CREATE TABLE IF NOT EXISTS triggers (
+    file_name TEXT NOT NULL REFERENCES workflows(file_name) ON DELETE CASCADE,
+    trigger_type TEXT NOT NULL,
+    PRIMARY KEY (file_name, trigger_type)
+);
+CREATE INDEX IF NOT EXISTS idx_triggers_type ON triggers(trigger_type);
+
+CREATE TABLE IF NOT EXISTS tags (
+    file_name TEXT NOT NULL REFERENCES workflows(file_name) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (file_name, tag)
+);
+CREATE INDEX IF NOT EXISTS idx_tags_tag ON tags(tag COLLATE NOCASE);
+"""
+
+
+def short_node_type(node_type):
+    """'@n8n/n8n-nodes-langchain.embeddingsOllama' -> 'embeddingsOllama'"""
+    return str(node_type).rsplit(".", 1)[-1]
+
+
+def trigger_key(node_type):
+    """Tetikleyici tipini sorgulanabilir kısa anahtara çevirir ('webhook', 'googledrive', 'chat' ...)"""
+    short = short_node_type(node_type).lower()
+    return short[:-len("trigger")] if short.endswith("trigger") and short != "trigger" else short
+
+
+def is_trigger_node(node_type):
+    """Node tipi bir tetikleyiciyse True döner"""
+    short = short_node_type(node_type)
+    return short.endswith("Trigger") or short.lower() in TRIGGER_NODE_TYPES
+
+
+def tag_names(workflow):
+    """Workflow'daki etiket isimlerini döndürür (API'deki sözlük veya düz metin formatı)"""
+    names = []
+    for tag in workflow.get("tags", []) or []:
+        name = tag.get("name") if isinstance(tag, dict) else tag
+        if name:
+            names.append(str(name))
+    return names
+
+
+def extract_record(workflow):
+    """İndekslenecek alanları workflow JSON'ından çıkarır"""
+    node_types = sorted({node.get("type") for node in workflow.get("nodes", []) or []
+                         if isinstance(node, dict) and node.get("type")})
+    return {
+        "id": workflow.get("id"),
+        "name": workflow.get("name"),
+        "hash": content_hash(workflow),
+        "node_count": len(workflow.get("nodes", []) or []),
+        "active": bool(workflow.get("active")),
+        "tags": tag_names(workflow),
+        "node_types": node_types,
+        "triggers": sorted({trigger_key(node_type) for node_type in node_types if is_trigger_node(node_type)})
+    }
+
+
+class WorkflowIndex:
+    """
+    Workflow dosyalarının id, isim, hash, node tipleri, etiket, aktiflik ve
+    tetikleyici bilgilerini SQLite'ta tutan indeks.
+
+    refresh() sadece mtime/boyutu değişen dosyaları yeniden parse eder;
+    sorgular indeksli tablolardan okunur.
+    """
+
+    def __init__(self, workflows_dir=None, db_path=None):
+        self.workflows_dir = workflows_dir or get_workflows_dir()
+        self.db_path = db_path or os.path.join(self.workflows_dir, INDEX_DB_FILE)
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self._ensure_schema()
+        # Son refresh() sırasında görülen .json dosyaları (geçersiz olanlar dahil); None: bu süreçte hiç güncellenmedi
+        self.file_names = None
+
+    def _ensure_schema(self):
+        version = self.connection.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            with self.connection:
+                for table in ("tags", "triggers", "node_types", "workflows"):
+                    self.connection.execute(f"DROP TABLE IF EXISTS {table}")
+                self.connection.executescript(SCHEMA)
+                self.connection.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    def close(self):
+        self.connection.close()
+
+    def refresh(self):
+        """
+        Dosya sistemindeki değişiklikleri indekse yansıtır.
+
+        {"added", "updated", "removed", "unchanged"} sayılarını döndürür.
+        """
+        stats = {"added": 0, "updated": 0, "removed": 0, "unchanged": 0}
+        if not os.path.isdir(self.workflows_dir):
+            self.file_names = []
+            return stats
+
+        known = {
+            row["file_name"]: (row["mtime_ns"], row["size"])
+            for row in self.connection.execute("SELECT file_name, mtime_ns, size FROM workflows")
+        }
+
+        with self.lock, self.connection:
+            seen = set()
+            for entry in os.scandir(self.workflows_dir):
+                if not entry.name.endswith(".json") or entry.name.startswith(".") or not entry.is_file():
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                if known.get(entry.name) == (stat.st_mtime_ns, stat.st_size):
+                    stats["unchanged"] += 1
+                    continue
+                try:
+                    with open(entry.path, 'r', encoding='utf-8') as f:
+                        workflow = json.load(f)
+                except (OSError, ValueError):
+                    workflow = None
+                if not isinstance(workflow, dict):
+                    # Geçersiz dosyalar indekste tutulmaz
+                    if entry.name in known:
+                        self.connection.execute("DELETE FROM workflows WHERE file_name = ?", (entry.name,))
+                        stats["removed"] += 1
+                    continue
+                self._store(entry.name, entry.path, stat, extract_record(workflow))
+                stats["updated" if entry.name in known else "added"] += 1
+
+            for file_name in set(known) - seen:
+                self.connection.execute("DELETE FROM workflows WHERE file_name = ?", (file_name,))
+                stats["removed"] += 1
+        self.file_names = sorted(seen)
+        return stats
+
+    def _store(self, file_name, path, stat, record):
+        self.connection.execute("DELETE FROM workflows WHERE file_name = ?", (file_name,))
+        self.connection.execute(
+            "INSERT INTO workflows (file_name, path, id, name, hash, mtime_ns, size, node_count, active, tags) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            (file_name, path, record["id"], record["name"], record["hash"], stat.st_mtime_ns, stat.st_size,
+             record["node_count"], int(record["active"]), json.dumps(record["tags"], ensure_ascii=False))
+        )
+        self.connection.executemany(
+            "INSERT INTO node_types (file_name, node_type, short_type) VALUES (?, ?, ?)",
+            [(file_name, node_type, short_node_type(node_type)) for node_type in record["node_types"]]
+        )
+        self.connection.executemany(
+            "INSERT INTO triggers (file_name, trigger_type) VALUES (?, ?)",
+            [(file_name, trigger) for trigger in record["triggers"]]
+        )
+        self.connection.executemany(
+            "INSERT OR IGNORE INTO tags (file_name, tag) VALUES (?, ?)",
+            [(file_name, tag) for tag in record["tags"]]
+        )
+
+    def _row(self, row):
+        result = dict(row)
+        result["active"] = bool(result["active"])
+        result["tags"] = json.loads(result["tags"])
+        return result
+
+    def find_by_id(self, workflow_id):
+        """Workflow id'sine ait indeks kaydını döndürür (yoksa None)"""
+        row = self.connection.execute("SELECT * FROM workflows WHERE id = ?", (workflow_id,)).fetchone()
+        return self._row(row) if row else None
+
+    def file_records(self):
+        """Tüm geçerli dosyaların (file_name, path, id, name, hash) kayıtlarını dosya adına göre döndürür"""
+        rows = self.connection.execute("SELECT file_name, path, id, name, hash FROM workflows ORDER BY file_name")
+        return [dict(row) for row in rows]
+
+    def find_by_name(self, name):
+        """İsmi (büyük/küçük harf duyarsız) eşleşen kayıtları döndürür"""
+        rows = self.connection.execute("SELECT * FROM workflows WHERE name = ? COLLATE NOCASE", (name,))
+        return [self._row(row) for row in rows]
+
+    def node_types_of(self, file_name):
+        """Dosyadaki node tiplerini döndürür"""
+        rows = self.connection.execute("SELECT node_type FROM node_types WHERE file_name = ? ORDER BY node_type",
+                                       (file_name,))
+        return [row["node_type"] for row in rows]
+
+    def query(self, node_type=None, trigger=None, active=None, tag=None, name=None):
+        """
+        Filtrelere uyan workflow kayıtlarını isme göre sıralı döndürür.
+
+        node_type tam tip veya kısa tip olabilir ('embeddingsOllama'), trigger
+        kısa tetikleyici adıdır ('webhook', 'chat', 'googleDriveTrigger'),
+        name isim içinde geçen metindir. Verilmeyen filtreler uygulanmaz.
+        """
+        conditions = []
+        params = []
+        if node_type:
+            conditions.append("file_name IN (SELECT file_name FROM node_types "
+                              "WHERE node_type = ? OR short_type = ? COLLATE NOCASE)")
+            params.extend([node_type, node_type])
+        if trigger:
+            conditions.append("file_name IN (SELECT file_name FROM triggers WHERE trigger_type = ?)")
+            params.append(trigger_key(trigger))
+        if active is not None:
+            conditions.append("active = ?")
+            params.append(int(bool(active)))
+        if tag:
+            conditions.append("file_name IN (SELECT file_name FROM tags WHERE tag = ? COLLATE NOCASE)")
+            params.append(tag)
+        if name:
+            conditions.append("name LIKE ?")
+            params.append(f"%{name}%")
+
+        sql = "SELECT * FROM workflows"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        sql += " ORDER BY name COLLATE NOCASE"
+        return [self._row(row) for row in self.connection.execute(sql, params)]
+
+    def stats(self):
+        """İndeksteki workflow ve en sık kullanılan node tipi sayılarını döndürür"""
+        total = self.connection.execute("SELECT COUNT(*) FROM workflows").fetchone()[0]
+        active = self.connection.execute("SELECT COUNT(*) FROM workflows WHERE active = 1").fetchone()[0]
+        top_types = self.connection.execute(
+            "SELECT short_type, COUNT(*) AS count FROM node_types GROUP BY short_type "
+            "ORDER BY count DESC, short_type LIMIT 10"
+        ).fetchall()
+        return {"workflows": total, "active": active, "top_node_types": [tuple(row) for row in top_types]}
+
+
+_indexes = {}
+_indexes_lock = threading.Lock()
+
+
+def get_workflow_index(workflows_dir=None, refresh=True):
+    """
+    Klasör başına paylaşılan WorkflowIndex örneğini döndürür.
+
+    refresh=True ise klasör taranıp indeks güncellenir (komut başına bir kez,
+    get_workflow_files bunu yapar). refresh=False ise indeks bu süreçte hiç
+    güncellenmediyse bir kez güncellenir, aksi halde olduğu gibi kullanılır.
+    """
+    workflows_dir = workflows_dir or get_workflows_dir()
+    with _indexes_lock:
+        index = _indexes.get(workflows_dir)
+        if index is None:
+            index = _indexes[workflows_dir] = WorkflowIndex(workflows_dir)
+    if refresh or index.file_names is None:
+        index.refresh()
+    return index
+
+
+def find_workflow_file(workflow_id, workflows_dir=None):
+    """Workflow id'sine ait dosyanın yolunu indeksten bulur (yoksa None); klasörü yeniden taramaz"""
+    record = get_workflow_index(workflows_dir, refresh=False).find_by_id(workflow_id)
+    return record["path"] if record else None
+
+
+def _print_rows(rows, as_json):
+    if as_json:
+        print(json.dumps(rows, ensure_ascii=False, indent=2))
+        return
+    for row in rows:
+        status = "aktif" if row["active"] else "pasif"
+        print(f"{row['id'] or '---':<20} {status:<6} {row['node_count']:>4} node  {row['name']}  ({row['file_name']})")
+    print(f"\n{len(rows)} workflow bulundu.")
+
+
+def main(argv=None):
+    """Komut satırından indeks sorgulama"""
+    parser = argparse.ArgumentParser(description="Yerel workflow indeksini sorgula")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="Workflow klasörü")
+    parser.add_argument("--rebuild", action="store_true", help="İndeksi baştan oluştur")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("stats", help="İndeks özetini göster")
+    find_parser = subparsers.add_parser("find", help="ID ile workflow bul")
+    find_parser.add_argument("workflow_id")
+
+    query_parser = subparsers.add_parser("query", help="Filtrelerle workflow ara")
+    query_parser.add_argument("--node-type", help="Tam veya kısa node tipi (ör. embeddingsOllama)")
+    query_parser.add_argument("--trigger", help="Tetikleyici tipi (ör. webhook, chat, googleDrive)")
+    query_parser.add_argument("--tag", help="Etiket adı")
+    query_parser.add_argument("--name", help="İsim içinde geçen metin")
+    status = query_parser.add_mutually_exclusive_group()
+    status.add_argument("--active", dest="active", action="store_true", default=None, help="Sadece aktifler")
+    status.add_argument("--inactive", dest="active", action="store_false", help="Sadece pasifler")
+
+    args = parser.parse_args(argv)
+    workflows_dir = args.workflows_dir or get_workflows_dir()
+    if args.rebuild:
+        db_path = os.path.join(workflows_dir, INDEX_DB_FILE)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(db_path + suffix):
+                os.remove(db_path + suffix)
+    index = get_workflow_index(workflows_dir)
+
+    if args.command == "stats":
+        stats = index.stats()
+        if args.json:
+            print(json.dumps(stats, ensure_ascii=False, indent=2))
+        else:
+            print(f"Toplam workflow: {stats['workflows']} (aktif: {stats['active']})")
+            for short_type, count in stats["top_node_types"]:
+                print(f"  {short_type:<40} {count}")
+    elif args.command == "find":
+        record = index.find_by_id(args.workflow_id)
+        if not record:
+            print(f"{args.workflow_id} ID'li workflow indekste bulunamadı.")
+            return 1
+        _print_rows([record], args.json)
+    else:
+        rows = index.query(node_type=args.node_type, trigger=args.trigger, active=args.active,
+                           tag=args.tag, name=args.name)
+        _print_rows(rows, args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
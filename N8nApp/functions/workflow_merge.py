@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Son senkron tabanını kullanarak workflow'lar için üç yönlü (three-way) birleştirme işlevleri
+"""
+
+import copy
+from .workflow_diff import index_nodes, connection_edges
+
+# Değerin bir tarafta bulunmadığını belirtmek için kullanılan işaretçi
+_MISSING = object()
+
+
+def _value(value):
+    return None if value is _MISSING else value
+
+
+def _merge_values(base, local, remote, path, conflicts):
+    """
+    Tek bir değeri üç yönlü birleştirir.
+
+    Sadece bir taraf değiştiyse o taraf alınır; iki taraf da aynı şekilde
+    değiştiyse sorun yoktur. İki taraf farklı değiştiyse ve ikisi de sözlükse
+    anahtar bazında devam edilir, değilse çakışma kaydedilir ve dosya tarafı tutulur.
+    """
+    if local == remote:
+        return local
+    if local == base:
+        return remote
+    if remote == base:
+        return local
+
+    if isinstance(local, dict) and isinstance(remote, dict):
+        base_dict = base if isinstance(base, dict) else {}
+        merged = {}
+        for key in list(local.keys()) + [key for key in remote if key not in local]:
+            value = _merge_values(base_dict.get(key, _MISSING), local.get(key, _MISSING),
+                                  remote.get(key, _MISSING), f"{path}/{key}", conflicts)
+            if value is not _MISSING:
+                merged[key] = value
+        return merged
+
+    conflicts.append({"path": path, "base": _value(base), "local": _value(local), "remote": _value(remote)})
+    return local
+
+
+def _merge_nodes(base_nodes, local_nodes, remote_nodes, conflicts):
+    """Node'ları id bazında birleştirir; node sırası dosya tarafındaki sırayı izler"""
+    order = list(local_nodes) + [key for key in remote_nodes if key not in local_nodes]
+    merged = []
+    for key in order:
+        base = base_nodes.get(key, _MISSING)
+        local = local_nodes.get(key, _MISSING)
+        remote = remote_nodes.get(key, _MISSING)
+        name = _value(local if local is not _MISSING else remote) or {}
+        node = _merge_values(base, local, remote, f"/nodes/{name.get('name', key)}", conflicts)
+        # Bir tarafta silinip diğerinde değişmeyen node düşer (_MISSING),
+        # bir tarafta silinip diğerinde değişen node çakışma olarak raporlanır
+        if node is not _MISSING:
+            merged.append(node)
+    return merged
+
+
+def _merge_connections(base, local, remote, merged_nodes):
+    """Bağlantıları kenar kümeleri üzerinden birleştirir ve n8n formatında yeniden kurar"""
+    base_connections = base.get("connections", {}) or {}
+    local_connections = local.get("connections", {}) or {}
+    remote_connections = remote.get("connections", {}) or {}
+
+    # Sadece bir taraf değiştiyse yapıyı olduğu gibi koru (boş çıkış listeleri dahil)
+    if local_connections == remote_connections or remote_connections == base_connections:
+        return local_connections
+    if local_connections == base_connections:
+        return remote_connections
+
+    name_to_key = {}
+    for workflow in (base, remote, local):
+        for key, node in index_nodes(workflow).items():
+            name_to_key[node.get("name")] = key
+
+    base_edges = connection_edges(base, name_to_key)
+    local_edges = connection_edges(local, name_to_key)
+    remote_edges = connection_edges(remote, name_to_key)
+
+    # Bir kenar iki tarafta da varsa ya da bir tarafça yeni eklendiyse kalır;
+    # taraflardan biri tabandaki bir kenarı sildiyse silinmiş sayılır
+    merged_edges = (local_edges & remote_edges) | (local_edges - base_edges) | (remote_edges - base_edges)
+
+    key_to_name = {node.get("id") or node.get("name"): node.get("name") for node in merged_nodes}
+    connections = {}
+    ordered_edges = [edge for edge in _ordered_edges(local, name_to_key) if edge in merged_edges]
+    ordered_edges += sorted(merged_edges - set(ordered_edges), key=str)
+
+    for source, connection_type, output_index, target, input_index in ordered_edges:
+        if source not in key_to_name or target not in key_to_name:
+            # Silinen node'lara giden kenarları at
+            continue
+        outputs = connections.setdefault(key_to_name[source], {}).setdefault(connection_type, [])
+        while len(outputs) <= output_index:
+            outputs.append([])
+        outputs[output_index].append({"node": key_to_name[target], "type": connection_type, "index": input_index})
+    return connections
+
+
+def _ordered_edges(workflow, name_to_key):
+    """Kenarları workflow'daki görünüm sırasıyla döndürür"""
+    edges = []
+    for source, outputs in (workflow.get("connections", {}) or {}).items():
+        if not isinstance(outputs, dict):
+            continue
+        for connection_type, output_list in outputs.items():
+            for output_index, targets in enumerate(output_list or []):
+                for target in targets or []:
+                    if isinstance(target, dict):
+                        edges.append((
+                            name_to_key.get(source, source), connection_type, output_index,
+                            name_to_key.get(target.get("node"), target.get("node")), target.get("index", 0)
+                        ))
+    return edges
+
+
+def merge_workflows(base, local, remote):
+    """
+    Taban (son senkron), dosya (local) ve n8n (remote) sürümlerini üç yönlü birleştirir.
+
+    {"merged": workflow, "conflicts": [...]} döndürür. Çakışmalar JSON Pointer
+    benzeri yol ile base/local/remote değerlerini içerir; çakışma varsa merged
+    içinde ilgili noktada dosya tarafı tutulur ve sonuç otomatik uygulanmamalıdır.
+    """
+    conflicts = []
+    name = _merge_values(base.get("name"), local.get("name"), remote.get("name"), "/name", conflicts)
+    settings = _merge_values(base.get("settings", {}) or {}, local.get("settings", {}) or {},
+                             remote.get("settings", {}) or {}, "/settings", conflicts)
+    nodes = _merge_nodes(index_nodes(base), index_nodes(local), index_nodes(remote), conflicts)
+    connections = _merge_connections(base, local, remote, nodes)
+
+    # Sürüm gibi diğer alanlar n8n tarafından alınır
+    merged = copy.deepcopy({**remote, "name": name, "nodes": nodes, "connections": connections, "settings": settings})
+    return {"merged": merged, "conflicts": conflicts}
+
+
+def format_conflicts_text(conflicts, indent="  "):
+    """Çakışmaları okunabilir satırlar halinde döndürür"""
+    lines = []
+    for conflict in conflicts:
+        lines.append(f"{indent}! {conflict['path']}: dosya={_short(conflict['local'])} "
+                     f"n8n={_short(conflict['remote'])} (taban={_short(conflict['base'])})")
+    return "\n".join(lines)
+
+
+def _short(value, limit=40):
+    text = repr(value)
+    return text if len(text) <= limit else text[:limit - 3] + "..."
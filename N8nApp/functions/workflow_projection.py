@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Workflow'ları yükleme ve dışa aktarma için sadeleştirme (projeksiyon) işlevleri
+"""
+
+import os
+import sys
+import json
+import argparse
+from .utils import (getenv, get_workflows_dir, encode_json_body, upload_payload, canonical_workflow_json,
+                    write_canonical_json)
+
+# Karşılaştırma ve yüklemede kullanılmayan, her kayıtta değişebilen üst düzey alanlar
+VOLATILE_FIELDS = ("pinData", "meta", "shared", "triggerCount", "createdAt", "updatedAt", "versionId")
+
+# Sadeleştirilmiş dosyalardan çıkarılan alanların tutulduğu gizli klasör (workflows içinde)
+SIDECAR_DIR = ".volatile"
+
+# full: API'den geldiği gibi, sidecar: değişken alanlar yan dosyaya, drop: değişken alanlar atılır
+EXPORT_MODES = ("full", "sidecar", "drop")
+DEFAULT_EXPORT_MODE = getenv("N8N_EXPORT_MODE", "full")
+
+STICKY_NOTE_TYPE = "n8n-nodes-base.stickyNote"
+
+
+def volatile_fields():
+    """Çıkarılacak alanlar; N8N_EXPORT_STRIP ile (virgülle ayrılmış) değiştirilebilir"""
+    value = getenv("N8N_EXPORT_STRIP")
+    if value is None:
+        return VOLATILE_FIELDS
+    return tuple(field.strip() for field in value.split(",") if field.strip())
+
+
+def split_volatile(workflow, fields=None):
+    """Workflow'u (sade kopya, çıkarılan alanlar) olarak ikiye ayırır"""
+    fields = volatile_fields() if fields is None else fields
+    lean = {key: value for key, value in workflow.items() if key not in fields}
+    volatile = {key: workflow[key] for key in fields if key in workflow}
+    return lean, volatile
+
+
+def merge_volatile(lean, volatile):
+    """Yan dosyadaki alanları sade workflow'a geri ekler"""
+    return {**lean, **{key: value for key, value in (volatile or {}).items() if key not in lean}}
+
+
+def sidecar_path(file_path):
+    """Workflow dosyasının yan dosya yolunu döndürür"""
+    directory, file_name = os.path.split(os.path.abspath(file_path))
+    return os.path.join(directory, SIDECAR_DIR, file_name)
+
+
+def load_sidecar(file_path):
+    """Yan dosyayı okur; yoksa boş sözlük döndürür"""
+    try:
+        with open(sidecar_path(file_path), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def write_workflow_file(file_path, workflow, mode=None):
+    """
+    Workflow'u seçilen dışa aktarım moduna göre kanonik biçimde dosyaya yazar.
+
+    sidecar modunda çıkarılan alanlar workflows/.volatile/ altına aynı isimle
+    yazılır; full modunda varsa eski yan dosya silinir. (yazılan byte, tasarruf
+    edilen byte) döndürür; içerik değişmemişse dosyaya dokunulmaz ve yazılan byte 0 olur.
+    """
+    mode = mode or DEFAULT_EXPORT_MODE
+    if mode not in EXPORT_MODES:
+        raise ValueError(f"Geçersiz dışa aktarım modu: {mode} ({', '.join(EXPORT_MODES)})")
+
+    side_path = sidecar_path(file_path)
+    if mode == "full":
+        written = write_canonical_json(file_path, workflow)
+        if os.path.exists(side_path):
+            os.remove(side_path)
+        return written, 0
+
+    lean, volatile = split_volatile(workflow)
+    written = write_canonical_json(file_path, lean)
+    if mode == "sidecar" and volatile:
+        os.makedirs(os.path.dirname(side_path), exist_ok=True)
+        write_canonical_json(side_path, volatile)
+    elif os.path.exists(side_path):
+        os.remove(side_path)
+    return written, _json_size(workflow) - _json_size(lean)
+
+
+def _json_size(data):
+    return len(canonical_workflow_json(data))
+
+
+def projection_report(workflow):
+    """
+    Workflow için dosya ve istek boyutlarını karşılaştıran rapor üretir.
+
+    file_*: kanonik dosya boyutu (tam ve sade), wire_before/wire_after: eski
+    (requests json=) ve yeni (encode_json_body) yükleme gövdesi boyutu; fields alan başına byte verir.
+    """
+    lean, volatile = split_volatile(workflow)
+    payload = upload_payload(workflow)
+    sticky_bytes = sum(_json_size(node) for node in workflow.get("nodes", []) or []
+                       if isinstance(node, dict) and node.get("type") == STICKY_NOTE_TYPE)
+    report = {
+        "id": workflow.get("id"),
+        "name": workflow.get("name"),
+        "file_full": _json_size(workflow),
+        "file_lean": _json_size(lean),
+        "wire_before": len(json.dumps(payload).encode('utf-8')),
+        "wire_after": len(encode_json_body(payload)),
+        "sticky_notes": sticky_bytes,
+        "fields": {key: len(encode_json_body(value)) for key, value in volatile.items()}
+    }
+    report["file_saved"] = report["file_full"] - report["file_lean"]
+    report["wire_saved"] = report["wire_before"] - report["wire_after"]
+    return report
+
+
+def format_report_text(reports):
+    """Workflow başına tasarruf raporunu tablo olarak döndürür"""
+    lines = [f"{'Workflow':<40} {'Dosya':>9} {'Sade':>9} {'Kazanç':>8} {'İstek':>9} {'Kazanç':>8}"]
+    for report in reports:
+        name = str(report.get("file") or report["name"])[:40]
+        lines.append(f"{name:<40} {report['file_full']:>9} {report['file_lean']:>9} {report['file_saved']:>8} "
+                     f"{report['wire_after']:>9} {report['wire_saved']:>8}")
+    if reports:
+        file_full = sum(report["file_full"] for report in reports)
+        file_saved = sum(report["file_saved"] for report in reports)
+        wire_before = sum(report["wire_before"] for report in reports)
+        wire_saved = sum(report["wire_saved"] for report in reports)
+        sticky = sum(report["sticky_notes"] for report in reports)
+        lines.append(f"\nDosya: {file_saved} / {file_full} byte tasarruf (%{100 * file_saved / max(file_full, 1):.1f})")
+        lines.append(f"İstek: {wire_saved} / {wire_before} byte tasarruf "
+                     f"(%{100 * wire_saved / max(wire_before, 1):.1f})")
+        lines.append(f"Sticky note içerikleri: {sticky} byte (workflow içeriği olduğu için korunur)")
+    return "\n".join(lines)
+
+
+def convert_directory(workflows_dir, mode):
+    """Klasördeki tüm dosyaları verilen moda çevirir; yan dosyalar tam moda dönüşte geri birleştirilir"""
+    converted = []
+    for file_name in sorted(os.listdir(workflows_dir)):
+        if not file_name.endswith(".json") or file_name.startswith("."):
+            continue
+        file_path = os.path.join(workflows_dir, file_name)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                workflow = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"{file_name} okunamadı: {e}", file=sys.stderr)
+            continue
+        workflow = merge_volatile(workflow, load_sidecar(file_path))
+        written, saved = write_workflow_file(file_path, workflow, mode)
+        converted.append((file_name, written, saved))
+    return converted
+
+
+def main(argv=None):
+    """Komut satırından tasarruf raporu ve dosya dönüştürme"""
+    parser = argparse.ArgumentParser(description="Workflow sadeleştirme raporu ve sade dışa aktarım")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="Workflow klasörü")
+    subparsers = parser.add_subparsers(dest="command")
+    report_parser = subparsers.add_parser("report", help="Workflow başına tasarruf edilen byte'ları göster")
+    report_parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    convert_parser = subparsers.add_parser("convert", help="Mevcut dosyaları verilen moda çevir")
+    convert_parser.add_argument("mode", choices=EXPORT_MODES)
+    args = parser.parse_args(argv)
+
+    workflows_dir = args.workflows_dir or get_workflows_dir()
+    if args.command == "convert":
+        converted = convert_directory(workflows_dir, args.mode)
+        print(f"{len(converted)} dosya '{args.mode}' moduna çevrildi, "
+              f"{sum(saved for _, _, saved in converted)} byte tasarruf edildi.")
+        return 0
+
+    reports = []
+    for file_name in sorted(os.listdir(workflows_dir)):
+        if not file_name.endswith(".json") or file_name.startswith("."):
+            continue
+        file_path = os.path.join(workflows_dir, file_name)
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                workflow = merge_volatile(json.load(f), load_sidecar(file_path))
+        except (OSError, ValueError) as e:
+            print(f"{file_name} okunamadı: {e}", file=sys.stderr)
+            continue
+        report = projection_report(workflow)
+        report["file"] = file_name
+        reports.append(report)
+
+    if getattr(args, "json", False):
+        print(json.dumps(reports, ensure_ascii=False, indent=2))
+    else:
+        print(format_report_text(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
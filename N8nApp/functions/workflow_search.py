@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+Node tipleri, node isimleri ve parametre değerleri üzerinde ters indeks (inverted index) ile arama
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import bisect
+import argparse
+from .utils import get_workflows_dir, atomic_write_json
+
+# Yerel ve canlı (n8n) indeks önbellekleri workflows klasöründe gizli dosyalar olarak tutulur
+LOCAL_CACHE_FILE = ".search-index.json"
+LIVE_CACHE_FILE = ".search-index-live.json"
+CACHE_VERSION = 1
+
+# Aranabilir alanlar; sorguda 'type:', 'name:', 'param:' önekleriyle daraltılabilir
+FIELDS = ("type", "name", "param")
+
+WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+CAMEL_PATTERN = re.compile(r"[A-Z]+(?![a-z])|[A-Z]?[a-z]+|\d+")
+
+
+def tokenize(text):
+    """Metni küçük harfli terimlere böler; camelCase kelimeler parçalarıyla birlikte eklenir"""
+    terms = []
+    for word in WORD_PATTERN.findall(str(text)):
+        terms.append(word.lower())
+        parts = CAMEL_PATTERN.findall(word)
+        if len(parts) > 1:
+            terms.extend(part.lower() for part in parts)
+    return terms
+
+
+def _parameter_strings(value):
+    """Parametre ağacındaki tüm metin ve sayı değerlerini düzleştirir"""
+    if isinstance(value, dict):
+        for child in value.values():
+            yield from _parameter_strings(child)
+    elif isinstance(value, list):
+        for child in value:
+            yield from _parameter_strings(child)
+    elif isinstance(value, str):
+        yield value
+    elif isinstance(value, (int, float)) and not isinstance(value, bool):
+        yield str(value)
+
+
+def document_terms(workflow):
+    """
+    Workflow'un alan bazında terimlerini çıkarır.
+
+    {alan: {terim: [node isimleri]}} döndürür; node isimleri sonuçta hangi
+    node'ların eşleştiğini göstermek için tutulur.
+    """
+    terms = {field: {} for field in FIELDS}
+
+    def add(field, text, node_name):
+        for term in tokenize(text):
+            nodes = terms[field].setdefault(term, [])
+            if node_name not in nodes:
+                nodes.append(node_name)
+
+    for node in workflow.get("nodes", []) or []:
+        if not isinstance(node, dict):
+            continue
+        node_name = node.get("name") or ""
+        node_type = node.get("type") or ""
+        add("type", node_type.rsplit(".", 1)[-1], node_name)
+        add("name", node_name, node_name)
+        for text in _parameter_strings(node.get("parameters", {})):
+            add("param", text, node_name)
+    return terms
+
+
+class SearchIndex:
+    """
+    Workflow belgeleri üzerinde alan bazlı ters indeks.
+
+    Belgeler (ileri indeks) önbellek dosyasında saklanır; ters indeks ve
+    önek araması için sıralı sözlük yüklemede bellekte kurulur.
+    """
+
+    def __init__(self, cache_path=None):
+        self.cache_path = cache_path
+        self.documents = {}
+        self.postings = {field: {} for field in FIELDS}
+        self._vocabulary = {}
+        self.dirty = False
+
+    @classmethod
+    def load(cls, cache_path):
+        """Önbellekten belgeleri yükler ve ters indeksi kurar"""
+        index = cls(cache_path)
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                for key, document in data.get("documents", {}).items():
+                    index._add_postings(key, document)
+                    index.documents[key] = document
+        except (OSError, ValueError, AttributeError):
+            pass
+        return index
+
+    def save(self):
+        """Değişiklik varsa belgeleri önbelleğe yazar"""
+        if self.dirty and self.cache_path:
+            atomic_write_json(self.cache_path, {"version": CACHE_VERSION, "documents": self.documents})
+            self.dirty = False
+
+    def _add_postings(self, key, document):
+        for field, terms in document["terms"].items():
+            postings = self.postings.setdefault(field, {})
+            for term in terms:
+                postings.setdefault(term, set()).add(key)
+        self._vocabulary.clear()
+
+    def remove(self, key):
+        """Belgeyi indeksten çıkarır"""
+        document = self.documents.pop(key, None)
+        if not document:
+            return
+        for field, terms in document["terms"].items():
+            postings = self.postings.get(field, {})
+            for term in terms:
+                keys = postings.get(term)
+                if keys:
+                    keys.discard(key)
+                    if not keys:
+                        del postings[term]
+        self._vocabulary.clear()
+        self.dirty = True
+
+    def put(self, key, workflow, stamp):
+        """Belgeyi (yeniden) indeksler; stamp değişiklik tespiti için saklanır (mtime/sürüm)"""
+        self.remove(key)
+        document = {
+            "id": workflow.get("id"),
+            "name": workflow.get("name"),
+            "stamp": stamp,
+            "terms": document_terms(workflow)
+        }
+        self.documents[key] = document
+        self._add_postings(key, document)
+        self.dirty = True
+
+    def vocabulary(self, field):
+        """Alanın sıralı terim listesi (önek araması için)"""
+        if field not in self._vocabulary:
+            self._vocabulary[field] = sorted(self.postings.get(field, {}))
+        return self._vocabulary[field]
+
+    def lookup(self, term, field=None, prefix=False):
+        """Terimi (veya öneki) içeren belge anahtarlarını döndürür"""
+        keys = set()
+        for current in ([field] if field else FIELDS):
+            postings = self.postings.get(current, {})
+            if not prefix:
+                keys |= postings.get(term, set())
+                continue
+            vocabulary = self.vocabulary(current)
+            position = bisect.bisect_left(vocabulary, term)
+            while position < len(vocabulary) and vocabulary[position].startswith(term):
+                keys |= postings[vocabulary[position]]
+                position += 1
+        return keys
+
+    def matching_nodes(self, key, terms):
+        """Belgede verilen terimlerle eşleşen node isimlerini döndürür"""
+        document = self.documents[key]
+        nodes = []
+        for field, term, prefix in terms:
+            for current in ([field] if field else FIELDS):
+                for candidate, node_names in document["terms"].get(current, {}).items():
+                    if candidate == term or (prefix and candidate.startswith(term)):
+                        nodes.extend(name for name in node_names if name not in nodes)
+        return nodes
+
+    def search(self, query):
+        """Sorguyu çalıştırır; isme göre sıralı [{'key','id','name','nodes'}] döndürür"""
+        tree = parse_query(query)
+        keys = _evaluate(tree, self)
+        terms = list(_positive_terms(tree))
+        results = [
+            {"key": key, "id": self.documents[key]["id"], "name": self.documents[key]["name"],
+             "nodes": self.matching_nodes(key, terms)}
+            for key in keys
+        ]
+        return sorted(results, key=lambda result: str(result["name"]).lower())
+
+
+# --- Sorgu dili --------------------------------------------------------------
+#
+# Boşlukla ayrılan terimler VE (AND) ile birleşir; OR, NOT (veya -terim) ve
+# parantez desteklenir. 'terim*' önek araması, 'alan:terim' alan kısıtlamasıdır,
+# "tırnaklı ifade" içindeki tüm terimlerin bulunmasını ister.
+
+QUERY_TOKEN_PATTERN = re.compile(r'\(|\)|-(?=\S)|"[^"]*"|[^\s()"]+')
+
+
+def _query_tokens(query):
+    return QUERY_TOKEN_PATTERN.findall(query)
+
+
+def _term_node(token):
+    """'type:vector*' gibi bir belirteci terim düğüm(ler)ine çevirir"""
+    field = None
+    if ":" in token:
+        candidate, rest = token.split(":", 1)
+        if candidate.lower() in FIELDS and rest:
+            field, token = candidate.lower(), rest
+    text = token.strip('"')
+    prefix = text.endswith("*")
+    # Sorgu kelimeleri olduğu gibi aranır; camelCase parçaları zaten indekste ayrı terimdir
+    words = [word.lower() for word in WORD_PATTERN.findall(text)]
+    if not words:
+        return ("all",)
+    nodes = [("term", field, word, prefix and index == len(words) - 1) for index, word in enumerate(words)]
+    return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+
+def parse_query(query):
+    """Sorgu metnini değerlendirilebilir bir ağaca çevirir"""
+    tokens = _query_tokens(query)
+    position = 0
+
+    def peek():
+        return tokens[position] if position < len(tokens) else None
+
+    def parse_or():
+        nonlocal position
+        nodes = [parse_and()]
+        while peek() is not None and peek().upper() == "OR":
+            position += 1
+            nodes.append(parse_and())
+        return nodes[0] if len(nodes) == 1 else ("or", nodes)
+
+    def parse_and():
+        nonlocal position
+        nodes = []
+        while peek() is not None and peek() != ")" and peek().upper() != "OR":
+            if peek().upper() == "AND":
+                position += 1
+                continue
+            nodes.append(parse_unary())
+        if not nodes:
+            return ("all",)
+        return nodes[0] if len(nodes) == 1 else ("and", nodes)
+
+    def parse_unary():
+        nonlocal position
+        token = peek()
+        if token.upper() == "NOT" or token == "-":
+            position += 1
+            if peek() is None:
+                return ("all",)
+            return ("not", parse_unary())
+        if token == "(":
+            position += 1
+            node = parse_or()
+            if peek() == ")":
+                position += 1
+            return node
+        position += 1
+        return _term_node(token)
+
+    return parse_or()
+
+
+def _evaluate(node, index):
+    kind = node[0]
+    if kind == "all":
+        return set(index.documents)
+    if kind == "term":
+        _, field, term, prefix = node
+        return index.lookup(term, field, prefix)
+    if kind == "not":
+        return set(index.documents) - _evaluate(node[1], index)
+    children = node[1]
+    if kind == "or":
+        return set().union(*(_evaluate(child, index) for child in children))
+    # AND: önce olumlu terimleri kesiştir, olumsuzları sonra çıkar
+    positives = [child for child in children if child[0] != "not"]
+    negatives = [child[1] for child in children if child[0] == "not"]
+    result = None
+    for child in positives:
+        keys = _evaluate(child, index)
+        result = keys if result is None else result & keys
+        if not result:
+            return set()
+    if result is None:
+        result = set(index.documents)
+    for child in negatives:
+        result -= _evaluate(child, index)
+    return result
+
+
+def _positive_terms(node):
+    if node[0] == "term":
+        yield node[1], node[2], node[3]
+    elif node[0] in ("and", "or"):
+        for child in node[1]:
+            yield from _positive_terms(child)
+
+
+# --- Yerel ve canlı indeks ---------------------------------------------------
+
+def build_local_index(workflows_dir=None):
+    """
+    workflows/ klasörünün indeksini önbellekten yükler ve artımlı günceller.
+
+    Sadece mtime/boyutu değişen dosyalar yeniden okunur; silinen dosyalar çıkarılır.
+    """
+    workflows_dir = workflows_dir or get_workflows_dir()
+    index = SearchIndex.load(os.path.join(workflows_dir, LOCAL_CACHE_FILE))
+    seen = set()
+    if os.path.isdir(workflows_dir):
+        for entry in os.scandir(workflows_dir):
+            if not entry.name.endswith(".json") or entry.name.startswith(".") or not entry.is_file():
+                continue
+            seen.add(entry.name)
+            stat = entry.stat()
+            stamp = [stat.st_mtime_ns, stat.st_size]
+            document = index.documents.get(entry.name)
+            if document and document["stamp"] == stamp:
+                continue
+            try:
+                with open(entry.path, 'r', encoding='utf-8') as f:
+                    workflow = json.load(f)
+            except (OSError, ValueError):
+                workflow = None
+            if isinstance(workflow, dict):
+                index.put(entry.name, workflow, stamp)
+            else:
+                index.remove(entry.name)
+    for key in set(index.documents) - seen:
+        index.remove(key)
+    index.save()
+    return index
+
+
+def build_live_index(workflows_dir=None):
+    """
+    N8N'deki workflow'ların indeksini kurar.
+
+    Listeleme tam içerikleri döndürdüğü için ek istek yapılmaz; sürümü
+    (versionId/updatedAt) değişmeyen workflow'lar yeniden terimlenmez.
+    """
+    from .api_client import get_client
+
+    workflows_dir = workflows_dir or get_workflows_dir()
+    cache_path = os.path.join(workflows_dir, LIVE_CACHE_FILE) if os.path.isdir(workflows_dir) else None
+    index = SearchIndex.load(cache_path) if cache_path else SearchIndex()
+    seen = set()
+    for workflow in get_client().iter_workflows():
+        if not isinstance(workflow, dict) or not workflow.get("id"):
+            continue
+        key = workflow["id"]
+        seen.add(key)
+        stamp = [workflow.get("versionId"), workflow.get("updatedAt")]
+        document = index.documents.get(key)
+        if document and document["stamp"] == stamp and any(stamp):
+            continue
+        index.put(key, workflow, stamp)
+    for key in set(index.documents) - seen:
+        index.remove(key)
+    index.save()
+    return index
+
+
+def search_workflows(query, live=False, workflows_dir=None):
+    """Yerel (varsayılan) veya canlı workflow'larda arama yapar"""
+    index = build_live_index(workflows_dir) if live else build_local_index(workflows_dir)
+    return index.search(query)
+
+
+def main(argv=None):
+    """Komut satırından arama"""
+    parser = argparse.ArgumentParser(
+        description="Workflow'larda node tipi, node ismi ve parametre değerlerine göre arama",
+        epilog='Örnek: "type:vectorStoreSupabase AND param:documents", "postgres* -type:memoryPostgresChat"'
+    )
+    parser.add_argument("query", nargs="+", help="Arama sorgusu (AND, OR, NOT, -terim, önek*, alan:terim)")
+    parser.add_argument("--live", action="store_true", help="Yerel dosyalar yerine N8N'deki workflow'larda ara")
+    parser.add_argument("--dir", dest="workflows_dir", default=None, help="Workflow klasörü")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    index = build_live_index(args.workflows_dir) if args.live else build_local_index(args.workflows_dir)
+    indexed = time.perf_counter()
+    results = index.search(" ".join(args.query))
+    searched = time.perf_counter()
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+        return 0
+    for result in results:
+        print(f"{result['id'] or '---':<20} {result['name']}  ({result['key']})")
+        if result["nodes"]:
+            print(f"    node'lar: {', '.join(result['nodes'])}")
+    print(f"\n{len(results)} workflow bulundu - indeks: {(indexed - started) * 1000:.1f} ms, "
+          f"arama: {(searched - indexed) * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
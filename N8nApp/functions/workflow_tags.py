@@ -3,14 +3,13 @@
 Workflow etiket (tag) işlevleri
 """
 
-import json
 import requests
-from functions.utils import N8N_URL, headers, headers_with_content_type
-from functions.list_workflows import list_workflows
+from functions.api_client import get_client
+from functions.workflow_cache import show_workflow_list, invalidate_workflow_list
 
 def get_workflow_tags():
     """Workflow'a atanmış mevcut etiketleri getir"""
-    workflows = list_workflows()
+    workflows = show_workflow_list()
     
     if not workflows:
         return
@@ -27,10 +26,7 @@ def get_workflow_tags():
         workflow_id = workflows[choice-1]["id"]
         
         print(f"\nWorkflow ID: {workflow_id} için etiketler getiriliyor...")
-        response = requests.get(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}/tags",
-            headers=headers
-        )
+        response = get_client().get(f"/workflows/{workflow_id}/tags")
         response.raise_for_status()
         
         tags = response.json()
@@ -62,10 +58,7 @@ def get_all_tags():
     """Tüm mevcut tagleri getir"""
     try:
         print("\nTüm taglar getiriliyor...")
-        response = requests.get(
-            f"{N8N_URL}/api/v1/tags",
-            headers=headers
-        )
+        response = get_client().get("/tags")
         response.raise_for_status()
         
         tags = response.json()
@@ -113,8 +106,11 @@ def get_all_tags():
         print(f"Taglar getirilirken hata oluştu: {error_detail}")
 
 def assign_tag():
-    """Workflow'a etiket ata"""
-    workflows = list_workflows()
+    """Workflow'a isim veya ID ile etiket ata (mevcut etiketler korunur, eksik etiketler oluşturulur)"""
+    from functions.tag_engine import get_tag_catalog, apply_tag_operation
+    from functions.workflow_filters import split_names
+    
+    workflows = show_workflow_list()
     
     if not workflows:
         return
@@ -130,26 +126,32 @@ def assign_tag():
         
         workflow_id = workflows[choice-1]["id"]
         
-        # Önce mevcut tagleri getir
-        get_all_tags()
+        # Mevcut tagleri önbellekli katalogdan göster (her seferinde /tags istenmez)
+        catalog = get_tag_catalog()
+        tag_list = sorted(catalog.tags().items(), key=lambda item: item[1].lower())
+        if tag_list:
+            print("\nMevcut taglar: " + ", ".join(f"{name} ({tag_id})" for tag_id, name in tag_list))
         
-        tag_id = input("\nAtamak istediğiniz tag ID'sini girin: ")
+        names = split_names(input("\nAtamak istediğiniz tag isimlerini veya ID'lerini girin (virgülle ayırın): "))
         
-        if not tag_id:
-            print("Tag ID'si boş olamaz. İşlem iptal edildi.")
+        if not names:
+            print("Tag boş olamaz. İşlem iptal edildi.")
             return
         
-        tag_data = [{"id": tag_id}]
-        
-        print(f"\nWorkflow ID: {workflow_id} için tag atanıyor...")
-        response = requests.put(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}/tags",
-            headers=headers_with_content_type,
-            data=json.dumps(tag_data)
-        )
+        # Workflow'un güncel etiketleri alınır ki PUT mevcut etiketleri silmesin
+        response = get_client().get(f"/workflows/{workflow_id}/tags")
         response.raise_for_status()
+        workflow = {"id": workflow_id, "name": workflows[choice-1].get("name"), "tags": response.json()}
         
-        print("\nTag başarıyla atandı!")
+        print(f"\nWorkflow ID: {workflow_id} için tag atanıyor...")
+        report = apply_tag_operation([workflow], add=names, workers=1, catalog=catalog)
+        
+        if report["failed"]:
+            print(f"\nTag atanırken hata oluştu: {report['failed'][0][2]}")
+        elif report["changed"]:
+            print(f"\nTag başarıyla atandı! Güncel etiketler: {', '.join(report['changed'][0][2])}")
+        else:
+            print("\nWorkflow zaten bu etiketlere sahip.")
     
     except ValueError:
         print("Lütfen geçerli bir sayı girin.")
@@ -167,7 +169,7 @@ def assign_tag():
 
 def remove_tags():
     """Workflow'dan tüm etiketleri kaldır"""
-    workflows = list_workflows()
+    workflows = show_workflow_list()
     
     if not workflows:
         return
@@ -184,12 +186,12 @@ def remove_tags():
         workflow_id = workflows[choice-1]["id"]
         
         print(f"\nWorkflow ID: {workflow_id} için tüm etiketler kaldırılıyor...")
-        response = requests.put(
-            f"{N8N_URL}/api/v1/workflows/{workflow_id}/tags",
-            headers=headers_with_content_type,
-            data=json.dumps([])  # Tüm etiketleri kaldırmak için boş dizi
+        response = get_client().put(
+            f"/workflows/{workflow_id}/tags",
+            json=[]  # Tüm etiketleri kaldırmak için boş dizi
         )
         response.raise_for_status()
+        invalidate_workflow_list()
         
         print("\nTüm etiketler başarıyla kaldırıldı!")
     
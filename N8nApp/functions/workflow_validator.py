@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Workflow dosyalarını API'ye göndermeden önce yerelde doğrulama işlevleri
+"""
+
+import os
+import sys
+import json
+import argparse
+from .utils import upload_payload
+from .workflow_graph import compile_graph
+
+# Bu sayının altındaki dosya sayısında süreç havuzu başlatma maliyetine değmez
+PROCESS_POOL_THRESHOLD = 16
+
+# n8n public API workflow şemasında node için zorunlu alanlar ve tipleri
+REQUIRED_NODE_FIELDS = {
+    "name": str,
+    "type": str,
+    "typeVersion": (int, float),
+    "position": list,
+}
+
+# Node'da bulunabilecek isteğe bağlı alanların tipleri
+OPTIONAL_NODE_FIELDS = {
+    "id": str,
+    "parameters": dict,
+    "credentials": dict,
+    "disabled": bool,
+    "notes": str,
+    "notesInFlow": bool,
+    "webhookId": str,
+    "alwaysOutputData": bool,
+    "executeOnce": bool,
+    "retryOnFail": bool,
+    "maxTries": int,
+    "waitBetweenTries": int,
+    "onError": str,
+}
+
+
+def _issue(path, message, level="error"):
+    return {"level": level, "path": path, "message": message}
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _validate_node(index, node, issues):
+    path = f"/nodes/{index}"
+    if not isinstance(node, dict):
+        issues.append(_issue(path, "node bir nesne olmalı"))
+        return
+    for field, expected in REQUIRED_NODE_FIELDS.items():
+        if field not in node:
+            issues.append(_issue(f"{path}/{field}", f"zorunlu '{field}' alanı eksik"))
+        elif not isinstance(node[field], expected) or isinstance(node[field], bool):
+            issues.append(_issue(f"{path}/{field}", f"'{field}' alanının tipi geçersiz"))
+    for field, expected in OPTIONAL_NODE_FIELDS.items():
+        if field in node and node[field] is not None and not isinstance(node[field], expected):
+            issues.append(_issue(f"{path}/{field}", f"'{field}' alanının tipi geçersiz"))
+
+    if "parameters" not in node:
+        # n8n eksik parametreleri varsayılanlarla doldurur; yine de editörden kaydedilmemiş olabilir
+        issues.append(_issue(f"{path}/parameters", "'parameters' alanı eksik", "warning"))
+    if isinstance(node.get("name"), str) and not node["name"].strip():
+        issues.append(_issue(f"{path}/name", "node ismi boş olamaz"))
+    type_version = node.get("typeVersion")
+    if _is_number(type_version) and type_version <= 0:
+        issues.append(_issue(f"{path}/typeVersion", "typeVersion pozitif bir sayı olmalı"))
+    position = node.get("position")
+    if isinstance(position, list) and (len(position) != 2 or not all(_is_number(value) for value in position)):
+        issues.append(_issue(f"{path}/position", "position iki sayıdan oluşan bir dizi olmalı [x, y]"))
+
+
+def _validate_connections(connections, node_names, issues):
+    for source, outputs in connections.items():
+        path = f"/connections/{source}"
+        if source not in node_names:
+            issues.append(_issue(path, f"bağlantı kaynağı '{source}' isimli bir node yok"))
+        if not isinstance(outputs, dict):
+            issues.append(_issue(path, "bağlantı tipi haritası bir nesne olmalı"))
+            continue
+        for connection_type, output_list in outputs.items():
+            if not isinstance(output_list, list):
+                issues.append(_issue(f"{path}/{connection_type}", "çıkış listesi bir dizi olmalı"))
+                continue
+            for output_index, targets in enumerate(output_list):
+                if targets is None:
+                    continue
+                if not isinstance(targets, list):
+                    issues.append(_issue(f"{path}/{connection_type}/{output_index}", "hedef listesi bir dizi olmalı"))
+                    continue
+                for target_index, target in enumerate(targets):
+                    target_path = f"{path}/{connection_type}/{output_index}/{target_index}"
+                    if not isinstance(target, dict) or not isinstance(target.get("node"), str):
+                        issues.append(_issue(target_path, "hedef {node, type, index} nesnesi olmalı"))
+                        continue
+                    if not isinstance(target.get("type"), str):
+                        issues.append(_issue(f"{target_path}/type", "hedef bağlantı tipi eksik"))
+                    if not isinstance(target.get("index"), int) or isinstance(target.get("index"), bool) \
+                            or target["index"] < 0:
+                        issues.append(_issue(f"{target_path}/index", "hedef index negatif olmayan bir tamsayı olmalı"))
+
+
+def validate_workflow(workflow):
+    """
+    Workflow'un yükleme gövdesini (upload_payload) n8n şemasına göre doğrular.
+
+    [{"level": "error"|"warning", "path": JSON Pointer, "message": ...}] döndürür;
+    'error' seviyesindeki sorunlar API tarafından reddedilecek dosyaları belirtir.
+    """
+    if not isinstance(workflow, dict):
+        return [_issue("", "workflow bir JSON nesnesi olmalı")]
+
+    payload = upload_payload(workflow)
+    issues = []
+
+    if not isinstance(payload["name"], str) or not payload["name"].strip():
+        issues.append(_issue("/name", "workflow ismi boş olamaz"))
+    if not isinstance(payload["nodes"], list):
+        issues.append(_issue("/nodes", "nodes bir dizi olmalı"))
+        return issues
+    if not isinstance(payload["connections"], dict):
+        issues.append(_issue("/connections", "connections bir nesne olmalı"))
+        return issues
+
+    seen_ids = {}
+    seen_names = {}
+    for index, node in enumerate(payload["nodes"]):
+        _validate_node(index, node, issues)
+        if not isinstance(node, dict):
+            continue
+        node_id = node.get("id")
+        if isinstance(node_id, str):
+            if node_id in seen_ids:
+                issues.append(_issue(f"/nodes/{index}/id", f"node id '{node_id}' tekrar ediyor "
+                                                            f"(/nodes/{seen_ids[node_id]})"))
+            seen_ids.setdefault(node_id, index)
+        name = node.get("name")
+        if isinstance(name, str):
+            if name in seen_names:
+                issues.append(_issue(f"/nodes/{index}/name", f"node ismi '{name}' tekrar ediyor "
+                                                              f"(/nodes/{seen_names[name]})"))
+            seen_names.setdefault(name, index)
+
+    _validate_connections(payload["connections"], set(seen_names), issues)
+
+    # Bağlantı hedeflerinin varlığı graf derlemesindeki kopuk kenarlardan okunur; graf sticky
+    # note'ları içermediğinden hedef tüm node isimlerine karşı kontrol edilir
+    graph = compile_graph(payload)
+    for source, connection_type, output_index, target, _ in graph.dangling:
+        if source in graph.nodes and target not in seen_names:
+            issues.append(_issue(f"/connections/{source}/{connection_type}/{output_index}",
+                                 f"bağlantı hedefi '{target}' isimli bir node yok"))
+    triggers = set(graph.triggers())
+    for name in graph.orphans():
+        if name not in triggers:
+            issues.append(_issue(f"/nodes/{seen_names[name]}", f"'{name}' node'unun hiç bağlantısı yok", "warning"))
+    return issues
+
+
+def has_errors(issues):
+    """Sorunlar arasında 'error' seviyesinde olan varsa True döner"""
+    return any(issue["level"] == "error" for issue in issues)
+
+
+def format_issues_text(issues, indent="  "):
+    """Doğrulama sorunlarını satır bazlı metne çevirir"""
+    return "\n".join(f"{indent}{'✗' if issue['level'] == 'error' else '!'} {issue['path'] or '/'}: {issue['message']}"
+                     for issue in issues)
+
+
+def validate_file(file_path):
+    """Dosyayı okuyup doğrular; (dosya yolu, sorunlar) döndürür (süreç havuzunda çalışabilir)"""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            workflow = json.load(f)
+    except ValueError as e:
+        return file_path, [_issue("", f"geçersiz JSON: {e}")]
+    except OSError as e:
+        return file_path, [_issue("", f"dosya okunamadı: {e}")]
+    return file_path, validate_workflow(workflow)
+
+
+def validate_files(file_paths, workers=None):
+    """
+    Dosyaları toplu olarak doğrular; {dosya yolu: sorunlar} döndürür.
+
+    Dosya sayısı PROCESS_POOL_THRESHOLD'u aşarsa doğrulama süreç havuzunda
+    (CPU çekirdeği sayısı kadar işçi) paralel çalışır.
+    """
+    file_paths = list(file_paths)
+    if len(file_paths) < PROCESS_POOL_THRESHOLD or workers == 1:
+        return dict(validate_file(path) for path in file_paths)
+    # multiprocessing sadece büyük klasörlerde yüklenir; tekil doğrulamalar hızlı başlar
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return dict(executor.map(validate_file, file_paths, chunksize=8))
+
+
+def validate_directory(workflows_dir, workers=None):
+    """Klasördeki tüm workflow dosyalarını doğrular; {dosya adı: sorunlar} döndürür"""
+    file_paths = [os.path.join(workflows_dir, name) for name in sorted(os.listdir(workflows_dir))
+                  if name.endswith(".json") and not name.startswith(".")]
+    results = validate_files(file_paths, workers)
+    return {os.path.basename(path): issues for path, issues in results.items()}
+
+
+def main(argv=None):
+    """Komut satırından toplu doğrulama; hata varsa 1 ile çıkar"""
+    from .utils import get_workflows_dir
+
+    parser = argparse.ArgumentParser(description="Workflow dosyalarını yüklemeden önce doğrula")
+    parser.add_argument("paths", nargs="*", help="Doğrulanacak dosyalar (varsayılan: workflows klasörü)")
+    parser.add_argument("--workers", type=int, default=None, help="Süreç sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--json", action="store_true", help="Sonuçları JSON olarak yazdır")
+    args = parser.parse_args(argv)
+
+    if args.paths:
+        results = {os.path.basename(path): issues for path, issues in validate_files(args.paths, args.workers).items()}
+    else:
+        results = validate_directory(get_workflows_dir(), args.workers)
+
+    if args.json:
+        print(json.dumps(results, ensure_ascii=False, indent=2))
+    else:
+        for file_name, issues in results.items():
+            if issues:
+                print(f"{file_name}:")
+                print(format_issues_text(issues))
+        invalid = sum(1 for issues in results.values() if has_errors(issues))
+        print(f"\n{len(results)} dosya doğrulandı, {invalid} dosyada hata var.")
+    return 1 if any(has_errors(issues) for issues in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
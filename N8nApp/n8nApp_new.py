@@ -3,44 +3,27 @@
 N8N API CLI - N8n API ile etkileşim için terminal tabanlı uygulama
 """
 
-# Gerekli modülleri içe aktar
+# Sadece menü ve komut kaydı yüklenir; komut modülleri (ve requests) seçildiklerinde içe aktarılır
 from functions.menu import display_menu
-from functions.list_workflows import list_workflows
-from functions.get_workflow_details import get_workflow_details
-from functions.create_workflow import create_workflow
-from functions.update_workflow import update_workflow
-from functions.delete_workflow import delete_workflow
-from functions.activate_workflow import activate_workflow, deactivate_workflow
-from functions.workflow_tags import get_workflow_tags, assign_tag, remove_tags
+from functions.commands import TAG_MENU
+from functions.workflow_cache import show_startup_snapshot
 
 def main():
     """Ana uygulama döngüsü"""
+    first_screen = True
     while True:
-        display_menu()
+        display_menu(TAG_MENU)
+        
+        if first_screen:
+            # Son bilinen listeyi API'yi beklemeden göster; güncel liste arka planda yüklenir
+            show_startup_snapshot()
+            first_screen = False
         
         try:
-            choice = input("\nBir seçenek seçin (0-10): ")
+            choice = input(f"\nBir seçenek seçin (0-{len(TAG_MENU)}): ")
             
-            if choice == "1":
-                list_workflows()
-            elif choice == "2":
-                get_workflow_details()
-            elif choice == "3":
-                create_workflow()
-            elif choice == "4":
-                update_workflow()
-            elif choice == "5":
-                delete_workflow()
-            elif choice == "6":
-                activate_workflow()
-            elif choice == "7":
-                deactivate_workflow()
-            elif choice == "8":
-                get_workflow_tags()
-            elif choice == "9":
-                assign_tag()
-            elif choice == "10":
-                remove_tags()
+            if choice in TAG_MENU:
+                TAG_MENU[choice]()
             elif choice == "0":
                 print("\nN8N API CLI'dan çıkılıyor. Hoşça kalın!")
                 break
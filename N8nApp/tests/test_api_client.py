@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Paylaşılan N8N API istemcisini test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import requests
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import api_client
+from functions.api_client import N8nClient, get_client
+from functions.utils import Config
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestN8nClient(unittest.TestCase):
+    """N8nClient tekrar deneme ve URL davranışlarını test et"""
+
+    def setUp(self):
+        # Açık başlıklarla oluşturulan istemci kimlik bilgisi (API_KEY/N8N_URL) gerektirmez
+        self.client = N8nClient(base_url="http://n8n.local/", api_headers={}, max_retries=3, backoff_factor=0.1)
+
+    def test_url(self):
+        """API yollarının tam URL'ye çevrildiğini test et"""
+        self.assertEqual(self.client.url("/workflows"), "http://n8n.local/api/v1/workflows")
+        self.assertEqual(self.client.url("tags"), "http://n8n.local/api/v1/tags")
+        self.assertEqual(self.client.url("https://other/x"), "https://other/x")
+
+    @patch('functions.api_client.time.sleep')
+    def test_retry_on_429_then_success(self, mock_sleep):
+        """429 yanıtından sonra Retry-After kadar beklenip tekrar denendiğini test et"""
+        responses = [make_response(429, {"Retry-After": "2"}), make_response(200)]
+        with patch.object(self.client.session, 'request', side_effect=responses) as mock_request:
+            response = self.client.get("/workflows")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 2)
+        mock_sleep.assert_called_once_with(2.0)
+
+    @patch('functions.api_client.time.sleep')
+    def test_retry_gives_up_after_max_retries(self, mock_sleep):
+        """Tekrar deneme hakkı bitince son yanıtın döndürüldüğünü test et"""
+        with patch.object(self.client.session, 'request', return_value=make_response(503)) as mock_request:
+            response = self.client.get("/workflows")
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(mock_request.call_count, 4)
+        for call in mock_sleep.call_args_list:
+            self.assertLessEqual(call.args[0], 0.1 * 2 ** 3)
+
+    @patch('functions.api_client.time.sleep')
+    def test_post_not_retried_on_server_error(self, mock_sleep):
+        """POST isteklerinin 5xx hatalarında tekrar gönderilmediğini test et"""
+        with patch.object(self.client.session, 'request', return_value=make_response(500)) as mock_request:
+            response = self.client.post("/workflows", json={})
+
+        self.assertEqual(response.status_code, 500)
+        mock_request.assert_called_once()
+        mock_sleep.assert_not_called()
+
+    @patch('functions.api_client.time.sleep')
+    def test_connection_error_retried(self, mock_sleep):
+        """Bağlantı hatalarında idempotent isteklerin tekrar denendiğini test et"""
+        side_effect = [requests.exceptions.ConnectionError("reset"), make_response(200)]
+        with patch.object(self.client.session, 'request', side_effect=side_effect):
+            response = self.client.put("/workflows/1", json={})
+
+        self.assertEqual(response.status_code, 200)
+
+    def test_timeout_passed_through(self):
+        """Çağrı bazlı zaman aşımının session'a iletildiğini test et"""
+        with patch.object(self.client.session, 'request', return_value=make_response(200)) as mock_request:
+            self.client.get("/workflows", timeout=5)
+
+        self.assertEqual(mock_request.call_args.kwargs["timeout"], 5)
+
+    def _paged_client(self, pages):
+        """Her çağrıda sıradaki sayfayı döndüren bir session mock'u hazırla"""
+        responses = []
+        for page in pages:
+            response = make_response(200)
+            response.json.return_value = page
+            responses.append(response)
+        return patch.object(self.client.session, 'request', side_effect=responses)
+
+    def test_iter_workflows_follows_cursor(self):
+        """nextCursor takip edilerek tüm sayfaların gezildiğini test et"""
+        pages = [
+            {"data": [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}], "nextCursor": "c1"},
+            {"data": [{"id": "3", "name": "C"}], "nextCursor": None},
+        ]
+        with self._paged_client(pages) as mock_request:
+            workflows = list(self.client.iter_workflows(page_size=2))
+
+        self.assertEqual([wf["id"] for wf in workflows], ["1", "2", "3"])
+        self.assertEqual(mock_request.call_count, 2)
+        second_params = mock_request.call_args_list[1].kwargs["params"]
+        self.assertEqual(second_params["cursor"], "c1")
+        self.assertEqual(second_params["limit"], 2)
+
+    def test_iter_workflows_summary_and_prefetch(self):
+        """Özet modunda sadece özet alanların döndüğünü ve prefetch'in sırayı bozmadığını test et"""
+        pages = [
+            {"data": [{"id": "1", "name": "A", "active": True, "nodes": [1, 2]}], "nextCursor": "c1"},
+            {"data": [{"id": "2", "name": "B", "versionId": "v2", "nodes": []}]},
+        ]
+        with self._paged_client(pages):
+            workflows = list(self.client.iter_workflows(summary=True, prefetch=True, active=True))
+
+        self.assertEqual([wf["id"] for wf in workflows], ["1", "2"])
+        self.assertNotIn("nodes", workflows[0])
+        self.assertEqual(workflows[1]["versionId"], "v2")
+
+    def test_iter_workflows_legacy_list(self):
+        """Eski API formatındaki (doğrudan liste) yanıtların da desteklendiğini test et"""
+        with self._paged_client([[{"id": "1"}, {"id": "2"}]]) as mock_request:
+            workflows = list(self.client.iter_workflows())
+
+        self.assertEqual(len(workflows), 2)
+        mock_request.assert_called_once()
+
+    def test_fetch_workflows_collects_errors(self):
+        """Eşzamanlı indirmede hatalı isteklerin diğerlerini durdurmadığını test et"""
+        def fake_request(method, url, **kwargs):
+            response = make_response(404 if url.endswith("/bad") else 200)
+            response.json.return_value = {"id": url.rsplit("/", 1)[1]}
+            response.raise_for_status.side_effect = (
+                requests.exceptions.HTTPError("404") if response.status_code == 404 else None
+            )
+            return response
+
+        with patch.object(self.client.session, 'request', side_effect=fake_request):
+            workflows, errors = self.client.fetch_workflows(["a", "bad", "b", "a"], workers=2)
+
+        self.assertEqual(sorted(workflows), ["a", "b"])
+        self.assertEqual(list(errors), ["bad"])
+
+    def test_get_client_singleton(self):
+        """get_client'ın her çağrıda aynı istemciyi döndürdüğünü test et"""
+        with patch.object(api_client, '_client', None), \
+             patch('functions.api_client.get_config', return_value=Config("test-key", "http://n8n.local")):
+            client = get_client()
+            self.assertIs(get_client(), client)
+            self.assertEqual(client.session.headers["X-N8N-API-KEY"], "test-key")
+
+if __name__ == '__main__':
+    unittest.main()
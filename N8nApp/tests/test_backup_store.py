@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+İçerik adresli yedek deposunu test etme
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.backup_store import BackupStore
+
+
+def make_workflow(value, workflow_id="wf1"):
+    return {"id": workflow_id, "name": "Yedek Test", "nodes": [{"name": "Set", "parameters": {"value": value}}]}
+
+
+class TestBackupStore(unittest.TestCase):
+    """Tekilleştirme, geri yükleme ve saklama politikasını test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = BackupStore(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def object_count(self):
+        return sum(len(files) for _, _, files in os.walk(os.path.join(self.tmp.name, "objects")))
+
+    def test_identical_content_is_stored_once(self):
+        """Aynı içeriğin tekrar yedeklenmesinin yeni dosya ve kayıt oluşturmadığını test et"""
+        first = self.store.add(make_workflow(1), timestamp="20250101_100000")
+        second = self.store.add(make_workflow(1), timestamp="20250101_110000")
+        self.assertTrue(first["new"])
+        self.assertFalse(second["new"])
+        self.assertEqual(self.object_count(), 1)
+
+        self.store.add(make_workflow(2), timestamp="20250101_120000")
+        self.assertEqual(self.object_count(), 2)
+        self.assertEqual(len(BackupStore(self.tmp.name).history("wf1")), 2)
+
+    def test_volatile_fields_do_not_create_new_versions(self):
+        """Sadece updatedAt/versionId farklı iki API gövdesinin tek içerik olarak saklandığını test et"""
+        first = {**make_workflow(1), "updatedAt": "2025-01-01T10:00:00.000Z", "versionId": "v1",
+                 "shared": [{"role": "workflow:owner"}]}
+        second = {**first, "updatedAt": "2025-01-01T11:00:00.000Z", "versionId": "v2"}
+        self.assertTrue(self.store.add(first, timestamp="20250101_100000")["new"])
+        self.assertFalse(self.store.add(second, timestamp="20250101_110000")["new"])
+        self.assertEqual(self.object_count(), 1)
+        self.assertEqual(len(self.store.history("wf1")), 1)
+
+        restored = self.store.restore("wf1")
+        self.assertEqual(restored["versionId"], "v1")
+        self.assertEqual(restored["nodes"], first["nodes"])
+
+    def test_pinned_data_is_content(self):
+        """pinData değişikliğinin yeni sürüm oluşturduğunu ve indekste değil nesnede tutulduğunu test et"""
+        first = {**make_workflow(1), "pinData": {"Webhook": [{"json": {"n": 1}}]}, "versionId": "v1"}
+        second = {**first, "pinData": {"Webhook": [{"json": {"n": 2}}]}, "versionId": "v2"}
+        self.store.add(first, timestamp="20250101_100000")
+        self.assertTrue(self.store.add(second, timestamp="20250101_110000")["new"])
+        self.assertEqual(self.object_count(), 2)
+
+        entry = self.store.history("wf1")[0]
+        self.assertEqual(entry["volatile"], {"versionId": "v2"})
+        self.assertEqual(self.store.restore("wf1")["pinData"], second["pinData"])
+
+    def test_restore_at_timestamp(self):
+        """Verilen zamandaki veya öncesindeki en yeni yedeğin geri yüklendiğini test et"""
+        self.store.add(make_workflow(1), timestamp="20250101_100000")
+        self.store.add(make_workflow(2), timestamp="20250102_100000")
+
+        self.assertEqual(self.store.restore("wf1")["nodes"][0]["parameters"]["value"], 2)
+        self.assertEqual(self.store.restore("wf1", "20250101_235959")["nodes"][0]["parameters"]["value"], 1)
+        self.assertIsNone(self.store.restore("wf1", "20241231_000000"))
+
+    def test_retention_policy(self):
+        """Son N, günlük ve haftalık saklamanın eski kayıtları ve içerikleri sildiğini test et"""
+        for day in range(1, 21):
+            self.store.add(make_workflow(day), timestamp=f"202501{day:02d}_120000", prune=False)
+
+        removed = self.store.prune(keep_last=2, keep_daily=3, keep_weekly=3)
+        kept = [entry["timestamp"][:8] for entry in self.store.history("wf1")]
+        # Son 3 gün (19-20 Ocak iki haftayı kapsar) + 2. ISO haftasının en yeni kaydı (12 Ocak Pazar)
+        self.assertEqual(kept, ["20250120", "20250119", "20250118", "20250112"])
+        self.assertEqual(len(removed), 16)
+        self.assertEqual(self.object_count(), 4)
+
+    def test_import_legacy_backups(self):
+        """Eski zaman damgalı yedek dosyalarının depoya aktarıldığını test et"""
+        with open(os.path.join(self.tmp.name, "yedek_test_wf1_20250101_093000.json"), 'w', encoding='utf-8') as f:
+            json.dump(make_workflow(1), f, indent=2)
+
+        self.assertEqual(self.store.import_legacy(remove=True), 1)
+        self.assertEqual(self.store.history("wf1")[0]["timestamp"], "20250101_093000")
+        self.assertNotIn("yedek_test_wf1_20250101_093000.json", os.listdir(self.tmp.name))
+
+if __name__ == '__main__':
+    unittest.main()
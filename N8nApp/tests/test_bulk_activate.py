@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Filtreyle toplu aktif/pasif yapmayı ve son durum doğrulamasını test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import threading
+import requests
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.bulk_activate import set_active_state, format_activation_report
+
+
+class FakeActivationApi:
+    """/workflows/{id}/activate|deactivate uçlarını ve özet listelemeyi taklit eden sahte istemci"""
+
+    def __init__(self, workflows, refuse=(), ignore=()):
+        self.states = {wf["id"]: wf["active"] for wf in workflows}
+        self.refuse = set(refuse)
+        self.ignore = set(ignore)
+        self.posts = []
+        self.lock = threading.Lock()
+
+    def post(self, path, data=None):
+        _, _, workflow_id, action = path.split("/")
+        with self.lock:
+            self.posts.append((workflow_id, action))
+        response = MagicMock()
+        if workflow_id in self.refuse:
+            response.status_code = 400
+            response.json.return_value = {"message": "Workflow has no node to start the workflow"}
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError("400", response=response)
+            return response
+        if workflow_id not in self.ignore:
+            self.states[workflow_id] = action == "activate"
+        response.status_code = 200
+        return response
+
+    def iter_workflows(self, summary=False, active=None):
+        for workflow_id, state in self.states.items():
+            yield {"id": workflow_id, "name": workflow_id, "active": state}
+
+
+class TestBulkActivate(unittest.TestCase):
+    """Eşzamanlı aktivasyon, reddedilenler ve doğrulamayı test et"""
+
+    def make_workflows(self, count):
+        return [{"id": f"wf{i}", "name": f"Akış {i}", "active": i % 4 == 0} for i in range(count)]
+
+    def test_deactivate_skips_already_inactive(self):
+        """Sadece aktif olanlara istek atıldığını ve listelemeyle doğrulandığını test et"""
+        workflows = [{**wf, "active": i < 30} for i, wf in enumerate(self.make_workflows(40))]
+        api = FakeActivationApi(workflows)
+        with patch('functions.bulk_activate.get_client', return_value=api):
+            report = set_active_state(workflows, active=False, workers=8)
+
+        self.assertEqual(len(api.posts), 30)
+        self.assertTrue(all(action == "deactivate" for _, action in api.posts))
+        self.assertEqual(len(report["changed"]), 30)
+        self.assertEqual(report["already"], 10)
+        self.assertEqual(report["refused"], [])
+        self.assertEqual(report["unverified"], [])
+        self.assertFalse(any(api.states.values()))
+
+    def test_refused_and_unverified(self):
+        """n8n'in reddettiklerinin mesajla, durumu tutmayanların doğrulamada raporlandığını test et"""
+        workflows = self.make_workflows(8)
+        api = FakeActivationApi(workflows, refuse=["wf1"], ignore=["wf2"])
+        with patch('functions.bulk_activate.get_client', return_value=api):
+            report = set_active_state(workflows, active=True)
+
+        self.assertEqual(report["refused"], [("wf1", "Akış 1", "Workflow has no node to start the workflow")])
+        self.assertEqual(report["unverified"], [("wf2", "Akış 2")])
+        self.assertEqual(report["already"], 2)
+        text = format_activation_report(report, active=True)
+        self.assertIn("Workflow has no node to start the workflow", text)
+        self.assertIn("1 reddedildi, 1 doğrulanamadı", text)
+
+    def test_dry_run_sends_nothing(self):
+        """--dry-run'da istek atılmadığını test et"""
+        workflows = self.make_workflows(5)
+        api = FakeActivationApi(workflows)
+        with patch('functions.bulk_activate.get_client', return_value=api):
+            report = set_active_state(workflows, active=True, dry_run=True)
+        self.assertEqual(api.posts, [])
+        self.assertEqual([workflow_id for workflow_id, _ in report["changed"]], ["wf1", "wf2", "wf3"])
+
+if __name__ == '__main__':
+    unittest.main()
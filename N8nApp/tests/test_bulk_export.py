@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Toplu workflow dışa aktarımını test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.bulk_export import export_all_workflows
+from functions.utils import atomic_write_json, write_canonical_json
+
+
+class TestBulkExport(unittest.TestCase):
+    """Eşzamanlı dışa aktarım ve atomik yazmayı test et"""
+
+    def test_atomic_write_json(self):
+        """Atomik yazmanın geçici dosya bırakmadığını ve unicode'u koruduğunu test et"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "wf.json")
+            written = atomic_write_json(path, {"name": "Merhaba Dünya"})
+
+            self.assertEqual(os.listdir(tmp), ["wf.json"])
+            with open(path, encoding='utf-8') as f:
+                content = f.read()
+            self.assertIn("Dünya", content)
+            self.assertEqual(written, len(content.encode('utf-8')))
+
+    def test_canonical_write_is_stable(self):
+        """Kanonik yazımın anahtar/node sırasından bağımsız olduğunu ve aynı içerikte dosyaya dokunmadığını test et"""
+        workflow = {"name": "Çağrı", "id": "wf1", "nodes": [{"name": "B", "id": "2"}, {"id": "1", "name": "A"}]}
+        reordered = {"nodes": [{"id": "1", "name": "A"}, {"id": "2", "name": "B"}], "id": "wf1", "name": "Çağrı"}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "wf.json")
+            written = write_canonical_json(path, workflow)
+            self.assertGreater(written, 0)
+            os.utime(path, ns=(1, 1))
+
+            self.assertEqual(write_canonical_json(path, reordered), 0)
+            self.assertEqual(os.stat(path).st_mtime_ns, 1)
+            with open(path, encoding='utf-8') as f:
+                content = f.read()
+            self.assertIn("Çağrı", content)
+            self.assertEqual([node["id"] for node in json.loads(content)["nodes"]], ["1", "2"])
+
+    @patch('functions.bulk_export.get_client')
+    def test_export_all_workflows(self, mock_client):
+        """Tüm workflow detaylarının indirilip dosyalara yazıldığını test et"""
+        summaries = [{"id": f"id{i}", "name": f"WF {i}"} for i in range(5)]
+        mock_client.return_value.iter_workflows.return_value = iter(summaries)
+
+        def fake_get(path):
+            workflow_id = path.split("/")[2].split("?")[0]
+            response = MagicMock()
+            response.json.return_value = {"id": workflow_id, "name": f"WF {workflow_id[2:]}", "nodes": []}
+            return response
+        mock_client.return_value.get.side_effect = fake_get
+
+        with tempfile.TemporaryDirectory() as tmp:
+            f = io.StringIO()
+            with redirect_stdout(f):
+                result = export_all_workflows(tmp, workers=3)
+
+            self.assertEqual(len(result["saved"]), 5)
+            self.assertEqual(result["failed"], [])
+            self.assertEqual(sorted(os.listdir(tmp)), [f"wf_{i}_id{i}.json" for i in range(5)])
+            with open(os.path.join(tmp, "wf_3_id3.json"), encoding='utf-8') as wf_file:
+                self.assertEqual(json.load(wf_file)["id"], "id3")
+            self.assertIn("workflow/s", f.getvalue())
+
+            # İkinci dışa aktarımda içerik aynı olduğu için hiçbir dosya yeniden yazılmaz
+            mock_client.return_value.iter_workflows.return_value = iter(summaries)
+            with redirect_stdout(io.StringIO()):
+                again = export_all_workflows(tmp, workers=3)
+            self.assertEqual(len(again["unchanged"]), 5)
+            self.assertEqual(again["bytes"], 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Toplu, değişiklik odaklı workflow yüklemeyi test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.bulk_upload import bulk_upload_workflows, put_workflow, AdaptiveLimiter
+
+
+def make_workflow(index, value=0):
+    return {
+        "id": f"id{index}",
+        "name": f"WF {index}",
+        "nodes": [{"id": "1", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": 3,
+                   "position": [0, 0], "parameters": {"value": value}}],
+        "connections": {},
+        "settings": {"executionOrder": "v1"}
+    }
+
+
+def make_response(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+
+class TestBulkUpload(unittest.TestCase):
+    """Sadece değişen dosyaların yüklendiğini ve 429'da geri çekildiğini test et"""
+
+    @patch('functions.bulk_upload.get_client')
+    def test_uploads_only_changed_workflows(self, mock_client):
+        """20 dosyadan 2'si değiştiğinde 2 yazma çağrısı yapıldığını test et"""
+        client = mock_client.return_value
+        remote = {f"id{i}": {**make_workflow(i), "versionId": "v1"} for i in range(20)}
+        client.iter_workflows.side_effect = lambda **kwargs: iter(
+            [{"id": wf["id"], "name": wf["name"], "versionId": wf["versionId"]} for wf in remote.values()])
+        client.fetch_workflows.side_effect = lambda ids, workers=None: ({i: remote[i] for i in ids}, {})
+
+        def fake_put(path, json=None, max_retries=None):
+            workflow_id = path.split("/")[2]
+            remote[workflow_id] = {**json, "id": workflow_id, "versionId": "v2"}
+            return make_response(200, remote[workflow_id])
+        client.put.side_effect = fake_put
+
+        with tempfile.TemporaryDirectory() as tmp:
+            for i in range(20):
+                with open(os.path.join(tmp, f"wf_{i}_id{i}.json"), 'w', encoding='utf-8') as f:
+                    json.dump(make_workflow(i, value=1 if i in (3, 7) else 0), f)
+
+            with redirect_stdout(io.StringIO()):
+                first = bulk_upload_workflows(tmp, workers=4)
+            self.assertEqual(sorted(file for file, _ in first["uploaded"]), ["wf_3_id3.json", "wf_7_id7.json"])
+            self.assertEqual(first["skipped"], 18)
+            self.assertEqual(client.put.call_count, 2)
+
+            # İkinci çalıştırmada önbellek sayesinde ne indirme ne de yazma yapılmalı
+            client.fetch_workflows.reset_mock()
+            with redirect_stdout(io.StringIO()):
+                second = bulk_upload_workflows(tmp, workers=4)
+            self.assertEqual(second["uploaded"], [])
+            self.assertEqual(second["skipped"], 20)
+            self.assertEqual(client.put.call_count, 2)
+            client.fetch_workflows.assert_not_called()
+
+    @patch('functions.bulk_upload.get_client')
+    def test_put_backs_off_on_rate_limit(self, mock_client):
+        """429 alındığında eşzamanlılık sınırının daraldığını ve tekrar denendiğini test et"""
+        client = mock_client.return_value
+        client.put.side_effect = [make_response(429), make_response(200, {"id": "wf1"})]
+        client.retry_after.return_value = None
+        client.backoff_delay.return_value = 0
+
+        limiter = AdaptiveLimiter(8)
+        result = put_workflow("wf1", {"name": "x"}, limiter)
+
+        self.assertEqual(result, {"id": "wf1"})
+        self.assertEqual(client.put.call_count, 2)
+        self.assertEqual(limiter.limit, 5)
+        self.assertEqual(limiter.active, 0)
+
+if __name__ == '__main__':
+    unittest.main()
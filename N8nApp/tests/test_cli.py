@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+Etkileşimsiz alt komut arayüzünü ve NDJSON çıktısını test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import io
+import json
+import tempfile
+import requests
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.cli import main, NdjsonWriter
+
+
+class CountingStream(io.StringIO):
+    """Kaç kez boşaltıldığını sayan çıktı akışı"""
+
+    def __init__(self):
+        super().__init__()
+        self.flushes = 0
+
+    def flush(self):
+        self.flushes += 1
+        super().flush()
+
+
+class FakeCliApi:
+    """Listeleme, silme ve aktivasyon uçlarını taklit eden sahte istemci"""
+
+    def __init__(self, count):
+        self.workflows = [{"id": f"wf{i}", "name": f"Akış {i}", "active": i % 2 == 0,
+                           "nodes": [{"type": "n8n-nodes-base.webhook"}] if i % 3 == 0 else [],
+                           "tags": [], "updatedAt": "2024-01-01", "versionId": "v1"} for i in range(count)]
+        self.yielded = 0
+        self.deleted = []
+
+    def iter_workflows(self, summary=False, prefetch=False, active=None):
+        for workflow in self.workflows:
+            if active is not None and workflow["active"] != active:
+                continue
+            self.yielded += 1
+            yield workflow
+
+    def delete(self, path):
+        workflow_id = path.rsplit("/", 1)[1]
+        response = MagicMock()
+        if workflow_id == "missing":
+            response.json.return_value = {"message": "Not Found"}
+            response.raise_for_status.side_effect = requests.exceptions.HTTPError("404", response=response)
+        else:
+            self.deleted.append(workflow_id)
+        return response
+
+    def post(self, path, data=None):
+        _, _, workflow_id, action = path.split("/")
+        for workflow in self.workflows:
+            if workflow["id"] == workflow_id:
+                workflow["active"] = action == "activate"
+        response = MagicMock()
+        response.status_code = 200
+        return response
+
+
+def run(argv, api):
+    """CLI'ı sahte istemciyle çalıştırır; (çıkış kodu, kayıtlar, stderr) döndürür"""
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    with patch('functions.api_client.get_client', return_value=api), \
+         patch('functions.workflow_filters.get_client', return_value=api), \
+         patch('functions.bulk_activate.get_client', return_value=api), \
+         patch('functions.workflow_cache.invalidate_workflow_list'), \
+         patch('functions.bulk_activate.invalidate_workflow_list'), \
+         patch('sys.stderr', stderr):
+        code = main(argv, stdout=stdout)
+    records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    return code, records, stderr.getvalue()
+
+
+class TestNdjsonWriter(unittest.TestCase):
+    """Satır başına tek kayıt ve periyodik boşaltmayı test et"""
+
+    def test_compact_lines_and_flush_interval(self):
+        stream = CountingStream()
+        writer = NdjsonWriter(stream, flush_every=100)
+        for i in range(250):
+            writer.write({"id": i, "name": "Çağrı"})
+        lines = stream.getvalue().splitlines()
+        self.assertEqual(len(lines), 250)
+        self.assertEqual(lines[0], '{"id":0,"name":"Çağrı"}')
+        self.assertEqual(stream.flushes, 2)
+
+
+class TestCli(unittest.TestCase):
+    """Alt komutların soru sormadan çalıştığını ve stdout'a sadece NDJSON yazdığını test et"""
+
+    def test_list_streams_summaries(self):
+        """Özet alanlarının satır satır yazıldığını ve --limit ile erken durulduğunu test et"""
+        api = FakeCliApi(500)
+        code, records, _ = run(["list"], api)
+        self.assertEqual(code, 0)
+        self.assertEqual(len(records), 500)
+        self.assertEqual(set(records[0]), {"id", "name", "active", "updatedAt", "versionId"})
+
+        api = FakeCliApi(500)
+        code, records, _ = run(["list", "--limit", "5", "--fields", "id"], api)
+        self.assertEqual(records, [{"id": f"wf{i}"} for i in range(5)])
+        self.assertEqual(api.yielded, 5)
+
+    def test_list_filters(self):
+        """Aktiflik ve tetikleyici filtrelerinin uygulandığını test et"""
+        code, records, _ = run(["list", "--active", "--trigger", "webhook", "--fields", "id"], FakeCliApi(12))
+        self.assertEqual([record["id"] for record in records], ["wf0", "wf6"])
+
+    def test_delete_requires_yes(self):
+        """--yes olmadan hiçbir şeyin silinmediğini, hataların kayıt olarak yazıldığını test et"""
+        api = FakeCliApi(3)
+        code, records, stderr = run(["delete", "wf1"], api)
+        self.assertEqual(code, 2)
+        self.assertEqual(api.deleted, [])
+        self.assertIn("--yes", stderr)
+
+        code, records, _ = run(["delete", "wf1", "missing", "--yes"], api)
+        self.assertEqual(code, 1)
+        self.assertEqual(api.deleted, ["wf1"])
+        self.assertEqual(records, [{"id": "wf1", "ok": True},
+                                   {"id": "missing", "ok": False, "error": "Not Found"}])
+
+    def test_deactivate_emits_record_per_workflow(self):
+        """Filtreyle seçilen her workflow için durum kaydı yazıldığını test et"""
+        api = FakeCliApi(6)
+        code, records, _ = run(["deactivate", "wf0", "wf1", "wf2", "--no-verify"], api)
+        self.assertEqual(code, 0)
+        statuses = {record["id"]: record["status"] for record in records}
+        self.assertEqual(statuses, {"wf0": "changed", "wf2": "changed", "wf1": "unchanged"})
+
+        code, records, _ = run(["activate"], api)
+        self.assertEqual(code, 2)
+        self.assertEqual(records, [])
+
+    def test_create_prints_only_to_stderr(self):
+        """Komut modüllerinin mesajlarının stdout'u kirletmediğini test et"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "yeni.json")
+            with open(file_path, 'w', encoding='utf-8') as f:
+                json.dump({"name": "Yeni", "nodes": [], "connections": {}}, f)
+
+            def fake_create(name, data, path):
+                print("Workflow oluşturuluyor")
+                with open(path, 'w', encoding='utf-8') as f:
+                    json.dump({**data, "id": "new1"}, f)
+                return True
+
+            with patch('functions.upload_workflow.create_new_workflow', side_effect=fake_create):
+                code, records, stderr = run(["create", file_path], FakeCliApi(0))
+
+        self.assertEqual(code, 0)
+        self.assertEqual(records, [{"file": file_path, "name": "Yeni", "ok": True, "id": "new1"}])
+        self.assertIn("Workflow oluşturuluyor", stderr)
+
+    def test_request_error_exit_code(self):
+        """API hatasında stdout'a kayıt yazılmadan 1 döndüğünü test et"""
+        api = MagicMock()
+        api.iter_workflows.side_effect = requests.exceptions.ConnectionError("bağlantı reddedildi")
+        code, records, stderr = run(["list"], api)
+        self.assertEqual(code, 1)
+        self.assertEqual(records, [])
+        self.assertIn("bağlantı reddedildi", stderr)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Workflow karşılaştırma motorunu test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout, redirect_stderr
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.compare_workflows import fetch_suspected_workflows, collect_sync_state, compare_workflows
+from functions.sync_plan import build_sync_plan
+from functions.sync_manifest import SyncManifest
+from functions.workflow_diff import diff_workflows, format_diff_text
+from functions.workflow_merge import merge_workflows
+
+
+def sample_workflow():
+    return {
+        "id": "wf1",
+        "name": "RAG",
+        "nodes": [
+            {"id": "1", "name": "Trigger", "type": "n8n-nodes-base.manualTrigger", "typeVersion": 1,
+             "position": [0, 0], "parameters": {}},
+            {"id": "2", "name": "Agent", "type": "@n8n/n8n-nodes-langchain.agent", "typeVersion": 1.7,
+             "position": [200, 0], "parameters": {"options": {"systemMessage": "Merhaba"}}},
+            {"id": "3", "name": "Tool", "type": "@n8n/n8n-nodes-langchain.toolCode", "typeVersion": 1,
+             "position": [200, 200], "parameters": {}},
+        ],
+        "connections": {
+            "Trigger": {"main": [[{"node": "Agent", "type": "main", "index": 0}]]},
+            "Tool": {"ai_tool": [[{"node": "Agent", "type": "ai_tool", "index": 0}]]},
+        },
+        "settings": {"executionOrder": "v1"}
+    }
+
+
+class TestTwoPhaseCompare(unittest.TestCase):
+    """Özet listeden sonra sadece şüpheli workflow'ların indirildiğini test et"""
+
+    @patch('functions.compare_workflows.get_client')
+    def test_fetch_only_suspected(self, mock_client):
+        """Son senkrondan beri değişmeyen workflow'ların içeriğinin indirilmediğini test et"""
+        manifest = SyncManifest("/nonexistent")
+        summaries = [
+            {"id": "same", "name": "A", "versionId": "v1"},
+            {"id": "changed", "name": "B", "versionId": "v3"},
+            {"id": "remote_only", "name": "C", "versionId": "v1"},
+        ]
+        file_workflows = {
+            "same": {"hash": "h1"},
+            "changed": {"hash": "h2"},
+        }
+        manifest.record_sync({"id": "same", "versionId": "v1"}, "h1")
+        manifest.record_sync({"id": "changed", "versionId": "v2"}, "h2")
+        mock_client.return_value.fetch_workflows.return_value = (
+            {"changed": {"id": "changed", "name": "B", "nodes": []}},
+            {"remote_only": "500 Server Error"}
+        )
+
+        with redirect_stdout(io.StringIO()):
+            result = fetch_suspected_workflows(summaries, file_workflows, manifest)
+
+        mock_client.return_value.fetch_workflows.assert_called_once_with(["changed", "remote_only"])
+        self.assertEqual(result[0], summaries[0])
+        self.assertIn("nodes", result[1])
+        self.assertEqual(len(result), 2)
+
+    def test_failed_fetch_is_not_created_again(self):
+        """İçeriği indirilemeyen workflow'un dosyası için create_api planlanmadığını test et"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for wf_id, name in (("wf_ok", "Sağlam"), ("wf_fail", "Hatalı")):
+                with open(os.path.join(temp_dir, f"{wf_id}.json"), 'w', encoding='utf-8') as f:
+                    json.dump({**sample_workflow(), "id": wf_id, "name": name}, f)
+            summaries = [{"id": "wf_ok", "name": "Sağlam", "versionId": "v1"},
+                         {"id": "wf_fail", "name": "Hatalı", "versionId": "v1"}]
+
+            with patch('functions.compare_workflows.get_client') as mock_client, \
+                 patch('functions.compare_workflows.get_workflow_files',
+                       return_value=(["wf_ok.json", "wf_fail.json"], temp_dir)), \
+                 redirect_stdout(io.StringIO()):
+                mock_client.return_value.iter_workflows.return_value = iter(summaries)
+                mock_client.return_value.fetch_workflows.return_value = (
+                    {"wf_ok": {**sample_workflow(), "id": "wf_ok", "name": "Sağlam", "versionId": "v1"}},
+                    {"wf_fail": "500 Server Error"}
+                )
+                state = collect_sync_state()
+                plan = build_sync_plan(state)
+
+        self.assertEqual(state["to_create_api"], [])
+        self.assertEqual([record["id"] for record in state["fetch_failed"]], ["wf_fail"])
+        self.assertNotIn("create_api", [action["action"] for action in plan["actions"]])
+
+    def test_json_apply_output_is_single_document(self):
+        """--json ile uygulamada stdout'a sadece plan ve sonucu içeren geçerli bir JSON yazıldığını test et"""
+        plan = {"workflow_dir": "/tmp", "matching": 0, "actions": [
+            {"action": "update_api", "workflow_id": "wf1", "name": "RAG", "payload": {}},
+            {"action": "create_api", "name": "Yeni", "file_name": "yeni.json", "payload": {}},
+        ]}
+
+        def fake_run(action, workflow_dir, backup_api):
+            print(f"\nWorkflow güncelleniyor: ID {action.get('workflow_id')}")
+            return action["action"] == "update_api"
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with patch('functions.compare_workflows.collect_sync_state', return_value={"manifest": None}), \
+             patch('functions.compare_workflows.build_sync_plan', return_value=plan), \
+             patch('functions.sync_plan._run_action', side_effect=fake_run), \
+             redirect_stdout(stdout), redirect_stderr(stderr):
+            compare_workflows(assume_yes=True, as_json=True)
+
+        output = json.loads(stdout.getvalue())
+        self.assertEqual(output["result"]["succeeded"], 1)
+        self.assertEqual(output["result"]["failed"][0]["name"], "Yeni")
+        self.assertIn("İŞLEM SONUCU", stderr.getvalue())
+        self.assertIn("Workflow güncelleniyor", stderr.getvalue())
+
+
+class TestWorkflowDiff(unittest.TestCase):
+    """Yapısal diff motorunu test et"""
+
+    def test_equal_workflows(self):
+        """Aynı workflow'lar için boş diff döndüğünü test et"""
+        diff = diff_workflows(sample_workflow(), sample_workflow())
+        self.assertTrue(diff["equal"])
+        self.assertIn("Fark yok", format_diff_text(diff))
+
+    def test_rename_does_not_produce_edge_changes(self):
+        """Yeniden adlandırılan node'un sahte bağlantı farkı üretmediğini test et"""
+        new = sample_workflow()
+        new["nodes"][1]["name"] = "AI Agent"
+        new["connections"]["Trigger"]["main"][0][0]["node"] = "AI Agent"
+        new["connections"]["Tool"]["ai_tool"][0][0]["node"] = "AI Agent"
+
+        diff = diff_workflows(sample_workflow(), new)
+        self.assertEqual(diff["nodes"]["renamed"], [{"id": "2", "from": "Agent", "to": "AI Agent"}])
+        self.assertEqual(diff["connections"], {})
+
+    def test_parameter_paths_and_edges(self):
+        """Parametre değişikliklerinin JSON Pointer yolları ve kenar farklarıyla raporlandığını test et"""
+        new = sample_workflow()
+        new["nodes"][1]["parameters"]["options"]["systemMessage"] = "Selam"
+        new["nodes"][1]["parameters"]["options"]["a/b"] = 1
+        new["nodes"].pop(2)
+        del new["connections"]["Tool"]
+        new["nodes"].append({"id": "4", "name": "Memory", "type": "x.memory", "typeVersion": 1,
+                             "position": [0, 300], "parameters": {}})
+        new["connections"]["Memory"] = {"ai_memory": [[{"node": "Agent", "type": "ai_memory", "index": 0}]]}
+
+        diff = diff_workflows(sample_workflow(), new)
+        self.assertFalse(diff["equal"])
+        self.assertEqual(diff["nodes"]["added"], ["Memory"])
+        self.assertEqual(diff["nodes"]["removed"], ["Tool"])
+        paths = [change["path"] for change in diff["nodes"]["changed"]["Agent"]]
+        self.assertEqual(paths, ["/parameters/options/a~1b", "/parameters/options/systemMessage"])
+        self.assertEqual(diff["connections"]["ai_tool"]["removed"][0]["from"], "Tool")
+        self.assertEqual(diff["connections"]["ai_memory"]["added"][0]["to"], "Agent")
+        self.assertIn("+ bağlantı [ai_memory] Memory[0] → Agent[0]", format_diff_text(diff))
+
+
+class TestWorkflowMerge(unittest.TestCase):
+    """Üç yönlü birleştirmeyi test et"""
+
+    def test_non_overlapping_edits_merge(self):
+        """Farklı node'lardaki değişikliklerin çakışmasız birleştiğini test et"""
+        base = sample_workflow()
+        local = sample_workflow()
+        local["nodes"][1]["parameters"]["options"]["systemMessage"] = "Dosyadan"
+        remote = sample_workflow()
+        remote["nodes"][2]["position"] = [400, 400]
+        remote["nodes"].append({"id": "4", "name": "Memory", "type": "x.memory", "typeVersion": 1,
+                                "position": [0, 300], "parameters": {}})
+        remote["connections"]["Memory"] = {"ai_memory": [[{"node": "Agent", "type": "ai_memory", "index": 0}]]}
+
+        result = merge_workflows(base, local, remote)
+        self.assertEqual(result["conflicts"], [])
+        merged_nodes = {node["id"]: node for node in result["merged"]["nodes"]}
+        self.assertEqual(merged_nodes["2"]["parameters"]["options"]["systemMessage"], "Dosyadan")
+        self.assertEqual(merged_nodes["3"]["position"], [400, 400])
+        self.assertIn("4", merged_nodes)
+        self.assertIn("Memory", result["merged"]["connections"])
+
+    def test_same_parameter_conflict(self):
+        """Aynı parametrenin iki tarafta farklı değiştirilmesinin çakışma olduğunu test et"""
+        local = sample_workflow()
+        local["nodes"][1]["parameters"]["options"]["systemMessage"] = "Dosya"
+        remote = sample_workflow()
+        remote["nodes"][1]["parameters"]["options"]["systemMessage"] = "N8N"
+
+        result = merge_workflows(sample_workflow(), local, remote)
+        self.assertEqual(len(result["conflicts"]), 1)
+        self.assertEqual(result["conflicts"][0]["path"], "/nodes/Agent/parameters/options/systemMessage")
+
+    def test_edges_merged_from_both_sides(self):
+        """İki taraftaki bağlantı değişikliklerinin kenar bazında birleştiğini test et"""
+        local = sample_workflow()
+        del local["connections"]["Tool"]
+        remote = sample_workflow()
+        remote["connections"]["Trigger"]["main"][0].append({"node": "Tool", "type": "main", "index": 0})
+
+        result = merge_workflows(sample_workflow(), local, remote)
+        self.assertEqual(result["conflicts"], [])
+        connections = result["merged"]["connections"]
+        self.assertNotIn("Tool", connections)
+        targets = [edge["node"] for edge in connections["Trigger"]["main"][0]]
+        self.assertEqual(targets, ["Agent", "Tool"])
+
+    def test_delete_on_one_side(self):
+        """Bir tarafta silinen ve diğerinde değişmeyen node'un silindiğini test et"""
+        local = sample_workflow()
+        local["nodes"].pop(2)
+        del local["connections"]["Tool"]
+        remote = sample_workflow()
+        remote["name"] = "RAG v2"
+
+        result = merge_workflows(sample_workflow(), local, remote)
+        self.assertEqual(result["conflicts"], [])
+        self.assertEqual(result["merged"]["name"], "RAG v2")
+        self.assertEqual([node["id"] for node in result["merged"]["nodes"]], ["1", "2"])
+        self.assertNotIn("Tool", result["merged"]["connections"])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+"""
+Yerel n8n API taklit sunucusunu gerçek HTTP istemcisiyle test etme
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+import requests
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.api_client import N8nClient
+from functions.mock_server import MockN8nServer, WorkflowStore, FaultInjector, synthetic_workflows
+from functions.tag_engine import TagCatalog
+
+
+def make_store(count=0, seed=1):
+    store = WorkflowStore(seed=seed)
+    for workflow in synthetic_workflows(count, nodes=3, seed=seed):
+        store.add_workflow(workflow)
+    return store
+
+
+class MockServerTestCase(unittest.TestCase):
+    """Her test için boş portta sunucu ve ona bağlı istemci açar"""
+
+    workflow_count = 0
+
+    def setUp(self):
+        self.faults = FaultInjector(seed=1)
+        self.server = MockN8nServer(make_store(self.workflow_count), self.faults, api_key="test-key")
+        self.server.start()
+        self.client = N8nClient(base_url=self.server.url, api_headers={"X-N8N-API-KEY": "test-key"},
+                                timeout=5, max_retries=3, backoff_factor=0.01)
+
+    def tearDown(self):
+        self.client.close()
+        self.server.stop()
+
+
+class TestMockServerWorkflows(MockServerTestCase):
+    """Sayfalama, CRUD ve aktivasyonu test et"""
+
+    workflow_count = 530
+
+    def test_cursor_pagination(self):
+        """Tüm workflow'ların nextCursor ile tekrarsız geldiğini ve sayfa sayısını test et"""
+        ids = [workflow["id"] for workflow in self.client.iter_workflows(summary=True, page_size=100)]
+        self.assertEqual(len(ids), 530)
+        self.assertEqual(len(set(ids)), 530)
+        self.assertEqual(self.server.stats.total("GET", "/workflows"), 6)
+
+        active = list(self.client.iter_workflows(summary=True, active=True, page_size=250))
+        self.assertTrue(active and all(workflow["active"] for workflow in active))
+
+    def test_crud_round_trip(self):
+        """Oluşturma, okuma, güncelleme ve silmenin uçtan uca çalıştığını test et"""
+        body = {"name": "Yeni Akış", "nodes": [{"name": "Webhook", "type": "n8n-nodes-base.webhook"}],
+                "connections": {}, "settings": {"executionOrder": "v1"}, "staticData": {}}
+        created = self.client.post("/workflows", json=body).json()
+        self.assertFalse(created["active"])
+
+        body["name"] = "Güncel Akış"
+        updated = self.client.put(f"/workflows/{created['id']}", json=body).json()
+        self.assertNotEqual(updated["versionId"], created["versionId"])
+        self.assertEqual(self.client.get_workflow(created["id"])["name"], "Güncel Akış")
+
+        self.assertEqual(self.client.delete(f"/workflows/{created['id']}").status_code, 200)
+        self.assertEqual(self.client.get(f"/workflows/{created['id']}").status_code, 404)
+
+    def test_rejects_additional_properties(self):
+        """n8n gibi fazladan alan içeren gövdeyi 400 ile reddettiğini test et"""
+        response = self.client.post("/workflows", json={"name": "x", "nodes": [], "connections": {},
+                                                        "settings": {}, "active": True})
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("additional properties", response.json()["message"])
+
+    def test_activation_requires_trigger(self):
+        """Sadece manuel tetikleyicili workflow'un aktif edilemediğini test et"""
+        response = self.client.post("/workflows/syn000009/activate", data="")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("no node to start", response.json()["message"])
+
+        self.client.post("/workflows/syn000001/deactivate", data="").raise_for_status()
+        self.assertFalse(self.client.get_workflow("syn000001")["active"])
+
+    def test_etag_not_modified(self):
+        """Değişiklik yoksa koşullu listelemenin 304, yazmadan sonra yeni liste döndüğünü test et"""
+        self.server.store.workflows = dict(list(self.server.store.workflows.items())[:50])
+        summaries, etag = self.client.workflow_summaries()
+        self.assertEqual(len(summaries), 50)
+        self.assertEqual(self.client.workflow_summaries(etag), (None, etag))
+
+        self.client.post("/workflows/syn000001/deactivate", data="").raise_for_status()
+        summaries, new_etag = self.client.workflow_summaries(etag)
+        self.assertIsNotNone(summaries)
+        self.assertNotEqual(new_etag, etag)
+
+    def test_requires_api_key(self):
+        response = requests.get(f"{self.server.url}/api/v1/workflows")
+        self.assertEqual(response.status_code, 401)
+
+
+class TestMockServerFaults(MockServerTestCase):
+    """Hata enjeksiyonu, gecikme ve eşzamanlılığı test et"""
+
+    workflow_count = 40
+
+    def test_rate_limit_is_retried(self):
+        """Planlanan 429'ların istemci tarafından tekrar denenerek aşıldığını test et"""
+        self.faults.retry_after = 0
+        self.faults.fail_next(429, count=2, method="GET", path="/workflows")
+        workflows = list(self.client.iter_workflows(summary=True))
+        self.assertEqual(len(workflows), 40)
+        self.assertEqual(self.server.stats.snapshot()["faults"], {"429": 2})
+
+    def test_server_error_exhausts_retries(self):
+        self.faults.fail_next(500, count=10)
+        with self.assertRaises(requests.exceptions.HTTPError):
+            self.client.get_workflow("syn000001")
+        self.assertEqual(self.server.stats.total("GET", "/workflows/{id}"), 4)
+
+    def test_timeout_injection(self):
+        """Yanıtsız kalan isteğin istemcide zaman aşımına, sonraki denemenin başarıya ulaştığını test et"""
+        self.faults.hang_seconds = 0.5
+        self.faults.fail_next("timeout", count=1)
+        client = N8nClient(base_url=self.server.url, api_headers={"X-N8N-API-KEY": "test-key"},
+                           timeout=0.2, max_retries=0)
+        try:
+            with self.assertRaises(requests.exceptions.Timeout):
+                client.get_workflow("syn000001")
+            self.assertEqual(client.get_workflow("syn000001")["id"], "syn000001")
+        finally:
+            client.close()
+
+    def test_concurrent_fetch_with_latency(self):
+        """Gecikmeli sunucuda fetch_workflows isteklerinin gerçekten eşzamanlı gittiğini test et"""
+        self.faults.latency = 0.05
+        ids = [f"syn{index:06d}" for index in range(40)]
+        workflows, errors = self.client.fetch_workflows(ids, workers=8)
+        self.assertEqual((len(workflows), errors), (40, {}))
+        self.assertGreater(self.server.stats.snapshot()["max_in_flight"], 1)
+
+
+class TestMockServerTags(MockServerTestCase):
+    """Etiket kataloğunun ve workflow etiketlemenin sunucuyla çalıştığını test et"""
+
+    workflow_count = 5
+
+    def test_tag_catalog_and_assignment(self):
+        catalog = TagCatalog(client=self.client)
+        resolved, missing = catalog.resolve(["prod", "yeni-etiket"], create_missing=True)
+        self.assertEqual(missing, [])
+
+        response = self.client.put("/workflows/syn000000/tags", json=[{"id": resolved["yeni-etiket"]}])
+        self.assertEqual(response.json()[0]["name"], "yeni-etiket")
+        tagged = list(self.client.iter_workflows(tags="yeni-etiket"))
+        self.assertEqual([workflow["id"] for workflow in tagged], ["syn000000"])
+
+        self.assertEqual(self.client.post("/tags", json={"name": "prod"}).status_code, 409)
+        self.assertEqual(self.client.put("/workflows/syn000000/tags", json=[{"id": "yok"}]).status_code, 404)
+
+    def test_executions(self):
+        self.server.store.add_executions(3)
+        page = self.client.get("/executions", params={"workflowId": "syn000002", "limit": 2}).json()
+        self.assertEqual(len(page["data"]), 2)
+        self.assertTrue(all(execution["workflowId"] == "syn000002" for execution in page["data"]))
+        self.assertIsNotNone(page["nextCursor"])
+
+
+class TestMockServerSeeding(unittest.TestCase):
+    """Klasörden yüklemeyi test et"""
+
+    def test_load_directory(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            with open(os.path.join(temp_dir, "a.json"), 'w', encoding='utf-8') as f:
+                json.dump({"id": "abc", "name": "A", "nodes": [], "connections": {},
+                           "tags": [{"id": "t1", "name": "prod"}]}, f)
+            with open(os.path.join(temp_dir, "bozuk.json"), 'w', encoding='utf-8') as f:
+                f.write("{")
+            with open(os.path.join(temp_dir, ".upload-cache.json"), 'w', encoding='utf-8') as f:
+                f.write("{}")
+            store = WorkflowStore()
+            self.assertEqual(store.load_directory(temp_dir), 1)
+        self.assertEqual(store.workflows["abc"]["tags"][0]["id"], "t1")
+        self.assertEqual(store.get_workflow({}, "abc")[0], 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -54,9 +54,10 @@ class TestN8nAppFunctions(unittest.TestCase):
         # En az 10 kez print çağrısı yapıldığını kontrol et (menü öğeleri)
         self.assertGreaterEqual(mock_print.call_count, 10)
 
-    @patch('functions.list_workflows.requests.get')
-    def test_list_workflows(self, mock_get):
+    @patch('functions.list_workflows.get_client')
+    def test_list_workflows(self, mock_client):
         """Workflow'ları listeleme işlevini test et"""
+        mock_get = mock_client.return_value.get
         # Mock response oluştur
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
@@ -84,10 +85,11 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertEqual(result[0]["id"], "123")
         self.assertEqual(result[1]["id"], "456")
 
-    @patch('functions.create_workflow.requests.post')
+    @patch('functions.create_workflow.get_client')
     @patch('builtins.input', return_value="Test Workflow")
-    def test_create_workflow(self, mock_input, mock_post):
+    def test_create_workflow(self, mock_input, mock_client):
         """Workflow oluşturma işlevini test et"""
+        mock_post = mock_client.return_value.post
         # Mock response oluştur
         mock_response = MagicMock()
         mock_response.raise_for_status = MagicMock()
@@ -116,12 +118,13 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("data", kwargs)
 
     @patch('functions.get_workflow_details.list_workflows')
-    @patch('functions.get_workflow_details.requests.get')
+    @patch('functions.api_client.get_client')
     @patch('builtins.input', return_value="1")
     @patch('builtins.open', new_callable=unittest.mock.mock_open)
     @patch('json.dump')
-    def test_get_workflow_details(self, mock_json_dump, mock_open, mock_input, mock_get, mock_list_workflows):
+    def test_get_workflow_details(self, mock_json_dump, mock_open, mock_input, mock_client, mock_list_workflows):
         """Workflow detaylarını getirme işlevini test et"""
+        mock_get = mock_client.return_value.get
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -153,12 +156,13 @@ class TestN8nAppFunctions(unittest.TestCase):
         mock_open.assert_called_once()
         mock_json_dump.assert_called_once()
 
-    @patch('functions.update_workflow.list_workflows')
-    @patch('functions.update_workflow.requests.get')
-    @patch('functions.update_workflow.requests.put')
+    @patch('functions.update_workflow.show_workflow_list')
+    @patch('functions.update_workflow.get_client')
     @patch('builtins.input', side_effect=["1", "Yeni İsim"])
-    def test_update_workflow(self, mock_input, mock_put, mock_get, mock_list_workflows):
+    def test_update_workflow(self, mock_input, mock_client, mock_list_workflows):
         """Workflow güncelleme işlevini test et"""
+        mock_get = mock_client.return_value.get
+        mock_put = mock_client.return_value.put
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -191,10 +195,11 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("başarıyla güncellendi", output.lower())
 
     @patch('functions.delete_workflow.list_workflows')
-    @patch('functions.delete_workflow.requests.delete')
+    @patch('functions.delete_workflow.get_client')
     @patch('builtins.input', side_effect=["1", "SIL"])
-    def test_delete_workflow(self, mock_input, mock_delete, mock_list_workflows):
+    def test_delete_workflow(self, mock_input, mock_client, mock_list_workflows):
         """Workflow silme işlevini test et"""
+        mock_delete = mock_client.return_value.delete
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -216,10 +221,11 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("başarıyla silindi", output.lower())
 
     @patch('functions.activate_workflow.list_workflows')
-    @patch('functions.activate_workflow.requests.post')
+    @patch('functions.activate_workflow.get_client')
     @patch('builtins.input', return_value="1")
-    def test_activate_workflow(self, mock_input, mock_post, mock_list_workflows):
+    def test_activate_workflow(self, mock_input, mock_client, mock_list_workflows):
         """Workflow aktifleştirme işlevini test et"""
+        mock_post = mock_client.return_value.post
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": False},
@@ -241,10 +247,11 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("başarıyla aktif edildi", output.lower())
 
     @patch('functions.activate_workflow.list_workflows')
-    @patch('functions.activate_workflow.requests.post')
+    @patch('functions.activate_workflow.get_client')
     @patch('builtins.input', return_value="1")
-    def test_deactivate_workflow(self, mock_input, mock_post, mock_list_workflows):
+    def test_deactivate_workflow(self, mock_input, mock_client, mock_list_workflows):
         """Workflow pasifleştirme işlevini test et"""
+        mock_post = mock_client.return_value.post
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -265,11 +272,12 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("pasif ediliyor", output.lower())
         self.assertIn("başarıyla pasif edildi", output.lower())
 
-    @patch('functions.workflow_tags.list_workflows')
-    @patch('functions.workflow_tags.requests.get')
+    @patch('functions.workflow_tags.show_workflow_list')
+    @patch('functions.workflow_tags.get_client')
     @patch('builtins.input', return_value="1")
-    def test_get_workflow_tags(self, mock_input, mock_get, mock_list_workflows):
+    def test_get_workflow_tags(self, mock_input, mock_client, mock_list_workflows):
         """Workflow etiketlerini getirme işlevini test et"""
+        mock_get = mock_client.return_value.get
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -296,11 +304,12 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("tag1", output)
         self.assertIn("tag2", output)
 
-    @patch('functions.workflow_tags.list_workflows')
-    @patch('functions.workflow_tags.requests.put')
+    @patch('functions.workflow_tags.show_workflow_list')
+    @patch('functions.workflow_tags.get_client')
     @patch('builtins.input', side_effect=["1", "tag1"])
-    def test_assign_tag(self, mock_input, mock_put, mock_list_workflows):
+    def test_assign_tag(self, mock_input, mock_client, mock_list_workflows):
         """Workflow etiket atama işlevini test et"""
+        mock_put = mock_client.return_value.put
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -321,11 +330,12 @@ class TestN8nAppFunctions(unittest.TestCase):
         self.assertIn("etiketi atanıyor", output.lower())
         self.assertIn("başarıyla atandı", output.lower())
 
-    @patch('functions.workflow_tags.list_workflows')
-    @patch('functions.workflow_tags.requests.put')
+    @patch('functions.workflow_tags.show_workflow_list')
+    @patch('functions.workflow_tags.get_client')
     @patch('builtins.input', return_value="1")
-    def test_remove_tags(self, mock_input, mock_put, mock_list_workflows):
+    def test_remove_tags(self, mock_input, mock_client, mock_list_workflows):
         """Workflow etiketlerini kaldırma işlevini test et"""
+        mock_put = mock_client.return_value.put
         # list_workflows için mock değer oluştur
         mock_list_workflows.return_value = [
             {"id": "123", "name": "Test Workflow 1", "active": True},
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+N8N değişikliklerini yerel dosyalara artımlı çekmeyi test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import json
+import tempfile
+import subprocess
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.api_client import N8nClient
+from functions.pull_follow import pull_changes, git_commit_files
+
+
+def make_workflow(workflow_id, name, version, value=0):
+    return {
+        "id": workflow_id,
+        "name": name,
+        "versionId": version,
+        "nodes": [{"id": "1", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": 3,
+                   "position": [0, 0], "parameters": {"value": value}}],
+        "connections": {},
+        "settings": {"executionOrder": "v1"}
+    }
+
+
+class FakeRemote:
+    """workflow_summaries ve fetch_workflows'u taklit eden, ETag destekli sahte uzak"""
+
+    def __init__(self, workflows):
+        self.workflows = {workflow["id"]: workflow for workflow in workflows}
+        self.fetched = []
+
+    def etag(self):
+        return '"' + "-".join(f"{wf['id']}:{wf['versionId']}" for wf in self.workflows.values()) + '"'
+
+    def workflow_summaries(self, etag=None):
+        if etag == self.etag():
+            return None, etag
+        return [{"id": wf["id"], "name": wf["name"], "versionId": wf["versionId"]}
+                for wf in self.workflows.values()], self.etag()
+
+    def fetch_workflows(self, ids, workers=None):
+        self.fetched.extend(ids)
+        return {workflow_id: self.workflows[workflow_id] for workflow_id in ids}, {}
+
+
+class TestPullFollow(unittest.TestCase):
+    """Sadece değişenlerin indirildiğini ve yerel değişikliklerin korunduğunu test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.remote = FakeRemote([make_workflow("a", "Bir", "v1"), make_workflow("b", "Iki", "v1")])
+        patcher = patch('functions.pull_follow.get_client', return_value=self.remote)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_incremental_pull(self):
+        """İlk çekimde hepsinin, sonra sadece değişenin indirildiğini; boşta 304 döndüğünü test et"""
+        first = pull_changes(self.dir)
+        self.assertEqual(sorted(first["written"]), ["bir_a.json", "iki_b.json"])
+
+        idle = pull_changes(self.dir)
+        self.assertTrue(idle["not_modified"])
+
+        self.remote.fetched.clear()
+        self.remote.workflows["a"] = make_workflow("a", "Bir Yeni", "v2", value=1)
+        second = pull_changes(self.dir)
+        self.assertEqual(self.remote.fetched, ["a"])
+        self.assertEqual(second["renamed"], [("bir_a.json", "bir_yeni_a.json")])
+        with open(os.path.join(self.dir, "bir_yeni_a.json"), encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["nodes"][0]["parameters"]["value"], 1)
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "bir_a.json")))
+
+    def test_local_edits_are_not_overwritten(self):
+        """Son çekimden sonra yerelde düzenlenen dosyanın üzerine yazılmadığını test et"""
+        pull_changes(self.dir)
+        path = os.path.join(self.dir, "bir_a.json")
+        with open(path, encoding='utf-8') as f:
+            local = json.load(f)
+        local["nodes"][0]["parameters"]["value"] = 5
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(local, f)
+
+        self.remote.workflows["a"] = make_workflow("a", "Bir", "v2", value=1)
+        report = pull_changes(self.dir)
+        self.assertEqual(report["conflicts"], ["bir_a.json"])
+        with open(path, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["nodes"][0]["parameters"]["value"], 5)
+
+        # Çakışma kaydedilir: ne uzak sürüm ne dosya değişmedikçe tekrar indirilmez ve raporlanmaz
+        self.remote.fetched.clear()
+        self.remote.workflows["b"] = make_workflow("b", "Iki", "v2", value=1)
+        report = pull_changes(self.dir)
+        self.assertEqual((self.remote.fetched, report["conflicts"]), (["b"], []))
+
+        local["nodes"][0]["parameters"]["value"] = 6
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(local, f)
+        self.remote.workflows["b"] = make_workflow("b", "Iki", "v3", value=2)
+        report = pull_changes(self.dir)
+        self.assertEqual(report["conflicts"], ["bir_a.json"])
+
+    def test_git_commit_skips_untracked_old_paths(self):
+        """İzlenmeyen eski dosya adının commit'i engellemediğini test et"""
+        git = lambda *args: subprocess.run(['git', '-C', self.dir] + list(args), check=True,
+                                           capture_output=True, text=True).stdout
+        git('init', '-q')
+        git('config', 'user.email', 'test@example.com')
+        git('config', 'user.name', 'Test')
+        new_path = os.path.join(self.dir, "yeni.json")
+        with open(new_path, 'w', encoding='utf-8') as f:
+            json.dump(make_workflow("a", "Yeni", "v1"), f)
+
+        self.assertTrue(git_commit_files([os.path.join(self.dir, "eski.json"), new_path], "n8n: test"))
+        self.assertEqual(git('ls-files').split(), ["yeni.json"])
+
+    def test_client_conditional_listing(self):
+        """İstemcinin ETag'i If-None-Match olarak gönderdiğini ve 304'te None döndürdüğünü test et"""
+        client = N8nClient(base_url="http://localhost:5678", api_headers={})
+        response = MagicMock(status_code=304)
+        with patch.object(client.session, 'request', return_value=response) as mock_request:
+            summaries, etag = client.workflow_summaries('W/"abc"')
+        self.assertIsNone(summaries)
+        self.assertEqual(etag, 'W/"abc"')
+        self.assertEqual(mock_request.call_args.kwargs["headers"], {"If-None-Match": 'W/"abc"'})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Açılış süresini (python -X importtime) ve tembel yapılandırmayı test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import tempfile
+import subprocess
+
+# Ana proje dizinini import path'e ekleyelim
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(PROJECT_DIR)
+
+from functions import utils
+
+# Menünün gösterilmesi için izin verilen içe aktarma süresi (ms)
+STARTUP_BUDGET_MS = float(os.getenv("N8N_STARTUP_BUDGET_MS", "100"))
+
+# Açılışta yüklenmemesi gereken ağır modüller
+DEFERRED_MODULES = ("requests", "urllib3", "functions.api_client", "functions.list_workflows")
+
+
+def import_profile(module):
+    """
+    Modülü kimlik bilgisi olmayan yeni bir süreçte -X importtime ile içe aktarır.
+
+    (çıkış kodu, {modül: kümülatif mikro saniye}, yüklenen ertelenmiş modüller) döndürür.
+    """
+    env = {key: value for key, value in os.environ.items() if key not in ("API_KEY", "N8N_URL", "N8N_PROFILE")}
+    code = f"import sys, {module}; print(','.join(name for name in {DEFERRED_MODULES!r} if name in sys.modules))"
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=PROJECT_DIR, env=env,
+                            capture_output=True, text=True, timeout=60)
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line.split("|", 2)
+            if cumulative.strip().isdigit():
+                times[name.strip()] = int(cumulative)
+    loaded = [name for name in result.stdout.strip().split(",") if name]
+    return result.returncode, times, loaded
+
+
+class TestStartup(unittest.TestCase):
+    """Menünün ve yerel komutların hızlı ve kimlik bilgisi olmadan açıldığını test et"""
+
+    def test_menu_import_budget(self):
+        """n8nApp içe aktarılırken requests ve komut modüllerinin yüklenmediğini ve süre bütçesini test et"""
+        returncode, times, loaded = import_profile("n8nApp")
+        self.assertEqual(returncode, 0)
+        self.assertEqual(loaded, [])
+        self.assertLess(times["n8nApp"] / 1000, STARTUP_BUDGET_MS)
+
+    def test_offline_commands_without_credentials(self):
+        """Yerel doğrulama ve graf analizinin kimlik bilgisi ve HTTP istemcisi olmadan yüklendiğini test et"""
+        returncode, _, loaded = import_profile("functions.workflow_validator, functions.workflow_graph")
+        self.assertEqual(returncode, 0)
+        self.assertEqual(loaded, [])
+
+    def test_profile_and_lazy_credentials(self):
+        """Profil dosyasının .env'i ezdiğini ve eksik kimlik bilgisinin ilk erişimde çıkış yaptığını test et"""
+        with tempfile.TemporaryDirectory() as temp_dir, patch.dict(os.environ):
+            for key in ("API_KEY", "N8N_URL", "N8N_PROFILE"):
+                os.environ.pop(key, None)
+            with open(os.path.join(temp_dir, ".env"), 'w', encoding='utf-8') as f:
+                f.write("API_KEY=genel\nN8N_URL=http://genel:5678\nN8N_PROFILE=staging\n")
+            with open(os.path.join(temp_dir, ".env.staging"), 'w', encoding='utf-8') as f:
+                f.write("N8N_URL=http://staging:5678\n")
+            self.addCleanup(utils.set_profile, None)
+
+            with patch('functions.utils.BASE_DIR', temp_dir):
+                utils.set_profile(None)
+                config = utils.get_config()
+                self.assertEqual(config.api_key, "genel")
+                self.assertEqual(config.n8n_url, "http://staging:5678")
+                self.assertEqual(config.profile, "staging")
+                self.assertEqual(utils.N8N_URL, "http://staging:5678")
+
+                os.environ.pop("API_KEY")
+                os.remove(os.path.join(temp_dir, ".env"))
+                utils.set_profile("staging")
+                with self.assertRaises(SystemExit):
+                    utils.get_config()
+
+if __name__ == '__main__':
+    unittest.main()
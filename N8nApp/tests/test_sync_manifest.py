@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Artımlı senkronizasyon manifestini test etme
+"""
+import unittest
+from unittest.mock import MagicMock
+import sys
+import os
+import json
+import tempfile
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.sync_manifest import SyncManifest, content_hash
+
+
+def sample_workflow(**overrides):
+    workflow = {
+        "id": "wf1",
+        "name": "Örnek",
+        "nodes": [
+            {"id": "a", "name": "Start", "type": "n8n-nodes-base.start", "typeVersion": 1,
+             "position": [0, 0], "parameters": {}},
+            {"id": "b", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": 3,
+             "position": [200, 0], "parameters": {"x": 1}},
+        ],
+        "connections": {"Start": {"main": [[{"node": "Set", "type": "main", "index": 0}]]}},
+        "settings": {"executionOrder": "v1"},
+        "versionId": "v1",
+        "updatedAt": "2025-01-01T00:00:00.000Z"
+    }
+    workflow.update(overrides)
+    return workflow
+
+
+class TestSyncManifest(unittest.TestCase):
+    """Manifest ve içerik hash davranışlarını test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        with open(os.path.join(self.dir, name), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_content_hash_ignores_volatile_fields_and_node_order(self):
+        """Hash'in node sırası ve uçucu alanlardan etkilenmediğini test et"""
+        workflow = sample_workflow()
+        reordered = sample_workflow(nodes=list(reversed(workflow["nodes"])), updatedAt="x", versionId="y")
+        self.assertEqual(content_hash(workflow), content_hash(reordered))
+
+        changed = sample_workflow()
+        changed["nodes"][1]["parameters"] = {"x": 2}
+        self.assertNotEqual(content_hash(workflow), content_hash(changed))
+
+    def test_scan_file_skips_parse_when_stat_unchanged(self):
+        """Stat değişmediğinde dosyanın yeniden okunmadığını test et"""
+        self.write("wf.json", sample_workflow())
+        read_json = MagicMock(side_effect=lambda path: json.load(open(path, encoding='utf-8')))
+
+        manifest = SyncManifest.load(self.dir)
+        first = manifest.scan_file("wf.json", read_json)
+        manifest.save()
+        self.assertIsNotNone(first["data"])
+
+        manifest = SyncManifest.load(self.dir)
+        second = manifest.scan_file("wf.json", read_json)
+        self.assertIsNone(second["data"])
+        self.assertEqual(second["hash"], first["hash"])
+        self.assertEqual(read_json.call_count, 1)
+
+    def test_unchanged_since_sync(self):
+        """Kaydedilen senkron durumunun uzak sürüm değişince geçersiz olduğunu test et"""
+        manifest = SyncManifest(self.dir)
+        workflow = sample_workflow()
+        file_hash = content_hash(workflow)
+
+        self.assertFalse(manifest.is_unchanged_since_sync(workflow, file_hash))
+        manifest.record_sync(workflow, file_hash)
+        self.assertTrue(manifest.is_unchanged_since_sync(workflow, file_hash))
+        self.assertFalse(manifest.is_unchanged_since_sync(sample_workflow(versionId="v2"), file_hash))
+        self.assertFalse(manifest.is_unchanged_since_sync(workflow, "başka-hash"))
+
+if __name__ == '__main__':
+    unittest.main()
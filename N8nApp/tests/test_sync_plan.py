@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Senkron planı oluşturma ve uygulama işlevlerini test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.sync_manifest import SyncManifest, content_hash
+from functions.sync_plan import build_sync_plan, resolve_conflict, apply_sync_plan, plan_to_json
+
+
+def sample_workflow(**overrides):
+    workflow = {
+        "id": "wf1",
+        "name": "Plan Test",
+        "nodes": [
+            {"id": "1", "name": "Trigger", "type": "n8n-nodes-base.manualTrigger", "typeVersion": 1,
+             "position": [0, 0], "parameters": {}},
+            {"id": "2", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": 3,
+             "position": [200, 0], "parameters": {"value": 1}},
+        ],
+        "connections": {"Trigger": {"main": [[{"node": "Set", "type": "main", "index": 0}]]}},
+        "settings": {"executionOrder": "v1"}
+    }
+    workflow.update(overrides)
+    return workflow
+
+
+class TestSyncPlan(unittest.TestCase):
+    """Planın yan etkisiz oluşturulduğunu ve sıralı/paralel uygulandığını test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.manifest = SyncManifest(self.dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def file_record(self, workflow, file_name="eski_ad_wf1.json"):
+        return {"file_name": file_name, "file_path": os.path.join(self.dir, file_name),
+                "id": workflow.get("id"), "name": workflow.get("name"),
+                "hash": content_hash(workflow), "data": workflow}
+
+    def state(self, **lists):
+        state = {"workflow_dir": self.dir, "manifest": self.manifest, "matching_workflows": [],
+                 "to_update_from_file": [], "to_create_file": [], "to_create_api": []}
+        state.update(lists)
+        return state
+
+    def test_clean_merge_updates_both_sides(self):
+        """Çakışmasız birleştirmenin iki tarafı da güncelleyen adımlar ürettiğini test et"""
+        self.manifest.save_base(sample_workflow())
+        local = sample_workflow()
+        local["nodes"][1]["parameters"] = {"value": 2}
+        remote = sample_workflow(name="Plan Test 2")
+        item = {"api": remote, "file": self.file_record(local), "diff": None}
+
+        plan = build_sync_plan(self.state(to_update_from_file=[item]))
+        kinds = [action["action"] for action in plan["actions"]]
+        self.assertEqual(kinds, ["update_api", "rename_file", "write_file"])
+        self.assertEqual(plan["actions"][1]["to"], "plan_test_2_wf1.json")
+        self.assertNotIn("payload", json.loads(plan_to_json(plan))["actions"][0])
+
+    def test_conflict_without_base_and_resolution(self):
+        """Taban yoksa çakışma adımı üretildiğini ve tercihle çözüldüğünü test et"""
+        local = sample_workflow()
+        local["nodes"][1]["parameters"] = {"value": 2}
+        item = {"api": sample_workflow(), "file": self.file_record(local, "plan_test_wf1.json"), "diff": None}
+        state = self.state(to_update_from_file=[item])
+
+        plan = build_sync_plan(state)
+        self.assertEqual([action["action"] for action in plan["actions"]], ["conflict"])
+
+        resolve_conflict(plan, plan["actions"][0], "n8n", state)
+        self.assertEqual([action["action"] for action in plan["actions"]], ["write_file"])
+        self.assertEqual(build_sync_plan(state, prefer="file")["actions"][0]["action"], "update_api")
+
+    @patch('functions.sync_plan.create_new_workflow', return_value=True)
+    @patch('functions.sync_plan.update_workflow', return_value=True)
+    def test_apply_runs_steps_in_order(self, mock_update, mock_create):
+        """Uygulamanın workflow başına sırayı koruduğunu ve tabanı sakladığını test et"""
+        with open(os.path.join(self.dir, "eski_ad_wf1.json"), 'w', encoding='utf-8') as f:
+            json.dump(sample_workflow(), f)
+        remote = sample_workflow(name="Yeni Ad")
+        local_only = sample_workflow(id=None, name="Yerel")
+        plan = build_sync_plan(self.state(
+            to_update_from_file=[{"api": remote, "file": self.file_record(sample_workflow()), "diff": None}],
+            to_create_file=[sample_workflow(id="wf2", name="Uzak")],
+            to_create_api=[self.file_record(local_only, "yerel.json")]
+        ), prefer="n8n")
+
+        summary = apply_sync_plan(plan, manifest=self.manifest, workers=4)
+
+        self.assertEqual(summary["failed"], [])
+        self.assertEqual(summary["succeeded"], 4)
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "eski_ad_wf1.json")))
+        with open(os.path.join(self.dir, "yeni_ad_wf1.json"), encoding='utf-8') as f:
+            self.assertEqual(json.load(f)["name"], "Yeni Ad")
+        self.assertTrue(os.path.exists(os.path.join(self.dir, "uzak_wf2.json")))
+        mock_create.assert_called_once()
+        mock_update.assert_not_called()
+        self.assertEqual(self.manifest.load_base("wf1")["name"], "Yeni Ad")
+
+    def test_apply_records_sync_in_manifest(self):
+        """Uygulanan güncellemenin yeni uzak sürümle manifeste kaydedildiğini ve diske yazıldığını test et"""
+        local = sample_workflow(name="Yerel Ad")
+        item = {"api": sample_workflow(versionId="v1"), "file": self.file_record(local, "yerel_ad_wf1.json"),
+                "diff": None}
+        plan = build_sync_plan(self.state(to_update_from_file=[item]), prefer="file")
+        updated = {**local, "versionId": "v2", "updatedAt": "2025-01-01T10:00:00.000Z"}
+
+        with patch('functions.sync_plan.update_workflow', return_value=updated):
+            summary = apply_sync_plan(plan, manifest=self.manifest, workers=2)
+
+        self.assertEqual(summary["failed"], [])
+        reloaded = SyncManifest.load(self.dir)
+        self.assertTrue(reloaded.is_unchanged_since_sync({"id": "wf1", "versionId": "v2"}, content_hash(local)))
+        self.assertEqual(reloaded.load_base("wf1")["name"], "Yerel Ad")
+
+if __name__ == '__main__':
+    unittest.main()
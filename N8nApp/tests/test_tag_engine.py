@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Önbellekli etiket kataloğu, filtreler ve toplu etiketlemeyi test etme
+"""
+import unittest
+from unittest.mock import patch, MagicMock
+import sys
+import os
+import threading
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.tag_engine import TagCatalog, apply_tag_operation, merge_tag_ids, format_tag_report, main
+from functions.workflow_filters import WorkflowFilter
+
+
+def make_response(status_code, body=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    return response
+
+
+class FakeTagApi:
+    """/tags ve /workflows/{id}/tags uçlarını taklit eden sahte istemci"""
+
+    def __init__(self, tags):
+        self.tags = dict(tags)
+        self.workflow_tags = {}
+        self.tag_gets = 0
+        self.lock = threading.Lock()
+
+    def get(self, path, params=None):
+        self.tag_gets += 1
+        return make_response(200, {"data": [{"id": tag_id, "name": name} for tag_id, name in self.tags.items()],
+                                   "nextCursor": None})
+
+    def post(self, path, json=None):
+        tag_id = f"t{len(self.tags) + 1}"
+        self.tags[tag_id] = json["name"]
+        return make_response(200, {"id": tag_id, "name": json["name"]})
+
+    def put(self, path, json=None):
+        with self.lock:
+            self.workflow_tags[path.split("/")[2]] = [tag["id"] for tag in json]
+        return make_response(200, json)
+
+
+def make_workflow(index, tags=(), trigger="n8n-nodes-base.webhook"):
+    return {"id": f"wf{index}", "name": f"Akış {index}", "active": index % 2 == 0,
+            "tags": [{"id": tag_id, "name": name} for tag_id, name in tags],
+            "nodes": [{"name": "Tetik", "type": trigger}, {"name": "DB", "type": "n8n-nodes-base.postgres"}]}
+
+
+class TestTagEngine(unittest.TestCase):
+    """İsimle, birleştirerek ve eşzamanlı etiketlemeyi test et"""
+
+    def setUp(self):
+        self.api = FakeTagApi({"t1": "prod", "t2": "legacy"})
+        patcher = patch('functions.tag_engine.get_client', return_value=self.api)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch('functions.tag_engine.invalidate_workflow_list')
+        self.invalidate = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.catalog = TagCatalog(ttl=60)
+
+    def test_merge_tag_ids(self):
+        """Mevcut etiketlerin korunduğunu ve değişiklik yoksa None döndüğünü test et"""
+        self.assertEqual(merge_tag_ids(["a"], add_ids=["b"]), ["a", "b"])
+        self.assertEqual(merge_tag_ids(["a", "b"], remove_ids=["a"]), ["b"])
+        self.assertEqual(merge_tag_ids(["a"], set_ids=["c"]), ["c"])
+        self.assertIsNone(merge_tag_ids(["a", "b"], add_ids=["a"]))
+
+    def test_bulk_add_remove_with_cached_catalog(self):
+        """300 workflow'da eksik etiketin oluşturulup mevcutlarla birleştirildiğini test et"""
+        workflows = [make_workflow(i, tags=[("t1", "prod"), ("t2", "legacy")] if i % 3 == 0 else [("t1", "prod")])
+                     for i in range(300)]
+        report = apply_tag_operation(workflows, add=["Incident"], remove=["legacy"], workers=8,
+                                     catalog=self.catalog)
+
+        self.assertEqual(report["failed"], [])
+        self.assertEqual(len(report["changed"]), 300)
+        self.invalidate.assert_called_once()
+        incident_id = self.catalog.lookup("incident")
+        self.assertEqual(self.api.tags[incident_id], "Incident")
+        self.assertEqual(self.api.workflow_tags["wf0"], ["t1", incident_id])
+        self.assertEqual(self.api.workflow_tags["wf1"], ["t1", incident_id])
+
+        # İkinci işlemde katalog önbellekten okunur, etiketleri güncel olanlara istek atılmaz
+        self.api.workflow_tags.clear()
+        updated = [{**wf, "tags": [{"id": tag_id} for tag_id in ["t1", incident_id]]} for wf in workflows]
+        again = apply_tag_operation(updated, add=["incident"], catalog=self.catalog)
+        self.assertEqual(again["unchanged"], 300)
+        self.invalidate.assert_called_once()
+        self.assertEqual(self.api.workflow_tags, {})
+        self.assertEqual(self.api.tag_gets, 1)
+
+    def test_dry_run_lists_new_tags(self):
+        """Kuru çalıştırmada oluşturulacak etiketin raporda "(yeni)" olarak göründüğünü test et"""
+        report = apply_tag_operation([make_workflow(1, tags=[("t1", "prod")])], add=["Incident"],
+                                     dry_run=True, catalog=self.catalog)
+        self.assertEqual(report["new_tags"], ["Incident"])
+        self.assertEqual(report["missing_tags"], [])
+        self.assertEqual(report["changed"], [("wf1", "Akış 1", ["prod", "Incident (yeni)"])])
+        self.assertIn("Oluşturulacak etiketler: Incident (yeni)", format_tag_report(report, dry_run=True))
+        self.assertEqual((self.api.tags, self.api.workflow_tags), ({"t1": "prod", "t2": "legacy"}, {}))
+
+    def test_main_requires_filter_or_all(self):
+        """--add/--remove'un filtre veya --all olmadan tüm workflow'lara uygulanmadığını test et"""
+        with patch('functions.tag_engine.select_workflows') as select, patch('sys.stderr'):
+            for argv in (["--add", "prod"], ["--remove", "legacy"]):
+                with self.assertRaises(SystemExit):
+                    main(argv)
+            select.assert_not_called()
+
+    def test_workflow_filter(self):
+        """Etiket, isim, node tipi ve tetikleyici filtrelerini test et"""
+        workflows = [make_workflow(1, tags=[("t1", "prod")]),
+                     make_workflow(2, trigger="n8n-nodes-base.scheduleTrigger")]
+        select = lambda **kwargs: [wf["id"] for wf in workflows if WorkflowFilter(**kwargs).matches(wf)]
+        self.assertEqual(select(tags=["PROD"]), ["wf1"])
+        self.assertEqual(select(trigger="schedule"), ["wf2"])
+        self.assertEqual(select(node_type="postgres", name=r"akış\s2"), ["wf2"])
+        self.assertEqual(select(active=True), ["wf2"])
+        self.assertTrue(WorkflowFilter().is_empty())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+workflows klasörü izleme modunu test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import io
+import tempfile
+from contextlib import redirect_stdout
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.utils import atomic_write_json
+from functions.watch_workflows import Debouncer, PollingWatcher, WorkflowPusher, create_watcher
+
+
+def make_workflow(value=0):
+    return {
+        "id": "wf1",
+        "name": "İzlenen",
+        "nodes": [{"id": "1", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": 3,
+                   "position": [0, 0], "parameters": {"value": value}}],
+        "connections": {}
+    }
+
+
+class TestWatchWorkflows(unittest.TestCase):
+    """Olay biriktirme, değişiklik algılama ve sadece değişeni yüklemeyi test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.path = os.path.join(self.dir, "izlenen_wf1.json")
+        atomic_write_json(self.path, make_workflow())
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_debouncer_waits_for_quiet_period(self):
+        """Art arda gelen olayların sessizlik süresi dolunca tek seferde verildiğini test et"""
+        debouncer = Debouncer(delay=0.3)
+        debouncer.add({"a.json"}, now=0.0)
+        debouncer.add({"a.json", "b.json"}, now=0.2)
+        self.assertEqual(debouncer.ready(now=0.4), [])
+        self.assertAlmostEqual(debouncer.next_timeout(0.4, 1.0), 0.1)
+        self.assertEqual(debouncer.ready(now=0.5), ["a.json", "b.json"])
+        self.assertEqual(debouncer.next_timeout(0.5, 1.0), 1.0)
+
+    def test_watchers_detect_atomic_writes(self):
+        """Hem inotify hem stat izleyicinin atomik yazımı algıladığını, gizli dosyaları atladığını test et"""
+        for watcher in (create_watcher(self.dir), PollingWatcher(self.dir, interval=0)):
+            try:
+                os.utime(self.path, ns=(1, 1))
+                atomic_write_json(self.path, make_workflow(value=1))
+                with open(os.path.join(self.dir, ".gizli.json"), 'w', encoding='utf-8') as f:
+                    f.write("{}")
+                self.assertEqual(watcher.poll(1.0), {"izlenen_wf1.json"}, watcher.name)
+            finally:
+                watcher.close()
+
+    @patch('functions.watch_workflows.create_new_workflow')
+    @patch('functions.watch_workflows.update_workflow', return_value=True)
+    def test_pusher_uploads_only_changed_content(self, mock_update, mock_create):
+        """İçerik değişince güncellendiğini, değişmeyen veya geçersiz dosyada istek atılmadığını test et"""
+        pusher = WorkflowPusher(self.dir)
+        pusher.remember_all()
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(pusher.push("izlenen_wf1.json"), "unchanged")
+
+            atomic_write_json(self.path, make_workflow(value=2))
+            self.assertEqual(pusher.push("izlenen_wf1.json"), "pushed")
+            self.assertEqual(pusher.push("izlenen_wf1.json"), "unchanged")
+
+            broken = make_workflow(value=3)
+            del broken["nodes"][0]["type"]
+            atomic_write_json(self.path, broken)
+            self.assertEqual(pusher.push("izlenen_wf1.json"), "invalid")
+
+        mock_update.assert_called_once()
+        self.assertEqual(mock_update.call_args.args[0], "wf1")
+        # Dosya pusher'da doğrulandı; update_workflow ikinci kez doğrulamamalı
+        self.assertFalse(mock_update.call_args.kwargs["validate"])
+        mock_create.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Oturum boyunca tutulan workflow listesi önbelleğini test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import threading
+import tempfile
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.workflow_cache import WorkflowListCache, save_snapshot, load_snapshot
+
+
+class FakeSummaryApi:
+    """workflow_summaries çağrılarını sayan, ETag eşleşirse 304 (None) dönen sahte istemci"""
+
+    def __init__(self, workflows):
+        self.workflows = workflows
+        self.version = 1
+        self.calls = []
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def workflow_summaries(self, etag=None):
+        self.entered.set()
+        self.release.wait(5)
+        self.calls.append(etag)
+        current = f'"v{self.version}"'
+        if etag == current:
+            return None, etag
+        return [dict(workflow) for workflow in self.workflows], current
+
+
+class TestWorkflowListCache(unittest.TestCase):
+    """TTL, geçersiz kılma ve arka planda yenilemeyi test et"""
+
+    def setUp(self):
+        self.api = FakeSummaryApi([{"id": "1", "name": "Akış", "active": False}])
+        self.cache = WorkflowListCache(client=self.api, ttl=60, max_stale=600)
+
+    def test_fresh_list_served_from_memory(self):
+        """TTL içinde ikinci erişimin API'ye gitmediğini test et"""
+        self.assertEqual(self.cache.get()[0]["name"], "Akış")
+        self.cache.get()
+        self.assertEqual(self.api.calls, [None])
+
+    def test_invalidate_forces_conditional_refresh(self):
+        """invalidate sonrası listenin ETag ile yeniden istendiğini ve değişikliğin görüldüğünü test et"""
+        self.cache.get()
+        self.cache.invalidate()
+        self.cache.get()
+        self.assertEqual(self.api.calls, [None, '"v1"'])
+
+        self.api.workflows[0]["active"] = True
+        self.api.version = 2
+        self.cache.invalidate()
+        self.assertTrue(self.cache.get()[0]["active"])
+
+    def test_stale_list_returned_while_revalidating(self):
+        """TTL geçince eski listenin hemen döndüğünü, yenilemenin arka planda yapıldığını test et"""
+        self.cache.get()
+        self.cache.loaded_at -= 120
+        self.api.workflows[0]["name"] = "Yeni"
+        self.api.version = 2
+        self.api.release.clear()
+
+        self.assertEqual(self.cache.get()[0]["name"], "Akış")
+        # Yenileme sürerken gelen ikinci erişim yeni thread başlatmaz
+        worker = self.cache.refresh_in_background()
+        self.assertIs(self.cache.refresh_in_background(), worker)
+        self.api.release.set()
+        worker.join(5)
+
+        self.assertEqual(self.cache.get()[0]["name"], "Yeni")
+        self.assertEqual(len(self.api.calls), 2)
+
+    def test_refresh_started_before_invalidate_is_discarded(self):
+        """Geçersiz kılmadan önce başlamış yenilemenin sonucunun yazılmadığını test et"""
+        self.cache.get()
+        self.cache.loaded_at -= 120
+        self.api.release.clear()
+        self.api.entered.clear()
+        worker = self.cache.refresh_in_background()
+        self.api.entered.wait(5)
+        self.cache.invalidate()
+        self.api.release.set()
+        worker.join(5)
+        self.assertIsNone(self.cache.age())
+
+    def test_warm_start_from_snapshot(self):
+        """Kayıtlı listenin stale olarak hemen döndüğünü ve güncel listeyle değiştirildiğini test et"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, ".list-snapshot.jsonl")
+            save_snapshot(path, [{"id": "1", "name": "Eski", "active": True}], etag='"v0"', base_url="http://n8n")
+            self.assertIsNone(load_snapshot(path, base_url="http://baska-n8n"))
+
+            with patch.dict(os.environ, {"N8N_URL": "http://n8n"}):
+                cache = WorkflowListCache(client=self.api, ttl=60, snapshot_path=path)
+                self.api.release.clear()
+                self.assertTrue(cache.warm_start())
+                self.assertTrue(cache.stale)
+                self.assertEqual(cache.get()[0]["name"], "Eski")
+
+                self.api.release.set()
+                cache.refreshing.join(5)
+                self.assertFalse(cache.stale)
+                self.assertEqual(cache.get()[0]["name"], "Akış")
+                self.assertEqual(self.api.calls, ['"v0"'])
+
+                # Yeni liste bir sonraki açılış için diske yazılmış olmalı
+                workflows, saved_at, etag = load_snapshot(path)
+                self.assertEqual(workflows[0]["name"], "Akış")
+                self.assertEqual(etag, '"v1"')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Workflow bağlantı grafiği analizini test etme
+"""
+import unittest
+import sys
+import os
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.workflow_graph import analyze_workflow, compile_graph
+
+
+def node(name, node_type, x=0):
+    return {"id": name, "name": name, "type": node_type, "position": [x, 0], "parameters": {}}
+
+
+def link(target, connection_type="main"):
+    return {"node": target, "type": connection_type, "index": 0}
+
+
+def sample_workflow():
+    return {
+        "name": "Graf",
+        "nodes": [
+            node("Webhook", "n8n-nodes-base.webhook", 0),
+            node("Loop", "n8n-nodes-base.splitInBatches", 100),
+            node("Work", "n8n-nodes-base.set", 200),
+            node("Agent", "@n8n/n8n-nodes-langchain.agent", 300),
+            node("Model", "@n8n/n8n-nodes-langchain.lmChatOpenAi", 300),
+            node("Respond", "n8n-nodes-base.respondToWebhook", 400),
+            node("Unused Tool", "@n8n/n8n-nodes-langchain.toolCode", 500),
+            node("Lonely", "n8n-nodes-base.noOp", 600),
+            node("Note", "n8n-nodes-base.stickyNote", 700),
+        ],
+        "connections": {
+            "Webhook": {"main": [[link("Loop")]]},
+            "Loop": {"main": [[link("Agent")], [link("Work")]]},
+            "Work": {"main": [[link("Loop")]]},
+            "Model": {"ai_languageModel": [[link("Agent", "ai_languageModel")]]},
+            "Agent": {"main": [[link("Respond"), link("Missing")]]},
+            "Unused Tool": {"ai_tool": [[link("Lonely", "ai_tool")]]},
+        }
+    }
+
+
+class TestWorkflowGraph(unittest.TestCase):
+    """Topoloji, döngü, erişilebilirlik ve kritik yol hesaplarını test et"""
+
+    def test_analysis(self):
+        """Analiz raporunun beklenen alanları doğru hesapladığını test et"""
+        analysis = analyze_workflow(sample_workflow())
+
+        self.assertEqual(analysis["triggers"], ["Webhook"])
+        self.assertEqual(analysis["cycles"], [["Loop", "Work"]])
+        self.assertEqual(analysis["critical_path"], ["Webhook", "Loop", "Agent", "Respond"])
+        # Model ai_* bağlantısıyla erişilebilir agent'a bağlı olduğu için erişilebilir sayılır
+        self.assertEqual(analysis["unreachable"], ["Lonely", "Unused Tool"])
+        self.assertEqual(analysis["orphans"], [])
+        self.assertEqual(analysis["dangling_connections"], [{"from": "Agent", "type": "main", "to": "Missing"}])
+        self.assertNotIn("Note", analysis["topological_order"] + analysis["blocked_by_cycles"])
+
+    def test_longest_path_on_long_chain(self):
+        """Uzun doğrusal zincirde kritik yolun özyineleme sınırına takılmadan hesaplandığını test et"""
+        names = [f"N{index}" for index in range(3000)]
+        workflow = {
+            "name": "Zincir",
+            "nodes": [node(names[0], "n8n-nodes-base.webhook")] +
+                     [node(name, "n8n-nodes-base.set", index) for index, name in enumerate(names[1:], 1)],
+            "connections": {source: {"main": [[link(target)]]} for source, target in zip(names, names[1:])}
+        }
+        self.assertEqual(compile_graph(workflow).longest_path(), names)
+
+    def test_topological_order_without_cycles(self):
+        """Döngüsüz grafta tüm node'ların bağımlılık sırasıyla döndüğünü test et"""
+        workflow = sample_workflow()
+        del workflow["connections"]["Work"]
+        order, blocked = compile_graph(workflow).topological_order()
+        self.assertEqual(blocked, [])
+        self.assertLess(order.index("Webhook"), order.index("Loop"))
+        self.assertLess(order.index("Model"), order.index("Agent"))
+        self.assertLess(order.index("Agent"), order.index("Respond"))
+
+if __name__ == '__main__':
+    unittest.main()
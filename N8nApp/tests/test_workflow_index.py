@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+SQLite workflow indeksini test etme
+"""
+import unittest
+import sys
+import os
+import json
+import tempfile
+from unittest.mock import patch
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.workflow_index import WorkflowIndex, get_workflow_index, find_workflow_file
+
+
+def make_workflow(workflow_id, name, node_types, active=False, tags=()):
+    return {
+        "id": workflow_id,
+        "name": name,
+        "active": active,
+        "tags": [{"id": f"t{i}", "name": tag} for i, tag in enumerate(tags)],
+        "nodes": [{"id": str(i), "name": f"N{i}", "type": node_type} for i, node_type in enumerate(node_types)],
+        "connections": {}
+    }
+
+
+class TestWorkflowIndex(unittest.TestCase):
+    """İndeksin artımlı güncellenmesini ve sorgularını test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.write("rag.json", make_workflow("a1", "Yerel RAG", [
+            "@n8n/n8n-nodes-langchain.chatTrigger", "@n8n/n8n-nodes-langchain.embeddingsOllama"], active=True))
+        self.write("hook.json", make_workflow("b2", "Webhook Akışı", ["n8n-nodes-base.webhook"],
+                                              active=True, tags=["prod"]))
+        self.write("pasif.json", make_workflow("c3", "Pasif Webhook", ["n8n-nodes-base.webhook"]))
+        self.index = WorkflowIndex(self.dir)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        with open(os.path.join(self.dir, name), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def test_queries(self):
+        """Node tipi, tetikleyici, aktiflik ve etiket sorgularını test et"""
+        self.assertEqual(self.index.refresh()["added"], 3)
+
+        self.assertEqual([row["id"] for row in self.index.query(node_type="embeddingsOllama")], ["a1"])
+        self.assertEqual([row["id"] for row in self.index.query(trigger="webhook", active=True)], ["b2"])
+        self.assertEqual([row["id"] for row in self.index.query(trigger="chatTrigger")], ["a1"])
+        self.assertEqual([row["id"] for row in self.index.query(tag="PROD")], ["b2"])
+        self.assertEqual(self.index.find_by_id("c3")["file_name"], "pasif.json")
+
+    def test_incremental_refresh(self):
+        """Sadece değişen dosyaların yeniden indekslendiğini test et"""
+        self.index.refresh()
+        self.write("pasif.json", make_workflow("c3", "Artık Aktif", ["n8n-nodes-base.webhook"], active=True))
+        os.remove(os.path.join(self.dir, "rag.json"))
+
+        stats = self.index.refresh()
+        self.assertEqual(stats, {"added": 0, "updated": 1, "removed": 1, "unchanged": 1})
+        self.assertEqual(len(self.index.query(trigger="webhook", active=True)), 2)
+        self.assertIsNone(self.index.find_by_id("a1"))
+        self.assertEqual(self.index.query(node_type="embeddingsOllama"), [])
+    def test_lookups_refresh_once(self):
+        """Klasörün komut başına bir kez tarandığını, id aramalarının taramadan yanıtlandığını test et"""
+        with open(os.path.join(self.dir, "bozuk.json"), 'w', encoding='utf-8') as f:
+            f.write("{")
+        refresh = WorkflowIndex.refresh
+        with patch('functions.workflow_index._indexes', {}), \
+             patch.object(WorkflowIndex, 'refresh', autospec=True, side_effect=refresh) as mock_refresh:
+            index = get_workflow_index(self.dir)
+            self.assertEqual(index.file_names, ["bozuk.json", "hook.json", "pasif.json", "rag.json"])
+            self.assertEqual([record["id"] for record in index.file_records()], ["b2", "c3", "a1"])
+            self.assertEqual(find_workflow_file("c3", self.dir), os.path.join(self.dir, "pasif.json"))
+            self.assertIsNone(find_workflow_file("yok", self.dir))
+            index.close()
+        self.assertEqual(mock_refresh.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
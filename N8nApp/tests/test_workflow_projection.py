@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Workflow sadeleştirme (projeksiyon) ve sade dışa aktarımı test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.api_client import N8nClient
+from functions.workflow_projection import (write_workflow_file, sidecar_path, load_sidecar, merge_volatile,
+                                           projection_report)
+
+
+def full_workflow():
+    return {
+        "id": "wf1",
+        "name": "Müşteri Akışı",
+        "createdAt": "2025-05-14T10:00:00.000Z",
+        "updatedAt": "2025-05-15T10:00:00.000Z",
+        "versionId": "v1",
+        "triggerCount": 1,
+        "meta": {"templateCredsSetupCompleted": True},
+        "pinData": {},
+        "shared": [{"role": "workflow:owner", "projectId": "p1"}],
+        "nodes": [{"id": "1", "name": "Not", "type": "n8n-nodes-base.stickyNote", "typeVersion": 1,
+                   "position": [0, 0], "parameters": {"content": "Açıklama " * 20}}],
+        "connections": {},
+        "settings": {"executionOrder": "v1"}
+    }
+
+
+class TestWorkflowProjection(unittest.TestCase):
+    """Değişken alanların ayrılmasını ve kompakt istek gövdesini test et"""
+
+    def test_sidecar_round_trip(self):
+        """sidecar modunda değişken alanların yan dosyaya taşındığını ve geri birleştirildiğini test et"""
+        workflow = full_workflow()
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "musteri_wf1.json")
+            written, saved = write_workflow_file(path, workflow, mode="sidecar")
+            with open(path, encoding='utf-8') as f:
+                lean = json.load(f)
+
+            self.assertNotIn("pinData", lean)
+            self.assertNotIn("updatedAt", lean)
+            self.assertEqual(lean["nodes"], workflow["nodes"])
+            self.assertGreater(saved, 0)
+            self.assertEqual(written, os.path.getsize(path))
+            self.assertEqual(merge_volatile(lean, load_sidecar(path)), workflow)
+
+            # full moduna dönüşte yan dosya silinir
+            write_workflow_file(path, workflow, mode="full")
+            self.assertFalse(os.path.exists(sidecar_path(path)))
+            # Gizli yan dosya klasörü workflow listelerine karışmaz
+            self.assertEqual([name for name in os.listdir(tmp) if not name.startswith(".")], ["musteri_wf1.json"])
+
+    def test_report_and_compact_wire_body(self):
+        """Raporun tasarrufu hesapladığını ve istemcinin kompakt UTF-8 gövde gönderdiğini test et"""
+        report = projection_report(full_workflow())
+        self.assertEqual(report["file_saved"], report["file_full"] - report["file_lean"])
+        self.assertGreater(report["wire_saved"], 0)
+        self.assertIn("shared", report["fields"])
+
+        client = N8nClient(base_url="http://localhost:5678", api_headers={})
+        with patch.object(client.session, 'request') as mock_request:
+            mock_request.return_value.status_code = 200
+            client.put("/workflows/wf1", json={"name": "Müşteri Akışı"})
+        kwargs = mock_request.call_args.kwargs
+        self.assertEqual(kwargs["data"], '{"name":"Müşteri Akışı"}'.encode('utf-8'))
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertNotIn("json", kwargs)
+
+if __name__ == '__main__':
+    unittest.main()
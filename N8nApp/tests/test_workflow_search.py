@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Ters indeksli workflow aramasını test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import tempfile
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions import workflow_search
+from functions.workflow_search import build_local_index, tokenize
+
+
+def make_workflow(workflow_id, name, nodes):
+    return {
+        "id": workflow_id,
+        "name": name,
+        "nodes": [{"id": str(i), "name": node_name, "type": node_type, "parameters": parameters}
+                  for i, (node_name, node_type, parameters) in enumerate(nodes)],
+        "connections": {}
+    }
+
+
+class TestWorkflowSearch(unittest.TestCase):
+    """Sorgu dilini ve artımlı indekslemeyi test et"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+        self.write("v1.json", make_workflow("a", "V1 RAG", [
+            ("Embeddings Ollama", "@n8n/n8n-nodes-langchain.embeddingsOllama", {"model": "nomic-embed-text"}),
+            ("Postgres Chat Memory", "@n8n/n8n-nodes-langchain.memoryPostgresChat", {"tableName": "chat_histories"}),
+        ]))
+        self.write("v2.json", make_workflow("b", "V2 Supabase RAG", [
+            ("Supabase Vector Store", "@n8n/n8n-nodes-langchain.vectorStoreSupabase",
+             {"tableName": {"value": "documents"}}),
+            ("List Documents", "@n8n/n8n-nodes-langchain.postgresTool", {"query": "SELECT * FROM document_metadata"}),
+        ]))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def write(self, name, data):
+        with open(os.path.join(self.dir, name), 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+
+    def ids(self, index, query):
+        return [result["id"] for result in index.search(query)]
+
+    def test_tokenize_splits_camel_case(self):
+        """camelCase kelimelerin hem tamamının hem parçalarının terim olduğunu test et"""
+        self.assertEqual(tokenize("vectorStoreSupabase"), ["vectorstoresupabase", "vector", "store", "supabase"])
+
+    def test_boolean_prefix_and_field_queries(self):
+        """VE, VEYA, DEĞİL, önek ve alan kısıtlı sorguları test et"""
+        index = build_local_index(self.dir)
+        self.assertEqual(self.ids(index, "type:vectorStoreSupabase"), ["b"])
+        self.assertEqual(self.ids(index, "param:documents"), ["b"])
+        self.assertEqual(self.ids(index, "postgres*"), ["a", "b"])
+        self.assertEqual(self.ids(index, "postgres* -type:memoryPostgresChat"), ["b"])
+        self.assertEqual(self.ids(index, "ollama OR supabase"), ["a", "b"])
+        self.assertEqual(self.ids(index, "(ollama OR supabase) AND param:chat_histories"), ["a"])
+        self.assertEqual(self.ids(index, '"nomic-embed"'), ["a"])
+        self.assertEqual(index.search("param:chat_histories")[0]["nodes"], ["Postgres Chat Memory"])
+
+    def test_incremental_rebuild(self):
+        """Sadece değişen dosyaların yeniden terimlendiğini ve silinenlerin çıktığını test et"""
+        build_local_index(self.dir)
+        self.write("v1.json", make_workflow("a", "V1 RAG", [
+            ("Embeddings OpenAI", "@n8n/n8n-nodes-langchain.embeddingsOpenAi", {}),
+        ]))
+        os.remove(os.path.join(self.dir, "v2.json"))
+
+        with patch.object(workflow_search, "document_terms", wraps=workflow_search.document_terms) as terms:
+            index = build_local_index(self.dir)
+        self.assertEqual(terms.call_count, 1)
+        self.assertEqual(self.ids(index, "ollama"), [])
+        self.assertEqual(self.ids(index, "type:embeddingsOpenAi"), ["a"])
+        self.assertEqual(self.ids(index, "supabase"), [])
+
+if __name__ == '__main__':
+    unittest.main()
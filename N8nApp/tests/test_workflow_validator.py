@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Yükleme öncesi workflow doğrulamasını test etme
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import io
+import json
+import tempfile
+from contextlib import redirect_stdout
+
+# Ana proje dizinini import path'e ekleyelim
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from functions.workflow_validator import validate_workflow, validate_directory, has_errors
+from functions.upload_workflow import update_workflow
+
+
+def valid_workflow():
+    return {
+        "id": "wf1",
+        "name": "Geçerli",
+        "nodes": [
+            {"id": "1", "name": "Trigger", "type": "n8n-nodes-base.manualTrigger", "typeVersion": 1,
+             "position": [0, 0], "parameters": {}},
+            {"id": "2", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": 3.4,
+             "position": [200, 0], "parameters": {"value": 1}},
+        ],
+        "connections": {"Trigger": {"main": [[{"node": "Set", "type": "main", "index": 0}]]}}
+    }
+
+
+class TestWorkflowValidator(unittest.TestCase):
+    """Şema, bağlantı hedefi ve tekrar eden node kontrollerini test et"""
+
+    def paths(self, issues, level="error"):
+        return sorted(issue["path"] for issue in issues if issue["level"] == level)
+
+    def test_valid_workflow_has_no_issues(self):
+        """Geçerli workflow'un sorunsuz geçtiğini test et"""
+        self.assertEqual(validate_workflow(valid_workflow()), [])
+        self.assertEqual(validate_workflow({"name": "Boş", "nodes": [], "connections": {}}), [])
+
+    def test_detects_schema_and_connection_errors(self):
+        """Eksik/yanlış alanların, kopuk hedeflerin ve tekrarların yakalandığını test et"""
+        workflow = valid_workflow()
+        workflow["nodes"][1]["id"] = "1"
+        workflow["nodes"][1]["position"] = [200]
+        workflow["nodes"].append({"id": "3", "name": "Set", "type": "n8n-nodes-base.set", "typeVersion": "3",
+                                  "position": [400, 0], "parameters": {}})
+        workflow["connections"]["Trigger"]["main"][0].append({"node": "Yok", "type": "main", "index": 0})
+
+        issues = validate_workflow(workflow)
+        self.assertTrue(has_errors(issues))
+        self.assertEqual(self.paths(issues), [
+            "/connections/Trigger/main/0",
+            "/nodes/1/id",
+            "/nodes/1/position",
+            "/nodes/2/name",
+            "/nodes/2/typeVersion",
+        ])
+
+    def test_validate_directory(self):
+        """Klasör doğrulamasında bozuk JSON'un ve geçersiz dosyanın raporlandığını test et"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with open(os.path.join(tmp, "ok.json"), 'w', encoding='utf-8') as f:
+                json.dump(valid_workflow(), f)
+            with open(os.path.join(tmp, "bozuk.json"), 'w', encoding='utf-8') as f:
+                f.write("{")
+            results = validate_directory(tmp, workers=1)
+        self.assertEqual(results["ok.json"], [])
+        self.assertTrue(has_errors(results["bozuk.json"]))
+
+    def test_connection_to_sticky_note_is_not_dangling(self):
+        """Sticky note'a giden bağlantının kopuk hedef hatası vermediğini test et"""
+        workflow = valid_workflow()
+        workflow["nodes"].append({"id": "3", "name": "Not", "type": "n8n-nodes-base.stickyNote", "typeVersion": 1,
+                                  "position": [0, 200], "parameters": {}})
+        workflow["connections"]["Set"] = {"main": [[{"node": "Not", "type": "main", "index": 0}]]}
+        self.assertFalse(has_errors(validate_workflow(workflow)))
+
+    @patch('functions.upload_workflow.get_client')
+    def test_invalid_workflow_is_not_sent(self, mock_client):
+        """Doğrulamadan geçemeyen workflow için API isteği yapılmadığını test et"""
+        workflow = valid_workflow()
+        del workflow["nodes"][0]["type"]
+        with redirect_stdout(io.StringIO()):
+            result = update_workflow("wf1", workflow)
+        self.assertFalse(result)
+        mock_client.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()